@@ -15,6 +15,8 @@ from telegram.ext import (
 from telegram.request import HTTPXRequest
 
 from telegram_bot.config import (
+    MAX_CONCURRENT_DOWNLOADS_BOT_DATA_KEY,
+    MAX_CONCURRENT_DOWNLOADS_PER_CHAT_BOT_DATA_KEY,
     SCRAPER_MAX_TORRENT_SIZE_BOT_DATA_KEY,
     get_configuration,
     logger,
@@ -91,6 +93,12 @@ def main() -> None:
     application.bot_data[SCRAPER_MAX_TORRENT_SIZE_BOT_DATA_KEY] = runtime_limits[
         "scraper_max_torrent_size_gib"
     ]
+    application.bot_data[MAX_CONCURRENT_DOWNLOADS_PER_CHAT_BOT_DATA_KEY] = runtime_limits[
+        "max_concurrent_downloads_per_chat"
+    ]
+    application.bot_data[MAX_CONCURRENT_DOWNLOADS_BOT_DATA_KEY] = runtime_limits[
+        "max_concurrent_downloads"
+    ]
     # The 'persistence_file' key is removed from here as it's no longer needed.
     application.bot_data.setdefault("active_downloads", {})
     application.bot_data.setdefault("download_queues", {})
@@ -16,8 +16,16 @@ ALLOWED_EXTENSIONS = [".mkv", ".mp4"]
 DELETION_ENABLED = True
 PERSISTENCE_FILE = "persistence.json"
 TRACKING_STATE_FILE = "tracking_state.json"
+TORRENT_METADATA_CACHE_DIR = "torrent_metadata_cache"
+DISCOVERY_CACHE_FILE = "discovery_cache.json"
+METADATA_CACHE_FILE = "metadata_cache.sqlite3"  # Wikipedia/TMDB lookups
+TORRENT_RESUME_DIR = "torrent_resume"  # Fast-resume data, kept beside PERSISTENCE_FILE
 LOG_SCRAPER_STATS = True
 SCRAPER_MAX_TORRENT_SIZE_BOT_DATA_KEY = "SCRAPER_MAX_TORRENT_SIZE_GIB"
+MAX_CONCURRENT_DOWNLOADS_PER_CHAT = 2
+MAX_CONCURRENT_DOWNLOADS = 4
+MAX_CONCURRENT_DOWNLOADS_PER_CHAT_BOT_DATA_KEY = "MAX_CONCURRENT_DOWNLOADS_PER_CHAT"
+MAX_CONCURRENT_DOWNLOADS_BOT_DATA_KEY = "MAX_CONCURRENT_DOWNLOADS"
 
 # Setup basic logging
 logging.basicConfig(
@@ -29,17 +37,15 @@ logger = logging.getLogger(__name__)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
-def get_configuration() -> (
-    tuple[
-        str,
-        dict[str, str],
-        list[int],
-        dict[str, str],
-        dict[str, Any],
-        dict[str, str],
-        dict[str, Any],
-    ]
-):
+def get_configuration() -> tuple[
+    str,
+    dict[str, str],
+    list[int],
+    dict[str, str],
+    dict[str, Any],
+    dict[str, str],
+    dict[str, Any],
+]:
     """
     Reads bot token, paths, allowed IDs, Plex, Search, and TMDB config from the
     config.ini file. This function has been refactored to be more robust
@@ -228,7 +234,30 @@ def _load_runtime_limits(config: configparser.ConfigParser) -> dict[str, Any]:
     if scraper_max_torrent_size_gib <= 0:
         raise ValueError("'scraper_max_torrent_size_gib' in [host] must be greater than 0.")
 
-    return {"scraper_max_torrent_size_gib": float(scraper_max_torrent_size_gib)}
+    return {
+        "scraper_max_torrent_size_gib": float(scraper_max_torrent_size_gib),
+        "max_concurrent_downloads_per_chat": _load_positive_int(
+            config, "max_concurrent_downloads_per_chat", MAX_CONCURRENT_DOWNLOADS_PER_CHAT
+        ),
+        "max_concurrent_downloads": _load_positive_int(
+            config, "max_concurrent_downloads", MAX_CONCURRENT_DOWNLOADS
+        ),
+    }
+
+
+def _load_positive_int(config: configparser.ConfigParser, option: str, default: int) -> int:
+    """Reads an optional positive integer from [host], falling back to the default."""
+    if not config.has_option("host", option):
+        return default
+
+    try:
+        value = config.getint("host", option)
+    except ValueError as exc:
+        raise ValueError(f"'{option}' in [host] must be a positive integer.") from exc
+
+    if value <= 0:
+        raise ValueError(f"'{option}' in [host] must be greater than 0.")
+    return value
 
 
 def require_scraper_max_torrent_size_gib(bot_data: dict[str, Any] | Any) -> float:
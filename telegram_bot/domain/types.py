@@ -14,6 +14,7 @@ __all__ = [
     "TrackingStatus",
     "TrackingItem",
     "TrackingStateFile",
+    "PlacementReport",
     "PostProcessingResult",
 ]
 
@@ -31,6 +32,7 @@ class SourceDict(TypedDict, total=False):
 
 
 class DownloadData(TypedDict, total=False):
+    download_id: str
     source_dict: SourceDict
     chat_id: int
     message_id: int
@@ -142,6 +144,16 @@ class TrackingStateFile(TypedDict):
     items: dict[str, TrackingItem]
 
 
+class PlacementReport(TypedDict):
+    source: str
+    destination: str
+    episode: NotRequired[int]
+    status: Literal["placed", "failed"]
+    strategy: NotRequired[str]
+    size_bytes: NotRequired[int]
+    error: NotRequired[str]
+
+
 class PostProcessingResult(TypedDict, total=False):
     succeeded: bool
     final_message: str
@@ -149,3 +161,5 @@ class PostProcessingResult(TypedDict, total=False):
     media_type: NotRequired[Literal["movie", "tv"] | None]
     title: NotRequired[str | None]
     year: NotRequired[int | None]
+    placement_strategy: NotRequired[str | None]
+    placement_report: NotRequired[list[PlacementReport]]
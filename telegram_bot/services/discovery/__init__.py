@@ -1,5 +1,6 @@
+from .cache import DiscoveryResultCache
 from .exceptions import ProviderSearchError
-from .health import CircuitBreaker, ProviderHealthState
+from .health import CircuitBreaker, ProviderConcurrencyLimiter, ProviderHealthState
 from .orchestrator import DiscoveryOrchestrator
 from .schemas import DiscoveryRequest, DiscoveryResult, ProviderConfig
 
@@ -8,6 +9,8 @@ __all__ = [
     "DiscoveryRequest",
     "DiscoveryOrchestrator",
     "DiscoveryResult",
+    "DiscoveryResultCache",
+    "ProviderConcurrencyLimiter",
     "ProviderHealthState",
     "ProviderSearchError",
     "ProviderConfig",
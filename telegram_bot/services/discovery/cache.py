@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from ...config import logger
+from .schemas import DiscoveryRequest, DiscoveryResult
+
+CacheKey = tuple[str, str, str, str]
+
+
+def normalize_cache_query(query: str) -> str:
+    return " ".join(query.split()).casefold()
+
+
+def build_cache_key(provider_name: str, request: DiscoveryRequest, category: str) -> CacheKey:
+    return (
+        provider_name.casefold(),
+        normalize_cache_query(request.query),
+        request.media_type,
+        str(category),
+    )
+
+
+class DiscoveryResultCache:
+    """
+    Short-lived LRU cache of raw provider results.
+
+    Entries hold the unfiltered `DiscoveryResult` list a provider returned, so
+    retries with relaxed seeders/size filters and repeated browsing re-filter
+    cached results instead of querying the indexer again. When `persist_path`
+    is set the cache is loaded from and saved to that JSON file.
+    """
+
+    DEFAULT_TTL_SECONDS = 10 * 60
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        persist_path: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.persist_path = persist_path
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, list[DiscoveryResult]]] = OrderedDict()
+        if persist_path:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> list[DiscoveryResult] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return list(results)
+
+    def put(self, key: CacheKey, results: Sequence[DiscoveryResult]) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, list(results))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def load(self) -> None:
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, encoding="utf-8") as file_handle:
+                payload = json.load(file_handle)
+            now = self._clock()
+            for raw_entry in payload.get("entries", []):
+                expires_at = float(raw_entry["expires_at"])
+                if expires_at <= now:
+                    continue
+                key = tuple(str(part) for part in raw_entry["key"])
+                if len(key) != 4:
+                    continue
+                results = [DiscoveryResult(**item) for item in raw_entry["results"]]
+                self._entries[key] = (expires_at, results)  # type: ignore[index]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as exc:
+            logger.warning(
+                "[DISCOVERY] Ignoring unreadable result cache '%s': %s", self.persist_path, exc
+            )
+            self._entries.clear()
+            return
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        if not self.persist_path:
+            return
+        now = self._clock()
+        payload: dict[str, Any] = {
+            "entries": [
+                {
+                    "key": list(key),
+                    "expires_at": expires_at,
+                    "results": [dataclasses.asdict(result) for result in results],
+                }
+                for key, (expires_at, results) in self._entries.items()
+                if expires_at > now
+            ]
+        }
+        temp_path = f"{self.persist_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file_handle:
+                json.dump(payload, file_handle)
+            os.replace(temp_path, self.persist_path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning(
+                "[DISCOVERY] Could not save result cache to '%s': %s", self.persist_path, exc
+            )
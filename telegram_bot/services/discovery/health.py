@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -53,3 +54,17 @@ class CircuitBreaker:
         state.last_failure_time = self._clock()
         if state.failures >= self.FAILURE_THRESHOLD:
             state.is_offline = True
+
+
+class ProviderConcurrencyLimiter:
+    """Caps in-flight requests per provider across concurrent discovery searches."""
+
+    def __init__(self) -> None:
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def semaphore_for(self, provider_name: str, limit: int) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(provider_name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphores[provider_name] = semaphore
+        return semaphore
@@ -8,12 +8,18 @@ from dataclasses import dataclass
 from typing import Any
 
 from ...config import logger
-from ...utils import compute_av_match_metadata, score_torrent_result
+from ...utils import ScoringProfile
+from .cache import CacheKey, DiscoveryResultCache, build_cache_key
 from .exceptions import ProviderSearchError
-from .health import CircuitBreaker
+from .health import CircuitBreaker, ProviderConcurrencyLimiter
 from .providers.base import BaseProvider
 from .providers.torznab import TorznabProvider
-from .schemas import DiscoveryRequest, DiscoveryResult, ProviderConfig
+from .schemas import (
+    DEFAULT_TORZNAB_CATEGORIES,
+    DiscoveryRequest,
+    DiscoveryResult,
+    ProviderConfig,
+)
 
 DEFAULT_MIN_RESULT_SCORE = 6
 _MOVIE_SCREENER_PATTERN = re.compile(
@@ -32,6 +38,10 @@ PROVIDER_FACTORY: dict[str, type[BaseProvider]] = {
 }
 
 
+class _ProviderCoolingDown(ProviderSearchError):
+    """Raised when a provider's breaker opened while a search waited for a slot."""
+
+
 @dataclass(slots=True)
 class ProviderSearchStats:
     provider_name: str
@@ -60,8 +70,12 @@ class DiscoveryOrchestrator:
         preferences: Mapping[str, Any] | None = None,
         breaker: CircuitBreaker | None = None,
         min_result_score: int = DEFAULT_MIN_RESULT_SCORE,
+        result_cache: DiscoveryResultCache | None = None,
+        limiter: ProviderConcurrencyLimiter | None = None,
     ) -> None:
         self.breaker = breaker or CircuitBreaker()
+        self.result_cache = result_cache
+        self.limiter = limiter
         self.preferences = dict(preferences or {})
         self.min_result_score = min_result_score
         self.providers: list[BaseProvider] = []
@@ -93,15 +107,11 @@ class DiscoveryOrchestrator:
         raw_results = await self._execute_discovery(request)
         unique_results = self._deduplicate(raw_results)
         filtered_results = self._filter_results(unique_results, request)
+        profile = ScoringProfile.for_preferences(self._preferences_for(request, preferences))
         formatted_results = [
-            self._format_for_legacy_scoring(result, self._preferences_for(request, preferences))
-            for result in filtered_results
+            self._format_for_legacy_scoring(result, profile) for result in filtered_results
         ]
-        return self._score_and_sort(
-            formatted_results,
-            request,
-            self._preferences_for(request, preferences),
-        )
+        return self._score_and_sort(formatted_results, request, profile)
 
     def _coerce_provider_config(
         self, raw_config: ProviderConfig | Mapping[str, Any]
@@ -116,9 +126,21 @@ class DiscoveryOrchestrator:
 
     async def _execute_discovery(self, request: DiscoveryRequest) -> list[DiscoveryResult]:
         task_entries: list[tuple[BaseProvider, asyncio.Task[list[DiscoveryResult]]]] = []
+        found_by_provider: dict[str, list[DiscoveryResult]] = {}
 
         for provider in self.providers:
             provider_name = provider.config.name
+            cached = self._cached_results(provider, request)
+            if cached is not None:
+                logger.debug(
+                    "[DISCOVERY] Serving %s results for %r from cache.",
+                    provider_name,
+                    request.query,
+                )
+                self._record_provider_results(provider_name, cached, status="cached")
+                found_by_provider[provider_name] = cached
+                continue
+
             if not self.breaker.is_healthy(provider_name):
                 logger.warning("[DISCOVERY] Skipping %s because it is cooling down.", provider_name)
                 self._mark_provider_failed(
@@ -132,23 +154,31 @@ class DiscoveryOrchestrator:
             task_entries.append(
                 (
                     provider,
-                    asyncio.create_task(self._search_provider_with_timeout(provider, request)),
+                    asyncio.create_task(self._search_provider(provider, request)),
                 )
             )
 
-        if not task_entries:
-            return []
-
-        gathered = await asyncio.gather(
-            *(task for _, task in task_entries),
-            return_exceptions=True,
+        gathered = (
+            await asyncio.gather(
+                *(task for _, task in task_entries),
+                return_exceptions=True,
+            )
+            if task_entries
+            else []
         )
 
-        all_found: list[DiscoveryResult] = []
         for (provider, _), result in zip(task_entries, gathered):
             provider_name = provider.config.name
             if isinstance(result, asyncio.CancelledError):
                 raise result
+            if isinstance(result, _ProviderCoolingDown):
+                self._mark_provider_failed(
+                    provider_name,
+                    error_type="CircuitBreakerOpen",
+                    error_message="Provider is cooling down.",
+                    status="skipped",
+                )
+                continue
             if isinstance(result, ProviderSearchError):
                 logger.warning("[DISCOVERY] %s failed: %s", provider_name, result)
                 self._mark_provider_failed(
@@ -156,7 +186,6 @@ class DiscoveryOrchestrator:
                     error_type=type(result.__cause__ or result).__name__,
                     error_message=str(result.__cause__ or result),
                 )
-                self.breaker.record_failure(provider_name)
                 continue
             if isinstance(result, Exception):
                 logger.error("[DISCOVERY] %s failed unexpectedly: %s", provider_name, result)
@@ -165,22 +194,85 @@ class DiscoveryOrchestrator:
                     error_type=type(result).__name__,
                     error_message=str(result),
                 )
-                self.breaker.record_failure(provider_name)
                 continue
             if isinstance(result, BaseException):
                 raise result
 
-            self.breaker.record_success(provider_name)
-            stats = self.last_provider_stats.get(provider_name)
-            if stats is not None:
-                stats.status = "success"
-                stats.raw_count = len(result)
-                stats.raw_samples = [self._sample_result(item) for item in result[:5]]
-            all_found.extend(result)
+            # Early-stopping providers return filter-dependent partial feeds,
+            # which cannot be re-filtered from the cache.
+            if self.result_cache is not None and provider.config.early_stop_after is None:
+                self.result_cache.put(self._cache_key(provider, request), result)
+            self._record_provider_results(provider_name, result)
+            found_by_provider[provider_name] = result
 
+        all_found: list[DiscoveryResult] = []
+        for provider in self.providers:
+            all_found.extend(found_by_provider.get(provider.config.name, []))
         return all_found
 
-    async def _search_provider_with_timeout(
+    def _cache_key(self, provider: BaseProvider, request: DiscoveryRequest) -> CacheKey:
+        category = provider.config.categories.get(
+            request.media_type,
+            DEFAULT_TORZNAB_CATEGORIES[request.media_type],
+        )
+        return build_cache_key(provider.config.name, request, category)
+
+    def _cached_results(
+        self,
+        provider: BaseProvider,
+        request: DiscoveryRequest,
+    ) -> list[DiscoveryResult] | None:
+        if self.result_cache is None:
+            return None
+        return self.result_cache.get(self._cache_key(provider, request))
+
+    def _record_provider_results(
+        self,
+        provider_name: str,
+        results: Sequence[DiscoveryResult],
+        *,
+        status: str = "success",
+    ) -> None:
+        stats = self.last_provider_stats.get(provider_name)
+        if stats is not None:
+            stats.status = status
+            stats.raw_count = len(results)
+            stats.raw_samples = [self._sample_result(item) for item in results[:5]]
+
+    async def _search_provider(
+        self,
+        provider: BaseProvider,
+        request: DiscoveryRequest,
+    ) -> list[DiscoveryResult]:
+        if self.limiter is None:
+            return await self._run_provider_search(provider, request)
+
+        provider_name = provider.config.name
+        semaphore = self.limiter.semaphore_for(
+            provider_name, provider.config.max_concurrent_requests
+        )
+        async with semaphore:
+            # Earlier searches queued on this provider may have tripped its breaker.
+            if not self.breaker.is_healthy(provider_name):
+                raise _ProviderCoolingDown("Provider is cooling down.", provider_name=provider_name)
+            return await self._run_provider_search(provider, request)
+
+    async def _run_provider_search(
+        self,
+        provider: BaseProvider,
+        request: DiscoveryRequest,
+    ) -> list[DiscoveryResult]:
+        """Runs one provider search and records the outcome on the breaker as it lands."""
+        provider_name = provider.config.name
+        try:
+            results = await self._call_provider_with_timeout(provider, request)
+        except Exception:
+            self.breaker.record_failure(provider_name)
+            raise
+        self.breaker.record_success(provider_name)
+        return results
+
+    async def _call_provider_with_timeout(
         self,
         provider: BaseProvider,
         request: DiscoveryRequest,
@@ -285,9 +377,9 @@ class DiscoveryOrchestrator:
     def _format_for_legacy_scoring(
         self,
         result: DiscoveryResult,
-        preferences: Mapping[str, Any],
+        profile: ScoringProfile,
     ) -> dict[str, Any]:
-        av_metadata = compute_av_match_metadata(result.title, dict(preferences))
+        av_metadata = profile.av_metadata(result.title)
         return {
             "title": result.title,
             "page_url": result.magnet_url or result.download_url,
@@ -314,17 +406,10 @@ class DiscoveryOrchestrator:
         self,
         results: Sequence[dict[str, Any]],
         request: DiscoveryRequest,
-        preferences: Mapping[str, Any],
+        profile: ScoringProfile,
     ) -> list[dict[str, Any]]:
         scored: list[dict[str, Any]] = []
-        for result in results:
-            score = score_torrent_result(
-                str(result.get("title") or ""),
-                str(result.get("uploader") or ""),
-                dict(preferences),
-                seeders=int(result.get("seeders") or 0),
-                leechers=int(result.get("leechers") or 0),
-            )
+        for result, score in zip(results, profile.score_many(results), strict=True):
             if score < self.min_result_score:
                 source = result.get("source")
                 stats = self.last_provider_stats.get(str(source))
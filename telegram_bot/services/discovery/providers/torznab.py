@@ -3,13 +3,15 @@ from __future__ import annotations
 import re
 import urllib.parse
 import xml.etree.ElementTree as ET
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
 
 from ....config import logger
 from ....utils import parse_codec, parse_torrent_name
+from ...http_client import shared_http_client
 from ..exceptions import ProviderSearchError
 from ..schemas import DiscoveryRequest, DiscoveryResult
 from .base import BaseProvider
@@ -21,14 +23,16 @@ _DEFAULT_TORZNAB_TYPES = {
 _RESOLUTION_PATTERN = re.compile(r"(?i)\b(2160p|1080p|720p|480p|4k)\b")
 
 
-async def fetch_page(
+@asynccontextmanager
+async def stream_page(
     url: str,
     *,
     timeout: float = 30,
     follow_redirects: bool = True,
-) -> httpx.Response:
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=follow_redirects) as client:
-        return await client.get(url)
+) -> AsyncIterator[httpx.Response]:
+    client = shared_http_client(url, timeout=timeout, follow_redirects=follow_redirects)
+    async with client.stream("GET", url) as response:
+        yield response
 
 
 def _local_name(tag: str) -> str:
@@ -105,10 +109,77 @@ def _resolution_from_title(title: str) -> str | None:
     return match.group(1).lower() if match else None
 
 
-def _iter_items(root: ET.Element) -> Iterable[ET.Element]:
-    for element in root.iter():
-        if _local_name(element.tag) == "item":
-            yield element
+def _passes_request_filters(result: DiscoveryResult, request: DiscoveryRequest) -> bool:
+    if result.seeders < request.min_seeders:
+        return False
+    return request.max_size_gib is None or result.size_bytes <= request.max_size_gib * 1024**3
+
+
+class _TorznabFeedParser:
+    """
+    Incremental Torznab parser fed with raw bytes as they arrive.
+
+    Each `<item>` is mapped as soon as it closes and then detached from its
+    parent (usually `<channel>`), so memory stays bounded by one item rather
+    than the whole feed. With `stop_after`,
+    `done` turns true once that many mapped items pass `accept`.
+    """
+
+    def __init__(
+        self,
+        map_item: Callable[[ET.Element], DiscoveryResult | None],
+        *,
+        accept: Callable[[DiscoveryResult], bool] | None = None,
+        stop_after: int | None = None,
+    ) -> None:
+        self._parser: ET.XMLPullParser = ET.XMLPullParser(events=("start", "end"))
+        self._open: list[ET.Element] = []
+        self._map_item = map_item
+        self._accept = accept
+        self._stop_after = stop_after
+        self._accepted = 0
+        self.results: list[DiscoveryResult] = []
+
+    @property
+    def done(self) -> bool:
+        return self._stop_after is not None and self._accepted >= self._stop_after
+
+    def feed(self, data: bytes | str) -> None:
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> list[DiscoveryResult]:
+        self._parser.close()
+        self._drain()
+        return self.results
+
+    def _drain(self) -> None:
+        for parsed in self._parser.read_events():
+            # Only "start"/"end" events are requested; they always carry the element.
+            if len(parsed) != 2:
+                continue
+            event, element = parsed[0], parsed[1]
+            if not isinstance(element, ET.Element):
+                continue
+            if event == "start":
+                self._open.append(element)
+                continue
+            if event != "end":
+                continue
+            self._open.pop()
+            if _local_name(element.tag) != "item":
+                continue
+            if self._open:
+                # Detach the finished item so the tree does not keep a stub per item.
+                self._open[-1].remove(element)
+            if self.done:
+                continue
+            result = self._map_item(element)
+            if result is None:
+                continue
+            self.results.append(result)
+            if self._accept is None or self._accept(result):
+                self._accepted += 1
 
 
 class TorznabProvider(BaseProvider):
@@ -116,13 +187,37 @@ class TorznabProvider(BaseProvider):
 
     async def search(self, request: DiscoveryRequest) -> list[DiscoveryResult]:
         url = self.build_search_url(request)
+        parser = _TorznabFeedParser(
+            self._map_item_to_result,
+            accept=lambda result: _passes_request_filters(result, request),
+            stop_after=self.config.early_stop_after,
+        )
         try:
-            response = await fetch_page(
+            async with stream_page(
                 url,
                 timeout=self.config.timeout_seconds,
                 follow_redirects=True,
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                    if parser.done:
+                        break
+            if not parser.done:
+                parser.close()
+        except ET.ParseError as exc:
+            # A feed that breaks partway (e.g. an HTML error page) must not be
+            # cached or counted as a healthy response with partial results.
+            logger.error(
+                "[DISCOVERY] %s: Invalid Torznab XML after %d item(s): %s",
+                self.config.name,
+                len(parser.results),
+                exc,
             )
-            response.raise_for_status()
+            raise ProviderSearchError(
+                f"Invalid Torznab XML for {request.query!r}",
+                provider_name=self.config.name,
+            ) from exc
         except Exception as exc:
             logger.error(
                 "[DISCOVERY] %s: Torznab request failed for %r: %s: %s",
@@ -136,7 +231,7 @@ class TorznabProvider(BaseProvider):
                 provider_name=self.config.name,
             ) from exc
 
-        return self.parse_xml(response.text)
+        return parser.results
 
     def build_search_url(self, request: DiscoveryRequest) -> str:
         category = self.config.categories.get(
@@ -185,20 +280,15 @@ class TorznabProvider(BaseProvider):
             )
         )
 
-    def parse_xml(self, xml_content: str) -> list[DiscoveryResult]:
+    def parse_xml(self, xml_content: str | bytes) -> list[DiscoveryResult]:
+        parser = _TorznabFeedParser(self._map_item_to_result)
         try:
-            root = ET.fromstring(xml_content)
+            parser.feed(xml_content)
+            return parser.close()
         except ET.ParseError as exc:
             logger.error("[DISCOVERY] %s: Invalid Torznab XML: %s", self.config.name, exc)
             return []
 
-        results: list[DiscoveryResult] = []
-        for item in _iter_items(root):
-            result = self._map_item_to_result(item)
-            if result is not None:
-                results.append(result)
-        return results
-
     def _map_item_to_result(self, item: ET.Element) -> DiscoveryResult | None:
         title = _direct_child_text(item, "title")
         if not title:
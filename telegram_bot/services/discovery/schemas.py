@@ -85,6 +85,8 @@ class ProviderConfig:
     enabled: bool = True
     timeout_seconds: float = 8.0
     categories: dict[str, str] = field(default_factory=lambda: dict(DEFAULT_TORZNAB_CATEGORIES))
+    max_concurrent_requests: int = 4
+    early_stop_after: int | None = None
 
     def __post_init__(self) -> None:
         _validate_non_empty_string(self.name, field_name="name")
@@ -92,3 +94,7 @@ class ProviderConfig:
         _validate_non_empty_string(self.search_url, field_name="search_url")
         if self.timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be greater than 0.")
+        if self.max_concurrent_requests <= 0:
+            raise ValueError("max_concurrent_requests must be greater than 0.")
+        if self.early_stop_after is not None and self.early_stop_after <= 0:
+            raise ValueError("early_stop_after must be greater than 0 when provided.")
@@ -5,8 +5,8 @@ from telegram_bot.services.plex_service import (
     ensure_collection_contains_movies,
     wait_for_movies_to_be_available,
 )
-from telegram_bot.state import save_state
-from telegram_bot.utils import safe_edit_message, sanitize_collection_name
+from telegram_bot.state import save_state, schedule_state_save
+from telegram_bot.utils import safe_edit_message, safe_send_message, sanitize_collection_name
 from telegram_bot.workflows import finalize_movie_collection
 
 from .controls import handle_cancel_all, handle_cancel_request, handle_pause_resume
@@ -48,7 +48,9 @@ __all__ = [
     "handle_cancel_request",
     "handle_cancel_all",
     "safe_edit_message",
+    "safe_send_message",
     "save_state",
+    "schedule_state_save",
     "handle_successful_download",
     "_trigger_plex_scan",
     "ensure_collection_contains_movies",
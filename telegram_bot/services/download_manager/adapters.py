@@ -6,6 +6,8 @@ import os
 
 import httpx
 
+from telegram_bot.services.http_client import shared_http_client
+
 
 def path_exists(path: str) -> bool:
     return os.path.exists(path)
@@ -29,5 +31,5 @@ async def fetch_url(
     timeout: int = 30,
     follow_redirects: bool = True,
 ) -> httpx.Response:
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=follow_redirects) as client:
-        return await client.get(url)
+    client = shared_http_client(url, timeout=timeout, follow_redirects=follow_redirects)
+    return await client.get(url)
@@ -2,6 +2,12 @@ from __future__ import annotations
 
 from typing import Any, cast
 
+from telegram_bot.config import (
+    MAX_CONCURRENT_DOWNLOADS,
+    MAX_CONCURRENT_DOWNLOADS_BOT_DATA_KEY,
+    MAX_CONCURRENT_DOWNLOADS_PER_CHAT,
+    MAX_CONCURRENT_DOWNLOADS_PER_CHAT_BOT_DATA_KEY,
+)
 from telegram_bot.domain.types import BatchMeta, DownloadData
 
 
@@ -10,6 +16,41 @@ def get_active_downloads(bot_data: dict[str, Any]) -> dict[str, DownloadData]:
     return cast(dict[str, DownloadData], bot_data.get("active_downloads", {}))
 
 
+def get_chat_active_downloads(bot_data: dict[str, Any], chat_id: int | str) -> list[DownloadData]:
+    """Return the active downloads owned by one chat, in start order."""
+    chat_id_str = str(chat_id)
+    return [
+        download_data
+        for download_data in get_active_downloads(bot_data).values()
+        if str(download_data.get("chat_id")) == chat_id_str
+    ]
+
+
+def find_active_download(
+    bot_data: dict[str, Any], chat_id: int | str, message_id: int | None
+) -> DownloadData | None:
+    """Return the active download whose progress message is `message_id`.
+
+    Falls back to the chat's only active download so controls on older messages keep working.
+    """
+    chat_downloads = get_chat_active_downloads(bot_data, chat_id)
+    for download_data in chat_downloads:
+        if message_id is not None and download_data.get("message_id") == message_id:
+            return download_data
+    if len(chat_downloads) == 1:
+        return chat_downloads[0]
+    return None
+
+
+def get_download_slot_limits(bot_data: dict[str, Any]) -> tuple[int, int]:
+    """Return the (per-chat, global) concurrent download limits."""
+    per_chat = bot_data.get(
+        MAX_CONCURRENT_DOWNLOADS_PER_CHAT_BOT_DATA_KEY, MAX_CONCURRENT_DOWNLOADS_PER_CHAT
+    )
+    global_limit = bot_data.get(MAX_CONCURRENT_DOWNLOADS_BOT_DATA_KEY, MAX_CONCURRENT_DOWNLOADS)
+    return max(1, int(per_chat)), max(1, int(global_limit))
+
+
 def get_download_queues(bot_data: dict[str, Any]) -> dict[str, list[DownloadData]]:
     """Return queued downloads map from bot data."""
     return cast(dict[str, list[DownloadData]], bot_data.get("download_queues", {}))
@@ -16,16 +16,21 @@ from telegram_bot.ui.messages import (
     MSG_NO_ACTIVE_DOWNLOAD_PAUSE_RESUME,
 )
 
-from .bot_data_access import get_active_downloads, get_download_queues
+from .bot_data_access import (
+    find_active_download,
+    get_active_downloads,
+    get_chat_active_downloads,
+    get_download_queues,
+)
 
 
 async def handle_pause_resume(update, context):
-    """Toggle pause or resume for the current download."""
+    """Toggle pause or resume for the download shown in the pressed message."""
     query = update.callback_query
     chat_id_str = str(query.message.chat_id)
-    active_downloads = get_active_downloads(context.bot_data)
+    download_data = find_active_download(context.bot_data, chat_id_str, query.message.message_id)
 
-    if chat_id_str not in active_downloads:
+    if download_data is None:
         from . import safe_edit_message
 
         await safe_edit_message(
@@ -35,7 +40,6 @@ async def handle_pause_resume(update, context):
         )
         return
 
-    download_data = active_downloads[chat_id_str]
     async with download_data["lock"]:
         handle = download_data.get("handle")
         if handle is None:
@@ -58,14 +62,14 @@ async def handle_pause_resume(update, context):
 
 
 async def handle_cancel_request(update, context):
-    """Handles a user's request to cancel a download."""
+    """Handles a user's request to cancel the download shown in the pressed message."""
     from . import safe_edit_message
 
     query = update.callback_query
     chat_id_str = str(query.message.chat_id)
-    active_downloads = get_active_downloads(context.bot_data)
+    download_data = find_active_download(context.bot_data, chat_id_str, query.message.message_id)
 
-    if chat_id_str not in active_downloads:
+    if download_data is None:
         await safe_edit_message(
             query.message,
             text=MSG_NO_ACTIVE_DOWNLOAD_CANCEL,
@@ -73,7 +77,6 @@ async def handle_cancel_request(update, context):
         )
         return
 
-    download_data = active_downloads[chat_id_str]
     async with download_data["lock"]:
         if query.data == "cancel_download":
             # Mark this download so progress updates pause during confirmation.
@@ -107,8 +110,8 @@ async def handle_cancel_request(update, context):
 
 
 async def handle_cancel_all(update, context):
-    """Two-step cancel-all: confirm, then clear queue and cancel active."""
-    from . import safe_edit_message, save_state
+    """Two-step cancel-all: confirm, then clear queue and cancel every active download."""
+    from . import safe_edit_message, schedule_state_save
 
     query = update.callback_query
     chat_id = query.message.chat_id
@@ -118,12 +121,14 @@ async def handle_cancel_all(update, context):
     active_downloads = get_active_downloads(context.bot_data)
     download_queues = get_download_queues(context.bot_data)
 
+    # The download whose progress message hosts the confirmation prompt.
+    prompt_download = find_active_download(context.bot_data, chat_id_str, query.message.message_id)
+
     # When initiating, set pending flag and ask for confirmation
     if action == "cancel_all":
-        if chat_id_str in active_downloads:
-            dd = active_downloads[chat_id_str]
-            async with dd["lock"]:
-                dd["cancellation_pending"] = True
+        if prompt_download is not None:
+            async with prompt_download["lock"]:
+                prompt_download["cancellation_pending"] = True
 
         message_text = MSG_CONFIRM_CANCEL_ALL
         reply_markup = InlineKeyboardMarkup(
@@ -152,9 +157,8 @@ async def handle_cancel_all(update, context):
             del download_queues[chat_id_str]
             logger.info(f"Cleared {removed} queued downloads for user {chat_id_str}.")
 
-        # Cancel the active download task if present
-        if chat_id_str in active_downloads:
-            dd = active_downloads[chat_id_str]
+        # Cancel every active download task for this user
+        for dd in get_chat_active_downloads(context.bot_data, chat_id_str):
             async with dd["lock"]:
                 dd.pop("cancellation_pending", None)
                 task = dd.get("task")
@@ -163,7 +167,7 @@ async def handle_cancel_all(update, context):
                     task.cancel()
 
         # Persist state after clearing the queue
-        save_state(PERSISTENCE_FILE, active_downloads, download_queues)
+        schedule_state_save(PERSISTENCE_FILE, active_downloads, download_queues)
 
         # Acknowledge; the active task will finalize its own message text
         try:
@@ -179,9 +183,8 @@ async def handle_cancel_all(update, context):
 
     # Deny: remove pending flag and resume updates
     if action == "cancel_all_deny":
-        if chat_id_str in active_downloads:
-            dd = active_downloads[chat_id_str]
-            async with dd["lock"]:
-                dd.pop("cancellation_pending", None)
+        if prompt_download is not None:
+            async with prompt_download["lock"]:
+                prompt_download.pop("cancellation_pending", None)
         # No immediate re-render; progress updates will resume naturally
         return
@@ -10,9 +10,21 @@ import libtorrent as lt
 
 from telegram_bot.config import logger
 from telegram_bot.domain.types import DownloadData
+from telegram_bot.services.torrent_service import (
+    RESUME_DATA_SAVE_INTERVAL_SECONDS,
+    TorrentResumeStore,
+    TorrentWatch,
+    get_torrent_alert_pump,
+    get_torrent_metadata_cache,
+    get_torrent_resume_store,
+    info_hash_hex,
+)
 
 from .adapters import fetch_url
 
+# Upper bound between progress callbacks when no alert arrives for a torrent.
+STATUS_UPDATE_TIMEOUT_SECONDS = 1.0
+
 
 async def download_with_progress(
     source: str,
@@ -42,6 +54,11 @@ async def download_with_progress(
             params = lt.parse_magnet_uri(source)  # type: ignore
             params.save_path = save_path  # type: ignore
             params.storage_mode = lt.storage_mode_t.storage_mode_sparse  # type: ignore
+            # Metadata fetched for the confirmation preview lets pieces flow immediately.
+            cached_ti = get_torrent_metadata_cache(bot_data).get_torrent_info(info_hash_hex(params))
+            if cached_ti is not None:
+                logger.info("Reusing cached metadata; skipping the magnet metadata exchange.")
+                params.ti = cached_ti  # type: ignore
 
         elif source.startswith(("http://", "https://")):
             logger.info(f"Source is a URL. Downloading .torrent file from: {source}")
@@ -80,36 +97,85 @@ async def download_with_progress(
         )
         return False, None
 
-    # --- ADD TORRENT TO SESSION AND START DOWNLOAD LOOP ---
+    # --- ADD TORRENT TO SESSION AND FOLLOW IT THROUGH THE ALERT PUMP ---
+    pump = get_torrent_alert_pump(bot_data)
+    resume_store = get_torrent_resume_store(bot_data)
+    resume_store.attach(pump)
+    params = _apply_resume_data(resume_store, params, save_path)
     handle = ses.add_torrent(params)
     download_data["handle"] = handle  # Store handle for pausing/resuming
-
+    watch = pump.watch(handle)
+    try:
+        return await _follow_download(
+            handle, watch, status_callback, bot_data, download_data, resume_store
+        )
+    finally:
+        pump.unwatch(handle)
+
+
+def _apply_resume_data(resume_store: TorrentResumeStore, params: Any, save_path: str) -> Any:
+    """Swaps in stored fast-resume params so libtorrent skips re-hashing finished pieces."""
+    ti = params.get("ti") if isinstance(params, dict) else getattr(params, "ti", None)
+    resume_params = resume_store.load(info_hash_hex(ti if ti is not None else params))
+    if resume_params is None:
+        return params
+    logger.info("Restoring saved fast-resume data; skipping the full recheck.")
+    resume_params.save_path = save_path
+    if resume_params.ti is None and ti is not None:
+        resume_params.ti = ti
+    return resume_params
+
+
+async def _follow_download(
+    handle: Any,
+    watch: TorrentWatch,
+    status_callback: Callable[[lt.torrent_status], Coroutine[Any, Any, None]],  # type: ignore
+    bot_data: dict[str, Any],
+    download_data: DownloadData,
+    resume_store: TorrentResumeStore,
+) -> tuple[bool, lt.torrent_info | None]:  # type: ignore
+    """Reports progress from alert-driven status updates until the torrent completes."""
     start_time = time.monotonic()
-    while not handle.status().is_seeding:
+    next_resume_save_at = start_time + RESUME_DATA_SAVE_INTERVAL_SECONDS
+    # Seed the view once; afterwards statuses arrive from the session-wide alert pump.
+    status = handle.status()
+    while not (watch.finished or status.is_seeding):
         if bot_data.get("is_shutting_down") or download_data.get("requeued"):
             raise asyncio.CancelledError("Shutdown or requeue initiated.")
 
+        if watch.error is not None:
+            logger.error(f"libtorrent reported an error for {handle.name()}: {watch.error}")
+            return False, None
+
         # Handle pausing. We still emit progress updates so the user interface
         # can reflect the paused state and show a toggle button to resume.
         if download_data.get("is_paused"):
             handle.pause()
-            await status_callback(handle.status())  # Immediate paused update
+            await status_callback(status)  # Immediate paused update
             while download_data.get("is_paused"):
                 if bot_data.get("is_shutting_down"):
                     raise asyncio.CancelledError("Shutdown initiated.")
-                await asyncio.sleep(1)
-                await status_callback(handle.status())
+                await watch.wait_for_update(STATUS_UPDATE_TIMEOUT_SECONDS)
+                status = watch.status or status
+                await status_callback(status)
             handle.resume()
 
-        status = handle.status()
         await status_callback(status)
 
+        # Periodically checkpoint fast-resume data so a crash loses little progress.
+        if time.monotonic() >= next_resume_save_at:
+            resume_store.request_save(handle, only_if_modified=True)
+            next_resume_save_at = time.monotonic() + RESUME_DATA_SAVE_INTERVAL_SECONDS
+
         # Timeout logic for stalled metadata fetch (avoid libtorrent enum reference)
-        if (not getattr(status, "has_metadata", False)) and (time.monotonic() - start_time > 60):
+        if not (watch.has_metadata or getattr(status, "has_metadata", False)) and (
+            time.monotonic() - start_time > 60
+        ):
             logger.warning(f"Metadata download timed out for {handle.name()}")
             raise TimeoutError("metadata_timeout")
 
-        await asyncio.sleep(1)
+        await watch.wait_for_update(STATUS_UPDATE_TIMEOUT_SECONDS)
+        status = watch.status or status
 
     # Final "100%" update
     await status_callback(handle.status())
@@ -11,6 +11,7 @@ from telegram.helpers import escape_markdown
 
 from telegram_bot.config import PERSISTENCE_FILE, logger
 from telegram_bot.domain.types import BatchMeta, DownloadData, SourceDict
+from telegram_bot.services.torrent_service import get_torrent_resume_store, info_hash_hex
 from telegram_bot.services.tracking.manager import (
     mark_tracking_fulfillment_success,
     mark_tracking_hourly_retry,
@@ -121,16 +122,13 @@ async def download_task_wrapper(download_data: DownloadData, application: Applic
                 save_paths=get_save_paths(application.bot_data),
                 plex_config=get_plex_config(application.bot_data),
                 defer_scan=defer_scan,
+                on_placement_progress=reporter.report_placement,
             )
             message_text = str(post_processing.get("final_message", ""))
             if post_processing.get("succeeded"):
                 # Now that the media file has been moved, we can safely delete the originals.
                 logger.info(f"Removing torrent and deleting original files for: {clean_name}")
-                ses = application.bot_data["TORRENT_SESSION"]
-                handle = download_data.get("handle")
-                if handle and handle.is_valid():
-                    # This flag tells libtorrent to remove the torrent and delete all its files.
-                    ses.remove_torrent(handle, lt.session.delete_files)  # type: ignore
+                _remove_torrent_and_files(application, download_data)
                 # If part of a season batch, update counters and maybe trigger a single scan.
                 message_text = await _update_batch_and_maybe_scan(
                     application,
@@ -165,10 +163,7 @@ async def download_task_wrapper(download_data: DownloadData, application: Applic
             )
 
             # Clean up the stuck torrent
-            ses = application.bot_data["TORRENT_SESSION"]
-            handle = download_data.get("handle")
-            if handle and handle.is_valid():
-                ses.remove_torrent(handle, lt.session.delete_files)
+            _remove_torrent_and_files(application, download_data)
         else:
             logger.error(
                 f"Unexpected TimeoutError in download task for '{clean_name}': {e}",
@@ -193,14 +188,8 @@ async def download_task_wrapper(download_data: DownloadData, application: Applic
                 f"Cancellation cleanup: Removing torrent and deleting files for '{clean_name}'."
             )
 
-            # 2. Get the session and the handle.
-            ses = application.bot_data["TORRENT_SESSION"]
-            handle = download_data.get("handle")
-
-            # 3. Check if the handle is valid before using it.
-            if handle and handle.is_valid():
-                # 4. Use the key libtorrent feature to remove the torrent and its data.
-                ses.remove_torrent(handle, lt.session.delete_files)  # type: ignore
+            # 2. Remove the torrent and its data (and any saved resume state).
+            _remove_torrent_and_files(application, download_data)
 
             message_text = (
                 f"⏹️ *Cancelled*\nDownload has been stopped for:\n`{escape_markdown(clean_name)}`"
@@ -229,6 +218,7 @@ async def download_task_wrapper(download_data: DownloadData, application: Applic
                 message_text,
                 source_dict,
                 initial_save_path,
+                download_id=download_data.get("download_id"),
             )
             await process_queue_for_user(chat_id, application)
 
@@ -327,9 +317,30 @@ async def _update_batch_and_maybe_scan(
         return message_text
 
 
+def _remove_torrent_and_files(application: Application, download_data: DownloadData) -> None:
+    """Removes a torrent with its files from the session and drops its resume data."""
+    handle = download_data.get("handle")
+    if not handle or not handle.is_valid():
+        return
+    get_torrent_resume_store(application.bot_data).discard(info_hash_hex(handle))
+    ses = application.bot_data["TORRENT_SESSION"]
+    # This flag tells libtorrent to remove the torrent and delete all its files.
+    ses.remove_torrent(handle, lt.session.delete_files)  # type: ignore
+
+
+def _release_active_download(
+    active_downloads: dict[str, DownloadData], download_id: str | None, chat_id: int
+) -> None:
+    """Frees the slot held by a download, tolerating legacy per-chat keys."""
+    if download_id is not None:
+        active_downloads.pop(download_id, None)
+    else:
+        active_downloads.pop(str(chat_id), None)
+
+
 async def _requeue_download(download_data: DownloadData, application: Application) -> None:
     """Moves a paused or interrupted download to the back of the queue."""
-    from . import process_queue_for_user, save_state
+    from . import process_queue_for_user, schedule_state_save
 
     chat_id = download_data["chat_id"]
     chat_id_str = str(chat_id)
@@ -358,8 +369,7 @@ async def _requeue_download(download_data: DownloadData, application: Applicatio
         download_queues[chat_id_str] = []
     download_queues[chat_id_str].append(download_data)
 
-    if chat_id_str in active_downloads:
-        del active_downloads[chat_id_str]
+    _release_active_download(active_downloads, download_data.get("download_id"), chat_id)
 
     # If this was a metadata timeout and it's the ONLY item in the queue,
     # wait 60 seconds before letting process_queue_for_user pick it up again.
@@ -367,7 +377,7 @@ async def _requeue_download(download_data: DownloadData, application: Applicatio
         logger.info("Metadata timeout on the only queued item. Waiting 60s before retry.")
         await asyncio.sleep(60)
 
-    save_state(PERSISTENCE_FILE, active_downloads, download_queues)
+    schedule_state_save(PERSISTENCE_FILE, active_downloads, download_queues)
     await process_queue_for_user(chat_id, application)  # Start next in queue
 
 
@@ -378,6 +388,8 @@ async def _finalize_download(
     message_text: str,
     source_dict: SourceDict,
     save_path: str,
+    *,
+    download_id: str | None = None,
 ) -> None:
     """Handles final message sending and resource cleanup."""
     from . import safe_edit_message
@@ -395,7 +407,12 @@ async def _finalize_download(
         logger.warning(f"Could not send final status message: {e}")
 
     cleanup_download_resources(
-        application, chat_id, source_dict["type"], source_dict["value"], save_path
+        application,
+        chat_id,
+        source_dict["type"],
+        source_dict["value"],
+        save_path,
+        download_id=download_id,
     )
 
 
@@ -405,24 +422,28 @@ def cleanup_download_resources(
     source_type: str,
     source_value: str,
     base_save_path: str,
+    *,
+    download_id: str | None = None,
 ):
     """Handles all post-task cleanup of state and files."""
-    from . import save_state
+    from . import schedule_state_save
 
     logger.info(f"Cleaning up resources for task for chat_id {chat_id}.")
 
     active_downloads = get_active_downloads(application.bot_data)
     download_queues = get_download_queues(application.bot_data)
-    if str(chat_id) in active_downloads:
-        del active_downloads[str(chat_id)]
+    _release_active_download(active_downloads, download_id, chat_id)
 
-    save_state(PERSISTENCE_FILE, active_downloads, download_queues)
+    schedule_state_save(PERSISTENCE_FILE, active_downloads, download_queues)
 
     if source_type == "file" and source_value and path_exists(source_value):
         logger.info(f"Deleting temporary .torrent file: {source_value}")
         remove_file(source_value)
 
-    # Clean up leftover .parts files from libtorrent
+    # Clean up leftover .parts files from libtorrent. Torrents that are still
+    # running keep their own .parts files here, so only sweep once all are done.
+    if active_downloads:
+        return
     try:
         for filename in list_dir(base_save_path):
             if filename.endswith(".parts"):
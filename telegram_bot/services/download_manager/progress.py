@@ -6,13 +6,13 @@ from typing import Any
 import libtorrent as lt
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
-from telegram.error import NetworkError, TimedOut
 from telegram.ext import Application
 from telegram.helpers import escape_markdown
 
-from telegram_bot.config import logger
 from telegram_bot.domain.types import DownloadData
+from telegram_bot.services.media_manager.placement import PlacementProgress
 from telegram_bot.ui.messages import BTN_CANCEL, BTN_PAUSE, BTN_RESUME, BTN_STOP_ALL
+from telegram_bot.utils import get_message_edit_scheduler
 
 from .bot_data_access import get_download_queues
 
@@ -38,9 +38,7 @@ class ProgressReporter:
         self.last_update_time: float = 0
 
     async def report(self, status: lt.torrent_status) -> None:  # type: ignore
-        """Formats and sends a progress update message."""
-        from . import safe_edit_message
-
+        """Formats and queues a progress update message."""
         async with self.download_data["lock"]:
             if self.download_data.get("cancellation_pending"):
                 return
@@ -62,22 +60,7 @@ class ProgressReporter:
             speed_str = escape_markdown(f"{speed_mbps:.2f}", version=2)
 
             # --- Build the message content ---
-            if self.parsed_info.get("type") == "tv":
-                s = int(self.parsed_info.get("season", 0) or 0)
-                title_str = escape_markdown(self.parsed_info.get("title", ""), version=2)
-
-                # Season pack handling: show single-line "<Title> Season 01"
-                if self.parsed_info.get("is_season_pack"):
-                    name_str = f"`{title_str} Season {s:02d}`"
-                else:
-                    e = int(self.parsed_info.get("episode", 0) or 0)
-                    ep_title = self.parsed_info.get("episode_title", "")
-                    episode_details_str = escape_markdown(
-                        f"S{s:02d}E{e:02d} - {ep_title}", version=2
-                    )
-                    name_str = f"`{title_str}`\n`{episode_details_str}`"
-            else:
-                name_str = f"`{escape_markdown(self.clean_name, version=2)}`"
+            name_str = self._name_markdown()
 
             header_str = "⏸️ *Paused:*" if is_paused else "⬇️ *Downloading:*"
             state_str = "*paused*" if is_paused else escape_markdown(status.state.name, version=2)
@@ -111,18 +94,54 @@ class ProgressReporter:
 
             reply_markup = InlineKeyboardMarkup([controls_row])
 
-            # --- FIX: Add a try/except block to prevent UI errors from crashing the download ---
-            try:
-                await safe_edit_message(
-                    self.application.bot,
-                    chat_id=self.chat_id,
-                    message_id=self.message_id,
-                    text=message_text,
-                    parse_mode=ParseMode.MARKDOWN_V2,
-                    reply_markup=reply_markup,
-                )
-            except (TimedOut, NetworkError) as e:
-                logger.warning(
-                    f"Failed to send progress update due to a network error: {e}. "
-                    "The download will continue in the background."
-                )
+            # Queued rather than awaited: the scheduler coalesces edits across
+            # downloads and keeps them within Telegram's flood limits.
+            get_message_edit_scheduler().enqueue(
+                self.application.bot,
+                chat_id=self.chat_id,
+                message_id=self.message_id,
+                text=message_text,
+                parse_mode=ParseMode.MARKDOWN_V2,
+                reply_markup=reply_markup,
+            )
+
+    async def report_placement(self, progress: PlacementProgress) -> None:
+        """Shows library placement progress once the torrent itself has finished."""
+        async with self.download_data["lock"]:
+            if self.download_data.get("cancellation_pending"):
+                return
+
+            progress_str = escape_markdown(f"{progress.fraction * 100:.2f}", version=2)
+            speed_str = escape_markdown(f"{progress.bytes_per_second / 1024 / 1024:.2f}", version=2)
+            method_str = escape_markdown(progress.strategy, version=2)
+            message_text = (
+                f"📦 *Moving to library:*\n{self._name_markdown()}\n"
+                f"*Progress:* {progress_str}%\n"
+                f"*Speed:* {speed_str} MB/s\n"
+                f"*Method:* {method_str}"
+            )
+            reply_markup = InlineKeyboardMarkup(
+                [[InlineKeyboardButton(BTN_CANCEL, callback_data="cancel_download")]]
+            )
+            get_message_edit_scheduler().enqueue(
+                self.application.bot,
+                chat_id=self.chat_id,
+                message_id=self.message_id,
+                text=message_text,
+                parse_mode=ParseMode.MARKDOWN_V2,
+                reply_markup=reply_markup,
+            )
+
+    def _name_markdown(self) -> str:
+        if self.parsed_info.get("type") == "tv":
+            s = int(self.parsed_info.get("season", 0) or 0)
+            title_str = escape_markdown(self.parsed_info.get("title", ""), version=2)
+
+            # Season pack handling: show single-line "<Title> Season 01"
+            if self.parsed_info.get("is_season_pack"):
+                return f"`{title_str} Season {s:02d}`"
+            e = int(self.parsed_info.get("episode", 0) or 0)
+            ep_title = self.parsed_info.get("episode_title", "")
+            episode_details_str = escape_markdown(f"S{s:02d}E{e:02d} - {ep_title}", version=2)
+            return f"`{title_str}`\n`{episode_details_str}`"
+        return f"`{escape_markdown(self.clean_name, version=2)}`"
@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+import uuid
 from typing import Any, cast
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
@@ -27,7 +28,9 @@ from telegram_bot.utils import sanitize_collection_name
 
 from .bot_data_access import (
     get_active_downloads,
+    get_chat_active_downloads,
     get_download_queues,
+    get_download_slot_limits,
     get_or_create_download_batches,
     get_plex_config,
     require_active_downloads,
@@ -77,51 +80,115 @@ async def _run_owned_collection_finalization(
         logger.exception("[COLLECTION] Owned-only collection finalization failed.")
 
 
+def _count_running_downloads(downloads: list[DownloadData]) -> int:
+    """Counts downloads holding a slot; requeued ones are already on their way out."""
+    return sum(1 for download_data in downloads if not download_data.get("requeued"))
+
+
+def _has_free_download_slot(bot_data: dict[str, Any], chat_id_str: str) -> bool:
+    """Returns True when a newly queued download for this chat could start right away."""
+    per_chat_limit, global_limit = get_download_slot_limits(bot_data)
+    running_total = _count_running_downloads(list(get_active_downloads(bot_data).values()))
+    running_for_chat = _count_running_downloads(get_chat_active_downloads(bot_data, chat_id_str))
+    return running_total < global_limit and running_for_chat < per_chat_limit
+
+
+def _requeue_paused_downloads_if_full(bot_data: dict[str, Any], chat_id_str: str) -> None:
+    """Frees the chat's slots held by paused downloads so new work can start."""
+    if _has_free_download_slot(bot_data, chat_id_str):
+        return
+    for active_data in get_chat_active_downloads(bot_data, chat_id_str):
+        if not active_data.get("is_paused") or active_data.get("requeued"):
+            continue
+        logger.info("New download added while slots are held by paused downloads. Requeueing.")
+        active_data["requeued"] = True
+        if "task" in active_data and not active_data["task"].done():
+            active_data["task"].cancel()
+
+
 async def process_queue_for_user(chat_id: int, application) -> None:
     """
-    Checks and processes the download queue for a user.
+    Starts queued downloads for a user while free download slots remain.
     This is the single authority for starting a download from the queue.
+
+    Once the user's own queue is drained or its per-chat limit is reached, any
+    spare global slots are handed to other chats that were waiting on them.
     """
     from . import _start_download_task
 
-    chat_id_str = str(chat_id)
-    active_downloads = get_active_downloads(application.bot_data)
-    download_queues = get_download_queues(application.bot_data)
+    bot_data = application.bot_data
+    active_downloads = get_active_downloads(bot_data)
+    download_queues = get_download_queues(bot_data)
+    per_chat_limit, global_limit = get_download_slot_limits(bot_data)
 
-    if chat_id_str in active_downloads:
-        return  # A download is already active, do nothing.
+    own_chat_id_str = str(chat_id)
+    chat_order = [own_chat_id_str] + [key for key in download_queues if key != own_chat_id_str]
 
-    if chat_id_str in download_queues and download_queues[chat_id_str]:
-        logger.info(f"No active download for {chat_id_str}. Starting next from queue.")
+    for chat_id_str in chat_order:
+        while download_queues.get(chat_id_str):
+            if _count_running_downloads(list(active_downloads.values())) >= global_limit:
+                return
+            chat_downloads = get_chat_active_downloads(bot_data, chat_id_str)
+            if _count_running_downloads(chat_downloads) >= per_chat_limit:
+                break
 
-        next_download_data = download_queues[chat_id_str].pop(0)
-        if not download_queues[chat_id_str]:
-            del download_queues[chat_id_str]
+            logger.info(f"Free download slot for {chat_id_str}. Starting next from queue.")
+            next_download_data = download_queues[chat_id_str].pop(0)
+            if not download_queues[chat_id_str]:
+                del download_queues[chat_id_str]
 
-        await _start_download_task(next_download_data, application)
+            await _start_download_task(next_download_data, application)
 
 
 async def _start_download_task(download_data: DownloadData, application) -> None:
     """Creates, registers, and persists a new download task."""
-    from . import download_task_wrapper, safe_edit_message, save_state
+    from . import download_task_wrapper, safe_edit_message, safe_send_message, schedule_state_save
 
     active_downloads = get_active_downloads(application.bot_data)
     download_queues = get_download_queues(application.bot_data)
     chat_id_str = str(download_data["chat_id"])
 
+    # Build initial controls and include "Stop" if queue exists for this user
+    controls_row = [InlineKeyboardButton(BTN_CANCEL_DOWNLOAD, callback_data="cancel_download")]
+    if download_queues.get(chat_id_str):
+        controls_row.append(InlineKeyboardButton(BTN_STOP_ALL, callback_data="cancel_all"))
+    reply_markup = InlineKeyboardMarkup([controls_row])
+
+    # Batch downloads share the confirmation message. Running side by side, each
+    # one needs its own progress message so the controls address a single download.
+    shares_message = any(
+        other.get("message_id") == download_data["message_id"]
+        for other in get_chat_active_downloads(application.bot_data, chat_id_str)
+    )
+
+    # Claim the slot before any network I/O so concurrent queue passes see it.
+    download_id = download_data.get("download_id") or uuid.uuid4().hex[:12]
+    download_data["download_id"] = download_id
     download_data["lock"] = asyncio.Lock()
+    active_downloads[download_id] = download_data
+
+    if shares_message:
+        try:
+            message = await safe_send_message(
+                application.bot,
+                chat_id=download_data["chat_id"],
+                text=MSG_STARTING_DOWNLOAD,
+                parse_mode=ParseMode.MARKDOWN_V2,
+                reply_markup=reply_markup,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not send a separate progress message: %s", exc)
+            shares_message = False
+        else:
+            download_data["message_id"] = message.message_id
+
     task = asyncio.create_task(download_task_wrapper(download_data, application))
     download_data["task"] = task
-    active_downloads[chat_id_str] = download_data
 
-    save_state(PERSISTENCE_FILE, active_downloads, download_queues)
+    schedule_state_save(PERSISTENCE_FILE, active_downloads, download_queues)
 
-    # Build initial controls and include "Stop" if queue exists for this user
-    controls_row = [InlineKeyboardButton(BTN_CANCEL_DOWNLOAD, callback_data="cancel_download")]
-    dq = get_download_queues(application.bot_data)
-    if dq.get(chat_id_str):
-        controls_row.append(InlineKeyboardButton(BTN_STOP_ALL, callback_data="cancel_all"))
-    reply_markup = InlineKeyboardMarkup([controls_row])
+    if shares_message:
+        return
     await safe_edit_message(
         application.bot,
         chat_id=download_data["chat_id"],
@@ -147,7 +214,7 @@ async def queue_download_source(
     - started_download: True when queue processing can start this item immediately.
     - position: queue position after enqueueing.
     """
-    from . import process_queue_for_user, save_state
+    from . import process_queue_for_user, schedule_state_save
 
     bot_data = application.bot_data
     active_downloads = cast(dict[str, DownloadData], bot_data.setdefault("active_downloads", {}))
@@ -164,13 +231,9 @@ async def queue_download_source(
 
     chat_id_str = str(chat_id)
 
-    # If a currently active download is paused, requeue it.
-    if chat_id_str in active_downloads and active_downloads[chat_id_str].get("is_paused"):
-        logger.info("New download added while another is paused. Requeueing the paused one.")
-        active_data = active_downloads[chat_id_str]
-        active_data["requeued"] = True
-        if "task" in active_data and not active_data["task"].done():
-            active_data["task"].cancel()
+    # If every slot for this chat is held by paused downloads, requeue them.
+    _requeue_paused_downloads_if_full(bot_data, chat_id_str)
+    started_download = _has_free_download_slot(bot_data, chat_id_str)
 
     download_data: DownloadData = {
         "source_dict": source_dict,
@@ -184,12 +247,7 @@ async def queue_download_source(
     download_queues[chat_id_str].append(download_data)
     position = len(download_queues[chat_id_str])
 
-    is_truly_active = chat_id_str in active_downloads and not active_downloads[chat_id_str].get(
-        "requeued"
-    )
-    started_download = not is_truly_active
-
-    save_state(PERSISTENCE_FILE, active_downloads, download_queues)
+    schedule_state_save(PERSISTENCE_FILE, active_downloads, download_queues)
     await process_queue_for_user(chat_id, application)
     return started_download, position
 
@@ -237,7 +295,7 @@ async def add_download_to_queue(update, context) -> bool:
 
 async def add_season_to_queue(update, context) -> bool:
     """Adds an entire season's torrents to the queue."""
-    from . import process_queue_for_user, safe_edit_message, save_state
+    from . import process_queue_for_user, safe_edit_message, schedule_state_save
 
     query = update.callback_query
     chat_id = query.message.chat_id
@@ -254,15 +312,8 @@ async def add_season_to_queue(update, context) -> bool:
     active_downloads = require_active_downloads(context.bot_data)
     download_queues = require_download_queues(context.bot_data)
     chat_id_str = str(chat_id)
-    had_active_download = chat_id_str in active_downloads and not active_downloads[chat_id_str].get(
-        "requeued"
-    )
-
-    if chat_id_str in active_downloads and active_downloads[chat_id_str].get("is_paused"):
-        active_data = active_downloads[chat_id_str]
-        active_data["requeued"] = True
-        if "task" in active_data and not active_data["task"].done():
-            active_data["task"].cancel()
+    _requeue_paused_downloads_if_full(context.bot_data, chat_id_str)
+    has_free_slot = _has_free_download_slot(context.bot_data, chat_id_str)
 
     save_paths = require_save_paths(context.bot_data)
     if chat_id_str not in download_queues:
@@ -323,14 +374,14 @@ async def add_season_to_queue(update, context) -> bool:
         parse_mode=ParseMode.MARKDOWN_V2,
         reply_markup=None,
     )
-    save_state(PERSISTENCE_FILE, active_downloads, download_queues)
+    schedule_state_save(PERSISTENCE_FILE, active_downloads, download_queues)
     await process_queue_for_user(chat_id, context.application)
-    return (not had_active_download) and added > 0
+    return has_free_slot and added > 0
 
 
 async def add_collection_to_queue(update, context) -> bool:
     """Queues all pending collection downloads."""
-    from . import process_queue_for_user, safe_edit_message, save_state
+    from . import process_queue_for_user, safe_edit_message, schedule_state_save
 
     query = update.callback_query
     chat_id = query.message.chat_id
@@ -361,15 +412,8 @@ async def add_collection_to_queue(update, context) -> bool:
     active_downloads = require_active_downloads(context.bot_data)
     download_queues = require_download_queues(context.bot_data)
     chat_id_str = str(chat_id)
-    had_active_download = chat_id_str in active_downloads and not active_downloads[chat_id_str].get(
-        "requeued"
-    )
-
-    if chat_id_str in active_downloads and active_downloads[chat_id_str].get("is_paused"):
-        active_data = active_downloads[chat_id_str]
-        active_data["requeued"] = True
-        if "task" in active_data and not active_data["task"].done():
-            active_data["task"].cancel()
+    _requeue_paused_downloads_if_full(context.bot_data, chat_id_str)
+    has_free_slot = _has_free_download_slot(context.bot_data, chat_id_str)
 
     save_paths = require_save_paths(context.bot_data)
     if chat_id_str not in download_queues:
@@ -446,9 +490,9 @@ async def add_collection_to_queue(update, context) -> bool:
         parse_mode=ParseMode.MARKDOWN_V2,
         reply_markup=None,
     )
-    save_state(PERSISTENCE_FILE, active_downloads, download_queues)
+    schedule_state_save(PERSISTENCE_FILE, active_downloads, download_queues)
     await process_queue_for_user(chat_id, context.application)
-    return (not had_active_download) and len(items) > 0
+    return has_free_slot and len(items) > 0
 
 
 async def _finalize_owned_collection_batch(
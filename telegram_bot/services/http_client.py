@@ -0,0 +1,181 @@
+# telegram_bot/services/http_client.py
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import urllib.parse
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+import httpx
+
+from telegram_bot.config import logger
+
+HTTP_CLIENTS_KEY = "HTTP_CLIENTS"
+HTTP_DEFAULT_TIMEOUT_SECONDS = 30.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 10.0
+HTTP_MAX_CONNECTIONS_PER_HOST = 8
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# HTTP/2 is negotiated via ALPN, so hosts without it transparently stay on HTTP/1.1.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """
+    Application-scoped pool of `httpx.AsyncClient`s, one per origin.
+
+    Keeping a client per scheme/host/port gives every host its own keep-alive
+    pool and connection cap, so bursts of requests to one indexer reuse a few
+    TLS connections and cannot starve requests to TMDB or Wikipedia. Clients
+    opened on an earlier event loop are retired when the loop changes and
+    closed on that loop if it is still running, otherwise by `aclose`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        timeout: float = HTTP_DEFAULT_TIMEOUT_SECONDS,
+        http2: bool = True,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(timeout, connect=min(timeout, HTTP_CONNECT_TIMEOUT_SECONDS))
+        self._http2 = http2 and _HTTP2_AVAILABLE
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._retired: list[httpx.AsyncClient] = []
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Returns the pooled client for the origin of `url`."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Connection pools are bound to the loop that opened them.
+            self._retire_clients(self._loop)
+            self._loop = loop
+        origin = _origin(url)
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                timeout=self._timeout,
+            )
+            self._clients[origin] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients = [*self._retired, *self._clients.values()]
+        self._retired, self._clients = [], {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("[HTTP] Failed to close pooled client: %s", exc)
+
+    def _retire_clients(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        clients = [client for client in self._clients.values() if not client.is_closed]
+        self._clients = {}
+        if not clients:
+            return
+        logger.info("[HTTP] Event loop changed; retiring %d pooled client(s).", len(clients))
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            for client in clients:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        self._retired.extend(clients)
+
+
+class PooledHttpClient:
+    """
+    Per-call defaults layered over a shared pooled client.
+
+    Usable as an async context manager like `httpx.AsyncClient`; leaving the
+    block does not close the underlying pool.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        timeout: float | None,
+        follow_redirects: bool,
+    ) -> None:
+        self._client = client
+        self._timeout = timeout
+        self._follow_redirects = follow_redirects
+
+    async def __aenter__(self) -> PooledHttpClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        kwargs.setdefault("follow_redirects", self._follow_redirects)
+        return await self._client.get(url, **kwargs)
+
+    def stream(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AbstractAsyncContextManager[httpx.Response]:
+        """Streams a response body; use as `async with client.stream(...) as response`."""
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        kwargs.setdefault("follow_redirects", self._follow_redirects)
+        return self._client.stream(method, url, **kwargs)
+
+
+_default_registry: HttpClientRegistry | None = None
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Returns the process-wide registry, creating one if `post_init` has not run."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = HttpClientRegistry()
+    return _default_registry
+
+
+def open_http_clients(bot_data: dict[str, Any]) -> HttpClientRegistry:
+    """Installs a fresh registry for the application and records it in `bot_data`."""
+    global _default_registry
+    registry = HttpClientRegistry()
+    _default_registry = registry
+    bot_data[HTTP_CLIENTS_KEY] = registry
+    return registry
+
+
+async def close_http_clients(bot_data: dict[str, Any]) -> None:
+    global _default_registry
+    registry = bot_data.pop(HTTP_CLIENTS_KEY, None)
+    if isinstance(registry, HttpClientRegistry):
+        await registry.aclose()
+        if _default_registry is registry:
+            _default_registry = None
+
+
+def shared_http_client(
+    url: str,
+    *,
+    timeout: float | None = None,
+    follow_redirects: bool = False,
+) -> PooledHttpClient:
+    """Returns a pooled client for requests to the host of `url`."""
+    return PooledHttpClient(
+        get_http_client_registry().client_for(url),
+        timeout=timeout,
+        follow_redirects=follow_redirects,
+    )
+
+
+def _origin(url: str) -> str:
+    parsed = urllib.parse.urlsplit(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
@@ -0,0 +1,286 @@
+# telegram_bot/services/library_index.py
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from telegram_bot.config import logger
+
+LIBRARY_INDEX_WARMUP_TASK_KEY = "LIBRARY_INDEX_WARMUP_TASK"
+LIBRARY_INDEX_REVALIDATE_SECONDS = 30.0
+
+_EPISODE_TOKEN_PATTERN = re.compile(r"(?i)\bS(\d{1,2})E(\d{1,2})\b")
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Snapshot of one directory's entries, keyed to the mtime it was read at."""
+
+    path: str
+    mtime_ns: int
+    dirs: tuple[str, ...]
+    files: tuple[str, ...]
+    # Symlinked directories are listed like os.walk does but never descended into.
+    linked_dirs: frozenset[str] = frozenset()
+    _episodes: dict[tuple[int, int], str] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+
+    def episodes(self) -> dict[tuple[int, int], str]:
+        """Maps `(season, episode)` parsed from SxxEyy file names to file paths."""
+        if not self._episodes and self.files:
+            for name in self.files:
+                match = _EPISODE_TOKEN_PATTERN.search(name)
+                if match is None:
+                    continue
+                token = (int(match.group(1)), int(match.group(2)))
+                self._episodes.setdefault(token, os.path.join(self.path, name))
+        return self._episodes
+
+
+class LibraryIndex:
+    """
+    Cached directory listings for the media library roots.
+
+    Lookups are served from snapshots instead of re-listing the NAS on every
+    search. A snapshot is re-checked against its directory's mtime at most once
+    per `revalidate_after` seconds and rescanned only when the mtime moved.
+    Post-processing and delete flows report their changes through
+    `record_added()` / `record_removed()` so the index stays current without
+    a rescan.
+    """
+
+    def __init__(
+        self,
+        *,
+        revalidate_after: float = LIBRARY_INDEX_REVALIDATE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._revalidate_after = revalidate_after
+        self._clock = clock
+        self._listings: dict[str, DirectoryListing] = {}
+        self._checked_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def listing(self, path: str) -> DirectoryListing | None:
+        """Returns the entries of directory `path`, or None if it is not a directory."""
+        key = os.path.abspath(path)
+        cached = self._listings.get(key)
+        now = self._clock()
+        if cached is not None and now - self._checked_at.get(key, 0.0) < self._revalidate_after:
+            return cached
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except OSError:
+            self._forget(key)
+            return None
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            self._checked_at[key] = now
+            return cached
+        return self._scan(key, mtime_ns, now)
+
+    def is_dir(self, path: str) -> bool:
+        key = os.path.abspath(path)
+        parent_key = os.path.dirname(key)
+        if parent_key in self._listings and parent_key != key:
+            parent = self.listing(parent_key)
+            return parent is not None and os.path.basename(key) in parent.dirs
+        return self.listing(key) is not None
+
+    def list_dir(self, path: str) -> list[str]:
+        listing = self.listing(path)
+        if listing is None:
+            raise FileNotFoundError(path)
+        return [*listing.dirs, *listing.files]
+
+    def walk(self, root: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        """Top-down `os.walk` equivalent served from cached listings.
+
+        Like `os.walk`, callers may prune `dirs` in place to skip subtrees.
+        """
+        pending = [root]
+        while pending:
+            current = pending.pop()
+            listing = self.listing(current)
+            if listing is None:
+                continue
+            dirs = list(listing.dirs)
+            yield current, dirs, list(listing.files)
+            pending.extend(
+                os.path.join(current, name)
+                for name in reversed(dirs)
+                if name not in listing.linked_dirs
+            )
+
+    def episodes(self, directory: str) -> dict[tuple[int, int], str]:
+        listing = self.listing(directory)
+        return listing.episodes() if listing is not None else {}
+
+    def warm(self, roots: Iterable[str]) -> int:
+        """Walks `roots` once to populate the index. Returns the directories indexed."""
+        for root in roots:
+            for _ in self.walk(root):
+                pass
+        return len(self._listings)
+
+    def record_added(self, path: str) -> None:
+        """Adds `path` and any newly created parents to their cached parent listings."""
+        key = os.path.abspath(path)
+        is_directory = os.path.isdir(key)
+        with self._lock:
+            while True:
+                parent_key = os.path.dirname(key)
+                if parent_key == key:
+                    return
+                parent = self._listings.get(parent_key)
+                if parent is None:
+                    # Uncached parents are scanned on first use; keep climbing.
+                    key, is_directory = parent_key, True
+                    continue
+                name = os.path.basename(key)
+                if name in parent.dirs or name in parent.files:
+                    self._refresh_mtime(parent)
+                    return
+                dirs, files = parent.dirs, parent.files
+                if is_directory:
+                    dirs = (*dirs, name)
+                else:
+                    files = (*files, name)
+                self._listings[parent_key] = self._replace(parent, dirs=dirs, files=files)
+                key, is_directory = parent_key, True
+
+    def record_removed(self, path: str) -> None:
+        """Drops `path` from its parent listing and forgets anything cached below it."""
+        key = os.path.abspath(path)
+        with self._lock:
+            parent_key = os.path.dirname(key)
+            parent = self._listings.get(parent_key)
+            if parent is not None:
+                name = os.path.basename(key)
+                self._listings[parent_key] = self._replace(
+                    parent,
+                    dirs=tuple(entry for entry in parent.dirs if entry != name),
+                    files=tuple(entry for entry in parent.files if entry != name),
+                )
+        self._forget(key)
+
+    def record_moved(self, source: str, destination: str) -> None:
+        self.record_removed(source)
+        self.record_added(destination)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+            self._checked_at.clear()
+
+    def _scan(self, key: str, mtime_ns: int, now: float) -> DirectoryListing | None:
+        dirs: list[str] = []
+        files: list[str] = []
+        linked_dirs: set[str] = set()
+        try:
+            with os.scandir(key) as entries:
+                for entry in entries:
+                    try:
+                        entry_is_dir = entry.is_dir()
+                    except OSError:
+                        entry_is_dir = False
+                    if not entry_is_dir:
+                        files.append(entry.name)
+                        continue
+                    dirs.append(entry.name)
+                    if entry.is_symlink():
+                        linked_dirs.add(entry.name)
+        except OSError as exc:
+            logger.debug("[LIBRARY] Could not list '%s': %s", key, exc)
+            self._forget(key)
+            return None
+
+        listing = DirectoryListing(
+            path=key,
+            mtime_ns=mtime_ns,
+            dirs=tuple(sorted(dirs)),
+            files=tuple(sorted(files)),
+            linked_dirs=frozenset(linked_dirs),
+        )
+        with self._lock:
+            self._listings[key] = listing
+            self._checked_at[key] = now
+        return listing
+
+    def _replace(
+        self,
+        listing: DirectoryListing,
+        *,
+        dirs: tuple[str, ...],
+        files: tuple[str, ...],
+    ) -> DirectoryListing:
+        return DirectoryListing(
+            path=listing.path,
+            mtime_ns=self._current_mtime(listing.path, listing.mtime_ns),
+            dirs=dirs,
+            files=files,
+            linked_dirs=listing.linked_dirs,
+        )
+
+    def _refresh_mtime(self, listing: DirectoryListing) -> None:
+        self._listings[listing.path] = self._replace(
+            listing, dirs=listing.dirs, files=listing.files
+        )
+
+    def _current_mtime(self, path: str, fallback: int) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return fallback
+
+    def _forget(self, key: str) -> None:
+        prefix = key.rstrip(os.sep) + os.sep
+        with self._lock:
+            for cached_key in [
+                cached for cached in self._listings if cached == key or cached.startswith(prefix)
+            ]:
+                self._listings.pop(cached_key, None)
+                self._checked_at.pop(cached_key, None)
+
+
+_default_index: LibraryIndex | None = None
+
+
+def get_library_index() -> LibraryIndex:
+    """Returns the process-wide library index, creating it on first use."""
+    global _default_index
+    if _default_index is None:
+        _default_index = LibraryIndex()
+    return _default_index
+
+
+def start_library_index_warmup(bot_data: dict[str, Any]) -> asyncio.Task[int] | None:
+    """Indexes the configured movie and TV roots in the background at startup."""
+    save_paths = bot_data.get("SAVE_PATHS") or {}
+    roots = [
+        root
+        for root in dict.fromkeys(save_paths.get(key) for key in ("movies", "tv_shows"))
+        if isinstance(root, str) and root
+    ]
+    if not roots:
+        return None
+
+    async def _warm() -> int:
+        started = time.monotonic()
+        count = await asyncio.to_thread(get_library_index().warm, roots)
+        logger.info("[LIBRARY] Indexed %d directories in %.1fs.", count, time.monotonic() - started)
+        return count
+
+    task = asyncio.create_task(_warm())
+    bot_data[LIBRARY_INDEX_WARMUP_TASK_KEY] = task
+    return task
@@ -10,10 +10,6 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def move_file(source: str, destination: str) -> None:
-    shutil.move(source, destination)
-
-
 def get_path_size_bytes(path: str) -> int:
     return os.path.getsize(path)
 
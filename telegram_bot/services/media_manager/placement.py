@@ -0,0 +1,249 @@
+# telegram_bot/services/media_manager/placement.py
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import os
+import shutil
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from telegram_bot.config import logger
+
+PlacementStrategy = Literal["rename", "reflink", "copy_file_range", "copy"]
+
+PLACEMENT_CHUNK_BYTES = 8 * 1024 * 1024
+PLACEMENT_PROGRESS_INTERVAL_SECONDS = 2.0
+
+# Linux FICLONE ioctl: clone the whole file on btrfs/XFS/bcachefs without copying.
+_FICLONE = 0x40049409
+# Errors meaning "this strategy is unavailable here", so the next one is tried.
+_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EACCES,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EMLINK,
+    errno.EBADF,
+}
+
+
+class PlacementCancelled(Exception):
+    """Raised when a copy is cancelled; the partial destination has been removed."""
+
+
+@dataclass(frozen=True)
+class PlacementProgress:
+    strategy: PlacementStrategy
+    copied_bytes: int
+    total_bytes: int
+    bytes_per_second: float
+
+    @property
+    def fraction(self) -> float:
+        return self.copied_bytes / self.total_bytes if self.total_bytes else 1.0
+
+
+@dataclass(frozen=True)
+class PlacementResult:
+    strategy: PlacementStrategy
+    size_bytes: int
+    elapsed_seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.size_bytes / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def place_file(
+    source: str,
+    destination: str,
+    *,
+    progress: Callable[[PlacementProgress], None] | None = None,
+    cancel_event: threading.Event | None = None,
+    chunk_size: int = PLACEMENT_CHUNK_BYTES,
+) -> PlacementResult:
+    """
+    Places `source` at `destination` using the cheapest strategy that works.
+
+    An atomic rename is tried first. Across filesystems the file is cloned
+    (FICLONE), copied in-kernel (`copy_file_range`) or copied in chunks into
+    a `.partial` file. The copy's size is checked before it replaces
+    `destination` and before the source is removed.
+    """
+    started = time.monotonic()
+    total_bytes = os.path.getsize(source)
+
+    def _result(strategy: PlacementStrategy) -> PlacementResult:
+        return PlacementResult(strategy, total_bytes, time.monotonic() - started)
+
+    if _try_rename(source, destination):
+        return _result("rename")
+
+    partial_path = f"{destination}.partial"
+    try:
+        strategy = _copy_into(
+            source,
+            partial_path,
+            total_bytes,
+            progress=progress,
+            cancel_event=cancel_event,
+            chunk_size=chunk_size,
+        )
+        copied_bytes = os.path.getsize(partial_path)
+        if copied_bytes != total_bytes:
+            raise OSError(
+                errno.EIO,
+                f"Size mismatch after copy ({copied_bytes} of {total_bytes} bytes)",
+                destination,
+            )
+        try:
+            shutil.copystat(source, partial_path)
+        except OSError:
+            pass
+        os.replace(partial_path, destination)
+    except BaseException:
+        _remove_quietly(partial_path)
+        raise
+
+    os.remove(source)
+    return _result(strategy)
+
+
+async def place_file_async(
+    source: str,
+    destination: str,
+    *,
+    on_progress: Callable[[PlacementProgress], Awaitable[None]] | None = None,
+    progress_interval: float = PLACEMENT_PROGRESS_INTERVAL_SECONDS,
+) -> PlacementResult:
+    """
+    Runs `place_file` in a worker thread, forwarding progress to `on_progress`.
+
+    Progress is sampled every `progress_interval` seconds. Cancelling the
+    awaiting task stops an in-flight copy at the next chunk.
+    """
+    latest: PlacementProgress | None = None
+
+    def _record(snapshot: PlacementProgress) -> None:
+        nonlocal latest
+        latest = snapshot
+
+    cancel_event = threading.Event()
+    worker = asyncio.ensure_future(
+        asyncio.to_thread(
+            place_file,
+            source,
+            destination,
+            progress=_record if on_progress is not None else None,
+            cancel_event=cancel_event,
+        )
+    )
+    reported: PlacementProgress | None = None
+    try:
+        while True:
+            done, _ = await asyncio.wait({worker}, timeout=progress_interval)
+            if done:
+                return worker.result()
+            if on_progress is not None and latest is not None and latest is not reported:
+                reported = latest
+                try:
+                    await on_progress(reported)
+                except Exception as exc:  # noqa: BLE001
+                    logger.debug("[PLACEMENT] Progress callback failed: %s", exc)
+    except asyncio.CancelledError:
+        cancel_event.set()
+        # The worker removes its partial file before it exits.
+        await asyncio.gather(worker, return_exceptions=True)
+        raise
+
+
+def _try_rename(source: str, destination: str) -> bool:
+    try:
+        os.replace(source, destination)
+    except OSError as exc:
+        if exc.errno not in _FALLBACK_ERRNOS:
+            raise
+        return False
+    return True
+
+
+def _copy_into(
+    source: str,
+    target: str,
+    total_bytes: int,
+    *,
+    progress: Callable[[PlacementProgress], None] | None,
+    cancel_event: threading.Event | None,
+    chunk_size: int,
+) -> PlacementStrategy:
+    started = time.monotonic()
+
+    def _report(strategy: PlacementStrategy, copied: int) -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            raise PlacementCancelled(target)
+        if progress is not None:
+            elapsed = time.monotonic() - started
+            progress(
+                PlacementProgress(
+                    strategy, copied, total_bytes, copied / elapsed if elapsed > 0 else 0.0
+                )
+            )
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        if _try_clone(src.fileno(), dst.fileno()):
+            _report("reflink", total_bytes)
+            return "reflink"
+
+        strategy: PlacementStrategy = "copy_file_range"
+        copied = 0
+        while copied < total_bytes:
+            _report(strategy, copied)
+            if strategy == "copy_file_range":
+                try:
+                    written = os.copy_file_range(src.fileno(), dst.fileno(), chunk_size)
+                except (AttributeError, OSError) as exc:
+                    if isinstance(exc, OSError) and exc.errno not in _FALLBACK_ERRNOS:
+                        raise
+                    strategy = "copy"
+                    src.seek(copied)
+                    dst.seek(copied)
+                    continue
+            else:
+                chunk = src.read(chunk_size)
+                written = dst.write(chunk) if chunk else 0
+            if written == 0:
+                break
+            copied += written
+        _report(strategy, copied)
+        return strategy
+
+
+def _try_clone(source_fd: int, target_fd: int) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+    try:
+        fcntl.ioctl(target_fd, _FICLONE, source_fd)
+    except OSError as exc:
+        if exc.errno not in _FALLBACK_ERRNOS:
+            raise
+        return False
+    return True
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        logger.warning("[PLACEMENT] Could not remove partial file '%s': %s", path, exc)
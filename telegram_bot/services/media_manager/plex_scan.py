@@ -6,8 +6,8 @@ from plexapi.exceptions import NotFound, Unauthorized
 from telegram.helpers import escape_markdown
 
 from telegram_bot.config import logger
-from telegram_bot.services.interfaces import PlexClient, PlexClientFactory
-from telegram_bot.services.plex_adapters import create_plex_client
+from telegram_bot.services.interfaces import PlexClientFactory
+from telegram_bot.services.plex_session import PlexUnavailableError, get_plex_session
 
 
 async def _trigger_plex_scan(
@@ -37,16 +37,17 @@ async def _trigger_plex_scan(
         return ""
 
     logger.info(f"Attempting to scan '{library_name}' library in Plex...")
+    plex_session = get_plex_session()
     try:
         # Run blocking PlexAPI calls in a separate thread
-        plex: PlexClient = await asyncio.to_thread(
-            create_plex_client,
-            plex_config["url"],
-            plex_config["token"],
-            plex_client_factory,
+        target_library = await asyncio.to_thread(
+            plex_session.section, plex_config, library_name, plex_client_factory
         )
-        target_library = await asyncio.to_thread(plex.library.section, library_name)
-        await asyncio.to_thread(target_library.update)
+        try:
+            await asyncio.to_thread(target_library.update)
+        except Exception as exc:
+            plex_session.record_failure(exc)
+            raise
 
         logger.info(f"Successfully triggered Plex scan for '{library_name}'.")
         return (
@@ -57,6 +58,7 @@ async def _trigger_plex_scan(
         error_map = {
             Unauthorized: "Plex token is invalid.",
             NotFound: f"Plex library '{library_name}' not found.",
+            PlexUnavailableError: "Plex is unreachable; skipped while it cools down.",
         }
         reason = error_map.get(type(e), f"An unexpected error occurred: {e}")
         logger.error(f"Plex scan failed: {reason}")
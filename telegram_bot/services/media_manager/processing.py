@@ -2,24 +2,50 @@
 
 import asyncio
 import os
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 import libtorrent as lt
 from telegram.helpers import escape_markdown
 
 from telegram_bot.config import ALLOWED_EXTENSIONS, logger
-from telegram_bot.domain.types import PostProcessingResult
-from telegram_bot.services.scraping_service import fetch_episode_title_from_wikipedia
+from telegram_bot.domain.types import PlacementReport, PostProcessingResult
+from telegram_bot.services.library_index import get_library_index
+from telegram_bot.services.scraping_service import (
+    fetch_episode_title_from_wikipedia,
+    fetch_episode_titles_for_season,
+)
 from telegram_bot.ui.messages import format_media_summary
 from telegram_bot.utils import format_bytes, parse_torrent_name
 
 from . import adapters
 from .naming import _build_media_display_name, generate_plex_filename
 from .paths import _get_disk_usage_percent, _get_final_destination_path, _get_path_size_bytes
+from .placement import (
+    PLACEMENT_PROGRESS_INTERVAL_SECONDS,
+    PlacementProgress,
+    PlacementResult,
+    PlacementStrategy,
+    place_file_async,
+)
 from .plex_scan import _trigger_plex_scan
 from .validation import select_primary_media_file
 
 LOW_FREE_SPACE_USAGE_THRESHOLD_PERCENT = 85
+# Moves on one filesystem are renames; the cap matters for cross-device copies,
+# where a few parallel streams keep a NAS busy without thrashing its disks.
+SEASON_PACK_PLACEMENT_CONCURRENCY = 3
+
+
+@dataclass(frozen=True)
+class _PlannedMove:
+    source: str
+    destination: str
+    destination_directory: str
+    episode: int
+    size_bytes: int
 
 
 def _coerce_year(raw_year: Any) -> int | None:
@@ -38,11 +64,32 @@ async def handle_successful_download(
     plex_config: dict[str, str] | None,
     *,
     defer_scan: bool = False,
+    on_placement_progress: Callable[[PlacementProgress], Awaitable[None]] | None = None,
 ) -> PostProcessingResult:
     """
     Moves completed downloads to the correct media directory, renames them
     for Plex, and triggers a library scan.
     """
+    placement_strategies: list[PlacementStrategy] = []
+
+    async def _place(
+        current_path: str,
+        new_path: str,
+        on_progress: Callable[[PlacementProgress], Awaitable[None]] | None = on_placement_progress,
+    ) -> PlacementResult:
+        result = await place_file_async(current_path, new_path, on_progress=on_progress)
+        logger.info(
+            "Placed '%s' via %s (%s/s).",
+            new_path,
+            result.strategy,
+            format_bytes(int(result.bytes_per_second)),
+        )
+        if result.strategy not in placement_strategies:
+            placement_strategies.append(result.strategy)
+        get_library_index().record_added(new_path)
+        return result
+
+    placement_report: list[PlacementReport] = []
     summary_destination: str | None = None
     summary_size_bytes: int | None = None
     season_pack_processed = 0
@@ -55,68 +102,25 @@ async def handle_successful_download(
         files = ti.files()
 
         if is_season_pack:
-            processed = 0
-            total_size_bytes = 0
-            season_destination: str | None = None
-
-            for i in range(files.num_files()):
-                path_in_torrent = files.file_path(i)
-                _, ext = os.path.splitext(path_in_torrent)
-                if ext.lower() not in ALLOWED_EXTENSIONS:
-                    continue
-
-                parsed_info_for_file = parse_torrent_name(os.path.basename(path_in_torrent))
-                parsed_info_for_file["title"] = parsed_info.get("title")
-                parsed_info_for_file["season"] = parsed_info.get("season")
-                parsed_info_for_file["type"] = "tv"
-
-                show_title = parsed_info_for_file.get("title")
-                season_num = parsed_info_for_file.get("season")
-                episode_num = parsed_info_for_file.get("episode")
-
-                if (
-                    not isinstance(show_title, str)
-                    or not isinstance(season_num, int)
-                    or not isinstance(episode_num, int)
-                ):
-                    continue
-
-                (
-                    episode_title,
-                    corrected_show_title,
-                ) = await fetch_episode_title_from_wikipedia(
-                    show_title=show_title,
-                    season=season_num,
-                    episode=episode_num,
-                )
-
-                parsed_info_for_file["episode_title"] = episode_title
-                if corrected_show_title:
-                    parsed_info_for_file["title"] = corrected_show_title
-
-                destination_directory = _get_final_destination_path(
-                    parsed_info_for_file, save_paths
+            planned = await _plan_season_pack_moves(
+                files, parsed_info, initial_download_path, save_paths
+            )
+            for directory in dict.fromkeys(move.destination_directory for move in planned):
+                adapters.ensure_dir(directory)
+
+            placement_report = await _run_planned_moves(planned, _place, on_placement_progress)
+            failures = [entry for entry in placement_report if entry["status"] == "failed"]
+            if failures:
+                raise OSError(
+                    f"{len(failures)} of {len(placement_report)} episode(s) could not be "
+                    f"moved: {failures[0].get('error')}"
                 )
-                adapters.ensure_dir(destination_directory)
-
-                final_filename = generate_plex_filename(parsed_info_for_file, ext)
-                current_path = os.path.join(initial_download_path, path_in_torrent)
-                new_path = os.path.join(destination_directory, final_filename)
-                logger.info("Moving file from '%s' to '%s'", current_path, new_path)
-                await asyncio.to_thread(adapters.move_file, current_path, new_path)
-
-                processed += 1
-                if season_destination is None:
-                    season_destination = destination_directory
-
-                moved_size = _get_path_size_bytes(new_path)
-                if moved_size is not None:
-                    total_size_bytes += moved_size
 
+            total_size_bytes = sum(entry.get("size_bytes") or 0 for entry in placement_report)
             scan_status_message = await _trigger_plex_scan("tv", plex_config)
-            summary_destination = season_destination
+            summary_destination = planned[0].destination_directory if planned else None
             summary_size_bytes = total_size_bytes if total_size_bytes > 0 else None
-            season_pack_processed = processed
+            season_pack_processed = len(placement_report)
 
         else:
             selected_media = select_primary_media_file(files)
@@ -139,7 +143,16 @@ async def handle_successful_download(
                 ti.name(),
             )
             logger.info("Moving file from '%s' to '%s'", current_path, new_path)
-            await asyncio.to_thread(adapters.move_file, current_path, new_path)
+            result = await _place(current_path, new_path)
+            placement_report.append(
+                {
+                    "source": current_path,
+                    "destination": new_path,
+                    "status": "placed",
+                    "strategy": result.strategy,
+                    "size_bytes": result.size_bytes,
+                }
+            )
 
             summary_destination = new_path
             summary_size_bytes = _get_path_size_bytes(new_path)
@@ -162,6 +175,7 @@ async def handle_successful_download(
             "media_type": parsed_info.get("type"),
             "title": summary_title,
             "year": year_value,
+            "placement_report": placement_report,
         }
 
     size_label = format_bytes(summary_size_bytes) if summary_size_bytes is not None else None
@@ -201,4 +215,136 @@ async def handle_successful_download(
         "media_type": parsed_info.get("type"),
         "title": summary_title,
         "year": year_value,
+        "placement_strategy": ", ".join(placement_strategies) or None,
+        "placement_report": placement_report,
     }
+
+
+async def _plan_season_pack_moves(
+    files: Any,
+    parsed_info: dict[str, Any],
+    initial_download_path: str,
+    save_paths: dict[str, str],
+) -> list[_PlannedMove]:
+    """Names every episode of a season pack, using one season-wide title lookup."""
+    show_title = parsed_info.get("title")
+    season_num = parsed_info.get("season")
+    if not isinstance(show_title, str) or not isinstance(season_num, int):
+        return []
+
+    candidates: list[tuple[int, str, str, dict[str, Any]]] = []
+    for i in range(files.num_files()):
+        path_in_torrent = files.file_path(i)
+        _, ext = os.path.splitext(path_in_torrent)
+        if ext.lower() not in ALLOWED_EXTENSIONS:
+            continue
+
+        parsed_info_for_file = parse_torrent_name(os.path.basename(path_in_torrent))
+        parsed_info_for_file["title"] = show_title
+        parsed_info_for_file["season"] = season_num
+        parsed_info_for_file["type"] = "tv"
+        if not isinstance(parsed_info_for_file.get("episode"), int):
+            continue
+        candidates.append((i, path_in_torrent, ext, parsed_info_for_file))
+
+    if not candidates:
+        return []
+
+    titles_by_episode, corrected_show_title = await fetch_episode_titles_for_season(
+        show_title, season_num
+    )
+
+    planned: list[_PlannedMove] = []
+    for i, path_in_torrent, ext, parsed_info_for_file in candidates:
+        episode_num = parsed_info_for_file["episode"]
+        episode_title = (titles_by_episode.get(episode_num) or {}).get("title")
+        if episode_title is None:
+            # Only episodes the season table did not cover cost an extra lookup.
+            episode_title, corrected_show_title = await fetch_episode_title_from_wikipedia(
+                show_title=show_title,
+                season=season_num,
+                episode=episode_num,
+            )
+        parsed_info_for_file["episode_title"] = episode_title
+        if corrected_show_title:
+            parsed_info_for_file["title"] = corrected_show_title
+
+        destination_directory = _get_final_destination_path(parsed_info_for_file, save_paths)
+        final_filename = generate_plex_filename(parsed_info_for_file, ext)
+        planned.append(
+            _PlannedMove(
+                source=os.path.join(initial_download_path, path_in_torrent),
+                destination=os.path.join(destination_directory, final_filename),
+                destination_directory=destination_directory,
+                episode=episode_num,
+                size_bytes=_torrent_file_size(files, i),
+            )
+        )
+    return planned
+
+
+async def _run_planned_moves(
+    planned: Sequence[_PlannedMove],
+    place: Callable[..., Awaitable[PlacementResult]],
+    on_progress: Callable[[PlacementProgress], Awaitable[None]] | None,
+) -> list[PlacementReport]:
+    """Runs planned moves with bounded concurrency and reports each file's outcome."""
+    semaphore = asyncio.Semaphore(SEASON_PACK_PLACEMENT_CONCURRENCY)
+    total_bytes = sum(move.size_bytes for move in planned)
+    copied_by_source: dict[str, int] = {}
+    last_report = 0.0
+
+    async def _forward(snapshot: PlacementProgress, source: str) -> None:
+        # Parallel moves share one status message, so report pack-wide totals.
+        nonlocal last_report
+        copied_by_source[source] = snapshot.copied_bytes
+        now = time.monotonic()
+        if on_progress is None or now - last_report < PLACEMENT_PROGRESS_INTERVAL_SECONDS:
+            return
+        last_report = now
+        copied = sum(copied_by_source.values())
+        await on_progress(
+            PlacementProgress(
+                strategy=snapshot.strategy,
+                copied_bytes=copied,
+                total_bytes=max(total_bytes, copied),
+                bytes_per_second=snapshot.bytes_per_second,
+            )
+        )
+
+    async def _move(move: _PlannedMove) -> PlacementReport:
+        async with semaphore:
+            logger.info("Moving file from '%s' to '%s'", move.source, move.destination)
+            try:
+                result = await place(
+                    move.source,
+                    move.destination,
+                    (lambda snapshot: _forward(snapshot, move.source)) if on_progress else None,
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Failed to move '%s': %s", move.source, exc)
+                return {
+                    "source": move.source,
+                    "destination": move.destination,
+                    "episode": move.episode,
+                    "status": "failed",
+                    "error": str(exc),
+                }
+            copied_by_source[move.source] = result.size_bytes
+            return {
+                "source": move.source,
+                "destination": move.destination,
+                "episode": move.episode,
+                "status": "placed",
+                "strategy": result.strategy,
+                "size_bytes": result.size_bytes,
+            }
+
+    return list(await asyncio.gather(*(_move(move) for move in planned)))
+
+
+def _torrent_file_size(files: Any, index: int) -> int:
+    try:
+        return int(files.file_size(index))
+    except (AttributeError, TypeError, ValueError):
+        return 0
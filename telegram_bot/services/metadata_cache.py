@@ -0,0 +1,395 @@
+# telegram_bot/services/metadata_cache.py
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from telegram_bot.config import METADATA_CACHE_FILE, logger
+
+METADATA_CACHE_KEY = "METADATA_CACHE"
+METADATA_CACHE_MAX_BYTES = 32 * 1024 * 1024
+METADATA_CACHE_DEFAULT_TTL_SECONDS = 30 * 60
+METADATA_CACHE_DEFAULT_NEGATIVE_TTL_SECONDS = 5 * 60
+# Reads refresh an entry's eviction recency at most this often, so most hits
+# stay read-only instead of each one writing to the WAL.
+METADATA_CACHE_TOUCH_INTERVAL_SECONDS = 5 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    negative INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS metadata_cache_accessed ON metadata_cache (accessed_at);
+"""
+
+
+@dataclass
+class NamespaceStats:
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+
+
+class MetadataCache:
+    """
+    SQLite-backed cache for metadata lookups (Wikipedia, TMDB).
+
+    Entries are JSON documents grouped by namespace. Each one expires after
+    its namespace's TTL, or after the shorter negative TTL when it records a
+    failed lookup. The total stored size is bounded by `max_bytes`, and the
+    least recently read entries are evicted first; reads refresh that
+    recency at most every few minutes. Database errors after opening are
+    logged and treated as misses, so a broken cache never breaks a lookup.
+    The file lives next to the other state files, so lookups stay warm
+    across restarts. `":memory:"` gives a private cache that is never
+    written to disk.
+    """
+
+    MISS = object()
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        *,
+        max_bytes: int = METADATA_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max(1, max_bytes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: dict[str, NamespaceStats] = {}
+        self._connection = self._connect(path)
+        self._total_bytes = self._purge_expired_and_measure()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def namespace(
+        self,
+        name: str,
+        *,
+        ttl: float = METADATA_CACHE_DEFAULT_TTL_SECONDS,
+        negative_ttl: float = METADATA_CACHE_DEFAULT_NEGATIVE_TTL_SECONDS,
+    ) -> CacheNamespace:
+        return CacheNamespace(name, ttl=ttl, negative_ttl=negative_ttl, cache=self)
+
+    def get(self, namespace: str, key: Hashable) -> Any:
+        """Returns the cached value, or `MetadataCache.MISS` (also on database errors)."""
+        encoded_key = _encode_key(key)
+        stats = self._stats.setdefault(namespace, NamespaceStats())
+        now = self._clock()
+        with self._lock:
+            try:
+                row = self._execute(
+                    "SELECT value, negative, size, expires_at, accessed_at FROM metadata_cache "
+                    "WHERE namespace = ? AND key = ?",
+                    (namespace, encoded_key),
+                ).fetchone()
+                if row is None:
+                    stats.misses += 1
+                    return MetadataCache.MISS
+                raw_value, negative, size, expires_at, accessed_at = row
+                if expires_at <= now:
+                    self._delete(namespace, encoded_key, size)
+                    stats.misses += 1
+                    return MetadataCache.MISS
+                if now - accessed_at >= METADATA_CACHE_TOUCH_INTERVAL_SECONDS:
+                    self._execute(
+                        "UPDATE metadata_cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                        (now, namespace, encoded_key),
+                    )
+            except sqlite3.Error as exc:
+                logger.warning("[CACHE] Metadata cache read failed for %s: %s", namespace, exc)
+                stats.misses += 1
+                return MetadataCache.MISS
+        stats.hits += 1
+        if negative:
+            stats.negative_hits += 1
+        return _decode_value(json.loads(raw_value))
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        *,
+        ttl: float,
+        negative: bool = False,
+    ) -> None:
+        try:
+            raw_value = json.dumps(_encode_value(value), separators=(",", ":"))
+        except (TypeError, ValueError) as exc:
+            logger.debug("[CACHE] Not caching %s entry %r: %s", namespace, key, exc)
+            return
+        encoded_key = _encode_key(key)
+        size = len(raw_value) + len(encoded_key)
+        if size > self.max_bytes:
+            return
+        now = self._clock()
+        with self._lock:
+            try:
+                previous = self._execute(
+                    "SELECT size FROM metadata_cache WHERE namespace = ? AND key = ?",
+                    (namespace, encoded_key),
+                ).fetchone()
+                self._execute(
+                    "INSERT OR REPLACE INTO metadata_cache "
+                    "(namespace, key, value, negative, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (namespace, encoded_key, raw_value, int(negative), size, now + ttl, now),
+                )
+                self._total_bytes += size - (previous[0] if previous else 0)
+                self._evict_to_budget()
+            except sqlite3.Error as exc:
+                # The cache is an optimization; a locked or full database must not
+                # break the lookup that produced the value.
+                logger.warning("[CACHE] Metadata cache write failed for %s: %s", namespace, exc)
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drops every entry, or those of `namespace` and its `namespace:*` children."""
+        with self._lock:
+            try:
+                if namespace is None:
+                    self._execute("DELETE FROM metadata_cache")
+                else:
+                    self._execute(
+                        "DELETE FROM metadata_cache "
+                        "WHERE namespace = ? OR substr(namespace, 1, ?) = ?",
+                        (namespace, len(namespace) + 1, f"{namespace}:"),
+                    )
+                self._total_bytes = self._measure()
+            except sqlite3.Error as exc:
+                logger.warning("[CACHE] Failed to clear metadata cache: %s", exc)
+                return
+            if namespace is None:
+                self._stats.clear()
+            else:
+                for name in [
+                    n for n in self._stats if n == namespace or n.startswith(f"{namespace}:")
+                ]:
+                    del self._stats[name]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters since startup plus stored entries and bytes, per namespace."""
+        with self._lock:
+            try:
+                stored = {
+                    namespace: (entries, size)
+                    for namespace, entries, size in self._execute(
+                        "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) "
+                        "FROM metadata_cache GROUP BY namespace"
+                    )
+                }
+            except sqlite3.Error as exc:
+                logger.warning("[CACHE] Failed to read metadata cache sizes: %s", exc)
+                stored = {}
+        return {
+            namespace: {
+                "hits": counters.hits,
+                "misses": counters.misses,
+                "negative_hits": counters.negative_hits,
+                "entries": stored.get(namespace, (0, 0))[0],
+                "bytes": stored.get(namespace, (0, 0))[1],
+            }
+            for namespace, counters in sorted(
+                {**{name: NamespaceStats() for name in stored}, **self._stats}.items()
+            )
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._connection.close()
+            except sqlite3.Error as exc:
+                logger.warning("[CACHE] Failed to close metadata cache '%s': %s", self.path, exc)
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        try:
+            connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            if path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error as exc:
+            logger.warning(
+                "[CACHE] Metadata cache '%s' is unusable (%s); using memory instead.", path, exc
+            )
+            self.path = ":memory:"
+            connection = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+            connection.executescript(_SCHEMA)
+        return connection
+
+    def _execute(self, sql: str, parameters: tuple[Any, ...] = ()) -> sqlite3.Cursor:
+        return self._connection.execute(sql, parameters)
+
+    def _purge_expired_and_measure(self) -> int:
+        with self._lock:
+            self._execute("DELETE FROM metadata_cache WHERE expires_at <= ?", (self._clock(),))
+            total = self._measure()
+            self._total_bytes = total
+            self._evict_to_budget()
+            return self._total_bytes
+
+    def _measure(self) -> int:
+        row = self._execute("SELECT COALESCE(SUM(size), 0) FROM metadata_cache").fetchone()
+        return int(row[0])
+
+    def _delete(self, namespace: str, encoded_key: str, size: int) -> None:
+        self._execute(
+            "DELETE FROM metadata_cache WHERE namespace = ? AND key = ?",
+            (namespace, encoded_key),
+        )
+        self._total_bytes -= size
+
+    def _evict_to_budget(self) -> None:
+        while self._total_bytes > self.max_bytes:
+            victims = self._execute(
+                "SELECT namespace, key, size FROM metadata_cache ORDER BY accessed_at LIMIT 32"
+            ).fetchall()
+            if not victims:
+                self._total_bytes = 0
+                return
+            for namespace, encoded_key, size in victims:
+                self._delete(namespace, encoded_key, size)
+                if self._total_bytes <= self.max_bytes:
+                    return
+
+
+class CacheNamespace:
+    """
+    One namespace of a `MetadataCache` with its own TTLs.
+
+    Without an explicit `cache` it uses the process-wide cache at call time,
+    so module-level namespaces follow `open_metadata_cache()`.
+    """
+
+    MISS = MetadataCache.MISS
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: float = METADATA_CACHE_DEFAULT_TTL_SECONDS,
+        negative_ttl: float = METADATA_CACHE_DEFAULT_NEGATIVE_TTL_SECONDS,
+        cache: MetadataCache | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._cache = cache
+
+    @property
+    def cache(self) -> MetadataCache:
+        return self._cache if self._cache is not None else get_metadata_cache()
+
+    def get(self, key: Hashable, default: Any = MISS) -> Any:
+        value = self.cache.get(self.name, key)
+        return default if value is MetadataCache.MISS else value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        negative: bool = False,
+        ttl: float | None = None,
+    ) -> None:
+        if ttl is None:
+            ttl = self.negative_ttl if negative else self.ttl
+        self.cache.set(self.name, key, value, ttl=ttl, negative=negative)
+
+    def clear(self) -> None:
+        self.cache.clear(self.name)
+
+
+def _encode_key(key: Hashable) -> str:
+    return json.dumps(_encode_value(key), separators=(",", ":"), sort_keys=True)
+
+
+# JSON has no tuples, dates or non-string keys; tag them so values round-trip.
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode_value(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and not key.startswith("__") for key in value):
+            return {key: _encode_value(item) for key, item in value.items()}
+        return {"__items__": [[_encode_value(k), _encode_value(v)] for k, v in value.items()]}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"unsupported cache value type {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if isinstance(value, dict):
+        if "__tuple__" in value:
+            return tuple(_decode_value(item) for item in value["__tuple__"])
+        if "__date__" in value:
+            return date.fromisoformat(value["__date__"])
+        if "__items__" in value:
+            return {_decode_value(k): _decode_value(v) for k, v in value["__items__"]}
+        return {key: _decode_value(item) for key, item in value.items()}
+    return value
+
+
+_default_cache: MetadataCache | None = None
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Returns the process-wide cache; in memory until `open_metadata_cache` runs."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = MetadataCache()
+    return _default_cache
+
+
+def open_metadata_cache(bot_data: dict[str, Any], path: str | None = None) -> MetadataCache:
+    """Opens the on-disk cache for the application and records it in `bot_data`."""
+    global _default_cache
+    path = path or METADATA_CACHE_FILE
+    cache = MetadataCache(path)
+    _default_cache = cache
+    bot_data[METADATA_CACHE_KEY] = cache
+    logger.info(
+        "[CACHE] Metadata cache '%s' opened with %d bytes of entries.", path, cache.total_bytes
+    )
+    return cache
+
+
+def close_metadata_cache(bot_data: dict[str, Any]) -> None:
+    global _default_cache
+    cache = bot_data.pop(METADATA_CACHE_KEY, None)
+    if isinstance(cache, MetadataCache):
+        for namespace, counters in cache.stats().items():
+            logger.info(
+                "[CACHE] %s: %d hits (%d negative), %d misses, %d entries, %d bytes.",
+                namespace,
+                counters["hits"],
+                counters["negative_hits"],
+                counters["misses"],
+                counters["entries"],
+                counters["bytes"],
+            )
+        cache.close()
+        if _default_cache is cache:
+            _default_cache = None
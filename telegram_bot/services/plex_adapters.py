@@ -7,6 +7,7 @@ import subprocess
 from collections.abc import Sequence
 
 from plexapi.server import PlexServer
+from requests import Session
 
 from .interfaces import PlexClient, PlexClientFactory
 
@@ -15,9 +16,11 @@ def create_plex_client(
     url: str,
     token: str,
     plex_client_factory: PlexClientFactory | None = None,
+    session: Session | None = None,
 ) -> PlexClient:
-    factory = plex_client_factory or PlexServer
-    return factory(url, token)
+    if plex_client_factory is not None:
+        return plex_client_factory(url, token)
+    return PlexServer(url, token, session=session)
 
 
 def run_subprocess(command: Sequence[str]) -> subprocess.CompletedProcess[str]:
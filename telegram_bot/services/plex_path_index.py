@@ -0,0 +1,329 @@
+# telegram_bot/services/plex_path_index.py
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from telegram_bot.config import logger
+
+from .plex_adapters import abs_path
+
+# Misses within this window share one incremental refresh.
+PLEX_PATH_INDEX_REFRESH_INTERVAL_SECONDS = 1.0
+
+# Listed when a section is first used; episodes are loaded per show on demand.
+_SECTION_LISTING_LIBTYPES: dict[str, tuple[str | None, ...]] = {
+    "movie": ("movie",),
+    "show": ("show",),
+}
+# Searched for items added or updated since the last sync.
+_SECTION_REFRESH_LIBTYPES: dict[str, tuple[str | None, ...]] = {
+    "movie": ("movie",),
+    "show": ("show", "episode"),
+}
+_TITLE_YEAR_PATTERN = re.compile(r"^(?P<title>.+?)\s*\((?P<year>\d{4})\)")
+_EPISODE_CODE_PATTERN = re.compile(r"[\s._-]*\bS\d{1,2}E\d{1,3}\b.*$", re.IGNORECASE)
+
+
+def _normalize_media_path(path: str) -> str:
+    return os.path.normcase(abs_path(path))
+
+
+def _iter_media_file_paths(item: Any) -> list[str]:
+    paths: list[str] = []
+
+    raw_locations = getattr(item, "locations", None)
+    if callable(raw_locations):
+        try:
+            raw_locations = raw_locations()
+        except Exception:
+            raw_locations = None
+
+    if isinstance(raw_locations, Sequence) and not isinstance(raw_locations, (str, bytes)):
+        for path in raw_locations:
+            if isinstance(path, str) and path.strip():
+                paths.append(path.strip())
+
+    for media in getattr(item, "media", []) or []:
+        for part in getattr(media, "parts", []) or []:
+            file_path = getattr(part, "file", None)
+            if isinstance(file_path, str) and file_path.strip():
+                paths.append(file_path.strip())
+
+    deduped_paths: list[str] = []
+    seen: set[str] = set()
+    for path in paths:
+        normalized = _normalize_media_path(path)
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        deduped_paths.append(path)
+    return deduped_paths
+
+
+@dataclass
+class _SectionPaths:
+    exact: dict[str, set[Hashable]] = field(default_factory=dict)
+    under: dict[str, set[Hashable]] = field(default_factory=dict)
+    item_paths: dict[Hashable, tuple[set[str], set[str]]] = field(default_factory=dict)
+    expanded: set[Hashable] = field(default_factory=set)
+    refreshed_at: float = 0.0
+    synced_through: datetime | None = None
+
+
+class PlexPathIndex:
+    """
+    Maps normalized file and folder paths to Plex ratingKeys, per section.
+
+    A section is listed once, on first use; show sections list only their
+    shows, and a show's episodes are loaded the first time a lookup lands in
+    its folder. After that, a miss refreshes only the items added or updated
+    since the last sync, via an `addedAt`/`updatedAt` filter. Hits are
+    resolved with one `fetchItems` call on their ratingKeys and re-checked
+    against the path, so deleted or moved items drop out of the index. Every
+    folder above a media file is indexed, so folder lookups find files at any
+    depth. When the index has no entry, a targeted title/year
+    `search(filters=...)` guessed from the path is tried before giving up.
+
+    Methods block on the Plex API; call them through `asyncio.to_thread`.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._sections: dict[Hashable, _SectionPaths] = {}
+
+    def items_at(self, section: Any, path: str) -> list[Any]:
+        """Items whose media file or folder is exactly `path`."""
+        target = _normalize_media_path(path)
+
+        def matches(paths: set[str]) -> bool:
+            return target in paths
+
+        return self._resolve(section, target, "exact", matches)
+
+    def items_under(self, section: Any, directory: str) -> list[Any]:
+        """Items with a media file somewhere below `directory`."""
+        target = _normalize_media_path(directory)
+        prefix = target.rstrip(os.sep) + os.sep
+
+        def matches(paths: set[str]) -> bool:
+            return any(path.startswith(prefix) for path in paths)
+
+        return self._resolve(section, target, "under", matches)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sections.clear()
+
+    def _resolve(
+        self,
+        section: Any,
+        target: str,
+        table: str,
+        matches: Callable[[set[str]], bool],
+    ) -> list[Any]:
+        with self._lock:
+            state = self._state(section)
+            keys = set(getattr(state, table).get(target, ()))
+            if not keys:
+                self._refresh(section, state)
+                keys = set(getattr(state, table).get(target, ()))
+            if not keys and self._expand_shows(section, state, target):
+                keys = set(getattr(state, table).get(target, ()))
+
+        items = self._fetch(section, keys) if keys else None
+        if items is not None:
+            with self._lock:
+                # Keys Plex no longer returns belong to deleted items.
+                for key in keys - {getattr(item, "ratingKey", None) for item in items}:
+                    self._forget(state, key)
+                for item in items:
+                    self._index_item(state, item)
+            found = [item for item in items if matches(_item_path_set(item))]
+            if found:
+                return found
+
+        return self._search_fallback(section, target, matches)
+
+    def _state(self, section: Any) -> _SectionPaths:
+        section_key = _section_key(section)
+        state = self._sections.get(section_key)
+        if state is None:
+            state = _SectionPaths(refreshed_at=self._clock())
+            for libtype in _section_libtypes(section, _SECTION_LISTING_LIBTYPES):
+                for item in _listing(section.all(libtype=libtype)):
+                    self._index_item(state, item)
+            logger.info(
+                "[PLEX] Indexed %d path(s) for %d item(s) in '%s'.",
+                len(state.exact),
+                len(state.item_paths),
+                getattr(section, "title", "section"),
+            )
+            self._sections[section_key] = state
+        return state
+
+    def _refresh(self, section: Any, state: _SectionPaths) -> None:
+        now = self._clock()
+        if state.synced_through is None:
+            return
+        if now - state.refreshed_at < PLEX_PATH_INDEX_REFRESH_INTERVAL_SECONDS:
+            return
+        state.refreshed_at = now
+        since = state.synced_through - timedelta(seconds=1)
+        changed = {"or": [{"addedAt>>": since}, {"updatedAt>>": since}]}
+        for libtype in _section_libtypes(section, _SECTION_REFRESH_LIBTYPES):
+            try:
+                items = section.search(libtype=libtype, filters=changed)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("[PLEX] Incremental path index refresh failed: %s", exc)
+                return
+            for item in _listing(items):
+                self._index_item(state, item)
+
+    def _expand_shows(self, section: Any, state: _SectionPaths, target: str) -> bool:
+        """Indexes the episodes of shows whose folder contains `target`."""
+        shows: set[Hashable] = set()
+        folder = target
+        while True:
+            parent = os.path.dirname(folder)
+            if not parent or parent == folder:
+                break
+            shows.update(state.exact.get(parent, ()))
+            folder = parent
+        shows -= state.expanded
+        if not shows:
+            return False
+        state.expanded.update(shows)
+        for show in self._fetch(section, shows) or []:
+            episodes = getattr(show, "episodes", None)
+            if not callable(episodes):
+                continue
+            try:
+                listed = _listing(episodes())
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("[PLEX] Could not list episodes of '%s': %s", show, exc)
+                continue
+            for episode in listed:
+                self._index_item(state, episode)
+        return True
+
+    def _fetch(self, section: Any, keys: set[Hashable]) -> list[Any] | None:
+        try:
+            return _listing(section.fetchItems(sorted(keys, key=str)))
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("[PLEX] Could not fetch indexed items %s: %s", sorted(keys, key=str), exc)
+            return None
+
+    def _search_fallback(
+        self,
+        section: Any,
+        target: str,
+        matches: Callable[[set[str]], bool],
+    ) -> list[Any]:
+        filters = _guess_title_filters(target)
+        if not filters:
+            return []
+        try:
+            candidates = _listing(section.search(filters=filters))
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("[PLEX] Targeted path search failed for '%s': %s", target, exc)
+            return []
+
+        found: list[Any] = []
+        for candidate in candidates:
+            if matches(_item_path_set(candidate)):
+                found.append(candidate)
+                continue
+            episodes = getattr(candidate, "episodes", None)
+            if callable(episodes) and any(
+                target.startswith(location.rstrip(os.sep) + os.sep)
+                for location in _item_path_set(candidate)
+            ):
+                found.extend(
+                    episode for episode in _listing(episodes()) if matches(_item_path_set(episode))
+                )
+        with self._lock:
+            state = self._state(section)
+            for item in found:
+                self._index_item(state, item)
+        return found
+
+    def _index_item(self, state: _SectionPaths, item: Any) -> None:
+        key = getattr(item, "ratingKey", None)
+        if key is None:
+            return
+        self._forget(state, key)
+        exact = _item_path_set(item)
+        under: set[str] = set()
+        for path in exact:
+            folder = path
+            while True:
+                parent = os.path.dirname(folder)
+                if not parent or parent == folder:
+                    break
+                under.add(parent)
+                folder = parent
+        for path in exact:
+            state.exact.setdefault(path, set()).add(key)
+        for path in under:
+            state.under.setdefault(path, set()).add(key)
+        state.item_paths[key] = (exact, under)
+
+        for stamp in (getattr(item, "addedAt", None), getattr(item, "updatedAt", None)):
+            if isinstance(stamp, datetime) and (
+                state.synced_through is None or stamp > state.synced_through
+            ):
+                state.synced_through = stamp
+
+    def _forget(self, state: _SectionPaths, key: Hashable) -> None:
+        exact, under = state.item_paths.pop(key, (set(), set()))
+        for table, paths in ((state.exact, exact), (state.under, under)):
+            for path in paths:
+                keys = table.get(path)
+                if keys is None:
+                    continue
+                keys.discard(key)
+                if not keys:
+                    del table[path]
+
+
+def _section_key(section: Any) -> Hashable:
+    uuid = getattr(section, "uuid", None)
+    return uuid if isinstance(uuid, str) and uuid else id(section)
+
+
+def _section_libtypes(
+    section: Any, libtypes: dict[str, tuple[str | None, ...]]
+) -> tuple[str | None, ...]:
+    section_type = getattr(section, "type", None)
+    if isinstance(section_type, str):
+        return libtypes.get(section_type, (None,))
+    return (None,)
+
+
+def _listing(items: Any) -> list[Any]:
+    if isinstance(items, Iterable) and not isinstance(items, (str, bytes)):
+        return list(items)
+    return []
+
+
+def _item_path_set(item: Any) -> set[str]:
+    return {_normalize_media_path(path) for path in _iter_media_file_paths(item)}
+
+
+def _guess_title_filters(path: str) -> dict[str, Any] | None:
+    """Title (and year) filters guessed from a "Title (Year)" or "Show - S01E02" name."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    match = _TITLE_YEAR_PATTERN.match(name)
+    if match:
+        return {"title": match.group("title").strip(), "year": int(match.group("year"))}
+    title = _EPISODE_CODE_PATTERN.sub("", name).strip(" ._-")
+    return {"title": title} if title else None
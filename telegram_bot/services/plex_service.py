@@ -2,7 +2,7 @@
 
 import asyncio
 import difflib
-import os
+import functools
 import platform
 import re
 import subprocess
@@ -15,16 +15,15 @@ from telegram.helpers import escape_markdown
 
 from ..config import logger
 from .interfaces import PlexClient, PlexClientFactory
+from .library_index import LibraryIndex, get_library_index
 from .plex_adapters import (
     abs_path,
-    create_plex_client,
     dir_name,
-    is_dir,
     join_path,
-    list_dir,
     path_exists,
     run_subprocess,
 )
+from .plex_session import get_plex_session
 
 __all__ = [
     "get_plex_server_status",
@@ -138,13 +137,13 @@ def _normalize_collection_lookup_key(value: str) -> str:
     return " ".join(tokens) if tokens else normalized
 
 
-def _resolve_tv_show_directory(tv_root: str, show_title: str) -> str | None:
+def _resolve_tv_show_directory(tv_root: str, show_title: str, index: LibraryIndex) -> str | None:
     """Resolve a TV show directory when punctuation or separators differ."""
     invalid_chars = r'<>:"/\\|?*'
     safe_show = "".join(c for c in show_title if c not in invalid_chars).strip()
     if safe_show:
         direct_path = join_path(tv_root, safe_show)
-        if is_dir(direct_path):
+        if index.is_dir(direct_path):
             return direct_path
 
     normalized_target = _normalize_plex_title(show_title)
@@ -153,11 +152,9 @@ def _resolve_tv_show_directory(tv_root: str, show_title: str) -> str | None:
 
     best_path: str | None = None
     best_score = 0.0
-    for entry in list_dir(tv_root):
+    tv_listing = index.listing(tv_root)
+    for entry in tv_listing.dirs if tv_listing is not None else ():
         candidate_path = join_path(tv_root, entry)
-        if not is_dir(candidate_path):
-            continue
-
         normalized_entry = _normalize_plex_title(entry)
         if not normalized_entry:
             continue
@@ -285,59 +282,15 @@ def _dedupe_media_items(items: Sequence[Any]) -> list[Any]:
     return deduped
 
 
-def _normalize_media_path(path: str) -> str:
-    return os.path.normcase(abs_path(path))
-
-
-def _iter_media_file_paths(item: Any) -> list[str]:
-    paths: list[str] = []
-
-    raw_locations = getattr(item, "locations", None)
-    if callable(raw_locations):
-        try:
-            raw_locations = raw_locations()
-        except Exception:
-            raw_locations = None
-
-    if isinstance(raw_locations, Sequence) and not isinstance(raw_locations, (str, bytes)):
-        for path in raw_locations:
-            if isinstance(path, str) and path.strip():
-                paths.append(path.strip())
-
-    for media in getattr(item, "media", []) or []:
-        for part in getattr(media, "parts", []) or []:
-            file_path = getattr(part, "file", None)
-            if isinstance(file_path, str) and file_path.strip():
-                paths.append(file_path.strip())
-
-    deduped_paths: list[str] = []
-    seen: set[str] = set()
-    for path in paths:
-        normalized = _normalize_media_path(path)
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        deduped_paths.append(path)
-    return deduped_paths
-
-
 def _find_movie_by_path(movies_section: Any, expected_path: str) -> Sequence[Any]:
-    normalized_expected = _normalize_media_path(expected_path)
-    if not normalized_expected:
+    if not expected_path.strip():
         return []
 
     try:
-        items = movies_section.all()
+        items = get_plex_session().path_index.items_at(movies_section, expected_path)
     except Exception:
         return []
-
-    matches: list[Any] = []
-    for item in items or []:
-        for candidate_path in _iter_media_file_paths(item):
-            if _normalize_media_path(candidate_path) == normalized_expected:
-                matches.append(item)
-                break
-    return _dedupe_media_items(matches)
+    return _dedupe_media_items(items)
 
 
 def _resolve_existing_collection_name(movies_section: Any, requested_name: str) -> str:
@@ -568,12 +521,12 @@ async def get_plex_server_status(
     try:
         logger.info(f"Attempting to connect to Plex server at {plex_config.get('url')}...")
 
-        # Run the blocking plexapi call in a separate thread
+        # Run the blocking plexapi call in a separate thread. Reconnecting
+        # makes this a live probe and resets the shared session's breaker.
         plex: PlexClient = await asyncio.to_thread(
-            create_plex_client,
-            plex_config["url"],
-            plex_config["token"],
-            plex_client_factory,
+            functools.partial(
+                get_plex_session().server, plex_config, plex_client_factory, refresh=True
+            )
         )
 
         # The connection is successful if no exception was raised.
@@ -683,46 +636,29 @@ async def get_existing_episodes_for_season(
         if not tv_root:
             return existing
 
-        show_dir = _resolve_tv_show_directory(tv_root, show_title)
+        index = get_library_index()
+        show_dir = _resolve_tv_show_directory(tv_root, show_title, index)
         if not show_dir:
             return existing
 
-        season_scan_dirs: list[str] = []
         season_dir = join_path(show_dir, f"Season {int(season):02d}")
-        if not is_dir(season_dir):
+        if not index.is_dir(season_dir):
             # Accept common season directory variants such as:
             # "Season 1", "Season 01 (2013-2014)", or "Season 01 - Extras".
             season_label_pattern = re.compile(rf"(?i)^season[\s._-]*0*{int(season)}\b")
-            for entry in list_dir(show_dir):
-                candidate = join_path(show_dir, entry)
-                if not is_dir(candidate):
-                    continue
+            show_listing = index.listing(show_dir)
+            for entry in show_listing.dirs if show_listing is not None else ():
                 if season_label_pattern.search(entry):
-                    season_dir = candidate
+                    season_dir = join_path(show_dir, entry)
                     break
 
-        if is_dir(season_dir):
-            season_scan_dirs.append(season_dir)
-        else:
-            # Some libraries place episode files directly under the show directory.
-            season_scan_dirs.append(show_dir)
-
-        pat = re.compile(r"(?i)\bS(\d{1,2})E(\d{1,2})\b")
-        for scan_dir in season_scan_dirs:
-            for fname in list_dir(scan_dir):
-                candidate_path = join_path(scan_dir, fname)
-                if is_dir(candidate_path):
-                    continue
-                m = pat.search(fname)
-                if not m:
-                    continue
-                try:
-                    s_num = int(m.group(1))
-                    e_num = int(m.group(2))
-                    if s_num == int(season):
-                        existing.add(e_num)
-                except Exception:
-                    continue
+        # Some libraries place episode files directly under the show directory.
+        scan_dir = season_dir if index.is_dir(season_dir) else show_dir
+        existing.update(
+            episode_num
+            for season_num, episode_num in index.episodes(scan_dir)
+            if season_num == int(season)
+        )
     except Exception as e:
         logger.warning(f"Filesystem episode check failed: {e}")
 
@@ -748,13 +684,9 @@ async def ensure_collection_contains_movies(
         return []
 
     try:
-        plex: PlexClient = await asyncio.to_thread(
-            create_plex_client,
-            plex_config["url"],
-            plex_config["token"],
-            plex_client_factory,
+        movies_section = await asyncio.to_thread(
+            get_plex_session().section, plex_config, "Movies", plex_client_factory
         )
-        movies_section = await asyncio.to_thread(plex.library.section, "Movies")
     except Exception as exc:  # noqa: BLE001
         logger.error(f"[PLEX] Could not prepare collection '{collection_name}': {exc}")
         return []
@@ -804,6 +736,7 @@ async def ensure_collection_contains_movies(
                 label = f"{label} ({target_year})"
             matched_labels.append(label)
         except Exception as exc:  # noqa: BLE001
+            get_plex_session().record_failure(exc)
             logger.warning(
                 "[PLEX] Failed to tag '%s' for collection '%s': %s",
                 title,
@@ -850,13 +783,9 @@ async def wait_for_movies_to_be_available(
         return False
 
     try:
-        plex: PlexClient = await asyncio.to_thread(
-            create_plex_client,
-            plex_config["url"],
-            plex_config["token"],
-            plex_client_factory,
+        movies_section = await asyncio.to_thread(
+            get_plex_session().section, plex_config, "Movies", plex_client_factory
         )
-        movies_section = await asyncio.to_thread(plex.library.section, "Movies")
     except Exception as exc:  # noqa: BLE001
         logger.error("[PLEX] Could not prepare index wait: %s", exc)
         return False
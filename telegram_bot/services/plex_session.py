@@ -0,0 +1,189 @@
+# telegram_bot/services/plex_session.py
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+from plexapi.exceptions import Unauthorized
+from requests import Session
+from requests import exceptions as requests_exceptions
+from requests.adapters import HTTPAdapter
+
+from telegram_bot.config import logger
+
+from .discovery.health import CircuitBreaker
+from .interfaces import PlexClient, PlexClientFactory, PlexLibrarySection
+from .plex_adapters import create_plex_client
+from .plex_path_index import PlexPathIndex
+
+PLEX_SESSION_KEY = "PLEX_SESSION"
+PLEX_MAX_CONNECTIONS = 8
+PLEX_BREAKER_NAME = "plex"
+
+# Errors after which the cached server and section handles are rebuilt.
+PLEX_RECONNECT_ERRORS: tuple[type[BaseException], ...] = (
+    Unauthorized,
+    requests_exceptions.ConnectionError,
+    requests_exceptions.Timeout,
+)
+
+
+class PlexUnavailableError(Exception):
+    """Raised while the Plex circuit breaker is open."""
+
+
+class PlexCircuitBreaker(CircuitBreaker):
+    """A local Plex server usually comes back quickly, so cool down for a minute."""
+
+    COOLDOWN_SECONDS = 60
+
+
+class PlexSessionManager:
+    """
+    Process-wide Plex connection.
+
+    Keeps one authenticated `PlexServer` on a pooled `requests` session and
+    caches library sections by name, so repeated scans, collection updates
+    and index polls skip the server handshake and section listing. Its
+    `path_index` resolves media paths to items without listing whole
+    sections; it is reset when the server or token changes. Auth and
+    connection errors drop the cached handles so the next call reconnects.
+    Failures feed a circuit breaker; while it is open, calls fail fast with
+    `PlexUnavailableError` instead of waiting on an unreachable server.
+
+    Methods block on network I/O; call them through `asyncio.to_thread`.
+    """
+
+    def __init__(self, *, breaker: CircuitBreaker | None = None) -> None:
+        self.breaker = breaker or PlexCircuitBreaker()
+        self._lock = threading.RLock()
+        self._http: Session | None = None
+        self._server: PlexClient | None = None
+        self._server_key: Hashable | None = None
+        self._sections: dict[str, PlexLibrarySection] = {}
+        self.path_index = PlexPathIndex()
+        self._index_key: Hashable | None = None
+
+    @property
+    def is_available(self) -> bool:
+        return self.breaker.is_healthy(PLEX_BREAKER_NAME)
+
+    def server(
+        self,
+        plex_config: Mapping[str, str],
+        plex_client_factory: PlexClientFactory | None = None,
+        *,
+        refresh: bool = False,
+    ) -> PlexClient:
+        """
+        Returns the shared server for `plex_config`, connecting if needed.
+
+        `refresh=True` always reconnects and ignores an open breaker. The
+        status check uses it as an explicit health probe.
+        """
+        url = plex_config["url"]
+        token = plex_config["token"]
+        key = (url, token, plex_client_factory)
+        with self._lock:
+            if not refresh and self._server is not None and self._server_key == key:
+                return self._server
+            if not refresh and not self.is_available:
+                raise PlexUnavailableError("Plex is unreachable; waiting for the cooldown.")
+
+            self._drop_handles()
+            try:
+                server = create_plex_client(
+                    url, token, plex_client_factory, session=self._requests_session()
+                )
+            except Exception:
+                self.breaker.record_failure(PLEX_BREAKER_NAME)
+                raise
+            self.breaker.record_success(PLEX_BREAKER_NAME)
+            if self._index_key != key:
+                self.path_index.clear()
+                self._index_key = key
+            self._server = server
+            self._server_key = key
+            return server
+
+    def section(
+        self,
+        plex_config: Mapping[str, str],
+        name: str,
+        plex_client_factory: PlexClientFactory | None = None,
+    ) -> PlexLibrarySection:
+        """Returns the library section called `name`, reusing the cached handle."""
+        with self._lock:
+            server = self.server(plex_config, plex_client_factory)
+            section = self._sections.get(name)
+            if section is not None:
+                return section
+            try:
+                section = server.library.section(name)
+            except Exception as exc:
+                self.record_failure(exc)
+                raise
+            self._sections[name] = section
+            return section
+
+    def record_failure(self, exc: BaseException) -> None:
+        """Drops the cached handles after an auth or connection error."""
+        if not isinstance(exc, PLEX_RECONNECT_ERRORS):
+            return
+        logger.info("[PLEX] Dropping cached Plex connection after %s.", type(exc).__name__)
+        with self._lock:
+            self._drop_handles()
+        self.breaker.record_failure(PLEX_BREAKER_NAME)
+
+    def close(self) -> None:
+        with self._lock:
+            self._drop_handles()
+            self.path_index.clear()
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    def _requests_session(self) -> Session:
+        if self._http is None:
+            session = Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=PLEX_MAX_CONNECTIONS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._http = session
+        return self._http
+
+    def _drop_handles(self) -> None:
+        self._server = None
+        self._server_key = None
+        self._sections.clear()
+
+
+_default_session: PlexSessionManager | None = None
+
+
+def get_plex_session() -> PlexSessionManager:
+    """Returns the process-wide Plex session manager, creating one on first use."""
+    global _default_session
+    if _default_session is None:
+        _default_session = PlexSessionManager()
+    return _default_session
+
+
+def open_plex_session(bot_data: dict[str, Any]) -> PlexSessionManager:
+    """Installs a fresh session manager for the application and records it in `bot_data`."""
+    global _default_session
+    manager = PlexSessionManager()
+    _default_session = manager
+    bot_data[PLEX_SESSION_KEY] = manager
+    return manager
+
+
+def close_plex_session(bot_data: dict[str, Any]) -> None:
+    global _default_session
+    manager = bot_data.pop(PLEX_SESSION_KEY, None)
+    if isinstance(manager, PlexSessionManager):
+        manager.close()
+        if _default_session is manager:
+            _default_session = None
@@ -1,7 +1,6 @@
 from .wikipedia import (
     _WIKI_FRANCHISE_CACHE,
     _WIKI_MOVIE_CACHE,
-    _WIKI_SOUP_CACHE,
     _WIKI_TITLES_CACHE,
     fetch_episode_title_from_wikipedia,
     fetch_episode_titles_for_season,
@@ -19,7 +18,6 @@ __all__ = [
     "fetch_total_seasons_from_wikipedia",
     "fetch_season_episode_count_from_wikipedia",
     "_WIKI_TITLES_CACHE",
-    "_WIKI_SOUP_CACHE",
     "_WIKI_MOVIE_CACHE",
     "_WIKI_FRANCHISE_CACHE",
 ]
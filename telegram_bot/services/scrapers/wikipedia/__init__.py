@@ -1,7 +1,6 @@
 from .cache import (
     _WIKI_FRANCHISE_CACHE,
     _WIKI_MOVIE_CACHE,
-    _WIKI_SOUP_CACHE,
     _WIKI_TITLES_CACHE,
 )
 from .episodes import (
@@ -28,7 +27,6 @@ __all__ = [
     "fetch_total_seasons_from_wikipedia",
     "fetch_season_episode_count_from_wikipedia",
     "_WIKI_TITLES_CACHE",
-    "_WIKI_SOUP_CACHE",
     "_WIKI_MOVIE_CACHE",
     "_WIKI_FRANCHISE_CACHE",
     "_extract_movies_from_infobox",
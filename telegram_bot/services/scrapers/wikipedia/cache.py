@@ -1,8 +1,7 @@
-from typing import Any
+from ...metadata_cache import CacheNamespace
 
-from bs4 import BeautifulSoup
-
-_WIKI_TITLES_CACHE: dict[tuple[str, int], tuple[dict[int, dict[str, Any]], str | None]] = {}
-_WIKI_SOUP_CACHE: dict[str, BeautifulSoup] = {}
-_WIKI_MOVIE_CACHE: dict[str, tuple[list[int], str | None]] = {}
-_WIKI_FRANCHISE_CACHE: dict[str, tuple[str, list[dict[str, Any]]]] = {}
+# Scraper-level results, keyed by the raw lookup title. They live in the shared
+# metadata cache so they are bounded by its byte budget and survive restarts.
+_WIKI_TITLES_CACHE = CacheNamespace("wiki:season_titles")
+_WIKI_MOVIE_CACHE = CacheNamespace("wiki:movie_search")
+_WIKI_FRANCHISE_CACHE = CacheNamespace("wiki:franchise_search")
@@ -1,4 +1,3 @@
-import asyncio
 import re
 from datetime import datetime
 from typing import Any
@@ -10,8 +9,9 @@ from ....config import logger
 from ....utils import extract_first_int
 from .cache import _WIKI_TITLES_CACHE
 from .dates import _extract_release_date_iso
-from .fetch import _fetch_html_from_page
 from .normalize import _YEAR_HEADER_TOKENS, _sanitize_wikipedia_title
+from .parsing import run_wiki_parse
+from .resolver import get_wiki_page_resolver
 
 
 async def fetch_episode_title_from_wikipedia(
@@ -21,7 +21,7 @@ async def fetch_episode_title_from_wikipedia(
     normalized_input = show_title.strip()
     cache_key = (normalized_input.lower(), season)
 
-    cached = _WIKI_TITLES_CACHE.get(cache_key)
+    cached = _WIKI_TITLES_CACHE.get(cache_key, None)
     if cached:
         titles_map, corrected = cached
         metadata = titles_map.get(episode)
@@ -31,14 +31,12 @@ async def fetch_episode_title_from_wikipedia(
 
     try:
         logger.info(f"[WIKI] Step 1: Finding main page to correct title for '{show_title}'")
-        search_results = await asyncio.to_thread(wikipedia.search, show_title)
+        search_results = await get_wiki_page_resolver().search(show_title)
         if not search_results:
             logger.error(f"[WIKI] No Wikipedia page found for '{show_title}'. Aborting.")
             return None, None
 
-        main_page = await asyncio.to_thread(
-            wikipedia.page, search_results[0], auto_suggest=False, redirect=True
-        )
+        main_page = await get_wiki_page_resolver().page(search_results[0])
         assert main_page is not None
 
         resolved_title = main_page.title.strip()
@@ -75,14 +73,14 @@ async def fetch_episode_title_from_wikipedia(
             )
         return None, None
 
+    page_to_scrape: wikipedia.WikipediaPage | None = None
     html_to_scrape: str | None = None
     try:
         direct_query = f"List of {canonical_title} episodes"
         logger.info(f"[WIKI] Step 2: Attempting to find dedicated episode page: '{direct_query}'")
-        list_page = await asyncio.to_thread(
-            wikipedia.page, direct_query, auto_suggest=False, redirect=True
-        )
-        html_to_scrape = await _fetch_html_from_page(list_page)
+        list_page = await get_wiki_page_resolver().page(direct_query)
+        page_to_scrape = list_page
+        html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
         logger.info("[WIKI] Found and will use dedicated episode page.")
 
     except wikipedia.exceptions.PageError:
@@ -90,13 +88,15 @@ async def fetch_episode_title_from_wikipedia(
             "[WIKI] No dedicated episode page found. Falling back to main show page HTML."
         )
         if main_page:
-            html_to_scrape = await _fetch_html_from_page(main_page)
+            page_to_scrape = main_page
+            html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
     except Exception as e:
         logger.error(
             f"[WIKI] Unexpected error fetching list page, falling back to main page HTML: {e}"
         )
         if main_page:
-            html_to_scrape = await _fetch_html_from_page(main_page)
+            page_to_scrape = main_page
+            html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
 
     if not html_to_scrape:
         logger.error("[WIKI] All page search attempts failed.")
@@ -108,10 +108,9 @@ async def fetch_episode_title_from_wikipedia(
             )
         return None, None
 
-    soup = BeautifulSoup(html_to_scrape, "html.parser")
-    titles_map = await _extract_titles_for_season(soup, season)
+    titles_map = await _titles_for_season_from_page(page_to_scrape, season)
     if titles_map:
-        _WIKI_TITLES_CACHE[cache_key] = (titles_map, corrected_show_title)
+        _WIKI_TITLES_CACHE.set(cache_key, (titles_map, corrected_show_title))
 
     metadata = titles_map.get(episode) if titles_map else None
     episode_title = metadata.get("title") if metadata else None
@@ -132,7 +131,7 @@ async def fetch_episode_titles_for_season(
     show_title: str, season: int, _last_resort: bool = False
 ) -> tuple[dict[int, dict[str, Any]], str | None]:
     cache_key = (show_title.strip().lower(), season)
-    cached = _WIKI_TITLES_CACHE.get(cache_key)
+    cached = _WIKI_TITLES_CACHE.get(cache_key, None)
     if cached:
         logger.info(f"[WIKI] Cache hit for episode titles: '{show_title}' S{season:02d}.")
         return cached[0], cached[1]
@@ -145,7 +144,7 @@ async def fetch_episode_titles_for_season(
         logger.info(
             f"[WIKI] Resolving main show page for '{show_title}' to determine canonical title."
         )
-        search_results = await asyncio.to_thread(wikipedia.search, show_title)
+        search_results = await get_wiki_page_resolver().search(show_title)
         if not search_results:
             logger.warning(f"[WIKI] No Wikipedia search results for '{show_title}'.")
             if not _last_resort:
@@ -153,9 +152,7 @@ async def fetch_episode_titles_for_season(
                 logger.info(f"[WIKI] Retrying with TV qualifier as last resort: '{qualified}'")
                 return await fetch_episode_titles_for_season(qualified, season, _last_resort=True)
             return {}, None
-        main_page = await asyncio.to_thread(
-            wikipedia.page, search_results[0], auto_suggest=False, redirect=True
-        )
+        main_page = await get_wiki_page_resolver().page(search_results[0])
         assert main_page is not None
         if main_page.title != show_title:
             corrected_show_title = main_page.title
@@ -172,32 +169,32 @@ async def fetch_episode_titles_for_season(
             return await fetch_episode_titles_for_season(qualified, season, _last_resort=True)
         return {}, None
 
+    page_to_scrape: wikipedia.WikipediaPage | None = None
     html_to_scrape: str | None = None
     try:
         direct_query_user = f"List of {show_title} episodes"
         logger.info(f"[WIKI] Attempting dedicated list page lookup: '{direct_query_user}'.")
-        list_page_user = await asyncio.to_thread(
-            wikipedia.page, direct_query_user, auto_suggest=False, redirect=True
-        )
+        list_page_user = await get_wiki_page_resolver().page(direct_query_user)
         logger.debug(f"[WIKI] List page URL: {list_page_user.url}")
-        html_to_scrape = await _fetch_html_from_page(list_page_user)
+        page_to_scrape = list_page_user
+        html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
     except Exception:
         try:
             direct_query_canon = f"List of {canonical_title} episodes"
             logger.info(
                 f"[WIKI] Dedicated list page not found. Retrying with canonical: '{direct_query_canon}'."
             )
-            list_page_canon = await asyncio.to_thread(
-                wikipedia.page, direct_query_canon, auto_suggest=False, redirect=True
-            )
+            list_page_canon = await get_wiki_page_resolver().page(direct_query_canon)
             logger.debug(f"[WIKI] List page URL: {list_page_canon.url}")
-            html_to_scrape = await _fetch_html_from_page(list_page_canon)
+            page_to_scrape = list_page_canon
+            html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
         except Exception:
             if main_page:
                 logger.info(
                     f"[WIKI] Dedicated list page not found. Falling back to main page for '{canonical_title}'."
                 )
-                html_to_scrape = await _fetch_html_from_page(main_page)
+                page_to_scrape = main_page
+                html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
 
     if not html_to_scrape:
         logger.warning(f"[WIKI] No HTML retrieved for '{canonical_title}'. Returning empty titles.")
@@ -207,13 +204,12 @@ async def fetch_episode_titles_for_season(
             return await fetch_episode_titles_for_season(qualified, season, _last_resort=True)
         return {}, corrected_show_title
 
-    soup = BeautifulSoup(html_to_scrape, "html.parser")
-    titles_map = await _extract_titles_for_season(soup, season)
+    titles_map = await _titles_for_season_from_page(page_to_scrape, season)
     if titles_map:
         logger.info(
             f"[WIKI] Parsed {len(titles_map)} episode titles for '{canonical_title}' S{season:02d}."
         )
-        _WIKI_TITLES_CACHE[cache_key] = (titles_map, corrected_show_title)
+        _WIKI_TITLES_CACHE.set(cache_key, (titles_map, corrected_show_title))
     if not titles_map and not _last_resort:
         qualified = f"{show_title} (TV series)"
         logger.info(
@@ -233,7 +229,7 @@ async def fetch_total_seasons_from_wikipedia(
         logger.info(
             f"[WIKI] Resolving main show page for '{show_title}' to determine total seasons."
         )
-        search_results = await asyncio.to_thread(wikipedia.search, show_title)
+        search_results = await get_wiki_page_resolver().search(show_title)
         if not search_results:
             logger.warning(f"[WIKI] No Wikipedia search results for '{show_title}'.")
             if not _last_resort:
@@ -241,9 +237,7 @@ async def fetch_total_seasons_from_wikipedia(
                 logger.info(f"[WIKI] Retrying with TV qualifier as last resort: '{qualified}'")
                 return await fetch_total_seasons_from_wikipedia(qualified, _last_resort=True)
             return None
-        main_page = await asyncio.to_thread(
-            wikipedia.page, search_results[0], auto_suggest=False, redirect=True
-        )
+        main_page = await get_wiki_page_resolver().page(search_results[0])
         assert main_page is not None
         if main_page.title != show_title:
             canonical_title = main_page.title
@@ -259,21 +253,22 @@ async def fetch_total_seasons_from_wikipedia(
             return await fetch_total_seasons_from_wikipedia(qualified, _last_resort=True)
         return None
 
+    page_to_scrape: wikipedia.WikipediaPage | None = None
     html_to_scrape: str | None = None
     try:
         direct_query = f"List of {canonical_title} episodes"
         logger.info(f"[WIKI] Attempting dedicated list page lookup: '{direct_query}'.")
-        list_page = await asyncio.to_thread(
-            wikipedia.page, direct_query, auto_suggest=False, redirect=True
-        )
+        list_page = await get_wiki_page_resolver().page(direct_query)
         logger.debug(f"[WIKI] List page URL: {list_page.url}")
-        html_to_scrape = await _fetch_html_from_page(list_page)
+        page_to_scrape = list_page
+        html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
     except Exception:
         if main_page:
             logger.info(
                 f"[WIKI] Dedicated list page not found. Falling back to main page for '{canonical_title}'."
             )
-            html_to_scrape = await _fetch_html_from_page(main_page)
+            page_to_scrape = main_page
+            html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
 
     if not html_to_scrape:
         logger.warning(
@@ -285,8 +280,22 @@ async def fetch_total_seasons_from_wikipedia(
             return await fetch_total_seasons_from_wikipedia(qualified, _last_resort=True)
         return None
 
-    soup = BeautifulSoup(html_to_scrape, "html.parser")
+    soup = await get_wiki_page_resolver().soup(page_to_scrape, "episode_list")
+    count = await run_wiki_parse(_extract_total_seasons, soup, canonical_title) if soup else None
+    if count is not None:
+        return count
 
+    logger.warning(f"[WIKI] Unable to determine season count for '{canonical_title}'.")
+    if not _last_resort:
+        qualified = f"{show_title} (TV series)"
+        logger.info(
+            f"[WIKI] Retrying season-count lookup with TV qualifier as last resort: '{qualified}'"
+        )
+        return await fetch_total_seasons_from_wikipedia(qualified, _last_resort=True)
+    return None
+
+
+def _extract_total_seasons(soup: BeautifulSoup, canonical_title: str) -> int | None:
     try:
         for table in soup.find_all("table", class_="wikitable"):
             if not isinstance(table, Tag):
@@ -334,14 +343,6 @@ async def fetch_total_seasons_from_wikipedia(
             return count
     except Exception as e:
         logger.debug(f"[WIKI] Failed parsing season headers for '{canonical_title}': {e}")
-
-    logger.warning(f"[WIKI] Unable to determine season count for '{canonical_title}'.")
-    if not _last_resort:
-        qualified = f"{show_title} (TV series)"
-        logger.info(
-            f"[WIKI] Retrying season-count lookup with TV qualifier as last resort: '{qualified}'"
-        )
-        return await fetch_total_seasons_from_wikipedia(qualified, _last_resort=True)
     return None
 
 
@@ -360,8 +361,9 @@ async def _parse_episode_tables(soup: BeautifulSoup, season: int, episode: int)
 
     episodes_header_pattern = re.compile(r"Episodes", re.IGNORECASE)
     episodes_header_tag = soup.find(
-        lambda tag: tag.name in ["h2", "h3"]
-        and bool(episodes_header_pattern.search(tag.get_text()))
+        lambda tag: (
+            tag.name in ["h2", "h3"] and bool(episodes_header_pattern.search(tag.get_text()))
+        )
     )
     if isinstance(episodes_header_tag, Tag):
         target_table = episodes_header_tag.find_next("table", class_="wikitable")
@@ -373,7 +375,16 @@ async def _parse_episode_tables(soup: BeautifulSoup, season: int, episode: int)
     return None
 
 
-async def _extract_titles_for_season(soup: BeautifulSoup, season: int) -> dict[int, dict[str, Any]]:
+async def _titles_for_season_from_page(
+    page: wikipedia.WikipediaPage | None, season: int
+) -> dict[int, dict[str, Any]]:
+    soup = await get_wiki_page_resolver().soup(page, "episode_list") if page else None
+    if soup is None:
+        return {}
+    return await run_wiki_parse(_extract_titles_for_season, soup, season)
+
+
+def _extract_titles_for_season(soup: BeautifulSoup, season: int) -> dict[int, dict[str, Any]]:
     def _get_column_indices(
         table: Tag, *, default_ep: int, default_title: int
     ) -> tuple[int, int, int | None]:
@@ -467,8 +478,9 @@ async def _extract_titles_for_season(soup: BeautifulSoup, season: int) -> dict[i
 
     episodes_header_pattern = re.compile(r"Episodes", re.IGNORECASE)
     episodes_header_tag = soup.find(
-        lambda tag: tag.name in ["h2", "h3"]
-        and bool(episodes_header_pattern.search(tag.get_text()))
+        lambda tag: (
+            tag.name in ["h2", "h3"] and bool(episodes_header_pattern.search(tag.get_text()))
+        )
     )
     if isinstance(episodes_header_tag, Tag):
         target_table = episodes_header_tag.find_next("table", class_="wikitable")
@@ -570,27 +582,24 @@ async def fetch_season_episode_count_from_wikipedia(
     show_title: str, season: int, _last_resort: bool = False
 ) -> int | None:
     logger.info(f"[WIKI] Fetching episode count for '{show_title}' S{season:02d} from Wikipedia.")
+    page_to_scrape: wikipedia.WikipediaPage | None = None
     html_to_scrape = None
     try:
         logger.debug(
             f"[WIKI] Trying dedicated list page for '{show_title}': 'List of {show_title} episodes'."
         )
-        list_page = await asyncio.to_thread(
-            wikipedia.page,
-            f"List of {show_title} episodes",
-            auto_suggest=False,
-            redirect=True,
-        )
+        list_page = await get_wiki_page_resolver().page(f"List of {show_title} episodes")
         logger.debug(
             f"[WIKI] List page resolved -> title: '{getattr(list_page, 'title', '?')}', url: {getattr(list_page, 'url', '?')}"
         )
-        html_to_scrape = await _fetch_html_from_page(list_page)
+        page_to_scrape = list_page
+        html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
     except wikipedia.exceptions.PageError:
         try:
             logger.debug(
                 f"[WIKI] Dedicated list page missing. Performing search-first fallback for '{show_title}'."
             )
-            search_results = await asyncio.to_thread(wikipedia.search, show_title)
+            search_results = await get_wiki_page_resolver().search(show_title)
             logger.debug(
                 f"[WIKI] Search results for '{show_title}': {search_results[:5] if search_results else '[]'}"
             )
@@ -598,33 +607,29 @@ async def fetch_season_episode_count_from_wikipedia(
                 logger.error(f"[WIKI] No search results for '{show_title}' during fallback.")
                 return None
 
-            main_page = await asyncio.to_thread(
-                wikipedia.page, search_results[0], auto_suggest=False, redirect=True
-            )
+            main_page = await get_wiki_page_resolver().page(search_results[0])
             logger.debug(
                 f"[WIKI] Fallback main page -> title: '{getattr(main_page, 'title', '?')}', url: {getattr(main_page, 'url', '?')}"
             )
-            html_to_scrape = await _fetch_html_from_page(main_page)
+            page_to_scrape = main_page
+            html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
         except wikipedia.exceptions.DisambiguationError as e:
             options_preview = e.options[:5] if hasattr(e, "options") else []
             logger.debug(f"[WIKI] Disambiguation for '{show_title}'. Options: {options_preview}")
             try:
                 choice = e.options[0]
-                chosen_page = await asyncio.to_thread(
-                    wikipedia.page, choice, auto_suggest=False, redirect=True
-                )
+                chosen_page = await get_wiki_page_resolver().page(choice)
                 logger.debug(
                     f"[WIKI] Disambiguation choice -> title: '{getattr(chosen_page, 'title', '?')}', url: {getattr(chosen_page, 'url', '?')}"
                 )
-                html_to_scrape = await _fetch_html_from_page(chosen_page)
+                page_to_scrape = chosen_page
+                html_to_scrape = await get_wiki_page_resolver().html(page_to_scrape)
             except Exception as e2:
                 logger.error(f"[WIKI] Failed to resolve disambiguation for '{show_title}': {e2}")
                 return None
         except Exception as e:
             try:
-                auto_page = await asyncio.to_thread(
-                    wikipedia.page, show_title, auto_suggest=True, redirect=True
-                )
+                auto_page = await get_wiki_page_resolver().page(show_title, auto_suggest=True)
                 logger.debug(
                     f"[WIKI] Autosuggest diagnostic -> title: '{getattr(auto_page, 'title', '?')}', url: {getattr(auto_page, 'url', '?')}"
                 )
@@ -660,11 +665,27 @@ async def fetch_season_episode_count_from_wikipedia(
             )
         return None
 
-    soup = BeautifulSoup(html_to_scrape, "html.parser")
+    soup = await get_wiki_page_resolver().soup(page_to_scrape, "episode_list")
+    if soup is None:
+        return None
+    count, overview_found = await run_wiki_parse(
+        _extract_season_episode_count, soup, show_title, season
+    )
+    if count is None and not overview_found and not _last_resort:
+        qualified = f"{show_title} (TV series)"
+        logger.info(f"[WIKI] Retrying with TV qualifier as last resort: '{qualified}'")
+        return await fetch_season_episode_count_from_wikipedia(qualified, season, _last_resort=True)
+    return count
+
+
+def _extract_season_episode_count(
+    soup: BeautifulSoup, show_title: str, season: int
+) -> tuple[int | None, bool]:
+    """Returns the season's episode count and whether a series overview table was found."""
 
     count_from_titles: int | None = None
     try:
-        titles_map = await _extract_titles_for_season(soup, season)
+        titles_map = _extract_titles_for_season(soup, season)
         if titles_map:
             ep_numbers = sorted(titles_map.keys())
             count_from_titles = ep_numbers[-1] if ep_numbers else len(titles_map)
@@ -697,19 +718,13 @@ async def fetch_season_episode_count_from_wikipedia(
             logger.info(
                 f"[WIKI] Using titles-derived count for '{show_title}' S{season:02d}: {count_from_titles}"
             )
-            return count_from_titles
-        if not _last_resort:
-            qualified = f"{show_title} (TV series)"
-            logger.info(f"[WIKI] Retrying with TV qualifier as last resort: '{qualified}'")
-            return await fetch_season_episode_count_from_wikipedia(
-                qualified, season, _last_resort=True
-            )
-        return None
+            return count_from_titles, False
+        return None, False
 
     header_row = overview_table.find("tr")
     if not isinstance(header_row, Tag):
         logger.debug(f"[WIKI] Header row not found in overview table for '{show_title}'.")
-        return None
+        return None, True
 
     header_cells = [th.get_text(strip=True).lower() for th in header_row.find_all("th")]
     episodes_col_index = -1
@@ -732,7 +747,7 @@ async def fetch_season_episode_count_from_wikipedia(
         logger.debug(
             f"[WIKI] Could not locate 'Episodes' column in overview table for '{show_title}'."
         )
-        return None
+        return None, True
 
     for row in overview_table.find_all("tr")[1:]:
         if not isinstance(row, Tag):
@@ -761,8 +776,8 @@ async def fetch_season_episode_count_from_wikipedia(
                     f"[WIKI] Overview indicates season is ongoing for '{show_title}' S{season:02d}; skipping overview count."
                 )
                 if isinstance(count_from_titles, int) and count_from_titles > 0:
-                    return count_from_titles
-                return None
+                    return count_from_titles, True
+                return None, True
             ep_text = cells[episodes_col_index].get_text(strip=True)
             ep_count = extract_first_int(ep_text)
             logger.info(
@@ -772,12 +787,12 @@ async def fetch_season_episode_count_from_wikipedia(
                 logger.info(
                     f"[WIKI] Overview says {ep_count}, titles count is {count_from_titles}. Using titles count for '{show_title}' S{season:02d}."
                 )
-                return count_from_titles
-            return ep_count
+                return count_from_titles, True
+            return ep_count, True
 
     if isinstance(count_from_titles, int) and count_from_titles > 0:
         logger.info(
             f"[WIKI] Using titles-derived fallback for '{show_title}' S{season:02d}: {count_from_titles}"
         )
-        return count_from_titles
-    return None
+        return count_from_titles, True
+    return None, True
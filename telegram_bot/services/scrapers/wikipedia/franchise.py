@@ -19,6 +19,7 @@ from .normalize import (
     _normalize_for_comparison,
     _sanitize_wikipedia_title,
 )
+from .parsing import parse_wiki_html, run_wiki_parse
 
 _FRANCHISE_KEYWORDS = (
     "film series",
@@ -495,7 +496,12 @@ def _extract_movies_from_navbox_films(soup: BeautifulSoup) -> list[dict[str, Any
 
 
 def _extract_franchise_candidate_result(html: str) -> _FranchiseExtractionResult | None:
-    soup = BeautifulSoup(html, "html.parser")
+    return _extract_franchise_candidate_from_soup(parse_wiki_html(html))
+
+
+def _extract_franchise_candidate_from_soup(
+    soup: BeautifulSoup,
+) -> _FranchiseExtractionResult | None:
     extractors: tuple[tuple[_FranchiseSourceKind, Any], ...] = (
         ("infobox", _extract_movies_from_infobox),
         ("film_series_section", _extract_movies_from_film_series_section),
@@ -512,6 +518,28 @@ def _extract_franchise_candidate_result(html: str) -> _FranchiseExtractionResult
     return None
 
 
+def _evaluate_franchise_candidate_html(
+    html: str,
+    *,
+    candidate_title: str,
+    resolved_title: str,
+) -> tuple[_FranchiseExtractionResult, dict[str, Any]] | None:
+    """Parses a candidate page once, then extracts its films and scores it."""
+    # Section walkers follow sibling paragraphs and lists, so the whole page is parsed.
+    soup = parse_wiki_html(html)
+    extraction = _extract_franchise_candidate_from_soup(soup)
+    if not extraction:
+        return None
+    scoring = _score_franchise_candidate(
+        candidate_title=candidate_title,
+        resolved_title=resolved_title,
+        soup=soup,
+        movies=extraction["movies"],
+        source_kind=extraction["source_kind"],
+    )
+    return extraction, scoring
+
+
 def _text_from_infobox_nodes(nodes: list[Tag | NavigableString]) -> str:
     parts: list[str] = []
     for node in nodes:
@@ -859,8 +887,9 @@ async def fetch_movie_franchise_details_from_wikipedia(
         return None
 
     cache_key = search_title.casefold()
-    if cache_key in _WIKI_FRANCHISE_CACHE:
-        return _WIKI_FRANCHISE_CACHE[cache_key]
+    cached = _WIKI_FRANCHISE_CACHE.get(cache_key, None)
+    if cached is not None:
+        return cached
 
     search_variants = [
         f"{search_title} film series",
@@ -909,22 +938,19 @@ async def fetch_movie_franchise_details_from_wikipedia(
         html = await _fetch_html_from_page(page)
         if not html:
             continue
-        extraction = _extract_franchise_candidate_result(html)
-        if not extraction:
-            continue
-        if progress_callback is not None:
-            resolved_name = _sanitize_wikipedia_title(page.title.strip())
-            await progress_callback("score", resolved_name)
-
-        soup = BeautifulSoup(html, "html.parser")
         resolved_name = _sanitize_wikipedia_title(page.title.strip())
-        scoring = _score_franchise_candidate(
+        evaluated = await run_wiki_parse(
+            _evaluate_franchise_candidate_html,
+            html,
             candidate_title=candidate,
             resolved_title=resolved_name,
-            soup=soup,
-            movies=extraction["movies"],
-            source_kind=extraction["source_kind"],
         )
+        if evaluated is None:
+            continue
+        extraction, scoring = evaluated
+        if progress_callback is not None:
+            await progress_callback("score", resolved_name)
+
         evaluated_candidates.append(
             {
                 "page_title": candidate,
@@ -941,5 +967,5 @@ async def fetch_movie_franchise_details_from_wikipedia(
         return None
 
     payload = (best_candidate["resolved_title"], best_candidate["movies"])
-    _WIKI_FRANCHISE_CACHE[cache_key] = payload
+    _WIKI_FRANCHISE_CACHE.set(cache_key, payload)
     return payload
@@ -1,13 +1,15 @@
 import asyncio
 import re
+from collections.abc import Callable
 
 import wikipedia
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from ....config import logger
 from .cache import _WIKI_MOVIE_CACHE
 from .fetch import _fetch_html_from_page
 from .normalize import _normalize_for_comparison
+from .parsing import FILM_PAGE_STRAINER, LINK_STRAINER, parse_wiki_html, run_wiki_parse
 
 
 async def fetch_movie_years_from_wikipedia(
@@ -18,7 +20,7 @@ async def fetch_movie_years_from_wikipedia(
         return [], None
 
     cache_key = title.lower()
-    cached = _WIKI_MOVIE_CACHE.get(cache_key)
+    cached = _WIKI_MOVIE_CACHE.get(cache_key, None)
     if cached:
         return cached
 
@@ -27,15 +29,6 @@ async def fetch_movie_years_from_wikipedia(
     generic_film_pat = re.compile(r"\((?:feature\s+)?film\)", re.IGNORECASE)
     disamb_pat = re.compile(r"\(disambiguation\)\Z", re.IGNORECASE)
 
-    def _extract_years_from_text(text: str) -> list[int]:
-        yrs = []
-        for m in re.finditer(r"\b(19\d{2}|20\d{2})\b", text):
-            try:
-                yrs.append(int(m.group(1)))
-            except Exception:
-                continue
-        return yrs
-
     def _year_from_title(page_title: str) -> int | None:
         m = re.search(r"\((19\d{2}|20\d{2})\s+film\)", page_title, re.IGNORECASE)
         return int(m.group(1)) if m else None
@@ -143,32 +136,9 @@ async def fetch_movie_years_from_wikipedia(
                     if page:
                         html = await _fetch_html_from_page(page)
                         if html:
-                            soup = BeautifulSoup(html, "html.parser")
-                            infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
-                            if isinstance(infobox, Tag):
-                                for row in infobox.find_all("tr"):
-                                    if not isinstance(row, Tag):
-                                        continue
-                                    th = row.find("th")
-                                    if th and "release" in th.get_text(strip=True).lower():
-                                        td = row.find("td")
-                                        if td:
-                                            cand_years = _extract_years_from_text(
-                                                td.get_text(" ", strip=True)
-                                            )
-                                            for y in cand_years:
-                                                if y not in years:
-                                                    years.append(y)
-                            if not years:
-                                lead_p = soup.find("p")
-                                if isinstance(lead_p, Tag):
-                                    m2 = re.search(
-                                        r"\b(19\d{2}|20\d{2})\b[^.]{0,60}\bfilm\b",
-                                        lead_p.get_text(" ", strip=True),
-                                        re.IGNORECASE,
-                                    )
-                                    if m2:
-                                        years.append(int(m2.group(1)))
+                            for y in await run_wiki_parse(_extract_film_page_years, html):
+                                if y not in years:
+                                    years.append(y)
         except wikipedia.exceptions.DisambiguationError as d_err:
             for opt in getattr(d_err, "options", []) or []:
                 m = re.search(r"\((19\d{2}|20\d{2})\s+film\)", opt, re.IGNORECASE)
@@ -187,21 +157,14 @@ async def fetch_movie_years_from_wikipedia(
             )
             html = await _fetch_html_from_page(disamb_page)
             if html:
-                soup = BeautifulSoup(html, "html.parser")
-                for a in soup.find_all("a", href=True):
-                    if not isinstance(a, Tag):
-                        continue
-                    text = a.get_text(strip=True)
-                    if not text:
-                        continue
-                    if not _candidate_matches_title(text):
-                        continue
-                    m = year_film_pat.search(text)
-                    if m:
-                        try:
-                            equal_precision_years.add(int(m.group(1)))
-                        except Exception:
-                            pass
+                equal_precision_years.update(
+                    await run_wiki_parse(
+                        _extract_disambiguation_film_years,
+                        html,
+                        _candidate_matches_title,
+                        year_film_pat,
+                    )
+                )
         except Exception as e:  # noqa: BLE001
             logger.debug(
                 "[WIKI] Error parsing disambiguation for '%s' via '%s': %s",
@@ -218,21 +181,14 @@ async def fetch_movie_years_from_wikipedia(
             )
             html = await _fetch_html_from_page(disamb_page)
             if html:
-                soup = BeautifulSoup(html, "html.parser")
-                for a in soup.find_all("a", href=True):
-                    if not isinstance(a, Tag):
-                        continue
-                    text = a.get_text(strip=True)
-                    if not text:
-                        continue
-                    if not _candidate_matches_title(text):
-                        continue
-                    m = year_film_pat.search(text)
-                    if m:
-                        try:
-                            equal_precision_years.add(int(m.group(1)))
-                        except Exception:
-                            pass
+                equal_precision_years.update(
+                    await run_wiki_parse(
+                        _extract_disambiguation_film_years,
+                        html,
+                        _candidate_matches_title,
+                        year_film_pat,
+                    )
+                )
         except Exception:
             pass
 
@@ -265,5 +221,67 @@ async def fetch_movie_years_from_wikipedia(
         preferred_years,
         corrected_for_search,
     )
-    _WIKI_MOVIE_CACHE[cache_key] = (preferred_years, corrected_for_search)
+    _WIKI_MOVIE_CACHE.set(cache_key, (preferred_years, corrected_for_search))
     return preferred_years, corrected_for_search
+
+
+def _extract_years_from_text(text: str) -> list[int]:
+    yrs = []
+    for m in re.finditer(r"\b(19\d{2}|20\d{2})\b", text):
+        try:
+            yrs.append(int(m.group(1)))
+        except Exception:
+            continue
+    return yrs
+
+
+def _extract_film_page_years(html: str) -> list[int]:
+    """Reads release years from a film page's infobox, falling back to its lead paragraph."""
+    years: list[int] = []
+    soup = parse_wiki_html(html, FILM_PAGE_STRAINER)
+    infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
+    if isinstance(infobox, Tag):
+        for row in infobox.find_all("tr"):
+            if not isinstance(row, Tag):
+                continue
+            th = row.find("th")
+            if th and "release" in th.get_text(strip=True).lower():
+                td = row.find("td")
+                if td:
+                    for y in _extract_years_from_text(td.get_text(" ", strip=True)):
+                        if y not in years:
+                            years.append(y)
+    if not years:
+        lead_p = soup.find("p")
+        if isinstance(lead_p, Tag):
+            m = re.search(
+                r"\b(19\d{2}|20\d{2})\b[^.]{0,60}\bfilm\b",
+                lead_p.get_text(" ", strip=True),
+                re.IGNORECASE,
+            )
+            if m:
+                years.append(int(m.group(1)))
+    return years
+
+
+def _extract_disambiguation_film_years(
+    html: str,
+    matches_title: Callable[[str], bool],
+    year_film_pat: re.Pattern[str],
+) -> set[int]:
+    """Collects years from "Title (YYYY film)" links on a disambiguation page."""
+    years: set[int] = set()
+    soup = parse_wiki_html(html, LINK_STRAINER)
+    for a in soup.find_all("a", href=True):
+        if not isinstance(a, Tag):
+            continue
+        text = a.get_text(strip=True)
+        if not text or not matches_title(text):
+            continue
+        m = year_film_pat.search(text)
+        if m:
+            try:
+                years.add(int(m.group(1)))
+            except Exception:
+                pass
+    return years
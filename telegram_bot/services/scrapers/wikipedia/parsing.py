@@ -0,0 +1,56 @@
+import asyncio
+import functools
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+WIKI_PARSE_MAX_WORKERS = 2
+
+# Elements the extractors read. Only these (and their descendants) are built
+# into the tree, which skips most of a long article's prose and markup.
+EPISODE_LIST_STRAINER = SoupStrainer(["h2", "h3", "table"])
+FILM_PAGE_STRAINER = SoupStrainer(["table", "p"])
+INFOBOX_STRAINER = SoupStrainer("table", class_=re.compile(r"\binfobox\b"))
+LINK_STRAINER = SoupStrainer("a", href=True)
+# Strainers by name, so cached soups are keyed on what they were parsed with.
+WIKI_STRAINERS: dict[str, SoupStrainer] = {
+    "episode_list": EPISODE_LIST_STRAINER,
+    "film_page": FILM_PAGE_STRAINER,
+    "infobox": INFOBOX_STRAINER,
+    "links": LINK_STRAINER,
+}
+
+_T = TypeVar("_T")
+
+_parse_executor: ThreadPoolExecutor | None = None
+
+
+def parse_wiki_html(html: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """Parses Wikipedia HTML with lxml, optionally keeping only `parse_only` elements."""
+    return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+
+def _get_parse_executor() -> ThreadPoolExecutor:
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ThreadPoolExecutor(
+            max_workers=WIKI_PARSE_MAX_WORKERS, thread_name_prefix="wiki-parse"
+        )
+    return _parse_executor
+
+
+async def run_wiki_parse(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Runs a parse-and-extract function on the Wikipedia parsing threads.
+
+    Large episode lists take hundreds of milliseconds to parse and walk, so
+    that work stays off the event loop. A dedicated pool keeps it from
+    queueing behind the page fetches running in the default executor.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_parse_executor(), functools.partial(func, *args, **kwargs)
+    )
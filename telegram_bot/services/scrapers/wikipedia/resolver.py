@@ -0,0 +1,183 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import wikipedia
+from bs4 import BeautifulSoup
+
+from ...single_flight import SingleFlight
+from .fetch import _fetch_html_from_page
+from .parsing import WIKI_STRAINERS, parse_wiki_html, run_wiki_parse
+
+WIKI_PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+WIKI_PAGE_CACHE_MAX_LOOKUPS = 512
+WIKI_PAGE_CACHE_TTL_SECONDS = 30 * 60
+# Rough in-memory cost of a parsed tree relative to its source HTML.
+WIKI_SOUP_SIZE_FACTOR = 6
+
+_MISS = object()
+# Lookup failures worth remembering: the page genuinely does not exist or is ambiguous.
+_CACHEABLE_ERRORS = (wikipedia.exceptions.PageError, wikipedia.exceptions.DisambiguationError)
+
+
+class _ByteBoundedLru:
+    """TTL-bounded LRU whose capacity is a total of per-entry sizes."""
+
+    def __init__(self, *, max_size: int, ttl: float, clock: Callable[[], float]) -> None:
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self.size = 0
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, int, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISS
+        expires_at, _, value = entry
+        if expires_at <= self._clock():
+            self._pop(key)
+            return _MISS
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        if key in self._entries:
+            self._pop(key)
+        if size > self.max_size:
+            return
+        self._entries[key] = (self._clock() + self.ttl, size, value)
+        self.size += size
+        while self.size > self.max_size:
+            self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def _pop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+
+class WikiPageResolver:
+    """
+    Shared cache for Wikipedia search results, pages, their HTML and parsed soups.
+
+    One TV lookup resolves the show page and its "List of ... episodes" page
+    for titles, season counts and episode counts. All of them go through here,
+    so each page is resolved, downloaded and parsed once. Search and page
+    lookups are bounded by entry count. HTML and soups share a byte budget and
+    are evicted least recently used first. Concurrent requests for the same
+    key share one in-flight call.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = WIKI_PAGE_CACHE_MAX_BYTES,
+        max_lookups: int = WIKI_PAGE_CACHE_MAX_LOOKUPS,
+        ttl: float = WIKI_PAGE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._lookups = _ByteBoundedLru(max_size=max_lookups, ttl=ttl, clock=clock)
+        self._content = _ByteBoundedLru(max_size=max_bytes, ttl=ttl, clock=clock)
+        self._single_flight = SingleFlight()
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._content.size
+
+    async def search(self, query: str) -> list[str]:
+        return await self._lookup(("search", query), lambda: wikipedia.search(query))
+
+    async def page(self, title: str, *, auto_suggest: bool = False) -> wikipedia.WikipediaPage:
+        """Resolves `title` (following redirects) to its canonical page."""
+        return await self._lookup(
+            ("page", title, auto_suggest),
+            lambda: wikipedia.page(title, auto_suggest=auto_suggest, redirect=True),
+        )
+
+    async def html(self, page: wikipedia.WikipediaPage) -> str | None:
+        key = ("html", _page_key(page))
+        cached = self._content.get(key)
+        if cached is not _MISS:
+            return cached
+
+        async def _fetch() -> str | None:
+            html = await _fetch_html_from_page(page)
+            if html:
+                self._content.put(key, html, len(html))
+            return html
+
+        return await self._single_flight.run(key, _fetch)
+
+    async def soup(
+        self,
+        page: wikipedia.WikipediaPage,
+        strainer: str | None = None,
+    ) -> BeautifulSoup | None:
+        """
+        Returns `page` parsed off the event loop, once per strainer.
+
+        `strainer` names an entry of `WIKI_STRAINERS`; without one the whole
+        page is parsed.
+        """
+        parse_only = WIKI_STRAINERS[strainer] if strainer is not None else None
+        key = ("soup", _page_key(page), strainer)
+        cached = self._content.get(key)
+        if cached is not _MISS:
+            return cached
+
+        async def _parse() -> BeautifulSoup | None:
+            html = await self.html(page)
+            if not html:
+                return None
+            soup = await run_wiki_parse(parse_wiki_html, html, parse_only)
+            self._content.put(key, soup, len(html) * WIKI_SOUP_SIZE_FACTOR)
+            return soup
+
+        return await self._single_flight.run(key, _parse)
+
+    def clear(self) -> None:
+        self._lookups.clear()
+        self._content.clear()
+
+    async def _lookup(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        cached = self._lookups.get(key)
+        if cached is not _MISS:
+            if isinstance(cached, BaseException):
+                raise cached.with_traceback(None)
+            return cached
+
+        async def _resolve() -> Any:
+            try:
+                value = await asyncio.to_thread(call)
+            except _CACHEABLE_ERRORS as exc:
+                self._lookups.put(key, exc, 1)
+                raise
+            self._lookups.put(key, value, 1)
+            return value
+
+        return await self._single_flight.run(key, _resolve)
+
+
+def _page_key(page: wikipedia.WikipediaPage) -> Hashable:
+    title = getattr(page, "title", None)
+    return title if isinstance(title, str) else id(page)
+
+
+_default_resolver: WikiPageResolver | None = None
+
+
+def get_wiki_page_resolver() -> WikiPageResolver:
+    """Returns the process-wide page resolver, creating it on first use."""
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = WikiPageResolver()
+    return _default_resolver
@@ -2,17 +2,13 @@
 
 from __future__ import annotations
 
-import threading
-import time
-from collections import OrderedDict
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
-from typing import Any, Hashable
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
 
 from ..config import logger
+from .metadata_cache import MetadataCache, get_metadata_cache
 from .scrapers import (
     _WIKI_MOVIE_CACHE,
-    _WIKI_SOUP_CACHE,
     _WIKI_TITLES_CACHE,
     fetch_episode_title_from_wikipedia,
 )
@@ -31,70 +27,66 @@ from .scrapers import (
 from .scrapers import (
     fetch_total_seasons_from_wikipedia as _raw_fetch_total_seasons,
 )
+from .scrapers.wikipedia.resolver import get_wiki_page_resolver
+from .single_flight import SingleFlight
 
-WIKI_CACHE_MAX_ENTRIES = 100
 WIKI_CACHE_TTL_SECONDS = 30 * 60  # 30 minutes
 WIKI_CACHE_FAILURE_TTL_SECONDS = 5 * 60  # Negative cache entries expire quickly
 
-
-@dataclass
-class _CacheEntry:
-    value: Any
-    expires_at: float
+_T = TypeVar("_T")
 
 
 class WikiCache:
-    """Simple TTL-based LRU cache for Wikipedia helper functions."""
+    """
+    TTL cache for Wikipedia helper functions, stored in the shared metadata cache.
+
+    It holds derived results (years, season counts, titles). Keys are tuples
+    whose first element names the lookup, and each lookup gets its own
+    `wiki:<lookup>` namespace so hit rates are reported separately. Failed
+    lookups are kept as negative entries for `failure_ttl`. The pages and
+    parsed soups those results come from are shared in `WikiPageResolver`
+    underneath, so a miss here usually costs only an extraction.
+    """
 
-    MISS = object()
+    MISS = MetadataCache.MISS
+    NAMESPACE = "wiki"
 
     def __init__(
         self,
         *,
-        max_entries: int = WIKI_CACHE_MAX_ENTRIES,
         ttl: float = WIKI_CACHE_TTL_SECONDS,
         failure_ttl: float = WIKI_CACHE_FAILURE_TTL_SECONDS,
-        clock: Callable[[], float] | None = None,
+        cache: MetadataCache | None = None,
     ) -> None:
-        self.max_entries = max(1, max_entries)
         self.ttl = ttl
         self.failure_ttl = failure_ttl
-        self._clock = clock or time.monotonic
-        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
-        self._lock = threading.Lock()
+        self._cache = cache
+
+    @property
+    def cache(self) -> MetadataCache:
+        return self._cache if self._cache is not None else get_metadata_cache()
 
     def get(self, key: Hashable) -> Any:
-        with self._lock:
-            entry = self._entries.get(key)
-            if not entry:
-                return WikiCache.MISS
-            if entry.expires_at <= self._clock():
-                del self._entries[key]
-                return WikiCache.MISS
-            self._entries.move_to_end(key)
-            return entry.value
-
-    def set(self, key: Hashable, value: Any, *, ttl: float | None = None) -> None:
-        expires_at = self._clock() + (ttl if ttl is not None else self.ttl)
-        with self._lock:
-            self._entries[key] = _CacheEntry(value=value, expires_at=expires_at)
-            self._entries.move_to_end(key)
-            self._evict_if_needed()
+        return self.cache.get(self._namespace(key), key)
 
-    def clear(self) -> None:
-        with self._lock:
-            self._entries.clear()
+    def set(
+        self, key: Hashable, value: Any, *, ttl: float | None = None, negative: bool = False
+    ) -> None:
+        if ttl is None:
+            ttl = self.failure_ttl if negative else self.ttl
+        self.cache.set(self._namespace(key), key, value, ttl=ttl, negative=negative)
 
-    def __len__(self) -> int:  # pragma: no cover - convenience
-        with self._lock:
-            return len(self._entries)
+    def clear(self) -> None:
+        self.cache.clear(WikiCache.NAMESPACE)
 
-    def _evict_if_needed(self) -> None:
-        while len(self._entries) > self.max_entries:
-            self._entries.popitem(last=False)
+    def _namespace(self, key: Hashable) -> str:
+        if isinstance(key, tuple) and key and isinstance(key[0], str):
+            return f"{WikiCache.NAMESPACE}:{key[0]}"
+        return WikiCache.NAMESPACE
 
 
 _WIKI_LOOKUP_CACHE = WikiCache()
+_WIKI_LOOKUP_FLIGHTS = SingleFlight()
 
 
 def _display_title(value: str) -> str:
@@ -146,13 +138,36 @@ def _log_cache_event(hit: bool, bucket: str, identifier: str) -> None:
 
 
 def _store_lookup_value(key: Hashable, value: Any, *, success: bool) -> None:
-    ttl = _WIKI_LOOKUP_CACHE.ttl if success else _WIKI_LOOKUP_CACHE.failure_ttl
-    _WIKI_LOOKUP_CACHE.set(key, value, ttl=ttl)
+    _WIKI_LOOKUP_CACHE.set(key, value, negative=not success)
+
+
+async def _cached_lookup(
+    key: Hashable,
+    bucket: str,
+    identifier: str,
+    fetch: Callable[[], Awaitable[_T]],
+    is_success: Callable[[_T], bool],
+) -> _T:
+    cached = _WIKI_LOOKUP_CACHE.get(key)
+    if cached is not WikiCache.MISS:
+        _log_cache_event(True, bucket, identifier)
+        return cached
+
+    _log_cache_event(False, bucket, identifier)
+
+    async def _fetch_and_store() -> _T:
+        result = await fetch()
+        _store_lookup_value(key, result, success=is_success(result))
+        return result
+
+    # Concurrent misses for the same key share one lookup.
+    return await _WIKI_LOOKUP_FLIGHTS.run(key, _fetch_and_store)
 
 
 def clear_wiki_cache() -> None:
-    """Clears the process-wide Wikipedia lookup cache (used in tests)."""
+    """Clears the process-wide Wikipedia lookup and page caches (used in tests)."""
     _WIKI_LOOKUP_CACHE.clear()
+    get_wiki_page_resolver().clear()
 
 
 def get_cached_movie_years(title: str) -> tuple[list[int], str | None] | None:
@@ -166,20 +181,13 @@ def get_cached_movie_years(title: str) -> tuple[list[int], str | None] | None:
 async def fetch_movie_years_from_wikipedia(
     movie_title: str, _last_resort: bool = False
 ) -> tuple[list[int], str | None]:
-    normalized_title = _display_title(movie_title)
-    cache_key = _movie_years_cache_key(movie_title)
-    cached = _WIKI_LOOKUP_CACHE.get(cache_key)
-    if cached is not WikiCache.MISS:
-        _log_cache_event(True, "movie_years", normalized_title)
-        return cached
-
-    _log_cache_event(False, "movie_years", normalized_title)
-    result = await _raw_fetch_movie_years(movie_title, _last_resort=_last_resort)
-    years: list[int] | None = None
-    if isinstance(result, tuple) and result:
-        years = result[0]
-    _store_lookup_value(cache_key, result, success=bool(years))
-    return result
+    return await _cached_lookup(
+        _movie_years_cache_key(movie_title),
+        "movie_years",
+        _display_title(movie_title),
+        lambda: _raw_fetch_movie_years(movie_title, _last_resort=_last_resort),
+        lambda result: bool(isinstance(result, tuple) and result and result[0]),
+    )
 
 
 async def fetch_movie_franchise_details(
@@ -189,72 +197,49 @@ async def fetch_movie_franchise_details(
 ) -> tuple[str, list[dict[str, Any]]] | None:
     """Returns a franchise name and list of movies, when available."""
     normalized_title = _display_title(movie_title)
-    cache_key = _franchise_cache_key(normalized_title)
-    cached = _WIKI_LOOKUP_CACHE.get(cache_key)
-    if cached is not WikiCache.MISS:
-        _log_cache_event(True, "movie_franchise", normalized_title)
-        return cached
-
-    _log_cache_event(False, "movie_franchise", normalized_title)
-    result = await _raw_fetch_franchise_details(movie_title, progress_callback=progress_callback)
-    success = bool(result and isinstance(result, tuple) and len(result) == 2)
-    _store_lookup_value(cache_key, result, success=success)
-    return result
+    return await _cached_lookup(
+        _franchise_cache_key(normalized_title),
+        "movie_franchise",
+        normalized_title,
+        lambda: _raw_fetch_franchise_details(movie_title, progress_callback=progress_callback),
+        lambda result: bool(result and isinstance(result, tuple) and len(result) == 2),
+    )
 
 
 async def fetch_total_seasons_from_wikipedia(
     show_title: str, _last_resort: bool = False
 ) -> int | None:
-    normalized_title = _display_title(show_title)
-    cache_key = _season_count_cache_key(show_title)
-    cached = _WIKI_LOOKUP_CACHE.get(cache_key)
-    if cached is not WikiCache.MISS:
-        _log_cache_event(True, "season_count", normalized_title)
-        return cached
-
-    _log_cache_event(False, "season_count", normalized_title)
-    result = await _raw_fetch_total_seasons(show_title, _last_resort=_last_resort)
-    success = isinstance(result, int) and result > 0
-    _store_lookup_value(cache_key, result, success=success)
-    return result
+    return await _cached_lookup(
+        _season_count_cache_key(show_title),
+        "season_count",
+        _display_title(show_title),
+        lambda: _raw_fetch_total_seasons(show_title, _last_resort=_last_resort),
+        lambda result: isinstance(result, int) and result > 0,
+    )
 
 
 async def fetch_season_episode_count_from_wikipedia(
     show_title: str, season: int, _last_resort: bool = False
 ) -> int | None:
-    normalized_title = _display_title(show_title)
-    cache_key = _episode_count_cache_key(show_title, season)
-    season_tag = _season_label(normalized_title, season)
-    cached = _WIKI_LOOKUP_CACHE.get(cache_key)
-    if cached is not WikiCache.MISS:
-        _log_cache_event(True, "episode_count", season_tag)
-        return cached
-
-    _log_cache_event(False, "episode_count", season_tag)
-    result = await _raw_fetch_episode_count(show_title, season, _last_resort=_last_resort)
-    success = isinstance(result, int) and result > 0
-    _store_lookup_value(cache_key, result, success=success)
-    return result
+    return await _cached_lookup(
+        _episode_count_cache_key(show_title, season),
+        "episode_count",
+        _season_label(_display_title(show_title), season),
+        lambda: _raw_fetch_episode_count(show_title, season, _last_resort=_last_resort),
+        lambda result: isinstance(result, int) and result > 0,
+    )
 
 
 async def fetch_episode_titles_for_season(
     show_title: str, season: int, _last_resort: bool = False
 ) -> tuple[dict[int, dict[str, Any]], str | None]:
-    normalized_title = _display_title(show_title)
-    cache_key = _episode_titles_cache_key(show_title, season)
-    season_tag = _season_label(normalized_title, season)
-    cached = _WIKI_LOOKUP_CACHE.get(cache_key)
-    if cached is not WikiCache.MISS:
-        _log_cache_event(True, "episode_titles", season_tag)
-        return cached
-
-    _log_cache_event(False, "episode_titles", season_tag)
-    result = await _raw_fetch_episode_titles_for_season(
-        show_title, season, _last_resort=_last_resort
+    return await _cached_lookup(
+        _episode_titles_cache_key(show_title, season),
+        "episode_titles",
+        _season_label(_display_title(show_title), season),
+        lambda: _raw_fetch_episode_titles_for_season(show_title, season, _last_resort=_last_resort),
+        lambda result: bool(isinstance(result, tuple) and result and result[0]),
     )
-    titles = result[0] if isinstance(result, tuple) and result else {}
-    _store_lookup_value(cache_key, result, success=bool(titles))
-    return result
 
 
 __all__ = [
@@ -268,6 +253,5 @@ __all__ = [
     "fetch_total_seasons_from_wikipedia",
     "fetch_season_episode_count_from_wikipedia",
     "_WIKI_TITLES_CACHE",
-    "_WIKI_SOUP_CACHE",
     "_WIKI_MOVIE_CACHE",
 ]
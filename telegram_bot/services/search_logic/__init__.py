@@ -1,12 +1,17 @@
 # telegram_bot/services/search_logic/__init__.py
 
 from .local_search import find_episode_file, find_media_by_name, find_season_directory
-from .orchestrator import has_configured_discovery_providers, orchestrate_searches
+from .orchestrator import (
+    has_configured_discovery_providers,
+    orchestrate_searches,
+    save_discovery_result_cache,
+)
 from .size_utils import _parse_size_to_gb, _parse_size_to_gib
 
 __all__ = [
     "orchestrate_searches",
     "has_configured_discovery_providers",
+    "save_discovery_result_cache",
     "_parse_size_to_gib",
     "_parse_size_to_gb",
     "find_media_by_name",
@@ -0,0 +1,50 @@
+# telegram_bot/services/search_logic/fuzzy_match.py
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from thefuzz import fuzz, process
+
+FUZZY_MATCH_THRESHOLD = 85
+
+
+@dataclass(frozen=True, slots=True)
+class FuzzyMatch:
+    key: str
+    name: str
+    score: int
+
+
+def rank_fuzzy_matches(
+    query: str,
+    candidates: Mapping[str, str],
+    *,
+    threshold: int = FUZZY_MATCH_THRESHOLD,
+    limit: int | None = None,
+) -> list[FuzzyMatch]:
+    """
+    Scores `query` against every candidate name in one batched pass.
+
+    `candidates` maps a key (usually the full path) to the name being matched.
+    Matches scoring above `threshold` with `fuzz.partial_ratio` are returned
+    best-first, truncated to the top `limit` when given.
+    """
+    if not query or not candidates:
+        return []
+    # The cutoff lets the matcher skip hopeless candidates early; thefuzz rounds
+    # scores afterwards, so the strict threshold is applied to the rounded value.
+    ranked = process.extractBests(
+        query,
+        candidates,
+        scorer=fuzz.partial_ratio,
+        score_cutoff=threshold,
+        limit=None,
+    )
+    matches = [
+        FuzzyMatch(key=key, name=name, score=score)
+        for name, score, key in ranked
+        if score > threshold
+    ]
+    return matches if limit is None else matches[:limit]
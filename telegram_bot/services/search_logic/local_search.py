@@ -3,10 +3,10 @@
 import asyncio
 import re
 
-from thefuzz import fuzz, process
-
-from .adapters import is_dir, join_path, list_dir, path_exists, walk_dir
+from ..library_index import get_library_index
+from .adapters import is_dir, join_path, list_dir, path_exists
 from .filesystem_filters import is_ignored_search_directory, is_ignored_search_file
+from .fuzzy_match import rank_fuzzy_matches
 
 
 async def find_media_by_name(
@@ -14,9 +14,13 @@ async def find_media_by_name(
     query: str,
     save_paths: dict[str, str],
     search_mode: str = "directory",
+    *,
+    limit: int | None = None,
 ) -> str | list[str] | None:
     """
     Finds a movie or TV show in the local library using fuzzy string matching.
+
+    Multiple matches are returned best-first, capped at `limit` when given.
     """
     path_key = "movies" if media_type == "movie" else "tv_shows"
     search_path = save_paths.get(path_key)
@@ -24,11 +28,9 @@ async def find_media_by_name(
     if not search_path or not path_exists(search_path):
         return None
 
-    matches = []
-    match_threshold = 85
-
-    def search_filesystem() -> None:
-        for root, dirs, files in walk_dir(search_path):
+    def search_filesystem() -> list[str]:
+        candidates: dict[str, str] = {}
+        for root, dirs, files in get_library_index().walk(search_path):
             if is_ignored_search_directory(root):
                 dirs[:] = []
                 continue
@@ -42,11 +44,10 @@ async def find_media_by_name(
             ]
             items_to_search = dirs if search_mode == "directory" else filtered_files
             for name in items_to_search:
-                ratio = process.extractOne(query, [name], scorer=fuzz.partial_ratio)
-                if ratio and ratio[1] > match_threshold:
-                    matches.append(join_path(root, name))
+                candidates[join_path(root, name)] = name
+        return [match.key for match in rank_fuzzy_matches(query, candidates, limit=limit)]
 
-    await asyncio.to_thread(search_filesystem)
+    matches = await asyncio.to_thread(search_filesystem)
 
     if not matches:
         return None
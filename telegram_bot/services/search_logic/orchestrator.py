@@ -5,13 +5,21 @@ from typing import Any
 
 from telegram.ext import ContextTypes
 
-from ...config import logger, resolve_scraper_max_torrent_size_gib
-from ..discovery import CircuitBreaker, DiscoveryOrchestrator, DiscoveryRequest
+from ...config import DISCOVERY_CACHE_FILE, logger, resolve_scraper_max_torrent_size_gib
+from ..discovery import (
+    CircuitBreaker,
+    DiscoveryOrchestrator,
+    DiscoveryRequest,
+    DiscoveryResultCache,
+    ProviderConcurrencyLimiter,
+)
 from ..discovery.orchestrator import PROVIDER_FACTORY
 
 _DEFAULT_MIN_RESULT_SCORE = 6
 _DEFAULT_MIN_RESULT_SEEDERS = 20
 _DISCOVERY_CIRCUIT_BREAKER_KEY = "DISCOVERY_CIRCUIT_BREAKER"
+_DISCOVERY_RESULT_CACHE_KEY = "DISCOVERY_RESULT_CACHE"
+_DISCOVERY_PROVIDER_LIMITER_KEY = "DISCOVERY_PROVIDER_LIMITER"
 _DISCOVERY_PROVIDER_KEYS = {
     "name",
     "type",
@@ -19,6 +27,8 @@ _DISCOVERY_PROVIDER_KEYS = {
     "enabled",
     "timeout_seconds",
     "categories",
+    "max_concurrent_requests",
+    "early_stop_after",
 }
 
 
@@ -117,6 +127,33 @@ def _get_discovery_circuit_breaker(bot_data: dict[str, Any]) -> CircuitBreaker:
     return breaker
 
 
+def _get_discovery_provider_limiter(bot_data: dict[str, Any]) -> ProviderConcurrencyLimiter:
+    limiter = bot_data.get(_DISCOVERY_PROVIDER_LIMITER_KEY)
+    if isinstance(limiter, ProviderConcurrencyLimiter):
+        return limiter
+
+    limiter = ProviderConcurrencyLimiter()
+    bot_data[_DISCOVERY_PROVIDER_LIMITER_KEY] = limiter
+    return limiter
+
+
+def _get_discovery_result_cache(bot_data: dict[str, Any]) -> DiscoveryResultCache:
+    cache = bot_data.get(_DISCOVERY_RESULT_CACHE_KEY)
+    if isinstance(cache, DiscoveryResultCache):
+        return cache
+
+    cache = DiscoveryResultCache(persist_path=DISCOVERY_CACHE_FILE)
+    bot_data[_DISCOVERY_RESULT_CACHE_KEY] = cache
+    return cache
+
+
+def save_discovery_result_cache(bot_data: dict[str, Any]) -> None:
+    """Writes the discovery result cache to disk, if one was created this run."""
+    cache = bot_data.get(_DISCOVERY_RESULT_CACHE_KEY)
+    if isinstance(cache, DiscoveryResultCache):
+        cache.save()
+
+
 def _build_discovery_request(
     query: str,
     media_type: str,
@@ -189,6 +226,8 @@ async def _orchestrate_discovery_searches(
         preferences=search_config.get("preferences", {}),
         breaker=_get_discovery_circuit_breaker(context.bot_data),
         min_result_score=min_result_score,
+        result_cache=_get_discovery_result_cache(context.bot_data),
+        limiter=_get_discovery_provider_limiter(context.bot_data),
     )
     try:
         results = await orchestrator.search(request)
@@ -0,0 +1,365 @@
+# telegram_bot/services/tmdb_client.py
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import time
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any
+
+from telegram_bot.config import logger
+from telegram_bot.services.http_client import shared_http_client
+from telegram_bot.services.metadata_cache import CacheNamespace
+from telegram_bot.services.single_flight import SingleFlight
+
+TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
+TMDB_REQUEST_TIMEOUT_SECONDS = 8.0
+# TMDB allows about 50 requests per second per IP; stay comfortably below it.
+TMDB_RATE_LIMIT_PER_SECOND = 40.0
+TMDB_RATE_LIMIT_BURST = 20
+TMDB_RATE_LIMIT_RETRIES = 2
+TMDB_RESPONSE_TTL_SECONDS = 6 * 60 * 60
+TMDB_TV_RESPONSE_TTL_SECONDS = 60 * 60  # Air dates of ongoing shows move more often
+# Release checks must notice new digital/physical dates quickly; ETag revalidation keeps it cheap.
+TMDB_RELEASE_RESPONSE_TTL_SECONDS = 10 * 60
+TMDB_NOT_FOUND_TTL_SECONDS = 30 * 60
+# Expired responses with an ETag are kept this long so they can be revalidated.
+TMDB_REVALIDATE_WINDOW_SECONDS = 7 * 24 * 60 * 60
+# One movie request returns details, release dates and watch providers together.
+TMDB_MOVIE_APPENDS = ("release_dates", "watch/providers")
+
+
+class TmdbError(Exception):
+    """Base class for TMDB client errors."""
+
+
+class TmdbCredentialsError(TmdbError):
+    """Raised when no TMDB access token or API key is configured."""
+
+
+class TmdbNotFoundError(TmdbError):
+    """Raised when TMDB answers 404 for a resource."""
+
+
+@dataclass(frozen=True)
+class TmdbAuth:
+    headers: dict[str, str] = field(default_factory=dict)
+    params: dict[str, str] = field(default_factory=dict)
+    region: str = "US"
+
+
+def get_tmdb_auth() -> TmdbAuth | None:
+    """Reads TMDB credentials from the environment; a bearer token wins over an API key."""
+    access_token = (os.getenv("TMDB_ACCESS_TOKEN") or os.getenv("TMDB_BEARER_TOKEN") or "").strip()
+    api_key = (os.getenv("TMDB_API_KEY") or "").strip()
+    region = (os.getenv("TMDB_REGION") or "US").strip().upper() or "US"
+
+    if access_token:
+        return TmdbAuth(headers={"Authorization": f"Bearer {access_token}"}, region=region)
+    if api_key:
+        return TmdbAuth(params={"api_key": api_key}, region=region)
+    return None
+
+
+def parse_tmdb_date(value: Any) -> date | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+def extract_tmdb_result_year(value: Any) -> int | None:
+    if not isinstance(value, str) or len(value) < 4:
+        return None
+    year_text = value[:4]
+    if not year_text.isdigit():
+        return None
+    year_value = int(year_text)
+    return year_value if year_value > 0 else None
+
+
+def coerce_tmdb_id(value: Any) -> int | None:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def _normalize_text_for_match(value: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", (value or "").casefold())
+
+
+def _normalize_title(value: str, year: int | None = None) -> str:
+    cleaned = (value or "").strip()
+    if not cleaned:
+        return "Unknown"
+    if year is None:
+        return cleaned
+    pattern = re.compile(rf"\s*\({int(year)}(?:\s+film)?\)\s*$", re.IGNORECASE)
+    normalized = pattern.sub("", cleaned).strip()
+    return normalized or cleaned
+
+
+def choose_tmdb_movie_result(
+    query_title: str,
+    *,
+    year: int | None,
+    raw_results: Any,
+    exact_title_score: int = 100,
+    collection_bonus: int = 0,
+) -> dict[str, Any] | None:
+    """Picks the `/search/movie` result that best matches the title and year."""
+    if not isinstance(raw_results, list):
+        return None
+
+    normalized_query = _normalize_text_for_match(_normalize_title(query_title, year))
+    best_score = -1
+    best: dict[str, Any] | None = None
+    for result in raw_results:
+        if not isinstance(result, dict):
+            continue
+
+        score = 0
+        candidate_title = str(result.get("title") or result.get("original_title") or "")
+        normalized_candidate = _normalize_text_for_match(candidate_title)
+        if normalized_candidate and normalized_candidate == normalized_query:
+            score += exact_title_score
+        elif normalized_query and normalized_query in normalized_candidate:
+            score += 40
+
+        if isinstance(year, int):
+            candidate_year = extract_tmdb_result_year(result.get("release_date"))
+            if candidate_year == year:
+                score += 80
+            elif isinstance(candidate_year, int) and abs(candidate_year - year) == 1:
+                score += 15
+
+        if collection_bonus and isinstance(result.get("belongs_to_collection"), dict):
+            score += collection_bonus
+
+        popularity = result.get("popularity")
+        if isinstance(popularity, (int, float)) and popularity > 0:
+            score += min(int(popularity // 10), 10)
+
+        if score > best_score:
+            best_score = score
+            best = result
+
+    return best
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, holding at most `capacity`.
+
+    Each `acquire()` reserves a token immediately and sleeps until it would
+    have been available, so waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+
+    async def acquire(self) -> float:
+        """Takes one token and returns the seconds spent waiting for it."""
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens / self.rate
+        await asyncio.sleep(delay)
+        return delay
+
+
+class TmdbClient:
+    """
+    Shared TMDB API client.
+
+    It owns the credentials and caches responses in the metadata cache. A
+    cached response is served while it is younger than the caller's TTL, then
+    revalidated with its ETag, so callers sharing a resource can differ in
+    how fresh they need it.
+    Identical requests in flight share one call. Every request waits on a
+    token bucket sized to TMDB's rate limit, and 429 responses are retried
+    after `Retry-After`. 404s raise `TmdbNotFoundError` and are remembered
+    briefly.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: CacheNamespace | None = None,
+        limiter: TokenBucket | None = None,
+        timeout: float = TMDB_REQUEST_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._cache = cache or CacheNamespace(
+            "tmdb:api",
+            ttl=TMDB_RESPONSE_TTL_SECONDS,
+            negative_ttl=TMDB_NOT_FOUND_TTL_SECONDS,
+        )
+        self._limiter = limiter or TokenBucket(TMDB_RATE_LIMIT_PER_SECOND, TMDB_RATE_LIMIT_BURST)
+        self._timeout = timeout
+        self._clock = clock
+        self._flights = SingleFlight()
+
+    @property
+    def auth(self) -> TmdbAuth | None:
+        return get_tmdb_auth()
+
+    async def get_json(
+        self,
+        path: str,
+        params: dict[str, str] | None = None,
+        *,
+        append_to_response: Sequence[str] = (),
+        ttl: float = TMDB_RESPONSE_TTL_SECONDS,
+    ) -> Any:
+        """GETs `path` (e.g. "/movie/603") and returns the decoded JSON body."""
+        auth = self.auth
+        if auth is None:
+            raise TmdbCredentialsError("TMDB credentials are not configured.")
+
+        query = dict(params or {})
+        if append_to_response:
+            query["append_to_response"] = ",".join(append_to_response)
+        key: Hashable = (path, tuple(sorted(query.items())))
+
+        entry = self._cache.get(key, None)
+        if entry is not None:
+            max_age = TMDB_NOT_FOUND_TTL_SECONDS if entry.get("missing") else ttl
+            if entry["fetched_at"] + max_age > self._clock():
+                return _payload_or_raise(entry, path)
+
+        return await self._flights.run(
+            key, lambda: self._fetch(path, query, auth=auth, key=key, ttl=ttl, stale=entry)
+        )
+
+    async def search_movie(self, title: str, *, year: int | None = None) -> Any:
+        params = {"query": title, "include_adult": "false"}
+        if isinstance(year, int):
+            params["year"] = str(year)
+            params["primary_release_year"] = str(year)
+        return await self.get_json("/search/movie", params)
+
+    async def movie(self, movie_id: int, *, ttl: float = TMDB_RESPONSE_TTL_SECONDS) -> Any:
+        """Movie details bundled with `release_dates` and `watch/providers`."""
+        return await self.get_json(
+            f"/movie/{int(movie_id)}", append_to_response=TMDB_MOVIE_APPENDS, ttl=ttl
+        )
+
+    async def collection(self, collection_id: int) -> Any:
+        return await self.get_json(f"/collection/{int(collection_id)}")
+
+    async def search_tv(self, title: str, *, year: int | None = None) -> Any:
+        params = {"query": title, "include_adult": "false"}
+        if isinstance(year, int):
+            params["first_air_date_year"] = str(year)
+        return await self.get_json("/search/tv", params)
+
+    async def tv(self, series_id: int) -> Any:
+        return await self.get_json(f"/tv/{int(series_id)}", ttl=TMDB_TV_RESPONSE_TTL_SECONDS)
+
+    async def tv_season(self, series_id: int, season: int) -> Any:
+        return await self.get_json(
+            f"/tv/{int(series_id)}/season/{int(season)}", ttl=TMDB_TV_RESPONSE_TTL_SECONDS
+        )
+
+    async def tv_episode(self, series_id: int, season: int, episode: int) -> Any:
+        return await self.get_json(
+            f"/tv/{int(series_id)}/season/{int(season)}/episode/{int(episode)}",
+            ttl=TMDB_TV_RESPONSE_TTL_SECONDS,
+        )
+
+    async def _fetch(
+        self,
+        path: str,
+        query: dict[str, str],
+        *,
+        auth: TmdbAuth,
+        key: Hashable,
+        ttl: float,
+        stale: dict[str, Any] | None,
+    ) -> Any:
+        headers = dict(auth.headers)
+        etag = stale.get("etag") if stale else None
+        if etag:
+            headers["If-None-Match"] = etag
+
+        async with shared_http_client(TMDB_API_BASE_URL, timeout=self._timeout) as client:
+            for attempt in range(TMDB_RATE_LIMIT_RETRIES + 1):
+                await self._limiter.acquire()
+                response = await client.get(
+                    f"{TMDB_API_BASE_URL}{path}",
+                    params={**auth.params, **query},
+                    headers=headers,
+                )
+                if response.status_code != 429 or attempt == TMDB_RATE_LIMIT_RETRIES:
+                    break
+                retry_after = _retry_after_seconds(response)
+                logger.info("[TMDB] Rate limited on %s; retrying in %.1fs.", path, retry_after)
+                await asyncio.sleep(retry_after)
+
+        now = self._clock()
+        if response.status_code == 304 and stale is not None:
+            entry = {**stale, "fetched_at": now}
+        elif response.status_code == 404:
+            self._cache.set(
+                key,
+                {"missing": True, "fetched_at": now},
+                negative=True,
+            )
+            raise TmdbNotFoundError(path)
+        else:
+            response.raise_for_status()
+            entry = {
+                "payload": response.json(),
+                "etag": response.headers.get("ETag"),
+                "fetched_at": now,
+            }
+
+        keep_for = ttl + (TMDB_REVALIDATE_WINDOW_SECONDS if entry.get("etag") else 0)
+        self._cache.set(key, entry, ttl=keep_for)
+        return entry["payload"]
+
+
+def _payload_or_raise(entry: dict[str, Any], path: str) -> Any:
+    if entry.get("missing"):
+        raise TmdbNotFoundError(path)
+    return entry["payload"]
+
+
+def _retry_after_seconds(response: Any, default: float = 1.0) -> float:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+_default_client: TmdbClient | None = None
+
+
+def get_tmdb_client() -> TmdbClient:
+    """Returns the process-wide TMDB client, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        _default_client = TmdbClient()
+    return _default_client
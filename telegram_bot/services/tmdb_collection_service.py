@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import os
-import re
-from datetime import date, datetime
+from datetime import date
 from typing import Any, Literal, TypedDict
 
-import httpx
-
 from telegram_bot.config import logger
-
-TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
-_TMDB_LOOKUP_TIMEOUT_SECONDS = 8.0
+from telegram_bot.services.tmdb_client import (
+    TmdbNotFoundError,
+    choose_tmdb_movie_result,
+    coerce_tmdb_id,
+    extract_tmdb_result_year,
+    get_tmdb_auth,
+    get_tmdb_client,
+    parse_tmdb_date,
+)
 
 TmdbCollectionLookupStatus = Literal[
     "ok",
@@ -54,109 +56,26 @@ class TmdbCollectionLookup(TypedDict):
     collection: TmdbCollectionSummary | None
 
 
-def _normalize_text_for_match(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", (value or "").casefold())
-
-
-def _normalize_title(value: str, year: int | None = None) -> str:
-    cleaned = (value or "").strip()
-    if not cleaned:
-        return "Unknown"
-    if year is None:
-        return cleaned
-    pattern = re.compile(rf"\s*\({int(year)}(?:\s+film)?\)\s*$", re.IGNORECASE)
-    normalized = pattern.sub("", cleaned).strip()
-    return normalized or cleaned
-
-
-def _extract_tmdb_result_year(value: Any) -> int | None:
-    if not isinstance(value, str) or len(value) < 4:
-        return None
-    year_text = value[:4]
-    if not year_text.isdigit():
-        return None
-    year_value = int(year_text)
-    return year_value if year_value > 0 else None
-
-
-def _parse_tmdb_date(value: Any) -> date | None:
-    if not isinstance(value, str) or not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
-    except ValueError:
-        return None
-
-
-def _coerce_tmdb_int(value: Any) -> int | None:
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str) and value.strip().isdigit():
-        return int(value.strip())
-    return None
-
-
-def _get_tmdb_auth() -> tuple[dict[str, str], dict[str, str], str] | None:
-    access_token = (os.getenv("TMDB_ACCESS_TOKEN") or os.getenv("TMDB_BEARER_TOKEN") or "").strip()
-    api_key = (os.getenv("TMDB_API_KEY") or "").strip()
-    region = (os.getenv("TMDB_REGION") or "US").strip().upper() or "US"
-
-    if access_token:
-        return {"Authorization": f"Bearer {access_token}"}, {}, region
-    if api_key:
-        return {}, {"api_key": api_key}, region
-    return None
-
-
 def _choose_tmdb_search_result(
     query_title: str,
     *,
     year: int | None,
     raw_results: Any,
 ) -> dict[str, Any] | None:
-    if not isinstance(raw_results, list):
-        return None
-
-    normalized_query = _normalize_text_for_match(_normalize_title(query_title, year))
-    best_score = -1
-    best: dict[str, Any] | None = None
-    for result in raw_results:
-        if not isinstance(result, dict):
-            continue
-
-        score = 0
-        candidate_title = str(result.get("title") or result.get("original_title") or "")
-        normalized_candidate = _normalize_text_for_match(candidate_title)
-        if normalized_candidate and normalized_candidate == normalized_query:
-            score += 120
-        elif normalized_query and normalized_query in normalized_candidate:
-            score += 40
-
-        if isinstance(year, int):
-            candidate_year = _extract_tmdb_result_year(result.get("release_date"))
-            if candidate_year == year:
-                score += 80
-            elif isinstance(candidate_year, int) and abs(candidate_year - year) == 1:
-                score += 15
-
-        if isinstance(result.get("belongs_to_collection"), dict):
-            score += 15
-
-        popularity = result.get("popularity")
-        if isinstance(popularity, (int, float)) and popularity > 0:
-            score += min(int(popularity // 10), 10)
-
-        if score > best_score:
-            best_score = score
-            best = result
-
-    return best
+    # Collection lookups favour exact titles and results already in a collection.
+    return choose_tmdb_movie_result(
+        query_title,
+        year=year,
+        raw_results=raw_results,
+        exact_title_score=120,
+        collection_bonus=15,
+    )
 
 
 def _build_movie_summary(payload: Any) -> TmdbMovieSummary | None:
     if not isinstance(payload, dict):
         return None
-    movie_id = _coerce_tmdb_int(payload.get("id"))
+    movie_id = coerce_tmdb_id(payload.get("id"))
     if movie_id is None:
         return None
 
@@ -175,7 +94,7 @@ def _build_movie_summary(payload: Any) -> TmdbMovieSummary | None:
         "title": normalized_title,
         "original_title": original_title,
         "release_date": normalized_release_date,
-        "release_year": _extract_tmdb_result_year(normalized_release_date),
+        "release_year": extract_tmdb_result_year(normalized_release_date),
     }
 
 
@@ -185,7 +104,7 @@ def _classify_release_status(
     release_year: int | None,
     reference_day: date,
 ) -> TmdbCollectionReleaseStatus:
-    parsed_release_date = _parse_tmdb_date(release_date)
+    parsed_release_date = parse_tmdb_date(release_date)
     if parsed_release_date is not None:
         return "released" if parsed_release_date <= reference_day else "upcoming"
 
@@ -200,7 +119,7 @@ def _classify_release_status(
 def _collection_movie_sort_key(
     movie: TmdbCollectionMovieSummary,
 ) -> tuple[int, int, str]:
-    parsed_release_date = _parse_tmdb_date(movie.get("release_date"))
+    parsed_release_date = parse_tmdb_date(movie.get("release_date"))
     if parsed_release_date is not None:
         return (0, parsed_release_date.toordinal(), movie.get("title", "").casefold())
 
@@ -220,7 +139,7 @@ def _build_collection_summary(
     if not isinstance(payload, dict):
         return None
 
-    collection_id = _coerce_tmdb_int(payload.get("id"))
+    collection_id = coerce_tmdb_id(payload.get("id"))
     if collection_id is None:
         return None
 
@@ -284,7 +203,7 @@ async def resolve_tmdb_collection_from_movie(
             "collection": None,
         }
 
-    auth = _get_tmdb_auth()
+    auth = get_tmdb_auth()
     if auth is None:
         logger.info(
             "[TMDB_COLLECTION] Lookup skipped for '%s' (year=%s): missing credentials.",
@@ -299,7 +218,7 @@ async def resolve_tmdb_collection_from_movie(
             "collection": None,
         }
 
-    headers, auth_params, region = auth
+    region = auth.region
     reference_day = reference_day or date.today()
     logger.info(
         "[TMDB_COLLECTION] Lookup started for '%s' (year=%s, region=%s).",
@@ -308,111 +227,82 @@ async def resolve_tmdb_collection_from_movie(
         region,
     )
 
-    search_params: dict[str, str] = {
-        **auth_params,
-        "query": lookup_title,
-        "include_adult": "false",
-    }
-    if isinstance(year, int):
-        search_params["year"] = str(year)
-        search_params["primary_release_year"] = str(year)
-
+    client = get_tmdb_client()
     try:
-        async with httpx.AsyncClient(timeout=_TMDB_LOOKUP_TIMEOUT_SECONDS) as client:
-            search_response = await client.get(
-                f"{TMDB_API_BASE_URL}/search/movie",
-                params=search_params,
-                headers=headers,
-            )
-            search_response.raise_for_status()
-            search_payload = search_response.json()
-            search_results = (
-                search_payload.get("results") if isinstance(search_payload, dict) else []
-            )
-            selected = _choose_tmdb_search_result(
-                lookup_title, year=year, raw_results=search_results
-            )
-            if not isinstance(selected, dict):
-                logger.info(
-                    "[TMDB_COLLECTION] No movie match found for '%s' (year=%s).",
-                    lookup_title,
-                    year,
-                )
-                return {
-                    "status": "movie_not_found",
-                    "reason": "TMDB search returned no confident movie match.",
-                    "region": region,
-                    "matched_movie": None,
-                    "collection": None,
-                }
-
-            matched_movie = _build_movie_summary(selected)
-            if matched_movie is None:
-                return {
-                    "status": "movie_not_found",
-                    "reason": "TMDB search result did not include a valid movie id.",
-                    "region": region,
-                    "matched_movie": None,
-                    "collection": None,
-                }
-
-            movie_response = await client.get(
-                f"{TMDB_API_BASE_URL}/movie/{matched_movie['id']}",
-                params=auth_params,
-                headers=headers,
-            )
-            if movie_response.status_code == 404:
-                return {
-                    "status": "movie_not_found",
-                    "reason": f"TMDB movie id {matched_movie['id']} was not found.",
-                    "region": region,
-                    "matched_movie": matched_movie,
-                    "collection": None,
-                }
-            movie_response.raise_for_status()
-            movie_payload = movie_response.json()
-            if isinstance(movie_payload, dict):
-                detailed_movie = _build_movie_summary(movie_payload)
-                if detailed_movie is not None:
-                    matched_movie = detailed_movie
-                collection_hint = movie_payload.get("belongs_to_collection")
-            else:
-                collection_hint = selected.get("belongs_to_collection")
-
-            if not isinstance(collection_hint, dict):
-                return {
-                    "status": "movie_without_collection",
-                    "reason": "Matched movie does not belong to a TMDB collection.",
-                    "region": region,
-                    "matched_movie": matched_movie,
-                    "collection": None,
-                }
-
-            collection_id = _coerce_tmdb_int(collection_hint.get("id"))
-            if collection_id is None:
-                return {
-                    "status": "movie_without_collection",
-                    "reason": "Matched movie includes an invalid TMDB collection id.",
-                    "region": region,
-                    "matched_movie": matched_movie,
-                    "collection": None,
-                }
-
-            collection_response = await client.get(
-                f"{TMDB_API_BASE_URL}/collection/{collection_id}",
-                params=auth_params,
-                headers=headers,
+        search_payload = await client.search_movie(lookup_title, year=year)
+        search_results = search_payload.get("results") if isinstance(search_payload, dict) else []
+        selected = _choose_tmdb_search_result(lookup_title, year=year, raw_results=search_results)
+        if not isinstance(selected, dict):
+            logger.info(
+                "[TMDB_COLLECTION] No movie match found for '%s' (year=%s).",
+                lookup_title,
+                year,
             )
-            if collection_response.status_code == 404:
-                return {
-                    "status": "collection_not_found",
-                    "reason": f"TMDB collection id {collection_id} was not found.",
-                    "region": region,
-                    "matched_movie": matched_movie,
-                    "collection": None,
-                }
-            collection_response.raise_for_status()
-            collection_payload = collection_response.json()
+            return {
+                "status": "movie_not_found",
+                "reason": "TMDB search returned no confident movie match.",
+                "region": region,
+                "matched_movie": None,
+                "collection": None,
+            }
+
+        matched_movie = _build_movie_summary(selected)
+        if matched_movie is None:
+            return {
+                "status": "movie_not_found",
+                "reason": "TMDB search result did not include a valid movie id.",
+                "region": region,
+                "matched_movie": None,
+                "collection": None,
+            }
+
+        try:
+            movie_payload = await client.movie(matched_movie["id"])
+        except TmdbNotFoundError:
+            return {
+                "status": "movie_not_found",
+                "reason": f"TMDB movie id {matched_movie['id']} was not found.",
+                "region": region,
+                "matched_movie": matched_movie,
+                "collection": None,
+            }
+        if isinstance(movie_payload, dict):
+            detailed_movie = _build_movie_summary(movie_payload)
+            if detailed_movie is not None:
+                matched_movie = detailed_movie
+            collection_hint = movie_payload.get("belongs_to_collection")
+        else:
+            collection_hint = selected.get("belongs_to_collection")
+
+        if not isinstance(collection_hint, dict):
+            return {
+                "status": "movie_without_collection",
+                "reason": "Matched movie does not belong to a TMDB collection.",
+                "region": region,
+                "matched_movie": matched_movie,
+                "collection": None,
+            }
+
+        collection_id = coerce_tmdb_id(collection_hint.get("id"))
+        if collection_id is None:
+            return {
+                "status": "movie_without_collection",
+                "reason": "Matched movie includes an invalid TMDB collection id.",
+                "region": region,
+                "matched_movie": matched_movie,
+                "collection": None,
+            }
+
+        try:
+            collection_payload = await client.collection(collection_id)
+        except TmdbNotFoundError:
+            return {
+                "status": "collection_not_found",
+                "reason": f"TMDB collection id {collection_id} was not found.",
+                "region": region,
+                "matched_movie": matched_movie,
+                "collection": None,
+            }
     except Exception as exc:  # noqa: BLE001
         logger.info("[TMDB_COLLECTION] Lookup failed for '%s': %s", lookup_title, exc)
         return {
@@ -1,9 +1,31 @@
 # telegram_bot/services/torrent_service/__init__.py
 
+from .alerts import (
+    TorrentAlertPump,
+    TorrentWatch,
+    get_torrent_alert_pump,
+    stop_torrent_alert_pump,
+)
 from .input_handlers import process_user_input
+from .metadata_cache import TorrentMetadataCache, get_torrent_metadata_cache, info_hash_hex
 from .metadata_fetch import fetch_metadata_from_magnet
+from .resume_data import (
+    RESUME_DATA_SAVE_INTERVAL_SECONDS,
+    TorrentResumeStore,
+    get_torrent_resume_store,
+)
 
 __all__ = [
     "process_user_input",
     "fetch_metadata_from_magnet",
+    "TorrentAlertPump",
+    "TorrentWatch",
+    "get_torrent_alert_pump",
+    "stop_torrent_alert_pump",
+    "TorrentMetadataCache",
+    "get_torrent_metadata_cache",
+    "info_hash_hex",
+    "RESUME_DATA_SAVE_INTERVAL_SECONDS",
+    "TorrentResumeStore",
+    "get_torrent_resume_store",
 ]
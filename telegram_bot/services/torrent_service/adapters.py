@@ -6,6 +6,8 @@ import os
 
 import httpx
 
+from telegram_bot.services.http_client import shared_http_client
+
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
@@ -22,5 +24,5 @@ async def fetch_url(
     timeout: int = 30,
     follow_redirects: bool = True,
 ) -> httpx.Response:
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=follow_redirects) as client:
-        return await client.get(url)
+    client = shared_http_client(url, timeout=timeout, follow_redirects=follow_redirects)
+    return await client.get(url)
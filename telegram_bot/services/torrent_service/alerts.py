@@ -0,0 +1,228 @@
+# telegram_bot/services/torrent_service/alerts.py
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import libtorrent as lt
+
+from telegram_bot.config import logger
+
+TORRENT_ALERT_PUMP_KEY = "TORRENT_ALERT_PUMP"
+ALERT_PUMP_UPDATE_INTERVAL_SECONDS = 1.0
+
+# Categories the pump relies on: status updates, metadata/finished notices and errors.
+_REQUIRED_ALERT_MASK = (
+    lt.alert.category_t.status_notification  # type: ignore
+    | lt.alert.category_t.error_notification  # type: ignore
+    | lt.alert.category_t.storage_notification  # type: ignore
+)
+
+AlertListener = Callable[[Any], None]
+
+
+class TorrentWatch:
+    """Latest alert-driven view of a single torrent handle."""
+
+    def __init__(self) -> None:
+        self.status: Any | None = None
+        self.error: str | None = None
+        self._updated = asyncio.Event()
+        self._metadata = asyncio.Event()
+        self._finished = asyncio.Event()
+
+    @property
+    def has_metadata(self) -> bool:
+        return self._metadata.is_set() or bool(getattr(self.status, "has_metadata", False))
+
+    @property
+    def finished(self) -> bool:
+        return self._finished.is_set() or bool(getattr(self.status, "is_seeding", False))
+
+    async def wait_for_update(self, timeout: float) -> None:
+        """Waits until the next alert for this torrent, or until `timeout` elapses."""
+        try:
+            await asyncio.wait_for(self._updated.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        self._updated.clear()
+
+    async def wait_for_metadata(self, timeout: float) -> bool:
+        """Waits for metadata (or an error). Returns True once metadata is available."""
+        deadline = time.monotonic() + timeout
+        while not self.has_metadata and self.error is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await self.wait_for_update(remaining)
+        return self.has_metadata
+
+    def _set_status(self, status: Any) -> None:
+        self.status = status
+        if getattr(status, "has_metadata", False):
+            self._metadata.set()
+        self._updated.set()
+
+    def _set_metadata(self) -> None:
+        self._metadata.set()
+        self._updated.set()
+
+    def _set_finished(self) -> None:
+        self._finished.set()
+        self._updated.set()
+
+    def _set_error(self, message: str) -> None:
+        self.error = message
+        self._updated.set()
+
+
+class TorrentAlertPump:
+    """
+    Drains libtorrent alerts for a whole session from a single asyncio task.
+
+    Each tick calls `post_torrent_updates()` once and fans the resulting status
+    updates, metadata arrival, completion and errors out to per-handle
+    `TorrentWatch` objects, so callers await alerts instead of polling
+    `handle.status()` in their own loops.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        *,
+        update_interval: float = ALERT_PUMP_UPDATE_INTERVAL_SECONDS,
+    ) -> None:
+        self._session = session
+        self._update_interval = update_interval
+        self._watches: dict[Any, TorrentWatch] = {}
+        self._listeners: list[AlertListener] = []
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._stop_requested = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Starts the pump task on the running loop. Safe to call more than once."""
+        if self.is_running:
+            return
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        self._wake = wake
+        self._stop_requested = False
+        self._ensure_alert_mask()
+        # libtorrent invokes this from its network thread when the alert queue
+        # goes from empty to non-empty; hop back onto the loop to drain it.
+        self._session.set_alert_notify(lambda: loop.call_soon_threadsafe(wake.set))
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the pump task and drains any alerts still queued."""
+        task = self._task
+        if task is None:
+            return
+        self._task = None
+        # Ask the loop to exit rather than cancelling it mid-`wait_for`, where a
+        # wake-up racing the cancellation can swallow it.
+        self._stop_requested = True
+        if self._wake is not None:
+            self._wake.set()
+        await asyncio.gather(task, return_exceptions=True)
+        try:
+            self._session.set_alert_notify(lambda: None)
+            self._dispatch(self._session.pop_alerts())
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[TORRENT] Failed to drain alerts during shutdown: %s", exc)
+
+    def watch(self, handle: Any) -> TorrentWatch:
+        """Returns the watch for `handle`, registering it on first use."""
+        watch = self._watches.get(handle)
+        if watch is None:
+            watch = TorrentWatch()
+            self._watches[handle] = watch
+        return watch
+
+    def unwatch(self, handle: Any) -> None:
+        self._watches.pop(handle, None)
+
+    def add_listener(self, listener: AlertListener) -> None:
+        """Registers a callback that receives every alert the pump pops."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: AlertListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _ensure_alert_mask(self) -> None:
+        try:
+            current_mask = int(self._session.get_settings().get("alert_mask", 0))
+            if current_mask & _REQUIRED_ALERT_MASK != _REQUIRED_ALERT_MASK:
+                self._session.apply_settings({"alert_mask": current_mask | _REQUIRED_ALERT_MASK})
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[TORRENT] Could not update libtorrent alert mask: %s", exc)
+
+    async def _run(self) -> None:
+        next_post_at = 0.0
+        while not self._stop_requested:
+            now = time.monotonic()
+            try:
+                if self._watches and now >= next_post_at:
+                    self._session.post_torrent_updates()
+                    next_post_at = now + self._update_interval
+                self._dispatch(self._session.pop_alerts())
+            except Exception:
+                logger.exception("[TORRENT] Alert pump tick failed.")
+                next_post_at = now + self._update_interval
+
+            timeout = max(0.0, next_post_at - time.monotonic()) or self._update_interval
+            assert self._wake is not None
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+
+    def _dispatch(self, alerts: Iterable[Any]) -> None:
+        for alert in alerts:
+            kind = alert.what()
+            if kind == "state_update":
+                for status in alert.status:
+                    watch = self._watches.get(status.handle)
+                    if watch is not None:
+                        watch._set_status(status)
+            else:
+                watch = self._watches.get(getattr(alert, "handle", None))
+                if watch is not None:
+                    if kind == "metadata_received":
+                        watch._set_metadata()
+                    elif kind == "torrent_finished":
+                        watch._set_finished()
+                    elif kind in ("torrent_error", "file_error", "metadata_failed"):
+                        watch._set_error(alert.message())
+
+            for listener in list(self._listeners):
+                try:
+                    listener(alert)
+                except Exception:
+                    logger.exception("[TORRENT] Alert listener failed for '%s'.", kind)
+
+
+def get_torrent_alert_pump(bot_data: dict[str, Any]) -> TorrentAlertPump:
+    """Returns the session's alert pump, creating and starting it on first use."""
+    pump = bot_data.get(TORRENT_ALERT_PUMP_KEY)
+    if not isinstance(pump, TorrentAlertPump):
+        pump = TorrentAlertPump(bot_data["TORRENT_SESSION"])
+        bot_data[TORRENT_ALERT_PUMP_KEY] = pump
+    pump.start()
+    return pump
+
+
+async def stop_torrent_alert_pump(bot_data: dict[str, Any]) -> None:
+    pump = bot_data.get(TORRENT_ALERT_PUMP_KEY)
+    if isinstance(pump, TorrentAlertPump):
+        await pump.stop()
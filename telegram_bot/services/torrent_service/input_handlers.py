@@ -21,7 +21,7 @@ from telegram_bot.services.media_manager import (
 from telegram_bot.ui.keyboards import single_column_keyboard
 from telegram_bot.utils import format_bytes, parse_torrent_name, safe_edit_message
 
-from .metadata_fetch import _blocking_fetch_metadata, fetch_metadata_from_magnet
+from .metadata_fetch import _fetch_metadata_bytes, fetch_metadata_from_magnet
 
 _MAGNET_LINK_PATTERN = re.compile(r"""(?i)href=["'](magnet:\?xt=urn:btih:[^"']+)["']""")
 _MAGNET_TEXT_PATTERN = re.compile(r"""(?i)magnet:\?xt=urn:btih:[^\s"'<>]+""")
@@ -226,7 +226,6 @@ async def _fetch_and_parse_magnet_details(
     progress_message: Message,
 ) -> list[dict[str, Any]]:
     """Fetches metadata for multiple magnet links in parallel and parses their details."""
-    ses = context.bot_data["TORRENT_SESSION"]
     status_text = escape_markdown(
         f"Found {len(magnet_links)} links. Fetching details...",
         version=2,
@@ -239,7 +238,7 @@ async def _fetch_and_parse_magnet_details(
 
     async def fetch_one(magnet_link: str, index: int):
         """Worker to fetch metadata for a single magnet link."""
-        bencoded_metadata = await asyncio.to_thread(_blocking_fetch_metadata, ses, magnet_link)
+        bencoded_metadata = await _fetch_metadata_bytes(context.bot_data, magnet_link)
         if bencoded_metadata:
             ti = lt.torrent_info(bencoded_metadata)  # type: ignore
             return {
@@ -0,0 +1,152 @@
+# telegram_bot/services/torrent_service/metadata_cache.py
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Any
+
+import libtorrent as lt
+
+from telegram_bot.config import TORRENT_METADATA_CACHE_DIR, logger
+
+TORRENT_METADATA_CACHE_KEY = "TORRENT_METADATA_CACHE"
+
+
+def info_hash_hex(source: Any) -> str | None:
+    """
+    Returns the best info-hash of a torrent_info or add_torrent_params as hex.
+
+    Handles both the libtorrent 2.x `info_hashes` API and the 1.x `info_hash`.
+    """
+    try:
+        hashes = getattr(source, "info_hashes", None)
+        if hashes is not None:
+            hashes = hashes() if callable(hashes) else hashes
+            best = str(hashes.get_best())
+        else:
+            legacy = source.info_hash
+            best = str(legacy() if callable(legacy) else legacy)
+    except Exception:  # noqa: BLE001
+        return None
+    best = best.strip().lower()
+    if not best or set(best) == {"0"}:
+        return None
+    return best
+
+
+class TorrentMetadataCache:
+    """
+    LRU cache of bencoded torrent metadata keyed by info-hash.
+
+    The hottest entries live in memory; entries evicted from memory spill to
+    `<spill_dir>/<info_hash>.torrent`, which is itself trimmed to `max_disk_entries`
+    by least-recent use. Confirming a magnet download after its metadata was
+    fetched for the preview then skips the second swarm round-trip.
+    """
+
+    def __init__(
+        self,
+        spill_dir: str | None = TORRENT_METADATA_CACHE_DIR,
+        *,
+        max_memory_entries: int = 32,
+        max_disk_entries: int = 256,
+    ) -> None:
+        self._spill_dir = spill_dir
+        self._max_memory_entries = max(1, max_memory_entries)
+        self._max_disk_entries = max(0, max_disk_entries)
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, info_hash: str | None) -> bytes | None:
+        if not info_hash:
+            return None
+        key = info_hash.lower()
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            return data
+
+        path = self._spill_path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as file_handle:
+                data = file_handle.read()
+            os.utime(path)  # Refresh recency for disk-level LRU trimming
+        except OSError as exc:
+            logger.warning("[TORRENT] Could not read cached metadata '%s': %s", path, exc)
+            return None
+        self._remember(key, data)
+        return data
+
+    def put(self, bencoded_metadata: bytes) -> str | None:
+        """Caches metadata under its own info-hash and returns that hash."""
+        try:
+            ti = lt.torrent_info(bencoded_metadata)  # type: ignore
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[TORRENT] Refusing to cache unreadable metadata: %s", exc)
+            return None
+        key = info_hash_hex(ti)
+        if key is None:
+            return None
+        self._remember(key, bytes(bencoded_metadata))
+        return key
+
+    def get_torrent_info(self, info_hash: str | None) -> Any | None:
+        data = self.get(info_hash)
+        if data is None:
+            return None
+        try:
+            return lt.torrent_info(data)  # type: ignore
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[TORRENT] Cached metadata for %s is unreadable: %s", info_hash, exc)
+            return None
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_memory_entries:
+            evicted_key, evicted_data = self._entries.popitem(last=False)
+            self._spill(evicted_key, evicted_data)
+
+    def _spill_path(self, key: str) -> str | None:
+        if not self._spill_dir or self._max_disk_entries == 0:
+            return None
+        return os.path.join(self._spill_dir, f"{key}.torrent")
+
+    def _spill(self, key: str, data: bytes) -> None:
+        path = self._spill_path(key)
+        if path is None or self._spill_dir is None:
+            return
+        try:
+            os.makedirs(self._spill_dir, exist_ok=True)
+            with open(path, "wb") as file_handle:
+                file_handle.write(data)
+            self._trim_disk()
+        except OSError as exc:
+            logger.warning("[TORRENT] Could not spill metadata to '%s': %s", path, exc)
+
+    def _trim_disk(self) -> None:
+        assert self._spill_dir is not None
+        entries = [
+            entry
+            for entry in os.scandir(self._spill_dir)
+            if entry.is_file() and entry.name.endswith(".torrent")
+        ]
+        if len(entries) <= self._max_disk_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - self._max_disk_entries]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+
+
+def get_torrent_metadata_cache(bot_data: dict[str, Any]) -> TorrentMetadataCache:
+    """Returns the application's metadata cache, creating it on first use."""
+    cache = bot_data.get(TORRENT_METADATA_CACHE_KEY)
+    if not isinstance(cache, TorrentMetadataCache):
+        cache = TorrentMetadataCache()
+        bot_data[TORRENT_METADATA_CACHE_KEY] = cache
+    return cache
@@ -3,6 +3,7 @@
 import asyncio
 import tempfile
 import time
+from typing import Any
 
 import libtorrent as lt
 from telegram import Message
@@ -12,7 +13,10 @@ from telegram.helpers import escape_markdown
 
 from telegram_bot.config import logger
 from telegram_bot.services.interfaces import TorrentSession
-from telegram_bot.utils import safe_edit_message
+from telegram_bot.utils import get_message_edit_scheduler, safe_edit_message
+
+from .alerts import get_torrent_alert_pump
+from .metadata_cache import get_torrent_metadata_cache, info_hash_hex
 
 
 async def fetch_metadata_from_magnet(
@@ -30,8 +34,7 @@ async def fetch_metadata_from_magnet(
     cancel_timer = asyncio.Event()
     timer_task = asyncio.create_task(_update_fetch_timer(progress_message, 120, cancel_timer))
 
-    ses = context.bot_data["TORRENT_SESSION"]
-    bencoded_metadata = await asyncio.to_thread(_blocking_fetch_metadata, ses, magnet_link)
+    bencoded_metadata = await _fetch_metadata_bytes(context.bot_data, magnet_link)
 
     cancel_timer.set()
     await timer_task
@@ -50,31 +53,46 @@ async def fetch_metadata_from_magnet(
     return None
 
 
-def _blocking_fetch_metadata(ses: TorrentSession, magnet_link: str) -> bytes | None:  # type: ignore
+async def _fetch_metadata_bytes(
+    bot_data: dict[str, Any], magnet_link: str, timeout_seconds: float = 30
+) -> bytes | None:
     """
-    Synchronous worker function to fetch torrent metadata. Intended to be run in a thread.
+    Adds the magnet in upload mode, awaits its metadata alert and returns the
+    bencoded torrent. The temporary handle is always removed again, and the
+    result is cached by info-hash so the confirmed download can reuse it.
     """
+    ses: TorrentSession = bot_data["TORRENT_SESSION"]
+    cache = get_torrent_metadata_cache(bot_data)
+    pump = get_torrent_alert_pump(bot_data)
     handle = None
     try:
         params = lt.parse_magnet_uri(magnet_link)  # type: ignore
+        cached_metadata = cache.get(info_hash_hex(params))
+        if cached_metadata is not None:
+            logger.info("Reusing cached metadata for magnet link.")
+            return cached_metadata
+
         params.save_path = tempfile.gettempdir()
         params.upload_mode = True  # Fetch metadata without downloading data
         handle = ses.add_torrent(params)
+        watch = pump.watch(handle)
 
-        timeout_seconds = 30
-        start_time = time.monotonic()
-        while time.monotonic() - start_time < timeout_seconds:
-            if handle.status().has_metadata:
-                ti = handle.torrent_file()
-                return lt.bencode(lt.create_torrent(ti).generate())  # type: ignore
-            time.sleep(0.5)
+        if await watch.wait_for_metadata(timeout_seconds):
+            ti = handle.torrent_file()
+            bencoded_metadata = lt.bencode(lt.create_torrent(ti).generate())  # type: ignore
+            cache.put(bencoded_metadata)
+            return bencoded_metadata
+        if watch.error is not None:
+            logger.warning(f"Metadata fetch failed for magnet link: {watch.error}")
 
     except Exception as e:
-        logger.error(f"An exception occurred in the metadata worker thread: {e}")
+        logger.error(f"An exception occurred while fetching magnet metadata: {e}")
     finally:
         # Ensure the handle is removed from the session on exit
-        if handle and handle.is_valid():
-            ses.remove_torrent(handle)
+        if handle is not None:
+            pump.unwatch(handle)
+            if handle.is_valid():
+                ses.remove_torrent(handle)
 
     return None
 
@@ -95,7 +113,9 @@ async def _update_fetch_timer(
             f"*Please wait, this can be slow\\.*\n"
             f"Elapsed Time: `{elapsed}s`"
         )
-        await safe_edit_message(
+        # Drained by the shared scheduler; the next direct edit of this message
+        # drops whatever tick is still queued.
+        get_message_edit_scheduler().enqueue(
             progress_message, text=message_text, parse_mode=ParseMode.MARKDOWN_V2
         )
 
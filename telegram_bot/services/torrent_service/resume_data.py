@@ -0,0 +1,150 @@
+# telegram_bot/services/torrent_service/resume_data.py
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Iterable
+from typing import Any
+
+import libtorrent as lt
+
+from telegram_bot.config import TORRENT_RESUME_DIR, logger
+
+from .alerts import TorrentAlertPump
+from .metadata_cache import info_hash_hex
+
+TORRENT_RESUME_STORE_KEY = "TORRENT_RESUME_STORE"
+RESUME_DATA_SAVE_INTERVAL_SECONDS = 300.0
+SHUTDOWN_RESUME_TIMEOUT_SECONDS = 10.0
+
+
+class TorrentResumeStore:
+    """
+    Persists libtorrent fast-resume data as `<resume_dir>/<info_hash>.fastresume`.
+
+    Saves are requested with `handle.save_resume_data()` and written when the
+    matching alert comes through the session's alert pump, so a restarted bot can
+    re-add torrents with their piece state instead of re-hashing every file.
+    """
+
+    def __init__(self, resume_dir: str = TORRENT_RESUME_DIR) -> None:
+        self._resume_dir = resume_dir
+        self._pending: set[str] = set()
+        self._settled = asyncio.Event()
+        self._settled.set()
+        self._pump: TorrentAlertPump | None = None
+
+    def attach(self, pump: TorrentAlertPump) -> None:
+        """Subscribes to `pump` for resume alerts. Safe to call more than once."""
+        if self._pump is pump:
+            return
+        if self._pump is not None:
+            self._pump.remove_listener(self._on_alert)
+        pump.add_listener(self._on_alert)
+        self._pump = pump
+
+    def request_save(self, handle: Any, *, only_if_modified: bool = False) -> bool:
+        """Asks libtorrent for resume data. Returns False if nothing was requested."""
+        try:
+            if not handle.is_valid() or not handle.status().has_metadata:
+                return False
+            if only_if_modified and not handle.need_save_resume_data():
+                return False
+            key = info_hash_hex(handle)
+            if key is None:
+                return False
+            handle.save_resume_data(
+                lt.save_resume_flags_t.flush_disk_cache  # type: ignore
+                | lt.save_resume_flags_t.save_info_dict  # type: ignore
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[TORRENT] Could not request resume data: %s", exc)
+            return False
+        self._pending.add(key)
+        self._settled.clear()
+        return True
+
+    async def save_all(
+        self, handles: Iterable[Any], timeout: float = SHUTDOWN_RESUME_TIMEOUT_SECONDS
+    ) -> None:
+        """Requests resume data for every handle and waits for the alerts to land."""
+        requested = sum(1 for handle in handles if self.request_save(handle))
+        if not requested:
+            return
+        logger.info("[TORRENT] Saving resume data for %d torrent(s)...", requested)
+        try:
+            await asyncio.wait_for(self._settled.wait(), timeout=timeout)
+        except TimeoutError:
+            logger.warning(
+                "[TORRENT] Timed out waiting for resume data of %d torrent(s).",
+                len(self._pending),
+            )
+
+    def load(self, info_hash: str | None) -> Any | None:
+        """Returns stored add_torrent_params for `info_hash`, or None."""
+        path = self._path(info_hash)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as file_handle:
+                return lt.read_resume_data(file_handle.read())  # type: ignore
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[TORRENT] Ignoring unreadable resume data '%s': %s", path, exc)
+            return None
+
+    def discard(self, info_hash: str | None) -> None:
+        path = self._path(info_hash)
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("[TORRENT] Could not remove resume data '%s': %s", path, exc)
+
+    def _path(self, info_hash: str | None) -> str | None:
+        if not info_hash:
+            return None
+        return os.path.join(self._resume_dir, f"{info_hash.lower()}.fastresume")
+
+    def _on_alert(self, alert: Any) -> None:
+        kind = alert.what()
+        if kind == "save_resume_data":
+            key = info_hash_hex(alert.params)
+            if key is not None:
+                self._write(key, lt.write_resume_data_buf(alert.params))  # type: ignore
+        elif kind == "save_resume_data_failed":
+            key = info_hash_hex(getattr(alert, "handle", None))
+            logger.warning("[TORRENT] Resume data save failed: %s", alert.message())
+        else:
+            return
+        self._pending.discard(key or "")
+        if not self._pending:
+            self._settled.set()
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        assert path is not None
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self._resume_dir, exist_ok=True)
+            with open(temp_path, "wb") as file_handle:
+                file_handle.write(data)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("[TORRENT] Could not write resume data '%s': %s", path, exc)
+
+
+def get_torrent_resume_store(bot_data: dict[str, Any]) -> TorrentResumeStore:
+    """
+    Returns the application's resume store, creating it on first use.
+
+    Callers that request saves must `attach()` it to the session's alert pump.
+    """
+    store = bot_data.get(TORRENT_RESUME_STORE_KEY)
+    if not isinstance(store, TorrentResumeStore):
+        store = TorrentResumeStore()
+        bot_data[TORRENT_RESUME_STORE_KEY] = store
+    return store
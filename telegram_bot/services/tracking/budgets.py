@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Literal
+
+TrackingPhase = Literal["tmdb", "wikipedia", "discovery", "queue"]
+
+# Calls allowed in flight per provider during one scheduler tick. Queueing is
+# serialized because it mutates the shared download queues.
+TRACKING_PHASE_CONCURRENCY: dict[TrackingPhase, int] = {
+    "tmdb": 4,
+    "wikipedia": 2,
+    "discovery": 3,
+    "queue": 1,
+}
+
+
+@dataclass
+class PhaseTiming:
+    calls: int = 0
+    wait_seconds: float = 0.0
+    busy_seconds: float = 0.0
+
+
+class TrackingTickBudget:
+    """
+    Per-tick provider semaphores and the time each phase spent waiting and working.
+
+    Provider calls made by concurrently processed items share one budget, so a
+    release day that opens many windows at once cannot flood TMDB, Wikipedia
+    or the indexers.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[TrackingPhase, int] = TRACKING_PHASE_CONCURRENCY,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._semaphores = {phase: asyncio.Semaphore(max(1, n)) for phase, n in limits.items()}
+        self._clock = clock
+        self.timings: dict[TrackingPhase, PhaseTiming] = {}
+
+    @asynccontextmanager
+    async def phase(self, phase: TrackingPhase) -> AsyncIterator[None]:
+        timing = self.timings.setdefault(phase, PhaseTiming())
+        semaphore = self._semaphores.get(phase)
+        requested = self._clock()
+        if semaphore is not None:
+            await semaphore.acquire()
+        started = self._clock()
+        try:
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+            timing.calls += 1
+            timing.wait_seconds += started - requested
+            timing.busy_seconds += self._clock() - started
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{phase}={timing.calls} calls/{timing.busy_seconds:.1f}s busy/"
+            f"{timing.wait_seconds:.1f}s waiting"
+            for phase, timing in sorted(self.timings.items())
+        )
+
+
+_current_budget: ContextVar[TrackingTickBudget | None] = ContextVar(
+    "tracking_tick_budget", default=None
+)
+
+
+@asynccontextmanager
+async def use_tracking_budget(budget: TrackingTickBudget) -> AsyncIterator[TrackingTickBudget]:
+    """Makes `budget` govern `tracking_phase()` calls in this task and tasks it spawns."""
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+@asynccontextmanager
+async def tracking_phase(phase: TrackingPhase) -> AsyncIterator[None]:
+    """Runs the block under the current tick's `phase` budget; a no-op outside a tick."""
+    budget = _current_budget.get()
+    if budget is None:
+        yield
+        return
+    async with budget.phase(phase):
+        yield
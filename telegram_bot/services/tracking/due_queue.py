@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+
+from telegram_bot.domain.types import TrackingItem
+
+# Statuses that are due immediately when they carry no next-check time.
+_DUE_WITHOUT_NEXT_CHECK = {"awaiting_metadata", "awaiting_window", "searching"}
+_TERMINAL_STATUSES = {"fulfilled", "cancelled"}
+_DUE_NOW = float("-inf")
+
+
+def tracking_due_timestamp(item: TrackingItem | None) -> float | None:
+    """Returns when `item` next needs a scheduler pass, or None if it never does."""
+    if not item:
+        return None
+    status = str(item.get("status") or "")
+    if status in _TERMINAL_STATUSES:
+        return None
+    raw_next_check = item.get("next_check_at_utc")
+    if not isinstance(raw_next_check, str) or not raw_next_check:
+        return _DUE_NOW if status in _DUE_WITHOUT_NEXT_CHECK else None
+    try:
+        next_check = datetime.fromisoformat(raw_next_check.replace("Z", "+00:00"))
+    except ValueError:
+        return _DUE_NOW if status in _DUE_WITHOUT_NEXT_CHECK else None
+    return next_check.timestamp()
+
+
+class TrackingDueQueue:
+    """
+    Min-heap of tracking items keyed on their next-check time.
+
+    Updating an item pushes a fresh entry and remembers its latest due time;
+    older entries for the same item are skipped when they surface, so moving
+    an item never needs a heap search. Moving an item ahead of the current
+    head sets the wake event so the scheduler loop can shorten its sleep.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, str]] = []
+        self._due_at: dict[str, float] = {}
+        self._sequence = itertools.count()
+        self._wake = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._due_at)
+
+    def rebuild(self, items: Mapping[str, TrackingItem]) -> None:
+        self._heap.clear()
+        self._due_at.clear()
+        for item_id, item in items.items():
+            due_at = tracking_due_timestamp(item)
+            if due_at is not None:
+                self._due_at[item_id] = due_at
+                self._heap.append((due_at, next(self._sequence), item_id))
+        heapq.heapify(self._heap)
+        self._wake.set()
+
+    def update(self, item_id: str, item: TrackingItem | None) -> None:
+        """Re-reads `item`'s schedule fields; pass None for a removed item."""
+        self.schedule(item_id, tracking_due_timestamp(item))
+
+    def update_many(self, item_ids: Iterable[str], items: Mapping[str, TrackingItem]) -> None:
+        for item_id in item_ids:
+            self.update(item_id, items.get(item_id))
+
+    def schedule(self, item_id: str, due_at: float | None) -> None:
+        if due_at is None:
+            self._due_at.pop(item_id, None)
+            return
+        if self._due_at.get(item_id) == due_at:
+            return
+        head = self.next_due_at()
+        self._due_at[item_id] = due_at
+        heapq.heappush(self._heap, (due_at, next(self._sequence), item_id))
+        if head is None or due_at < head:
+            self._wake.set()
+
+    def pop_due(self, now: datetime) -> list[str]:
+        """Removes and returns the ids of items due at `now`, earliest first."""
+        now_ts = now.timestamp()
+        due_ids: list[str] = []
+        while self._heap and self._heap[0][0] <= now_ts:
+            due_at, _, item_id = heapq.heappop(self._heap)
+            if self._due_at.get(item_id) != due_at:
+                continue
+            del self._due_at[item_id]
+            due_ids.append(item_id)
+        return due_ids
+
+    def next_due_at(self) -> float | None:
+        while self._heap:
+            due_at, _, item_id = self._heap[0]
+            if self._due_at.get(item_id) == due_at:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    async def wait(self, timeout: float | None) -> bool:
+        """Sleeps up to `timeout` seconds; returns True if woken by a schedule change."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except TimeoutError:
+            return False
+        finally:
+            self._wake.clear()
+        return True
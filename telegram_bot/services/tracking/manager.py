@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any
 from uuid import uuid4
@@ -19,13 +20,20 @@ from telegram_bot.domain.types import (
     TrackingTargetPayload,
 )
 
-from .persistence import load_tracking_state, save_tracking_state
+from .due_queue import TrackingDueQueue
+from .persistence import (
+    append_tracking_changes,
+    load_tracking_state,
+    save_tracking_state,
+    tracking_journal_length,
+)
 
 TRACKING_ITEMS_KEY = "tracking_items"
 TRACKING_IN_PROGRESS_KEY = "tracking_in_progress_ids"
 TRACKING_LOOP_TASK_KEY = "tracking_loop_task"
 TRACKING_TIMEZONE_KEY = "tracking_timezone"
 TRACKING_NOW_PROVIDER_KEY = "tracking_now_provider"
+TRACKING_DUE_QUEUE_KEY = "tracking_due_queue"
 
 TRACKING_FULFILLMENT_WATCHDOG_HOURS = 6
 TERMINAL_TRACKING_STATES = {"fulfilled", "cancelled"}
@@ -78,6 +86,16 @@ def get_tracking_items(bot_data: dict[str, Any]) -> dict[str, TrackingItem]:
     return store
 
 
+def get_tracking_due_queue(bot_data: dict[str, Any]) -> TrackingDueQueue:
+    raw = bot_data.get(TRACKING_DUE_QUEUE_KEY)
+    if isinstance(raw, TrackingDueQueue):
+        return raw
+    queue = TrackingDueQueue()
+    queue.rebuild(get_tracking_items(bot_data))
+    bot_data[TRACKING_DUE_QUEUE_KEY] = queue
+    return queue
+
+
 def get_tracking_in_progress_ids(bot_data: dict[str, Any]) -> set[str]:
     raw = bot_data.get(TRACKING_IN_PROGRESS_KEY)
     if isinstance(raw, set):
@@ -182,8 +200,10 @@ def load_tracking_state_into_bot_data(
         allowed_user_ids=allowed_user_ids,
     )
     removed_duplicates = _prune_duplicate_active_targets(items)
-    if removed_for_user_policy or removed_duplicates:
+    if removed_for_user_policy or removed_duplicates or tracking_journal_length(file_path):
+        # Startup is a quiet moment to fold the journal into the snapshot.
         save_tracking_state(file_path, items)
+    if removed_for_user_policy or removed_duplicates:
         logger.info(
             "[TRACKING] Pruned tracking state entries (unauthorized=%d, duplicates=%d).",
             removed_for_user_policy,
@@ -191,6 +211,7 @@ def load_tracking_state_into_bot_data(
         )
     application.bot_data[TRACKING_ITEMS_KEY] = items
     application.bot_data.setdefault(TRACKING_IN_PROGRESS_KEY, set())
+    get_tracking_due_queue(application.bot_data).rebuild(items)
     return items
 
 
@@ -198,8 +219,23 @@ def persist_tracking_state_from_bot_data(
     application: Application,
     *,
     file_path: str = TRACKING_STATE_FILE,
+    item_ids: Iterable[str] | None = None,
 ) -> None:
-    save_tracking_state(file_path, get_tracking_items(application.bot_data))
+    """
+    Persists tracking state. With `item_ids`, only those items are appended to
+    the change journal; without, a full snapshot is written and the journal
+    compacted. Either way the scheduler's due queue picks up the new
+    next-check times.
+    """
+    items = get_tracking_items(application.bot_data)
+    due_queue = get_tracking_due_queue(application.bot_data)
+    if item_ids is None:
+        due_queue.rebuild(items)
+        save_tracking_state(file_path, items)
+    else:
+        item_ids = tuple(item_ids)
+        due_queue.update_many(item_ids, items)
+        append_tracking_changes(file_path, items, item_ids)
 
 
 def _next_tracking_item_id(items: dict[str, TrackingItem]) -> str:
@@ -499,7 +535,7 @@ def create_tracking_item(
         _sync_tv_compatibility_fields(item)
 
     items[item_id] = item
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info(
         "[TRACKING] Created %s item %s for '%s' (status=%s).",
         target_kind,
@@ -653,7 +689,7 @@ def cancel_tracking_item(
 
     items.pop(item_id, None)
     get_tracking_in_progress_ids(application.bot_data).discard(item_id)
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info("[TRACKING] Cancelled and removed item %s.", item_id)
     return True
 
@@ -691,7 +727,7 @@ def mark_tracking_waiting_fulfillment(
         _sync_movie_compatibility_fields(item)
     else:
         _sync_tv_compatibility_fields(item)
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info("[TRACKING] Item %s is now waiting for fulfillment.", item_id)
     return True
 
@@ -719,7 +755,7 @@ def mark_tracking_hourly_retry(
         _sync_movie_compatibility_fields(item)
     else:
         _sync_tv_compatibility_fields(item)
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info("[TRACKING] Item %s scheduled for next hourly check.", item_id)
     return True
 
@@ -751,7 +787,7 @@ def mark_tracking_weekly_metadata_retry(
         _sync_movie_compatibility_fields(item)
     else:
         _sync_tv_compatibility_fields(item)
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info("[TRACKING] Item %s remains in metadata-only mode.", item_id)
     return True
 
@@ -792,7 +828,7 @@ def set_tracking_release_window(
     _ensure_retry(item)["last_error"] = None
     _sync_movie_compatibility_fields(item)
 
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info(
         "[TRACKING] Item %s release window updated to %s (%s).",
         item_id,
@@ -828,7 +864,7 @@ def mark_tracking_fulfilled(
         _sync_movie_compatibility_fields(item)
     else:
         _sync_tv_compatibility_fields(item)
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info("[TRACKING] Item %s fulfilled.", item_id)
     return True
 
@@ -889,7 +925,7 @@ def mark_tracking_fulfillment_success(
     retry["last_error"] = None
     _sync_tv_compatibility_fields(item)
 
-    persist_tracking_state_from_bot_data(application)
+    persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
     logger.info(
         "[TRACKING] TV item %s advanced cursor to S%02dE%02d.",
         item_id,
@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 import asyncio
-import os
 import re
 from datetime import date, datetime
-from typing import Any, Literal, TypedDict
+from typing import Literal, TypedDict
 
-import httpx
 import wikipedia
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from telegram_bot.config import logger
 from telegram_bot.services import scraping_service
 from telegram_bot.services.scrapers.wikipedia.dates import _extract_release_date_iso
 from telegram_bot.services.scrapers.wikipedia.fetch import _fetch_html_from_page
+from telegram_bot.services.scrapers.wikipedia.parsing import (
+    INFOBOX_STRAINER,
+    parse_wiki_html,
+    run_wiki_parse,
+)
+from telegram_bot.services.tracking import tmdb_release_service
+from telegram_bot.services.tracking.budgets import tracking_phase
 
 STREAMING_KEYWORDS = (
     "stream",
@@ -33,9 +38,6 @@ PHYSICAL_KEYWORDS = (
     "4k ultra hd",
     "uhd",
 )
-TMDB_DIGITAL_RELEASE_TYPE = 4
-TMDB_PHYSICAL_RELEASE_TYPE = 5
-TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
 
 
 class MovieTrackingResolution(TypedDict):
@@ -48,10 +50,6 @@ class MovieTrackingResolution(TypedDict):
     availability_source: Literal["streaming", "physical"] | None
 
 
-def _normalize_text_for_match(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", (value or "").casefold())
-
-
 def _normalize_title(value: str, year: int | None = None) -> str:
     cleaned = (value or "").strip()
     if not cleaned:
@@ -77,28 +75,10 @@ def _parse_iso_to_date(value: str | None) -> date | None:
         return None
 
 
-def _parse_tmdb_date(value: Any) -> date | None:
-    if not isinstance(value, str) or not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
-    except ValueError:
-        return None
-
-
-def _extract_tmdb_result_year(value: Any) -> int | None:
-    if not isinstance(value, str) or len(value) < 4:
-        return None
-    year_text = value[:4]
-    if not year_text.isdigit():
-        return None
-    return int(year_text)
-
-
 def _extract_earliest_availability_from_html(
     html: str,
 ) -> tuple[date | None, Literal["streaming", "physical"] | None]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_wiki_html(html, INFOBOX_STRAINER)
     infobox = soup.find("table", class_=re.compile(r"\binfobox\b"))
     if not isinstance(infobox, Tag):
         return None, None
@@ -142,203 +122,16 @@ def _extract_earliest_availability_from_html(
     return earliest_physical, "physical"
 
 
-def _get_tmdb_auth() -> tuple[dict[str, str], dict[str, str], str] | None:
-    access_token = (os.getenv("TMDB_ACCESS_TOKEN") or os.getenv("TMDB_BEARER_TOKEN") or "").strip()
-    api_key = (os.getenv("TMDB_API_KEY") or "").strip()
-    region = (os.getenv("TMDB_REGION") or "US").strip().upper() or "US"
-
-    if access_token:
-        return {"Authorization": f"Bearer {access_token}"}, {}, region
-    if api_key:
-        return {}, {"api_key": api_key}, region
-    return None
-
-
-def _choose_tmdb_search_result(
-    query_title: str,
-    *,
-    year: int | None,
-    raw_results: Any,
-) -> dict[str, Any] | None:
-    if not isinstance(raw_results, list):
-        return None
-
-    normalized_query = _normalize_text_for_match(_normalize_title(query_title, year))
-    best_score = -1
-    best: dict[str, Any] | None = None
-    for result in raw_results:
-        if not isinstance(result, dict):
-            continue
-
-        score = 0
-        candidate_title = str(result.get("title") or result.get("original_title") or "")
-        normalized_candidate = _normalize_text_for_match(candidate_title)
-        if normalized_candidate and normalized_candidate == normalized_query:
-            score += 100
-        elif normalized_query and normalized_query in normalized_candidate:
-            score += 40
-
-        if isinstance(year, int):
-            candidate_year = _extract_tmdb_result_year(result.get("release_date"))
-            if candidate_year == year:
-                score += 80
-            elif isinstance(candidate_year, int) and abs(candidate_year - year) == 1:
-                score += 15
-
-        popularity = result.get("popularity")
-        if isinstance(popularity, (int, float)) and popularity > 0:
-            score += min(int(popularity // 10), 10)
-
-        if score > best_score:
-            best_score = score
-            best = result
-
-    return best
-
-
-def _extract_tmdb_earliest_availability(
-    payload: Any,
-    *,
-    region: str,
-) -> tuple[date | None, Literal["streaming", "physical"] | None]:
-    if not isinstance(payload, dict):
-        return None, None
-    raw_regions = payload.get("results")
-    if not isinstance(raw_regions, list):
-        return None, None
-
-    def collect_candidates(
-        blocks: list[dict[str, Any]],
-    ) -> list[tuple[date, Literal["streaming", "physical"]]]:
-        candidates: list[tuple[date, Literal["streaming", "physical"]]] = []
-        for block in blocks:
-            release_dates = block.get("release_dates")
-            if not isinstance(release_dates, list):
-                continue
-            for entry in release_dates:
-                if not isinstance(entry, dict):
-                    continue
-                release_type = entry.get("type")
-                if release_type == TMDB_DIGITAL_RELEASE_TYPE:
-                    source: Literal["streaming", "physical"] = "streaming"
-                elif release_type == TMDB_PHYSICAL_RELEASE_TYPE:
-                    source = "physical"
-                else:
-                    continue
-
-                parsed = _parse_tmdb_date(entry.get("release_date"))
-                if parsed is None:
-                    continue
-                candidates.append((parsed, source))
-        return candidates
-
-    region_upper = region.upper()
-    preferred_blocks = [
-        block
-        for block in raw_regions
-        if isinstance(block, dict) and str(block.get("iso_3166_1") or "").upper() == region_upper
-    ]
-    candidates = collect_candidates(preferred_blocks)
-    if not candidates:
-        all_blocks = [block for block in raw_regions if isinstance(block, dict)]
-        candidates = collect_candidates(all_blocks)
-    if not candidates:
-        return None, None
-
-    candidates.sort(key=lambda item: (item[0], 0 if item[1] == "streaming" else 1))
-    return candidates[0]
-
-
 async def _resolve_tmdb_availability(
     title: str,
     *,
     year: int | None,
 ) -> tuple[date | None, Literal["streaming", "physical"] | None]:
-    auth = _get_tmdb_auth()
-    if auth is None:
-        return None, None
-
-    headers, auth_params, region = auth
-    params: dict[str, str] = {
-        **auth_params,
-        "query": title,
-        "include_adult": "false",
-    }
-    if isinstance(year, int):
-        params["year"] = str(year)
-        params["primary_release_year"] = str(year)
-
-    try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            search_response = await client.get(
-                f"{TMDB_API_BASE_URL}/search/movie",
-                params=params,
-                headers=headers,
-            )
-            search_response.raise_for_status()
-            search_payload = search_response.json()
-            search_results = (
-                search_payload.get("results") if isinstance(search_payload, dict) else []
-            )
-            selected = _choose_tmdb_search_result(title, year=year, raw_results=search_results)
-            if not isinstance(selected, dict):
-                return None, None
-
-            raw_movie_id = selected.get("id")
-            if isinstance(raw_movie_id, int):
-                movie_id = raw_movie_id
-            elif isinstance(raw_movie_id, str) and raw_movie_id.strip().isdigit():
-                movie_id = int(raw_movie_id.strip())
-            else:
-                return None, None
-
-            release_response = await client.get(
-                f"{TMDB_API_BASE_URL}/movie/{movie_id}/release_dates",
-                params=auth_params,
-                headers=headers,
-            )
-            release_response.raise_for_status()
-            release_payload = release_response.json()
-    except Exception as exc:  # noqa: BLE001
-        logger.info("[TRACKING] TMDB availability lookup failed for '%s': %s", title, exc)
-        return None, None
-
-    return _extract_tmdb_earliest_availability(release_payload, region=region)
+    return await tmdb_release_service.resolve_tmdb_availability(title, year=year)
 
 
 async def _resolve_tmdb_inferred_year(title: str, *, year: int | None) -> int | None:
-    auth = _get_tmdb_auth()
-    if auth is None:
-        return None
-
-    headers, auth_params, _ = auth
-    params: dict[str, str] = {
-        **auth_params,
-        "query": title,
-        "include_adult": "false",
-    }
-    if isinstance(year, int):
-        params["year"] = str(year)
-        params["primary_release_year"] = str(year)
-
-    try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            search_response = await client.get(
-                f"{TMDB_API_BASE_URL}/search/movie",
-                params=params,
-                headers=headers,
-            )
-            search_response.raise_for_status()
-            search_payload = search_response.json()
-    except Exception as exc:  # noqa: BLE001
-        logger.info("[TRACKING] TMDB year inference failed for '%s': %s", title, exc)
-        return None
-
-    search_results = search_payload.get("results") if isinstance(search_payload, dict) else []
-    selected = _choose_tmdb_search_result(title, year=year, raw_results=search_results)
-    if not isinstance(selected, dict):
-        return None
-    return _extract_tmdb_result_year(selected.get("release_date"))
+    return await tmdb_release_service.resolve_tmdb_inferred_year(title, year=year)
 
 
 async def _resolve_movie_page_html(title: str, year: int | None) -> tuple[str | None, str]:
@@ -388,22 +181,26 @@ async def resolve_movie_tracking_target(
     """Resolves release availability for a movie target."""
     reference_day = today or date.today()
     resolved_year = year
-    html, canonical_title = await _resolve_movie_page_html(title, year)
+    async with tracking_phase("wikipedia"):
+        html, canonical_title = await _resolve_movie_page_html(title, year)
     availability_date: date | None = None
     availability_source: Literal["streaming", "physical"] | None = None
     if html:
-        availability_date, availability_source = _extract_earliest_availability_from_html(html)
+        availability_date, availability_source = await run_wiki_parse(
+            _extract_earliest_availability_from_html, html
+        )
 
     if availability_date is None:
         tmdb_lookup_title = (
             canonical_title if canonical_title and canonical_title != "Unknown" else title
         )
-        tmdb_date, tmdb_source = await _resolve_tmdb_availability(
-            tmdb_lookup_title,
-            year=year,
-        )
-        if tmdb_date is None and tmdb_lookup_title != title:
-            tmdb_date, tmdb_source = await _resolve_tmdb_availability(title, year=year)
+        async with tracking_phase("tmdb"):
+            tmdb_date, tmdb_source = await _resolve_tmdb_availability(
+                tmdb_lookup_title,
+                year=year,
+            )
+            if tmdb_date is None and tmdb_lookup_title != title:
+                tmdb_date, tmdb_source = await _resolve_tmdb_availability(title, year=year)
         if tmdb_date is not None and tmdb_source is not None:
             if availability_date is not None and (
                 availability_date != tmdb_date or availability_source != tmdb_source
@@ -420,9 +217,10 @@ async def resolve_movie_tracking_target(
             availability_date, availability_source = tmdb_date, tmdb_source
 
         if resolved_year is None:
-            inferred_year = await _resolve_tmdb_inferred_year(tmdb_lookup_title, year=year)
-            if inferred_year is None and tmdb_lookup_title != title:
-                inferred_year = await _resolve_tmdb_inferred_year(title, year=year)
+            async with tracking_phase("tmdb"):
+                inferred_year = await _resolve_tmdb_inferred_year(tmdb_lookup_title, year=year)
+                if inferred_year is None and tmdb_lookup_title != title:
+                    inferred_year = await _resolve_tmdb_inferred_year(title, year=year)
             if isinstance(inferred_year, int):
                 resolved_year = inferred_year
 
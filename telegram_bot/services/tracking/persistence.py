@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import shutil
+from collections.abc import Iterable
 from typing import Any
 
 from telegram_bot.config import logger
@@ -16,10 +17,15 @@ from telegram_bot.domain.types import (
     TrackingTargetKind,
     TrackingTargetPayload,
 )
+from telegram_bot.state import write_file_atomically
 
 TRACKING_STATE_VERSION = 2
 _LEGACY_TRACKING_STATE_VERSION = 1
 _FILES_PENDING_V1_BACKUP: set[str] = set()
+# Journal records are cheap to append but replayed on every load, so the
+# journal is folded into a fresh snapshot once it grows past this many records.
+TRACKING_JOURNAL_COMPACT_AFTER = 500
+_JOURNAL_RECORD_COUNTS: dict[str, int] = {}
 
 _V1_TO_V2_STATUS_MAP = {
     "pending_date": "awaiting_metadata",
@@ -420,7 +426,24 @@ def _ensure_v1_backup_if_needed(file_path: str) -> None:
 
 
 def load_tracking_state(file_path: str) -> dict[str, TrackingItem]:
-    """Loads durable tracking items from disk with backward-compatible migration."""
+    """
+    Loads durable tracking items from disk with backward-compatible migration.
+
+    The snapshot is read first and the change journal beside it is replayed
+    on top, so changes appended since the last compaction are not lost.
+    """
+    items = _load_tracking_snapshot(file_path)
+    replayed = _replay_tracking_journal(file_path, items)
+    if replayed:
+        logger.info(
+            "Replayed %d tracking journal record(s) from '%s'.",
+            replayed,
+            _derive_journal_path(file_path),
+        )
+    return items
+
+
+def _load_tracking_snapshot(file_path: str) -> dict[str, TrackingItem]:
     if not os.path.exists(file_path):
         logger.info("Tracking state file '%s' not found. Starting with no schedules.", file_path)
         return {}
@@ -475,7 +498,12 @@ def load_tracking_state(file_path: str) -> dict[str, TrackingItem]:
 
 
 def save_tracking_state(file_path: str, items: dict[str, TrackingItem]) -> None:
-    """Persists tracking state to disk using the v2 schema."""
+    """
+    Persists tracking state to disk using the v2 schema.
+
+    This writes a full snapshot and then truncates the change journal, so it
+    doubles as journal compaction.
+    """
     _ensure_v1_backup_if_needed(file_path)
 
     serializable_items: dict[str, TrackingItem] = {}
@@ -491,9 +519,132 @@ def save_tracking_state(file_path: str, items: dict[str, TrackingItem]) -> None:
     }
 
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, sort_keys=True)
-            f.write("\n")
+        write_file_atomically(file_path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
         logger.info("Saved %d tracking item(s) to '%s'.", len(serializable_items), file_path)
     except OSError as exc:
         logger.error("Could not save tracking state '%s': %s", file_path, exc)
+        return
+
+    journal_path = _derive_journal_path(file_path)
+    try:
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+    except OSError as exc:
+        # The stale records would be replayed over the newer snapshot on next load.
+        logger.error("Could not truncate tracking journal '%s': %s", journal_path, exc)
+    _JOURNAL_RECORD_COUNTS[os.path.abspath(file_path)] = 0
+
+
+def append_tracking_changes(
+    file_path: str,
+    items: dict[str, TrackingItem],
+    item_ids: Iterable[str],
+) -> None:
+    """
+    Appends the current state of `item_ids` to the change journal.
+
+    Items present in `items` are written as `put` records and missing ones as
+    `delete` records, so a write costs O(changed items) instead of a full
+    snapshot. Once the journal holds `TRACKING_JOURNAL_COMPACT_AFTER` records
+    it is folded into a fresh snapshot.
+    """
+    records: list[str] = []
+    for item_id in dict.fromkeys(str(item_id) for item_id in item_ids):
+        item = items.get(item_id)
+        normalized = _normalize_tracking_item_v2(item_id, item) if item is not None else None
+        if normalized is None:
+            record: dict[str, Any] = {"op": "delete", "id": item_id}
+        else:
+            record = {"op": "put", "id": item_id, "item": normalized}
+        records.append(json.dumps(record, sort_keys=True, separators=(",", ":")))
+    if not records:
+        return
+
+    absolute_path = os.path.abspath(file_path)
+    pending = _JOURNAL_RECORD_COUNTS.get(absolute_path)
+    if pending is None:
+        pending = _count_journal_records(file_path)
+    if pending + len(records) >= TRACKING_JOURNAL_COMPACT_AFTER:
+        save_tracking_state(file_path, items)
+        return
+
+    journal_path = _derive_journal_path(file_path)
+    try:
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(records) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    except OSError as exc:
+        logger.error("Could not append to tracking journal '%s': %s", journal_path, exc)
+        save_tracking_state(file_path, items)
+        return
+    _JOURNAL_RECORD_COUNTS[absolute_path] = pending + len(records)
+
+
+def _derive_journal_path(file_path: str) -> str:
+    base, ext = os.path.splitext(file_path)
+    if ext:
+        return f"{base}.journal"
+    return f"{file_path}.journal"
+
+
+def _replay_tracking_journal(file_path: str, items: dict[str, TrackingItem]) -> int:
+    journal_path = _derive_journal_path(file_path)
+    replayed = 0
+    try:
+        with open(journal_path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        lines = []
+    except OSError as exc:
+        logger.error("Could not read tracking journal '%s': %s", journal_path, exc)
+        lines = []
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # Only the tail can be torn by a crash mid-append; earlier records stand.
+            logger.warning(
+                "Ignoring unreadable tracking journal record %d in '%s'.",
+                line_number,
+                journal_path,
+            )
+            continue
+        if not isinstance(record, dict):
+            continue
+        item_id = str(record.get("id") or "")
+        if not item_id:
+            continue
+        if record.get("op") == "delete":
+            items.pop(item_id, None)
+        elif record.get("op") == "put":
+            normalized = _normalize_tracking_item_v2(item_id, record.get("item"))
+            if normalized is None:
+                continue
+            items[normalized["id"]] = normalized
+        else:
+            continue
+        replayed += 1
+
+    _JOURNAL_RECORD_COUNTS[os.path.abspath(file_path)] = replayed
+    return replayed
+
+
+def _count_journal_records(file_path: str) -> int:
+    try:
+        with open(_derive_journal_path(file_path), encoding="utf-8") as f:
+            return sum(1 for line in f if line.strip())
+    except OSError:
+        return 0
+
+
+def tracking_journal_length(file_path: str) -> int:
+    """Returns how many records the journal holds since the last snapshot."""
+    absolute_path = os.path.abspath(file_path)
+    count = _JOURNAL_RECORD_COUNTS.get(absolute_path)
+    if count is None:
+        count = _JOURNAL_RECORD_COUNTS[absolute_path] = _count_journal_records(file_path)
+    return count
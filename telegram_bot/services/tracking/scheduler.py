@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import replace
 from datetime import date, datetime
 from types import SimpleNamespace
@@ -20,21 +21,28 @@ from .manager import (
     TRACKING_LOOP_TASK_KEY,
     TRACKING_NOW_PROVIDER_KEY,
     calculate_release_day_first_check_utc,
+    get_tracking_due_queue,
     get_tracking_in_progress_ids,
     get_tracking_item,
     get_tracking_items,
     get_tracking_target_kind,
     get_tracking_timezone,
     isoformat_utc,
-    parse_utc_iso,
     persist_tracking_state_from_bot_data,
     utc_now,
 )
+from .budgets import TrackingTickBudget, tracking_phase, use_tracking_budget
+from .due_queue import TrackingDueQueue, tracking_due_timestamp
 from .targets import get_tracking_adapter_for_item
 from .targets.base import TrackingSearchRequest, TrackingTargetAdapter
 from . import tv_next_episode
 
-TRACKING_SCHEDULER_INTERVAL_SECONDS = 60
+# Upper bound on one sleep, so wall-clock jumps (suspend, NTP) are noticed.
+TRACKING_SCHEDULER_MAX_SLEEP_SECONDS = 15 * 60
+TRACKING_IN_PROGRESS_RETRY_SECONDS = 60
+# Items that fail, or leave their next check in the past, wait this long before a retry.
+TRACKING_FAILED_ITEM_RETRY_SECONDS = 60
+TRACKING_LAST_TICK_BUDGET_KEY = "tracking_last_tick_budget"
 
 
 def _coerce_non_negative_int(value: Any, *, default: int) -> int:
@@ -235,11 +243,12 @@ async def _resolve_tracking_tv_episode_title(
     if tmdb_series_id is None:
         return None
 
-    return await tv_next_episode.fetch_episode_title_for_tmdb_episode(
-        tmdb_series_id=tmdb_series_id,
-        season=season,
-        episode=episode,
-    )
+    async with tracking_phase("tmdb"):
+        return await tv_next_episode.fetch_episode_title_for_tmdb_episode(
+            tmdb_series_id=tmdb_series_id,
+            season=season,
+            episode=episode,
+        )
 
 
 def _resolve_known_release_day(item: TrackingItem) -> date | None:
@@ -274,14 +283,8 @@ def _is_due(
     item: TrackingItem,
     now_utc: datetime,
 ) -> bool:
-    status = str(item.get("status") or "")
-    if status in TERMINAL_TRACKING_STATES:
-        return False
-
-    next_check = parse_utc_iso(item.get("next_check_at_utc"))
-    if next_check is None:
-        return status in {"awaiting_metadata", "awaiting_window", "searching"}
-    return next_check <= now_utc
+    due_at = tracking_due_timestamp(item)
+    return due_at is not None and due_at <= now_utc.timestamp()
 
 
 def reconcile_tracking_items_on_startup(
@@ -462,14 +465,16 @@ async def _queue_candidate_for_tracking_item(
         )
 
     try:
-        started_download, _ = await queue_download_source(
-            application,
-            chat_id=chat_id,
-            source_dict=source_dict,
-            message_id=message_id,
-        )
-        if started_download:
-            await _refresh_home_menu_after_tracking_queue_start(application, chat_id=chat_id)
+        # Queue mutations and the home-menu refresh run one item at a time.
+        async with tracking_phase("queue"):
+            started_download, _ = await queue_download_source(
+                application,
+                chat_id=chat_id,
+                source_dict=source_dict,
+                message_id=message_id,
+            )
+            if started_download:
+                await _refresh_home_menu_after_tracking_queue_start(application, chat_id=chat_id)
     except Exception as exc:  # noqa: BLE001
         logger.exception("[TRACKING] Failed to queue item %s: %s", item_id, exc)
         adapter.on_queue_failure(
@@ -540,12 +545,13 @@ async def _attempt_release_search(
 
     context = _build_search_context(application)
     search_kwargs = dict(search_request.search_kwargs)
-    results = await orchestrate_searches(
-        search_request.query,
-        search_request.media_type,
-        context,
-        **search_kwargs,
-    )
+    async with tracking_phase("discovery"):
+        results = await orchestrate_searches(
+            search_request.query,
+            search_request.media_type,
+            context,
+            **search_kwargs,
+        )
 
     # TPB API occasionally reports temporarily stale/low swarm counts for new TV
     # episodes. If the first pass yields nothing, retry once with relaxed swarm
@@ -565,12 +571,13 @@ async def _attempt_release_search(
         )
         relaxed_search_kwargs = dict(search_kwargs)
         relaxed_search_kwargs["min_seeders"] = 0
-        results = await orchestrate_searches(
-            search_request.query,
-            search_request.media_type,
-            context,
-            **relaxed_search_kwargs,
-        )
+        async with tracking_phase("discovery"):
+            results = await orchestrate_searches(
+                search_request.query,
+                search_request.media_type,
+                context,
+                **relaxed_search_kwargs,
+            )
 
     selected = adapter.select_candidate(
         results,
@@ -668,42 +675,114 @@ async def run_tracking_scheduler_tick(
     *,
     now_utc: datetime | None = None,
 ) -> int:
-    """Runs one scheduler pass over due items."""
+    """
+    Runs one scheduler pass over the items the due queue reports as due.
+
+    Due items are processed concurrently; their TMDB, Wikipedia, discovery and
+    queueing calls share one `TrackingTickBudget`, whose phase timings are
+    logged and kept in `bot_data` for the most recent tick.
+    """
     now_provider = application.bot_data.get(TRACKING_NOW_PROVIDER_KEY)
     now = now_utc or utc_now(now_provider)
     items = get_tracking_items(application.bot_data)
     in_progress = get_tracking_in_progress_ids(application.bot_data)
+    due_queue = get_tracking_due_queue(application.bot_data)
 
-    due_ids = [item_id for item_id, item in items.items() if _is_due(item, now)]
-    processed = 0
-    for item_id in due_ids:
-        if item_id in in_progress:
-            continue
+    claimed: list[tuple[str, TrackingItem]] = []
+    for item_id in due_queue.pop_due(now):
         item = items.get(item_id)
         if not item:
             continue
-
+        if item_id in in_progress:
+            # Another flow owns the item right now; look again on a later pass.
+            due_queue.schedule(item_id, now.timestamp() + TRACKING_IN_PROGRESS_RETRY_SECONDS)
+            continue
+        if not _is_due(item, now):
+            due_queue.update(item_id, item)
+            continue
+        # Claim every item before the first await so no other flow can start it.
         in_progress.add(item_id)
+        claimed.append((item_id, item))
+
+    if not claimed:
+        return 0
+
+    async def _run_item(item_id: str, item: TrackingItem) -> bool:
+        succeeded = False
         try:
             await _process_due_item(
                 application,
                 item,
                 now_utc=now,
             )
-            persist_tracking_state_from_bot_data(application)
-            processed += 1
+            persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
+            succeeded = True
+            return True
         except Exception:  # noqa: BLE001
             logger.exception("[TRACKING] Scheduler failed processing item %s", item_id)
+            return False
         finally:
             in_progress.discard(item_id)
+            _reschedule_processed_item(due_queue, item_id, items.get(item_id), now, succeeded)
+
+    budget = TrackingTickBudget()
+    started = time.monotonic()
+    async with use_tracking_budget(budget):
+        outcomes = await asyncio.gather(*(_run_item(item_id, item) for item_id, item in claimed))
+    processed = sum(outcomes)
+    application.bot_data[TRACKING_LAST_TICK_BUDGET_KEY] = budget
+    logger.info(
+        "[TRACKING] Tick processed %d/%d due item(s) in %.1fs (%s).",
+        processed,
+        len(claimed),
+        time.monotonic() - started,
+        budget.summary() or "no provider calls",
+    )
     return processed
 
 
+def _reschedule_processed_item(
+    due_queue: TrackingDueQueue,
+    item_id: str,
+    item: TrackingItem | None,
+    now: datetime,
+    succeeded: bool,
+) -> None:
+    """
+    Re-queues an item after processing.
+
+    A failed pass, or one that left the next check at or before `now`
+    (including searching items with no next check), would otherwise be due
+    again immediately and make the loop spin; those wait for a retry delay.
+    """
+    due_at = tracking_due_timestamp(item)
+    if due_at is None:
+        due_queue.schedule(item_id, None)
+        return
+    retry_at = now.timestamp() + TRACKING_FAILED_ITEM_RETRY_SECONDS
+    if not succeeded:
+        due_at = max(due_at, retry_at)
+    elif due_at <= now.timestamp():
+        due_at = retry_at
+    due_queue.schedule(item_id, due_at)
+
+
+def _seconds_until_next_check(application: Application) -> float:
+    now = utc_now(application.bot_data.get(TRACKING_NOW_PROVIDER_KEY))
+    next_due_at = get_tracking_due_queue(application.bot_data).next_due_at()
+    if next_due_at is None:
+        return TRACKING_SCHEDULER_MAX_SLEEP_SECONDS
+    return min(max(0.0, next_due_at - now.timestamp()), TRACKING_SCHEDULER_MAX_SLEEP_SECONDS)
+
+
 async def _tracking_scheduler_loop(application: Application) -> None:
     logger.info("[TRACKING] Scheduler loop started.")
     while True:
         await run_tracking_scheduler_tick(application)
-        await asyncio.sleep(TRACKING_SCHEDULER_INTERVAL_SECONDS)
+        # Sleep until the earliest next check; a schedule change that moves an
+        # item ahead of it wakes the loop early.
+        due_queue = get_tracking_due_queue(application.bot_data)
+        await due_queue.wait(_seconds_until_next_check(application))
 
 
 def start_tracking_scheduler(application: Application) -> None:
@@ -9,6 +9,7 @@ from telegram.ext import Application
 from telegram_bot.domain.types import TrackingEpisodeRef, TrackingItem, TrackingTargetPayload
 from telegram_bot.services import plex_service
 from telegram_bot.services.tracking import selection, tv_next_episode
+from telegram_bot.services.tracking.budgets import tracking_phase
 from telegram_bot.services.tracking.manager import (
     calculate_next_hourly_check,
     calculate_next_weekly_metadata_check,
@@ -100,7 +101,7 @@ class TvOngoingTrackingAdapter:
             item["status"] = "awaiting_metadata"  # type: ignore[typeddict-item]
             item["next_check_at_utc"] = isoformat_utc(calculate_next_weekly_metadata_check(now_utc))
             item["last_checked_at_utc"] = isoformat_utc(now_utc)
-            persist_tracking_state_from_bot_data(application)
+            persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
             return get_tracking_item(application, item_id)
 
         local_today = now_utc.astimezone(get_tracking_timezone(application.bot_data)).date()
@@ -116,20 +117,21 @@ class TvOngoingTrackingAdapter:
                 season=season,
             )
 
-        resolution = await tv_next_episode.resolve_next_ongoing_episode(
-            tmdb_series_id=tmdb_series_id,
-            fallback_show_title=fallback_title,
-            episode_cursor=(
-                {
-                    "season": int(episode_cursor["season"]),
-                    "episode": int(episode_cursor["episode"]),
-                }
-                if episode_cursor is not None
-                else None
-            ),
-            today=local_today,
-            existing_episode_lookup=_existing_episode_lookup,
-        )
+        async with tracking_phase("tmdb"):
+            resolution = await tv_next_episode.resolve_next_ongoing_episode(
+                tmdb_series_id=tmdb_series_id,
+                fallback_show_title=fallback_title,
+                episode_cursor=(
+                    {
+                        "season": int(episode_cursor["season"]),
+                        "episode": int(episode_cursor["episode"]),
+                    }
+                    if episode_cursor is not None
+                    else None
+                ),
+                today=local_today,
+                existing_episode_lookup=_existing_episode_lookup,
+            )
 
         canonical_title = (
             str(resolution.get("canonical_title") or fallback_title).strip() or fallback_title
@@ -185,7 +187,7 @@ class TvOngoingTrackingAdapter:
                 item["next_check_at_utc"] = isoformat_utc(calculate_next_hourly_check(now_utc))
 
             item["last_checked_at_utc"] = isoformat_utc(now_utc)
-            persist_tracking_state_from_bot_data(application)
+            persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
             return get_tracking_item(application, item_id)
 
         state = str(resolution.get("state") or "awaiting_metadata")
@@ -219,7 +221,7 @@ class TvOngoingTrackingAdapter:
             payload["pending_episode_air_date"] = None
 
         item["last_checked_at_utc"] = isoformat_utc(now_utc)
-        persist_tracking_state_from_bot_data(application)
+        persist_tracking_state_from_bot_data(application, item_ids=(item_id,))
         return get_tracking_item(application, item_id)
 
     def build_search_request(self, *, item: TrackingItem) -> TrackingSearchRequest | None:
@@ -1,16 +1,11 @@
 from __future__ import annotations
 
-import os
 import re
-from datetime import date, datetime
+from datetime import date
 from typing import Any, Awaitable, Callable, Literal, NotRequired, TypedDict
 
-import httpx
-
 from telegram_bot.config import logger
-
-TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
-TMDB_REQUEST_TIMEOUT_SECONDS = 8.0
+from telegram_bot.services.tmdb_client import get_tmdb_auth, get_tmdb_client, parse_tmdb_date
 
 
 class TvTrackingCandidate(TypedDict):
@@ -39,15 +34,6 @@ class TvNextEpisodeResolution(TypedDict):
     metadata_refresh_failed: NotRequired[bool]
 
 
-def _parse_tmdb_date(value: Any) -> date | None:
-    if not isinstance(value, str) or not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
-    except ValueError:
-        return None
-
-
 def _coerce_int(value: Any, *, minimum: int | None = None) -> int | None:
     if isinstance(value, int):
         result = value
@@ -73,17 +59,6 @@ def _extract_tmdb_year(value: Any) -> int | None:
     return int(prefix)
 
 
-def _get_tmdb_auth() -> tuple[dict[str, str], dict[str, str]] | None:
-    access_token = (os.getenv("TMDB_ACCESS_TOKEN") or os.getenv("TMDB_BEARER_TOKEN") or "").strip()
-    api_key = (os.getenv("TMDB_API_KEY") or "").strip()
-
-    if access_token:
-        return {"Authorization": f"Bearer {access_token}"}, {}
-    if api_key:
-        return {}, {"api_key": api_key}
-    return None
-
-
 def _score_tv_search_result(query_title: str, year: int | None, result: dict[str, Any]) -> int:
     score = 0
     query_normalized = _normalize_text_for_match(query_title)
@@ -152,14 +127,14 @@ def _extract_next_air_date_from_details(details_payload: Any) -> date | None:
     if not isinstance(details_payload, dict):
         return None
 
-    direct_next_air = _parse_tmdb_date(details_payload.get("next_air_date"))
+    direct_next_air = parse_tmdb_date(details_payload.get("next_air_date"))
     if direct_next_air is not None:
         return direct_next_air
 
     next_episode_to_air = details_payload.get("next_episode_to_air")
     if not isinstance(next_episode_to_air, dict):
         return None
-    return _parse_tmdb_date(next_episode_to_air.get("air_date"))
+    return parse_tmdb_date(next_episode_to_air.get("air_date"))
 
 
 async def fetch_episode_title_for_tmdb_episode(
@@ -172,20 +147,11 @@ async def fetch_episode_title_for_tmdb_episode(
     if tmdb_series_id <= 0 or season <= 0 or episode <= 0:
         return None
 
-    auth = _get_tmdb_auth()
-    if auth is None:
+    if get_tmdb_auth() is None:
         return None
 
-    headers, auth_params = auth
     try:
-        async with httpx.AsyncClient(timeout=TMDB_REQUEST_TIMEOUT_SECONDS) as client:
-            response = await client.get(
-                f"{TMDB_API_BASE_URL}/tv/{int(tmdb_series_id)}/season/{int(season)}/episode/{int(episode)}",
-                params=auth_params,
-                headers=headers,
-            )
-            response.raise_for_status()
-            payload = response.json()
+        payload = await get_tmdb_client().tv_episode(tmdb_series_id, season, episode)
     except Exception as exc:  # noqa: BLE001
         logger.info(
             "[TRACKING] TV episode title lookup failed for series_id=%s S%02dE%02d: %s",
@@ -205,21 +171,9 @@ async def fetch_episode_title_for_tmdb_episode(
     return normalized or None
 
 
-async def _fetch_tv_details_payload(
-    *,
-    client: httpx.AsyncClient,
-    tmdb_series_id: int,
-    headers: dict[str, str],
-    auth_params: dict[str, str],
-) -> dict[str, Any] | None:
+async def _fetch_tv_details_payload(*, tmdb_series_id: int) -> dict[str, Any] | None:
     try:
-        response = await client.get(
-            f"{TMDB_API_BASE_URL}/tv/{int(tmdb_series_id)}",
-            params=auth_params,
-            headers=headers,
-        )
-        response.raise_for_status()
-        payload = response.json()
+        payload = await get_tmdb_client().tv(tmdb_series_id)
     except Exception as exc:  # noqa: BLE001
         logger.info(
             "[TRACKING] TV details lookup failed for series_id=%s: %s",
@@ -243,76 +197,52 @@ async def find_tv_tracking_candidates(
     if not normalized_title:
         return []
 
-    auth = _get_tmdb_auth()
-    if auth is None:
+    if get_tmdb_auth() is None:
         logger.info(
             "[TRACKING] TV candidate lookup skipped for '%s': missing TMDB credentials.", show_title
         )
         return []
 
-    headers, auth_params = auth
-    params: dict[str, str] = {
-        **auth_params,
-        "query": normalized_title,
-        "include_adult": "false",
-    }
-    if isinstance(year, int):
-        params["first_air_date_year"] = str(year)
-
     candidates: list[TvTrackingCandidate] = []
     try:
-        async with httpx.AsyncClient(timeout=TMDB_REQUEST_TIMEOUT_SECONDS) as client:
-            response = await client.get(
-                f"{TMDB_API_BASE_URL}/search/tv",
-                params=params,
-                headers=headers,
-            )
-            response.raise_for_status()
-            payload = response.json()
-
-            raw_results = payload.get("results") if isinstance(payload, dict) else []
-            selected = _choose_tv_search_results(
-                normalized_title,
-                year=year,
-                raw_results=raw_results,
-                limit=limit,
+        payload = await get_tmdb_client().search_tv(normalized_title, year=year)
+
+        raw_results = payload.get("results") if isinstance(payload, dict) else []
+        selected = _choose_tv_search_results(
+            normalized_title,
+            year=year,
+            raw_results=raw_results,
+            limit=limit,
+        )
+        for result in selected:
+            tmdb_series_id = _coerce_int(result.get("id"), minimum=1)
+            canonical_title = str(result.get("name") or result.get("original_name") or "").strip()
+            if tmdb_series_id is None or not canonical_title:
+                continue
+
+            first_air_date = parse_tmdb_date(result.get("first_air_date"))
+            next_air_date = parse_tmdb_date(result.get("next_air_date"))
+            if next_air_date is None:
+                details_payload = await _fetch_tv_details_payload(tmdb_series_id=tmdb_series_id)
+                if isinstance(details_payload, dict):
+                    details_title = details_payload.get("name")
+                    if isinstance(details_title, str) and details_title.strip():
+                        canonical_title = details_title.strip()
+                    if first_air_date is None:
+                        first_air_date = parse_tmdb_date(details_payload.get("first_air_date"))
+                    next_air_date = _extract_next_air_date_from_details(details_payload)
+
+            candidates.append(
+                {
+                    "target_kind": "tv",
+                    "schedule_mode": "ongoing_next_episode",
+                    "title": canonical_title,
+                    "canonical_title": canonical_title,
+                    "tmdb_series_id": tmdb_series_id,
+                    "first_air_date": first_air_date,
+                    "next_air_date": next_air_date,
+                }
             )
-            for result in selected:
-                tmdb_series_id = _coerce_int(result.get("id"), minimum=1)
-                canonical_title = str(
-                    result.get("name") or result.get("original_name") or ""
-                ).strip()
-                if tmdb_series_id is None or not canonical_title:
-                    continue
-
-                first_air_date = _parse_tmdb_date(result.get("first_air_date"))
-                next_air_date = _parse_tmdb_date(result.get("next_air_date"))
-                if next_air_date is None:
-                    details_payload = await _fetch_tv_details_payload(
-                        client=client,
-                        tmdb_series_id=tmdb_series_id,
-                        headers=headers,
-                        auth_params=auth_params,
-                    )
-                    if isinstance(details_payload, dict):
-                        details_title = details_payload.get("name")
-                        if isinstance(details_title, str) and details_title.strip():
-                            canonical_title = details_title.strip()
-                        if first_air_date is None:
-                            first_air_date = _parse_tmdb_date(details_payload.get("first_air_date"))
-                        next_air_date = _extract_next_air_date_from_details(details_payload)
-
-                candidates.append(
-                    {
-                        "target_kind": "tv",
-                        "schedule_mode": "ongoing_next_episode",
-                        "title": canonical_title,
-                        "canonical_title": canonical_title,
-                        "tmdb_series_id": tmdb_series_id,
-                        "first_air_date": first_air_date,
-                        "next_air_date": next_air_date,
-                    }
-                )
     except Exception as exc:  # noqa: BLE001
         logger.info("[TRACKING] TV candidate lookup failed for '%s': %s", normalized_title, exc)
         return []
@@ -348,7 +278,7 @@ def _extract_episodes_from_season_payload(payload: Any) -> list[TvEpisodeRecord]
                 "season": season_number,
                 "episode": episode_number,
                 "title": title,
-                "air_date": _parse_tmdb_date(episode.get("air_date")),
+                "air_date": parse_tmdb_date(episode.get("air_date")),
             }
         )
 
@@ -372,7 +302,7 @@ async def resolve_next_ongoing_episode(
     today: date,
     existing_episode_lookup: Callable[[str, int], Awaitable[set[int]]],
 ) -> TvNextEpisodeResolution:
-    auth = _get_tmdb_auth()
+    auth = get_tmdb_auth()
     canonical_title = (fallback_show_title or "").strip() or "TV Show"
     fallback: TvNextEpisodeResolution = {
         "canonical_title": canonical_title,
@@ -389,7 +319,7 @@ async def resolve_next_ongoing_episode(
         )
         return fallback
 
-    headers, auth_params = auth
+    client = get_tmdb_client()
     cursor_ref = episode_cursor or {}
     cursor = (
         int(cursor_ref.get("season") or 0),
@@ -397,113 +327,98 @@ async def resolve_next_ongoing_episode(
     )
 
     try:
-        async with httpx.AsyncClient(timeout=TMDB_REQUEST_TIMEOUT_SECONDS) as client:
-            details_response = await client.get(
-                f"{TMDB_API_BASE_URL}/tv/{int(tmdb_series_id)}",
-                params=auth_params,
-                headers=headers,
-            )
-            details_response.raise_for_status()
-            details_payload = details_response.json()
-
-            if isinstance(details_payload, dict):
-                tmdb_name = details_payload.get("name")
-                if isinstance(tmdb_name, str) and tmdb_name.strip():
-                    canonical_title = tmdb_name.strip()
+        details_payload = await client.tv(tmdb_series_id)
+
+        if isinstance(details_payload, dict):
+            tmdb_name = details_payload.get("name")
+            if isinstance(tmdb_name, str) and tmdb_name.strip():
+                canonical_title = tmdb_name.strip()
+
+        raw_seasons = details_payload.get("seasons") if isinstance(details_payload, dict) else []
+        season_numbers: list[int] = []
+        if isinstance(raw_seasons, list):
+            for season in raw_seasons:
+                if not isinstance(season, dict):
+                    continue
+                season_number = _coerce_int(season.get("season_number"), minimum=1)
+                if season_number is None:
+                    continue
+                season_numbers.append(season_number)
+
+        if not season_numbers:
+            fallback["canonical_title"] = canonical_title
+            return fallback
+
+        season_numbers = sorted(set(season_numbers))
+        candidates_with_dates: list[TvEpisodeRecord] = []
+        unknown_date_exists = False
+
+        for season_number in season_numbers:
+            season_payload = await client.tv_season(tmdb_series_id, season_number)
+            season_episodes = _extract_episodes_from_season_payload(season_payload)
+            if not season_episodes:
+                continue
+
+            existing_episodes = await existing_episode_lookup(canonical_title, season_number)
+            for episode in season_episodes:
+                season = int(episode["season"])
+                episode_number = int(episode["episode"])
+                if not _is_episode_after_cursor(season, episode_number, cursor):
+                    continue
+                if episode_number in existing_episodes:
+                    continue
 
-            raw_seasons = (
-                details_payload.get("seasons") if isinstance(details_payload, dict) else []
-            )
-            season_numbers: list[int] = []
-            if isinstance(raw_seasons, list):
-                for season in raw_seasons:
-                    if not isinstance(season, dict):
-                        continue
-                    season_number = _coerce_int(season.get("season_number"), minimum=1)
-                    if season_number is None:
-                        continue
-                    season_numbers.append(season_number)
-
-            if not season_numbers:
-                fallback["canonical_title"] = canonical_title
-                return fallback
-
-            season_numbers = sorted(set(season_numbers))
-            candidates_with_dates: list[TvEpisodeRecord] = []
-            unknown_date_exists = False
-
-            for season_number in season_numbers:
-                season_response = await client.get(
-                    f"{TMDB_API_BASE_URL}/tv/{int(tmdb_series_id)}/season/{season_number}",
-                    params=auth_params,
-                    headers=headers,
-                )
-                season_response.raise_for_status()
-                season_payload = season_response.json()
-                season_episodes = _extract_episodes_from_season_payload(season_payload)
-                if not season_episodes:
+                if episode["air_date"] is None:
+                    unknown_date_exists = True
                     continue
+                candidates_with_dates.append(episode)
 
-                existing_episodes = await existing_episode_lookup(canonical_title, season_number)
-                for episode in season_episodes:
-                    season = int(episode["season"])
-                    episode_number = int(episode["episode"])
-                    if not _is_episode_after_cursor(season, episode_number, cursor):
-                        continue
-                    if episode_number in existing_episodes:
-                        continue
-
-                    if episode["air_date"] is None:
-                        unknown_date_exists = True
-                        continue
-                    candidates_with_dates.append(episode)
-
-            candidates_with_dates.sort(key=lambda item: (item["season"], item["episode"]))
-
-            released_episode = next(
-                (
-                    item
-                    for item in candidates_with_dates
-                    if item["air_date"] and item["air_date"] <= today
-                ),
-                None,
-            )
-            if released_episode is not None:
-                return {
-                    "canonical_title": canonical_title,
-                    "tmdb_series_id": int(tmdb_series_id),
-                    "state": "search_now",
-                    "next_episode": released_episode,
-                    "next_air_date": released_episode["air_date"],
-                    "metadata_refresh_failed": False,
-                }
+        candidates_with_dates.sort(key=lambda item: (item["season"], item["episode"]))
 
-            future_episode = next(
-                (
-                    item
-                    for item in candidates_with_dates
-                    if item["air_date"] and item["air_date"] > today
-                ),
-                None,
-            )
-            if future_episode is not None:
-                return {
-                    "canonical_title": canonical_title,
-                    "tmdb_series_id": int(tmdb_series_id),
-                    "state": "await_window",
-                    "next_episode": future_episode,
-                    "next_air_date": future_episode["air_date"],
-                    "metadata_refresh_failed": False,
-                }
+        released_episode = next(
+            (
+                item
+                for item in candidates_with_dates
+                if item["air_date"] and item["air_date"] <= today
+            ),
+            None,
+        )
+        if released_episode is not None:
+            return {
+                "canonical_title": canonical_title,
+                "tmdb_series_id": int(tmdb_series_id),
+                "state": "search_now",
+                "next_episode": released_episode,
+                "next_air_date": released_episode["air_date"],
+                "metadata_refresh_failed": False,
+            }
 
+        future_episode = next(
+            (
+                item
+                for item in candidates_with_dates
+                if item["air_date"] and item["air_date"] > today
+            ),
+            None,
+        )
+        if future_episode is not None:
             return {
                 "canonical_title": canonical_title,
                 "tmdb_series_id": int(tmdb_series_id),
-                "state": "awaiting_metadata" if unknown_date_exists else "awaiting_metadata",
-                "next_episode": None,
-                "next_air_date": None,
+                "state": "await_window",
+                "next_episode": future_episode,
+                "next_air_date": future_episode["air_date"],
                 "metadata_refresh_failed": False,
             }
+
+        return {
+            "canonical_title": canonical_title,
+            "tmdb_series_id": int(tmdb_series_id),
+            "state": "awaiting_metadata" if unknown_date_exists else "awaiting_metadata",
+            "next_episode": None,
+            "next_air_date": None,
+            "metadata_refresh_failed": False,
+        }
     except Exception as exc:  # noqa: BLE001
         logger.info(
             "[TRACKING] TV metadata refresh failed for '%s' (series_id=%s): %s",
@@ -1,8 +1,10 @@
 # telegram_bot/state.py
 
 import asyncio
+import contextlib
 import json
 import os
+import tempfile
 from types import SimpleNamespace
 from typing import Any
 
@@ -15,8 +17,16 @@ from .config import PERSISTENCE_FILE, logger
 STATE_LOAD_COMPLETED_KEY = "state_load_completed"
 
 
+STATE_SAVE_DEBOUNCE_SECONDS = 1.0
+
+
 def save_state(file_path: str, active_downloads: dict, download_queues: dict) -> None:
     """Saves the state of active and queued downloads to a JSON file."""
+    payload, active_count, queued_count = _encode_state(active_downloads, download_queues)
+    _write_state_payload(file_path, payload, active_count, queued_count)
+
+
+def _encode_state(active_downloads: dict, download_queues: dict) -> tuple[str, int, int]:
     # Create a serializable copy of the active downloads, removing non-serializable objects
     serializable_active = {}
     for chat_id, download_data in active_downloads.items():
@@ -33,19 +43,142 @@ def save_state(file_path: str, active_downloads: dict, download_queues: dict) ->
         "active_downloads": serializable_active,
         "download_queues": download_queues,
     }
+    queued_count = sum(len(q) for q in download_queues.values())
+    return (
+        json.dumps(data_to_save, separators=(",", ":")),
+        len(serializable_active),
+        queued_count,
+    )
 
-    try:
-        with open(file_path, "w") as f:
-            json.dump(data_to_save, f, indent=4)
 
-        queued_count = sum(len(q) for q in download_queues.values())
-        logger.info(
-            f"Saved state: {len(serializable_active)} active, {queued_count} queued downloads."
-        )
+def _write_state_payload(
+    file_path: str, payload: str, active_count: int, queued_count: int
+) -> None:
+    try:
+        write_file_atomically(file_path, payload)
+        logger.info(f"Saved state: {active_count} active, {queued_count} queued downloads.")
     except Exception as e:
         logger.error(f"Could not save persistence file to '{file_path}': {e}")
 
 
+def write_file_atomically(file_path: str, payload: str) -> None:
+    """Writes to a temp file beside `file_path`, fsyncs it and renames it into place."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+class DebouncedStateWriter:
+    """
+    Coalesces download-state saves into one atomic write per debounce window.
+
+    `mark_dirty()` remembers the state dicts and arms a timer. When it fires,
+    the state is encoded on the event loop and written from a worker thread,
+    so queuing a whole collection costs one write instead of dozens.
+    """
+
+    def __init__(
+        self, file_path: str, *, debounce_seconds: float = STATE_SAVE_DEBOUNCE_SECONDS
+    ) -> None:
+        self.file_path = file_path
+        self._debounce_seconds = debounce_seconds
+        self._dirty: tuple[dict, dict] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._write_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty is not None
+
+    def mark_dirty(self, active_downloads: dict, download_queues: dict) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to debounce on (scripts, shutdown): write right away.
+            save_state(self.file_path, active_downloads, download_queues)
+            return
+        if loop is not self._loop:
+            self._loop = loop
+            self._timer = None
+            self._write_task = None
+        self._dirty = (active_downloads, download_queues)
+        if self._timer is None:
+            self._timer = loop.call_later(self._debounce_seconds, self._start_write)
+
+    async def flush(self) -> None:
+        """Writes pending state now and waits for any write already in progress."""
+        self.cancel()
+        if self._write_task is not None and not self._write_task.done():
+            await asyncio.gather(self._write_task, return_exceptions=True)
+        if self._dirty is not None:
+            write_task = self._start_write()
+            if write_task is not None:
+                await asyncio.gather(write_task, return_exceptions=True)
+
+    def cancel(self) -> None:
+        """Disarms the timer; pending state stays dirty until the next flush."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def discard(self) -> None:
+        self.cancel()
+        self._dirty = None
+
+    def _start_write(self) -> asyncio.Task[None] | None:
+        """Starts a write, returning its task; re-arms instead while one is running."""
+        self._timer = None
+        if self._write_task is not None and not self._write_task.done():
+            # One write at a time; re-arm so the newer state follows this write.
+            self._timer = asyncio.get_running_loop().call_later(
+                self._debounce_seconds, self._start_write
+            )
+            return None
+        self._write_task = asyncio.ensure_future(self._write())
+        return self._write_task
+
+    async def _write(self) -> None:
+        dirty, self._dirty = self._dirty, None
+        if dirty is None:
+            return
+        payload, active_count, queued_count = _encode_state(*dirty)
+        await asyncio.to_thread(
+            _write_state_payload, self.file_path, payload, active_count, queued_count
+        )
+
+
+_state_writers: dict[str, DebouncedStateWriter] = {}
+
+
+def get_state_writer(file_path: str) -> DebouncedStateWriter:
+    writer = _state_writers.get(file_path)
+    if writer is None:
+        writer = _state_writers[file_path] = DebouncedStateWriter(file_path)
+    return writer
+
+
+def schedule_state_save(file_path: str, active_downloads: dict, download_queues: dict) -> None:
+    """Marks download state dirty; it is written once the debounce window closes."""
+    get_state_writer(file_path).mark_dirty(active_downloads, download_queues)
+
+
+async def flush_state_saves() -> None:
+    for writer in list(_state_writers.values()):
+        await writer.flush()
+
+
 def load_state(file_path: str) -> tuple[dict, dict]:
     """Loads the state of active and queued downloads from a JSON file."""
     if not os.path.exists(file_path):
@@ -120,6 +253,11 @@ async def post_init(application: Application) -> None:
     from .services.download_manager import (
         download_task_wrapper,
     )  # Avoid circular import
+    from .services.http_client import open_http_clients
+    from .services.library_index import start_library_index_warmup
+    from .services.metadata_cache import open_metadata_cache
+    from .services.plex_session import open_plex_session
+    from .services.torrent_service import get_torrent_alert_pump
     from .services.tracking.manager import load_tracking_state_into_bot_data
     from .services.tracking.scheduler import (
         reconcile_tracking_items_on_startup,
@@ -127,6 +265,9 @@ async def post_init(application: Application) -> None:
     )
 
     logger.info("--- Loading persisted state and resuming downloads ---")
+    open_http_clients(application.bot_data)
+    open_metadata_cache(application.bot_data)
+    open_plex_session(application.bot_data)
     application.bot_data[STATE_LOAD_COMPLETED_KEY] = False
     # --- Fix: Use the imported constant directly ---
     persistence_file = PERSISTENCE_FILE
@@ -139,8 +280,12 @@ async def post_init(application: Application) -> None:
     if not active_downloads:
         logger.info("No active downloads to resume.")
     else:
-        for chat_id_str, download_data in active_downloads.items():
-            logger.info(f"Resuming download for chat_id {chat_id_str}...")
+        for download_id, download_data in active_downloads.items():
+            # Files written before per-download slots were keyed by chat id.
+            download_data.setdefault("download_id", download_id)
+            logger.info(
+                f"Resuming download {download_id} for chat_id {download_data.get('chat_id')}..."
+            )
             # Re-create the non-serializable parts and restart the task
             download_data["lock"] = asyncio.Lock()
             task = asyncio.create_task(download_task_wrapper(download_data, application))
@@ -148,6 +293,10 @@ async def post_init(application: Application) -> None:
 
     logger.info("--- Resume process finished ---")
 
+    if "TORRENT_SESSION" in application.bot_data:
+        get_torrent_alert_pump(application.bot_data)
+
+    start_library_index_warmup(application.bot_data)
     load_tracking_state_into_bot_data(application)
     reconcile_tracking_items_on_startup(application)
     start_tracking_scheduler(application)
@@ -162,14 +311,36 @@ async def post_shutdown(application: Application) -> None:
     This function is called by the ApplicationBuilder.
     """
     logger.info("--- Shutting down: Signalling active tasks to stop ---")
+    from .services.http_client import close_http_clients
+    from .services.metadata_cache import close_metadata_cache
+    from .services.plex_session import close_plex_session
+    from .services.search_logic import save_discovery_result_cache
+    from .services.torrent_service import (
+        get_torrent_alert_pump,
+        get_torrent_resume_store,
+        stop_torrent_alert_pump,
+    )
     from .services.tracking.manager import persist_tracking_state_from_bot_data
     from .services.tracking.scheduler import stop_tracking_scheduler
+    from .utils import close_message_edit_scheduler
 
     # Set a global flag to indicate shutdown is in progress
     application.bot_data["is_shutting_down"] = True
 
     active_downloads = application.bot_data.get("active_downloads", {})
 
+    # Checkpoint fast-resume data while the alert pump can still deliver it, so
+    # restarted downloads pick up where they left off instead of re-hashing.
+    handles = [
+        download_data["handle"]
+        for download_data in active_downloads.values()
+        if download_data.get("handle") is not None
+    ]
+    if handles and "TORRENT_SESSION" in application.bot_data:
+        resume_store = get_torrent_resume_store(application.bot_data)
+        resume_store.attach(get_torrent_alert_pump(application.bot_data))
+        await resume_store.save_all(handles)
+
     tasks_to_cancel = [
         download_data["task"]
         for download_data in active_downloads.values()
@@ -186,9 +357,16 @@ async def post_shutdown(application: Application) -> None:
         # Wait for all tasks to acknowledge cancellation
         await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
 
+    await close_message_edit_scheduler()
     await stop_tracking_scheduler(application)
+    await stop_torrent_alert_pump(application.bot_data)
+    await close_http_clients(application.bot_data)
+    close_metadata_cache(application.bot_data)
+    close_plex_session(application.bot_data)
 
     if not application.bot_data.get(STATE_LOAD_COMPLETED_KEY, False):
+        for writer in _state_writers.values():
+            writer.discard()
         logger.warning(
             "Skipping persistence save on shutdown because startup state load did not complete."
         )
@@ -196,8 +374,12 @@ async def post_shutdown(application: Application) -> None:
         return
 
     persist_tracking_state_from_bot_data(application)
+    save_discovery_result_cache(application.bot_data)
 
-    # Final state save before exiting
+    # Final state save before exiting; it supersedes any debounced save still pending.
+    for writer in _state_writers.values():
+        writer.discard()
+    await flush_state_saves()
     # --- Fix: Use the imported constant directly ---
     save_state(
         PERSISTENCE_FILE,
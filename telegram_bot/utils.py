@@ -1,12 +1,17 @@
 # telegram_bot/utils.py
 
 import asyncio
+import contextlib
+import json
 import math
 import os
 import re
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any
+from typing import Any, ClassVar
 from urllib.parse import urlparse
 
 from telegram import Bot, Message
@@ -90,22 +95,68 @@ async def safe_edit_message(
     This function can be called in two ways:
     1. safe_edit_message(message_object, "new text")
     2. safe_edit_message(bot_object, "new text", chat_id=123, message_id=456)
+
+    An edit still queued for the same message in the `MessageEditScheduler`
+    is dropped first, so stale progress cannot overwrite this text.
     """
-    # Determine suppression key (chat_id, message_id) if available
-    key: tuple[int, int] | None = None
+    key = _edit_key(bot_or_message, kwargs)
+    if key is not None and _default_edit_scheduler is not None:
+        await _default_edit_scheduler.settle(key)
+    await _edit_message_with_retries(
+        bot_or_message,
+        text,
+        key=key,
+        max_attempts=max_attempts,
+        base_delay=base_delay,
+        max_retry_after=max_retry_after,
+        **kwargs,
+    )
+
+
+def _edit_key(bot_or_message: Bot | Message, kwargs: dict[str, Any]) -> tuple[int, int] | None:
+    """Returns the (chat_id, message_id) an edit targets, if it can be determined."""
     chat_id_kw = kwargs.get("chat_id")
     message_id_kw = kwargs.get("message_id")
     if isinstance(bot_or_message, Message):
         try:
-            key = (int(bot_or_message.chat_id), int(bot_or_message.message_id))
-        except Exception:
-            key = None
-    elif chat_id_kw is not None and message_id_kw is not None:
+            return (int(bot_or_message.chat_id), int(bot_or_message.message_id))
+        except (TypeError, ValueError):
+            return None
+    if chat_id_kw is not None and message_id_kw is not None:
         try:
-            key = (int(chat_id_kw), int(message_id_kw))
-        except Exception:
-            key = None
+            return (int(chat_id_kw), int(message_id_kw))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _retry_after_seconds(exc: RetryAfter, default: float) -> float:
+    ra = getattr(exc, "retry_after", None)
+    if isinstance(ra, timedelta):
+        return ra.total_seconds()
+    try:
+        return float(ra) if ra is not None else default
+    except (TypeError, ValueError):
+        return default
+
+
+async def _edit_message_with_retries(
+    bot_or_message: Bot | Message,
+    text: str,
+    *,
+    key: tuple[int, int] | None,
+    max_attempts: int = 3,
+    base_delay: float = 0.6,
+    max_retry_after: float = 10.0,
+    defer_retry_after: bool = False,
+    **kwargs,
+) -> None:
+    """
+    Edit loop behind `safe_edit_message`.
 
+    With `defer_retry_after` a `RetryAfter` is raised to the caller instead of
+    being slept on, so the edit scheduler can push back just that chat.
+    """
     # If flood control previously told us to wait, respect that by skipping
     if key is not None:
         suppressed_until = _edit_suppression_until.get(key, 0.0)
@@ -169,15 +220,10 @@ async def safe_edit_message(
             raise e
 
         except RetryAfter as e:
+            if defer_retry_after:
+                raise
             # Respect server backoff; if very large, suppress further edits until then
-            ra = getattr(e, "retry_after", None)
-            if isinstance(ra, timedelta):
-                wait = ra.total_seconds()
-            else:
-                try:
-                    wait = float(ra) if ra is not None else delay
-                except Exception:
-                    wait = delay
+            wait = _retry_after_seconds(e, delay)
 
             if wait > max_retry_after:
                 # Set suppression window and attempt a fallback send so the user still sees the update
@@ -225,6 +271,203 @@ async def safe_edit_message(
     return
 
 
+# Telegram allows roughly 30 outgoing requests per second per bot and about one
+# per second per chat; progress edits stay below both so replies still get through.
+EDIT_SCHEDULER_EDITS_PER_SECOND = 20.0
+EDIT_SCHEDULER_PER_CHAT_INTERVAL_SECONDS = 1.0
+_EDIT_SCHEDULER_REMEMBERED_MESSAGES = 1024
+
+
+@dataclass(frozen=True)
+class _ScheduledEdit:
+    target: Bot | Message
+    text: str
+    kwargs: dict[str, Any]
+
+    def same_payload(self, other: "_ScheduledEdit") -> bool:
+        return self.text == other.text and self.kwargs == other.kwargs
+
+
+class MessageEditScheduler:
+    """
+    Coalescing, rate-limited outbound queue for progress-style message edits.
+
+    Edits are keyed by `(chat_id, message_id)` and only the newest pending text
+    per message is kept. An edit identical to what the message already shows
+    is dropped without a request. One worker drains the queue within a global
+    edits-per-second budget and a minimum interval per chat; a `RetryAfter`
+    pushes back that chat instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        edits_per_second: float = EDIT_SCHEDULER_EDITS_PER_SECOND,
+        per_chat_interval: float = EDIT_SCHEDULER_PER_CHAT_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._global_interval = 1.0 / edits_per_second if edits_per_second > 0 else 0.0
+        self._per_chat_interval = per_chat_interval
+        self._clock = clock
+        self._pending: dict[tuple[int, int], _ScheduledEdit] = {}
+        self._last_sent: OrderedDict[tuple[int, int], _ScheduledEdit] = OrderedDict()
+        self._chat_ready_at: dict[int, float] = {}
+        self._global_ready_at = 0.0
+        self._in_flight: tuple[tuple[int, int], asyncio.Task[None]] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, bot_or_message: Bot | Message, text: str, **kwargs: Any) -> bool:
+        """
+        Queues an edit and returns immediately.
+
+        Takes the same arguments as `safe_edit_message`. Returns False when the
+        edit was dropped because the message already shows (or is about to
+        show) the same content.
+        """
+        key = _edit_key(bot_or_message, kwargs)
+        if key is None:
+            raise ValueError("Scheduled edits need a Message or both chat_id and message_id.")
+        self._bind_to_running_loop()
+
+        edit = _ScheduledEdit(bot_or_message, text, dict(kwargs))
+        last_sent = self._last_sent.get(key)
+        if last_sent is not None and last_sent.same_payload(edit):
+            self._pending.pop(key, None)
+            return False
+        pending = self._pending.get(key)
+        if pending is not None and pending.same_payload(edit):
+            return False
+
+        # Replacing a pending edit keeps its place in line.
+        self._pending[key] = edit
+        self._idle.clear()
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return True
+
+    async def settle(self, key: tuple[int, int]) -> None:
+        """Drops any queued edit for `key` and waits out one already being sent."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        self._pending.pop(key, None)
+        self._last_sent.pop(key, None)
+        self._wakeup.set()
+        if self._in_flight is not None and self._in_flight[0] == key:
+            await asyncio.wait({self._in_flight[1]})
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Waits until every queued edit has been sent. Returns False on timeout."""
+        if self._loop is not asyncio.get_running_loop():
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def aclose(self, timeout: float | None = 5.0) -> None:
+        if not await self.flush(timeout):
+            logger.warning("[UI] Dropping %d queued message edit(s) on shutdown.", len(self))
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+        self._pending.clear()
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        # Events and the worker task belong to the loop that created them.
+        self._loop = loop
+        self._worker = None
+        self._in_flight = None
+        self._pending.clear()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def _next_due(self, now: float) -> tuple[tuple[int, int] | None, float | None]:
+        earliest: float | None = None
+        for key in self._pending:
+            ready_at = max(self._chat_ready_at.get(key[0], 0.0), self._global_ready_at)
+            if ready_at <= now:
+                return key, None
+            if earliest is None or ready_at < earliest:
+                earliest = ready_at
+        return None, earliest
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            now = self._clock()
+            key, ready_at = self._next_due(now)
+            if key is None:
+                if not self._pending:
+                    self._idle.set()
+                timeout = None if ready_at is None else max(0.0, ready_at - now)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                continue
+
+            edit = self._pending.pop(key)
+            self._global_ready_at = now + self._global_interval
+            self._chat_ready_at[key[0]] = now + self._per_chat_interval
+            task = asyncio.create_task(self._deliver(key, edit))
+            self._in_flight = (key, task)
+            try:
+                await task
+            finally:
+                self._in_flight = None
+
+    async def _deliver(self, key: tuple[int, int], edit: _ScheduledEdit) -> None:
+        try:
+            await _edit_message_with_retries(
+                edit.target, edit.text, key=key, defer_retry_after=True, **edit.kwargs
+            )
+        except RetryAfter as exc:
+            wait = _retry_after_seconds(exc, self._per_chat_interval)
+            self._chat_ready_at[key[0]] = self._clock() + wait
+            # Retry later unless a newer edit for the message arrived meanwhile.
+            self._pending.setdefault(key, edit)
+            logger.info("[UI] Flood control: deferring edits to chat %s for %.1fs.", key[0], wait)
+            return
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[UI] Scheduled edit of message %s failed: %s", key, exc)
+            return
+        self._last_sent[key] = edit
+        self._last_sent.move_to_end(key)
+        while len(self._last_sent) > _EDIT_SCHEDULER_REMEMBERED_MESSAGES:
+            self._last_sent.popitem(last=False)
+
+
+_default_edit_scheduler: MessageEditScheduler | None = None
+
+
+def get_message_edit_scheduler() -> MessageEditScheduler:
+    """Returns the process-wide edit scheduler, creating it on first use."""
+    global _default_edit_scheduler
+    if _default_edit_scheduler is None:
+        _default_edit_scheduler = MessageEditScheduler()
+    return _default_edit_scheduler
+
+
+async def close_message_edit_scheduler(timeout: float | None = 5.0) -> None:
+    """Sends what is still queued (up to `timeout`) and stops the worker."""
+    global _default_edit_scheduler
+    scheduler, _default_edit_scheduler = _default_edit_scheduler, None
+    if scheduler is not None:
+        await scheduler.aclose(timeout)
+
+
 def parse_torrent_name(name: str) -> dict[str, Any]:
     """
     Parses a torrent name to identify if it's a movie, a single TV episode,
@@ -638,83 +881,7 @@ def _has_any(values: set[str], candidates: set[str]) -> bool:
 
 def compute_av_match_metadata(title: str, preferences: dict[str, Any]) -> dict[str, Any]:
     """Builds AV match metadata for UI and scoring consumers."""
-    parsed_video_formats = parse_video_formats(title)
-    parsed_audio_formats = parse_audio_formats(title)
-    parsed_audio_channels = parse_audio_channels(title)
-
-    video_weights = _canonical_preference_weights(
-        preferences.get("video_formats", {}),
-        key_normalizer=lambda key: _canonicalize_key(key, _VIDEO_KEY_SYNONYMS),
-        order=_VIDEO_FORMAT_ORDER,
-    )
-    audio_weights = _canonical_preference_weights(
-        preferences.get("audio_formats", {}),
-        key_normalizer=lambda key: _canonicalize_key(key, _AUDIO_KEY_SYNONYMS),
-        order=_AUDIO_FORMAT_ORDER,
-    )
-    channel_weights = _canonical_preference_weights(
-        preferences.get("audio_channels", {}),
-        key_normalizer=_canonicalize_audio_channel_key,
-        order=_AUDIO_CHANNEL_ORDER,
-    )
-
-    matched_video_formats = _ordered_matches(
-        parsed_video_formats, video_weights, order=_VIDEO_FORMAT_ORDER
-    )
-    matched_audio_formats = _ordered_matches(
-        parsed_audio_formats, audio_weights, order=_AUDIO_FORMAT_ORDER
-    )
-    matched_audio_channels = _ordered_matches(
-        parsed_audio_channels, channel_weights, order=_AUDIO_CHANNEL_ORDER
-    )
-
-    matched_video_set = set(matched_video_formats)
-    matched_audio_set = set(matched_audio_formats)
-
-    has_video_match = bool(matched_video_set)
-    has_audio_match = bool(matched_audio_set)
-    is_gold_av = "dolby_vision" in matched_video_set and "atmos" in matched_audio_set
-    silver_video_tier = {"hdr10_plus", "hdr10"}
-    silver_audio_tier = {"atmos", "truehd", "dts_hd_ma"}
-    is_silver_av = (
-        not is_gold_av
-        and _has_any(matched_video_set, silver_video_tier)
-        and _has_any(matched_audio_set, silver_audio_tier)
-    )
-    bronze_video_tier = {"dolby_vision", "hdr10_plus", "hdr10", "hdr", "hlg"}
-    bronze_audio_tier = {
-        "atmos",
-        "truehd",
-        "dts_hd_ma",
-        "ddp",
-        "dts_hd",
-        "dts",
-        "dd",
-        "aac",
-        "flac",
-        "opus",
-    }
-    is_bronze_av = (
-        not is_gold_av
-        and not is_silver_av
-        and _has_any(matched_video_set, bronze_video_tier)
-        and _has_any(matched_audio_set, bronze_audio_tier)
-    )
-
-    return {
-        "matched_video_formats": matched_video_formats,
-        "matched_audio_formats": matched_audio_formats,
-        "matched_audio_channels": matched_audio_channels,
-        "has_video_match": has_video_match,
-        "has_audio_match": has_audio_match,
-        "is_gold_av": is_gold_av,
-        "is_silver_av": is_silver_av,
-        "is_bronze_av": is_bronze_av,
-        # Format categories use top-match scoring to avoid double counting.
-        "video_format_score": _max_weight_for_matches(matched_video_formats, video_weights),
-        "audio_format_score": _max_weight_for_matches(matched_audio_formats, audio_weights),
-        "audio_channel_score": sum(channel_weights[key] for key in matched_audio_channels),
-    }
+    return ScoringProfile.for_preferences(preferences).av_metadata(title)
 
 
 def calculate_torrent_health(seeders: int, leechers: int) -> float:
@@ -753,34 +920,219 @@ def score_torrent_result(
     """
     Scores a torrent result based on user preferences and swarm health.
     """
-    score = 0
-    title_lower = title.lower()
-
-    # Score based on codecs (e.g., "x265": 2)
-    for codec, value in preferences.get("codecs", {}).items():
-        if codec.lower() in title_lower:
-            score += value
-
-    # Score based on resolutions/quality (e.g., "1080p": 5)
-    for quality, value in preferences.get("resolutions", {}).items():
-        if quality.lower() in title_lower:
-            score += value
-
-    # Score based on trusted uploaders (e.g., "MeGusta": 5)
-    for trusted_uploader, value in preferences.get("uploaders", {}).items():
-        if trusted_uploader.lower() == uploader.lower():
-            score += value
-
-    av_metadata = compute_av_match_metadata(title, preferences)
-    score += av_metadata["video_format_score"]
-    score += av_metadata["audio_format_score"]
-    score += av_metadata["audio_channel_score"]
-
-    # Add health score (max 10 points)
-    health = calculate_torrent_health(seeders, leechers)
-    score += int(round(health))
-
-    return score
+    return ScoringProfile.for_preferences(preferences).score(
+        title, uploader, seeders=seeders, leechers=leechers
+    )
+
+
+class _SubstringWeights:
+    """
+    Sums the weights of every preference key found as a case-insensitive substring.
+
+    All keys are folded into one alternation regex scanned with a lookahead at
+    every position. Keys are tried longest-first, so a shorter key that starts
+    at the same position as a longer match is implied by it and added through
+    `_implied`.
+    """
+
+    def __init__(self, raw_weights: Any) -> None:
+        self._weights: dict[str, Any] = {}
+        if isinstance(raw_weights, dict):
+            for key, value in raw_weights.items():
+                lowered = str(key).lower()
+                self._weights[lowered] = self._weights.get(lowered, 0) + value
+        self._always = self._weights.pop("", 0)
+        keys = sorted(self._weights, key=len, reverse=True)
+        self._pattern = (
+            re.compile("(?=(" + "|".join(re.escape(key) for key in keys) + "))") if keys else None
+        )
+        self._implied = {
+            key: [other for other in keys if other != key and other in key] for key in keys
+        }
+
+    def score(self, title_lower: str) -> Any:
+        if self._pattern is None:
+            return self._always
+        found: set[str] = set()
+        for match in self._pattern.finditer(title_lower):
+            key = match.group(1)
+            if key not in found:
+                found.add(key)
+                found.update(self._implied[key])
+        return self._always + sum(self._weights[key] for key in found)
+
+
+class ScoringProfile:
+    """
+    Preference set compiled once for scoring many torrent titles.
+
+    Canonical AV weights, one combined regex per substring category and the
+    lowercased uploader map are built up front. AV metadata is memoized per
+    title, so formatting and scoring the same result only parses it once.
+    Use `for_preferences()` to share compiled profiles between callers.
+    """
+
+    _AV_CACHE_MAX_ENTRIES = 4096
+    _PROFILE_CACHE_MAX_ENTRIES = 32
+    _profiles: ClassVar[dict[str, "ScoringProfile"]] = {}
+
+    def __init__(self, preferences: dict[str, Any]) -> None:
+        self._codecs = _SubstringWeights(preferences.get("codecs", {}))
+        self._resolutions = _SubstringWeights(preferences.get("resolutions", {}))
+        self._uploaders: dict[str, Any] = {}
+        raw_uploaders = preferences.get("uploaders", {})
+        if isinstance(raw_uploaders, dict):
+            for name, value in raw_uploaders.items():
+                lowered = str(name).lower()
+                self._uploaders[lowered] = self._uploaders.get(lowered, 0) + value
+
+        self._video_weights = _canonical_preference_weights(
+            preferences.get("video_formats", {}),
+            key_normalizer=lambda key: _canonicalize_key(key, _VIDEO_KEY_SYNONYMS),
+            order=_VIDEO_FORMAT_ORDER,
+        )
+        self._audio_weights = _canonical_preference_weights(
+            preferences.get("audio_formats", {}),
+            key_normalizer=lambda key: _canonicalize_key(key, _AUDIO_KEY_SYNONYMS),
+            order=_AUDIO_FORMAT_ORDER,
+        )
+        self._channel_weights = _canonical_preference_weights(
+            preferences.get("audio_channels", {}),
+            key_normalizer=_canonicalize_audio_channel_key,
+            order=_AUDIO_CHANNEL_ORDER,
+        )
+        self._av_cache: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def for_preferences(cls, preferences: dict[str, Any]) -> "ScoringProfile":
+        """Returns a compiled profile for `preferences`, reusing an equal earlier one."""
+        try:
+            key = json.dumps(preferences, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return cls(preferences)
+        profile = cls._profiles.get(key)
+        if profile is None:
+            if len(cls._profiles) >= cls._PROFILE_CACHE_MAX_ENTRIES:
+                cls._profiles.clear()
+            profile = cls(preferences)
+            cls._profiles[key] = profile
+        return profile
+
+    def av_metadata(self, title: str) -> dict[str, Any]:
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in self._cached_av_metadata(title).items()
+        }
+
+    def score(
+        self,
+        title: str,
+        uploader: str,
+        *,
+        seeders: int = 0,
+        leechers: int = 0,
+    ) -> int:
+        title_lower = title.lower()
+        score = self._codecs.score(title_lower)
+        score += self._resolutions.score(title_lower)
+        score += self._uploaders.get(uploader.lower(), 0)
+
+        av_metadata = self._cached_av_metadata(title)
+        score += av_metadata["video_format_score"]
+        score += av_metadata["audio_format_score"]
+        score += av_metadata["audio_channel_score"]
+
+        # Add health score (max 10 points)
+        score += int(round(calculate_torrent_health(seeders, leechers)))
+        return score
+
+    def score_many(self, results: Iterable[dict[str, Any]]) -> list[int]:
+        """Scores result dicts carrying `title`, `uploader`, `seeders` and `leechers`."""
+        return [
+            self.score(
+                str(result.get("title") or ""),
+                str(result.get("uploader") or ""),
+                seeders=int(result.get("seeders") or 0),
+                leechers=int(result.get("leechers") or 0),
+            )
+            for result in results
+        ]
+
+    def _cached_av_metadata(self, title: str) -> dict[str, Any]:
+        cached = self._av_cache.get(title)
+        if cached is None:
+            if len(self._av_cache) >= self._AV_CACHE_MAX_ENTRIES:
+                self._av_cache.clear()
+            cached = self._compute_av_metadata(title)
+            self._av_cache[title] = cached
+        return cached
+
+    def _compute_av_metadata(self, title: str) -> dict[str, Any]:
+        video_weights = self._video_weights
+        audio_weights = self._audio_weights
+        channel_weights = self._channel_weights
+        # Tags only count when weighted, so skip parsers with nothing to match.
+        parsed_video_formats = parse_video_formats(title) if video_weights else set()
+        parsed_audio_formats = parse_audio_formats(title) if audio_weights else set()
+        parsed_audio_channels = parse_audio_channels(title) if channel_weights else set()
+
+        matched_video_formats = _ordered_matches(
+            parsed_video_formats, video_weights, order=_VIDEO_FORMAT_ORDER
+        )
+        matched_audio_formats = _ordered_matches(
+            parsed_audio_formats, audio_weights, order=_AUDIO_FORMAT_ORDER
+        )
+        matched_audio_channels = _ordered_matches(
+            parsed_audio_channels, channel_weights, order=_AUDIO_CHANNEL_ORDER
+        )
+
+        matched_video_set = set(matched_video_formats)
+        matched_audio_set = set(matched_audio_formats)
+
+        has_video_match = bool(matched_video_set)
+        has_audio_match = bool(matched_audio_set)
+        is_gold_av = "dolby_vision" in matched_video_set and "atmos" in matched_audio_set
+        silver_video_tier = {"hdr10_plus", "hdr10"}
+        silver_audio_tier = {"atmos", "truehd", "dts_hd_ma"}
+        is_silver_av = (
+            not is_gold_av
+            and _has_any(matched_video_set, silver_video_tier)
+            and _has_any(matched_audio_set, silver_audio_tier)
+        )
+        bronze_video_tier = {"dolby_vision", "hdr10_plus", "hdr10", "hdr", "hlg"}
+        bronze_audio_tier = {
+            "atmos",
+            "truehd",
+            "dts_hd_ma",
+            "ddp",
+            "dts_hd",
+            "dts",
+            "dd",
+            "aac",
+            "flac",
+            "opus",
+        }
+        is_bronze_av = (
+            not is_gold_av
+            and not is_silver_av
+            and _has_any(matched_video_set, bronze_video_tier)
+            and _has_any(matched_audio_set, bronze_audio_tier)
+        )
+
+        return {
+            "matched_video_formats": matched_video_formats,
+            "matched_audio_formats": matched_audio_formats,
+            "matched_audio_channels": matched_audio_channels,
+            "has_video_match": has_video_match,
+            "has_audio_match": has_audio_match,
+            "is_gold_av": is_gold_av,
+            "is_silver_av": is_silver_av,
+            "is_bronze_av": is_bronze_av,
+            # Format categories use top-match scoring to avoid double counting.
+            "video_format_score": _max_weight_for_matches(matched_video_formats, video_weights),
+            "audio_format_score": _max_weight_for_matches(matched_audio_formats, audio_weights),
+            "audio_channel_score": sum(channel_weights[key] for key in matched_audio_channels),
+        }
 
 
 _COLLECTION_SUFFIX_KEYWORDS = (
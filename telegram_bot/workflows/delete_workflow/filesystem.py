@@ -8,6 +8,7 @@ import shutil
 from typing import TYPE_CHECKING
 
 from ...config import logger
+from ...services.library_index import get_library_index
 
 if TYPE_CHECKING:
     pass
@@ -27,6 +28,7 @@ async def _delete_from_filesystem(path: str) -> tuple[bool, str]:
 
     try:
         removed_kind = await asyncio.to_thread(_remove)
+        get_library_index().record_removed(path)
         logger.info("Removed %s from filesystem: %s", removed_kind, path)
         return True, removed_kind
     except FileNotFoundError:
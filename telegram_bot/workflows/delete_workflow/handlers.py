@@ -43,6 +43,9 @@ from .helpers import (
 from .plex import _delete_item_from_plex, _delete_plex_collection
 from .selection import _present_delete_results
 
+# Keeps the selection keyboard readable when a short query matches many titles.
+DELETE_SEARCH_MAX_RESULTS = 10
+
 
 def _truncate_log_text(value: str, limit: int = 120) -> str:
     if len(value) <= limit:
@@ -145,7 +148,9 @@ async def handle_delete_workflow(update: Update, context: ContextTypes.DEFAULT_T
             f"🔎 Searching for movie collection: `{escaped_text}`\\.\\.\\.",
             parse_mode=ParseMode.MARKDOWN_V2,
         )
-        found = await find_media_by_name("movie", text, save_paths, "directory")
+        found = await find_media_by_name(
+            "movie", text, save_paths, "directory", limit=DELETE_SEARCH_MAX_RESULTS
+        )
         _log_delete_search_outcome(
             update.message,
             target_kind="movie_collection",
@@ -176,7 +181,9 @@ async def handle_delete_workflow(update: Update, context: ContextTypes.DEFAULT_T
             f"🔎 Searching for single movie: `{escaped_text}`\\.\\.\\.",
             parse_mode=ParseMode.MARKDOWN_V2,
         )
-        found = await find_media_by_name("movie", text, save_paths, "file")
+        found = await find_media_by_name(
+            "movie", text, save_paths, "file", limit=DELETE_SEARCH_MAX_RESULTS
+        )
         _log_delete_search_outcome(
             update.message,
             target_kind="movie_file",
@@ -207,7 +214,9 @@ async def handle_delete_workflow(update: Update, context: ContextTypes.DEFAULT_T
             f"🔎 Searching for TV show: `{escaped_text}`\\.\\.\\.",
             parse_mode=ParseMode.MARKDOWN_V2,
         )
-        found_path = await find_media_by_name("tv_shows", text, save_paths)
+        found_path = await find_media_by_name(
+            "tv_shows", text, save_paths, limit=DELETE_SEARCH_MAX_RESULTS
+        )
         _log_delete_search_outcome(
             update.message,
             target_kind="tv_show",
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import os
-from typing import TYPE_CHECKING, Literal, TypedDict
+from typing import TYPE_CHECKING, Literal, TypedDict, cast
 
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized
 from plexapi.server import PlexServer
 
 from ...config import logger
+from ...services.plex_session import get_plex_session
 
 if TYPE_CHECKING:
     from plexapi.video import Episode, Movie, Season, Show
@@ -109,37 +110,23 @@ def _find_media_in_plex_by_path(
     plex: PlexServer, path_to_delete: str
 ) -> Movie | Episode | Show | Season | None:
     """
-    Scans all Plex libraries to find the media item that corresponds to a given file or directory path.
+    Finds the media item whose file or directory is `path_to_delete`, using the Plex path index.
 
     This is a blocking function and must be run in a separate thread.
     """
     # Normalize paths to be safe
     path_to_delete = os.path.abspath(path_to_delete)
+    path_index = get_plex_session().path_index
 
-    # Iterate through all video libraries
     for section in plex.library.sections():
         if section.type in ["movie", "show"]:
             logger.info(
                 f"Searching for path '{path_to_delete}' in Plex library '{section.title}'..."
             )
-
-            # Use the .search() method for efficiency where possible, but we need to check file paths,
-            # which often requires iterating.
-            for item in section.all():
-                # For Shows, Seasons, or Movies (items with locations)
-                if hasattr(item, "locations"):
-                    for location in item.locations:
-                        if os.path.abspath(location) == path_to_delete:
-                            logger.info(f"Found match for directory: {item.title}")
-                            return item  # Found a match for a whole Show or Movie directory
-
-                # For individual episodes
-                if hasattr(item, "media"):
-                    for media in item.media:
-                        for part in media.parts:
-                            if os.path.abspath(part.file) == path_to_delete:
-                                logger.info(f"Found match for file: {item.title}")
-                                return item  # Found a match for an Episode file
+            matches = path_index.items_at(section, path_to_delete)
+            if matches:
+                logger.info(f"Found match for path: {matches[0].title}")
+                return matches[0]
 
     logger.warning(f"Could not find any item in Plex matching path: {path_to_delete}")
     return None
@@ -149,12 +136,12 @@ async def _delete_item_from_plex(
     path_to_delete: str, plex_config: dict
 ) -> tuple[PlexDeleteResult, PlexServer | None]:
     """
-    Connects to Plex, finds a media item by its path, and deletes it via the API.
+    Uses the shared Plex connection, finds a media item by its path, and deletes it via the API.
     Returns a structured result plus the Plex connection for downstream use.
     """
     plex: PlexServer | None = None
     try:
-        plex = await asyncio.to_thread(PlexServer, plex_config["url"], plex_config["token"])
+        plex = cast(PlexServer, await asyncio.to_thread(get_plex_session().server, plex_config))
     except Unauthorized:
         return (
             {"status": "error", "detail": "Plex authentication failed."},
@@ -203,23 +190,16 @@ async def _delete_item_from_plex(
             )
             items_to_delete = []
             seen_keys: set[int] = set()
+            path_index = get_plex_session().path_index
 
             for section in plex_server.library.sections():
                 if getattr(section, "type", None) != "movie":
                     continue
-                for item in section.all():
-                    try:
-                        for media in getattr(item, "media", []) or []:
-                            for part in getattr(media, "parts", []) or []:
-                                part_path = os.path.abspath(getattr(part, "file", ""))
-                                if part_path.startswith(abs_path + os.sep):
-                                    rk = getattr(item, "ratingKey", None)
-                                    if rk is not None and rk not in seen_keys:
-                                        seen_keys.add(rk)
-                                        items_to_delete.append(item)
-                                    break
-                    except Exception:
-                        continue
+                for item in path_index.items_under(section, abs_path):
+                    rk = getattr(item, "ratingKey", None)
+                    if rk is not None and rk not in seen_keys:
+                        seen_keys.add(rk)
+                        items_to_delete.append(item)
 
             if items_to_delete:
                 base_name = os.path.basename(abs_path)
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Literal, TypedDict, cast
 
 from ...config import logger
+from ...services.library_index import get_library_index
 from ...services.search_logic.filesystem_filters import is_ignored_search_directory
 from .helpers import _normalize_label
 
@@ -156,7 +157,8 @@ def _find_label_matches(
     recursive: bool,
     excluded_roots: tuple[str, ...] = (),
 ) -> list[str]:
-    if not root_path or not os.path.isdir(root_path):
+    index = get_library_index()
+    if not root_path or not index.is_dir(root_path):
         return []
 
     normalized_label = _normalize_label(label)
@@ -174,7 +176,7 @@ def _find_label_matches(
 
     matches: list[str] = []
     if recursive:
-        for current_root, dirs, files in os.walk(root_path):
+        for current_root, dirs, files in index.walk(root_path):
             current_root_abs = os.path.abspath(current_root)
             if current_root_abs in excluded_paths or is_ignored_search_directory(current_root_abs):
                 dirs[:] = []
@@ -191,7 +193,7 @@ def _find_label_matches(
                     matches.append(entry_path)
     else:
         try:
-            for entry in os.listdir(root_path):
+            for entry in index.list_dir(root_path):
                 entry_path = os.path.join(root_path, entry)
                 if is_ignored_search_directory(entry_path):
                     continue
@@ -301,6 +303,7 @@ async def _flatten_directory_into_collection(
     if os.path.abspath(source_dir) == os.path.abspath(franchise_dir):
         return {"status": "already_in_collection", "destination_path": franchise_dir}
 
+    index = get_library_index()
     destination_path: str | None = None
     entries = os.listdir(source_dir)
     for entry in entries:
@@ -316,10 +319,12 @@ async def _flatten_directory_into_collection(
                 "detail": f"Target already exists: {target_path}",
             }
         await asyncio.to_thread(shutil.move, source_path, target_path)
+        index.record_moved(source_path, target_path)
         destination_path = target_path
 
     if entries:
         await asyncio.to_thread(shutil.rmtree, source_dir, ignore_errors=True)
+        index.record_removed(source_dir)
 
     return {
         "status": "moved_to_collection",
@@ -341,6 +346,7 @@ async def _move_file_into_collection(source_path: str, franchise_dir: str) -> Co
         }
 
     await asyncio.to_thread(shutil.move, source_path, destination_path)
+    get_library_index().record_moved(source_path, destination_path)
     return {"status": "moved_to_collection", "destination_path": destination_path}
 
 
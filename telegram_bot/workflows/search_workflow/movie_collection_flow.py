@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import time
 from datetime import date
 from typing import Any
 
@@ -60,6 +61,8 @@ from .state import _get_callback_data, _get_user_data_store, _save_session
 COLLECTION_CODEC_CHOICES: tuple[str, ...] = ("x264", "x265")
 COLLECTION_RESOLUTION_CHOICES: tuple[str, ...] = ("1080p", "2160p")
 COLLECTION_DEFAULT_RESOLUTION = "1080p"
+COLLECTION_SEARCH_CONCURRENCY = 4
+COLLECTION_PROGRESS_EDIT_INTERVAL_SECONDS = 3.0
 COLLECTION_DEFAULT_CODEC = "x265"
 _COLLECTION_RESOLUTION_ALIASES = {
     "1080p": "1080p",
@@ -900,8 +903,9 @@ def _update_collection_movie_status(
     chat_id_str = str(chat_id)
 
     parsed_entries: list[dict[str, Any]] = []
-    active_entry = active_downloads.get(chat_id_str)
-    if isinstance(active_entry, dict):
+    for active_entry in active_downloads.values():
+        if not isinstance(active_entry, dict) or str(active_entry.get("chat_id")) != chat_id_str:
+            continue
         parsed = (active_entry.get("source_dict", {}) or {}).get("parsed_info")
         if isinstance(parsed, dict):
             parsed_entries.append(parsed)
@@ -955,26 +959,13 @@ async def _collect_collection_torrents(
     """Searches and selects torrent entries for the chosen movies."""
     pending_items: list[dict[str, Any]] = []
     missing: list[str] = []
-    total = len(movies)
-    scraper_max_size_gib = require_scraper_max_torrent_size_gib(context.bot_data)
+    results_per_movie = await _search_collection_movies(message, context, movies)
 
-    for idx, movie in enumerate(movies, 1):
+    # Selection runs in collection order once every search has landed, so the
+    # seed size/uploader consistency rules do not depend on completion order.
+    for movie, results in zip(movies, results_per_movie):
         label = _format_collection_movie_label(movie)
-        await safe_edit_message(
-            message,
-            text=(f"🔍 Searching for *{escape_markdown(label, version=2)}* \\({idx}/{total}\\)…"),
-            parse_mode=ParseMode.MARKDOWN_V2,
-        )
-
         year_value = movie.get("year")
-        year_kw = str(year_value) if isinstance(year_value, int) else None
-
-        results = await search_logic.orchestrate_searches(
-            label, "movie", context, year=year_kw, max_size_gib=scraper_max_size_gib
-        )
-
-        if LOG_SCRAPER_STATS:
-            _log_aggregated_results(label, results)
 
         candidate = _pick_collection_candidate(
             results,
@@ -1038,6 +1029,52 @@ async def _collect_collection_torrents(
     return pending_payload, missing
 
 
+async def _search_collection_movies(
+    message: Message,
+    context: ContextTypes.DEFAULT_TYPE,
+    movies: list[dict[str, Any]],
+) -> list[list[dict[str, Any]]]:
+    """
+    Runs the collection's movie searches with bounded concurrency.
+
+    Returns results in the same order as `movies`. Progress edits are coalesced
+    to at most one per `COLLECTION_PROGRESS_EDIT_INTERVAL_SECONDS`.
+    """
+    total = len(movies)
+    scraper_max_size_gib = require_scraper_max_torrent_size_gib(context.bot_data)
+    semaphore = asyncio.Semaphore(COLLECTION_SEARCH_CONCURRENCY)
+    completed = 0
+    last_edit_at = time.monotonic()
+
+    async def _search_movie(movie: dict[str, Any]) -> list[dict[str, Any]]:
+        nonlocal completed, last_edit_at
+        label = _format_collection_movie_label(movie)
+        year_value = movie.get("year")
+        year_kw = str(year_value) if isinstance(year_value, int) else None
+        async with semaphore:
+            results = await search_logic.orchestrate_searches(
+                label, "movie", context, year=year_kw, max_size_gib=scraper_max_size_gib
+            )
+        if LOG_SCRAPER_STATS:
+            _log_aggregated_results(label, results)
+
+        completed += 1
+        now = time.monotonic()
+        if completed < total and now - last_edit_at >= COLLECTION_PROGRESS_EDIT_INTERVAL_SECONDS:
+            last_edit_at = now
+            await safe_edit_message(
+                message,
+                text=(
+                    f"🔍 Searching {total} movies… "
+                    f"\\({completed}/{total} done, latest: *{escape_markdown(label, version=2)}*\\)"
+                ),
+                parse_mode=ParseMode.MARKDOWN_V2,
+            )
+        return results or []
+
+    return list(await asyncio.gather(*(_search_movie(movie) for movie in movies)))
+
+
 def _build_franchise_metadata(session: SearchSession) -> dict[str, Any]:
     return {
         "name": session.collection_name,
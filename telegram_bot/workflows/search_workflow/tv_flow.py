@@ -1,7 +1,9 @@
 # telegram_bot/workflows/search_workflow/tv_flow.py
 
+import asyncio
 import re
 from collections import Counter
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -26,6 +28,7 @@ from ...ui.keyboards import (
     stacked_choice_keyboard,
 )
 from ...utils import (
+    get_message_edit_scheduler,
     parse_torrent_name,
     safe_edit_message,
     safe_send_message,
@@ -1013,7 +1016,19 @@ async def _perform_tv_all_seasons_search(
     skipped_owned_seasons: list[int] = []
     skipped_unverified_seasons: list[int] = []
 
-    for season in range(1, total_seasons + 1):
+    async def _fetch_episode_count(season: int) -> int | None:
+        try:
+            return await scraping_service.fetch_season_episode_count_from_wikipedia(title, season)
+        except Exception:
+            return None
+
+    # Season lookups are independent, so resolve them together up front; each
+    # season's episode searches below then run as one concurrent batch.
+    episode_counts = await asyncio.gather(
+        *(_fetch_episode_count(season) for season in range(1, total_seasons + 1))
+    )
+
+    for season, episode_count in enumerate(episode_counts, start=1):
         logger.info("[SEARCH] All-seasons mode evaluating %s S%02d.", title, season)
         await safe_edit_message(
             message,
@@ -1025,13 +1040,6 @@ async def _perform_tv_all_seasons_search(
             parse_mode=ParseMode.MARKDOWN_V2,
         )
 
-        try:
-            episode_count = await scraping_service.fetch_season_episode_count_from_wikipedia(
-                title, season
-            )
-        except Exception:
-            episode_count = None
-
         if not isinstance(episode_count, int) or episode_count <= 0:
             skipped_unverified_seasons.append(season)
             continue
@@ -1350,6 +1358,107 @@ async def _search_tv_single_results(
     )
 
 
+def _episode_candidates_from_results(
+    episode: int,
+    results: list[dict[str, Any]],
+    *,
+    target_res: str,
+    target_codec: str,
+) -> list[EpisodeCandidate]:
+    """Applies the season's resolution/codec filters and keeps the top candidates."""
+    filtered_eps = _filter_results_by_resolution(results, target_res)
+    if target_codec != "all":
+        filtered_eps = [
+            r for r in filtered_eps if (r.get("codec") or "").lower() == target_codec.lower()
+        ]
+
+    # If strict filtering yields nothing, fallback to relaxed
+    if not filtered_eps:
+        filtered_eps = results
+
+    normalized_candidates: list[EpisodeCandidate] = []
+    for raw in filtered_eps or []:
+        link = raw.get("page_url")
+        if not link:
+            continue
+        normalized_candidates.append(
+            EpisodeCandidate(
+                episode=episode,
+                link=link,
+                title=str(raw.get("title", "")),
+                source=_normalize_release_field(raw.get("source"), "Unknown"),
+                uploader=_normalize_release_field(raw.get("uploader"), "Anonymous"),
+                info_url=raw.get("info_url"),
+                size_gib=_coerce_float(raw.get("size_gib", raw.get("size_gb"))),
+                seeders=_coerce_int(raw.get("seeders")),
+                resolution=_infer_resolution_from_title(raw.get("title")),
+                codec=raw.get("codec"),
+                score=_coerce_float(raw.get("score")),
+            )
+        )
+        if len(normalized_candidates) >= EPISODE_CANDIDATE_LIMIT:
+            break
+    return normalized_candidates
+
+
+async def _search_episode_candidates(
+    context: ContextTypes.DEFAULT_TYPE,
+    title: str,
+    season: int,
+    episodes: list[int],
+    *,
+    target_res: str,
+    target_codec: str,
+    on_episode_searched: Callable[[int], Awaitable[None]] | None = None,
+) -> tuple[dict[int, list[EpisodeCandidate]], list[int]]:
+    """
+    Searches every episode of a season at once and collects candidates per episode.
+
+    Queries are dispatched together; the discovery layer caps in-flight requests
+    per provider and skips providers whose circuit breaker opens mid-batch.
+    `on_episode_searched` is awaited as each episode's search completes.
+    """
+
+    async def _search_episode(episode: int) -> tuple[int, str, list[dict[str, Any]]]:
+        search_term = f"{title} S{season:02d}E{episode:02d}"
+        # Hint resolution in query
+        if target_res in ("720p", "1080p"):
+            search_term += f" {target_res}"
+        results = await search_logic.orchestrate_searches(
+            search_term, "tv", context, base_query_for_filter=title
+        )
+        return episode, search_term, results or []
+
+    episode_candidates: dict[int, list[EpisodeCandidate]] = {}
+    tasks = [asyncio.create_task(_search_episode(episode)) for episode in episodes]
+    try:
+        for next_completed in asyncio.as_completed(tasks):
+            episode, search_term, ep_results = await next_completed
+            if LOG_SCRAPER_STATS:
+                _log_aggregated_results(search_term, ep_results)
+            candidates = _episode_candidates_from_results(
+                episode,
+                ep_results,
+                target_res=target_res,
+                target_codec=target_codec,
+            )
+            if candidates:
+                episode_candidates[episode] = candidates
+            if on_episode_searched is not None:
+                await on_episode_searched(episode)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    ordered_candidates = {
+        episode: episode_candidates[episode]
+        for episode in episodes
+        if episode in episode_candidates
+    }
+    missing_candidates = [episode for episode in episodes if episode not in episode_candidates]
+    return ordered_candidates, missing_candidates
+
+
 async def _perform_tv_season_search(
     message: Message,
     context: ContextTypes.DEFAULT_TYPE,
@@ -1525,11 +1634,9 @@ async def _perform_tv_season_search(
 
     targets = filtered_targets
 
-    episode_candidates: dict[int, list[EpisodeCandidate]] = {}
-    missing_candidates: list[int] = []
     processed_eps = 0
 
-    def _progress_text(last_ep: int | None) -> str:
+    def _progress_text() -> str:
         base = (
             f"🔎 Searching for Season {escape_markdown(str(season), version=2)} "
             f"of *{escape_markdown(title, version=2)}* in {escape_markdown(target_res, version=2)}\\.\\.\\."
@@ -1539,60 +1646,30 @@ async def _perform_tv_season_search(
             return base + f"\nProgress: {processed_eps}/{total_targets}"
         return base
 
-    for ep in targets:
-        search_term = f"{title} S{season:02d}E{ep:02d}"
-        # Hint resolution in query
-        if target_res in ("720p", "1080p"):
-            search_term += f" {target_res}"
-
-        ep_results = await search_logic.orchestrate_searches(
-            search_term, "tv", context, base_query_for_filter=title
+    async def _on_episode_searched(_episode: int) -> None:
+        nonlocal processed_eps
+        processed_eps += 1
+        # Episodes finish in bursts; the scheduler coalesces these ticks into a
+        # paced stream of edits instead of one per completion.
+        get_message_edit_scheduler().enqueue(
+            message,
+            text=_progress_text(),
+            parse_mode=ParseMode.MARKDOWN_V2,
         )
 
-        if LOG_SCRAPER_STATS:
-            _log_aggregated_results(search_term, ep_results)
-
-        # Apply Filters
-        filtered_eps = _filter_results_by_resolution(ep_results, target_res)
-        if target_codec != "all":
-            filtered_eps = [
-                r for r in filtered_eps if (r.get("codec") or "").lower() == target_codec.lower()
-            ]
-
-        # If strict filtering yields nothing, fallback to relaxed
-        if not filtered_eps:
-            filtered_eps = ep_results
-
-        normalized_candidates: list[EpisodeCandidate] = []
-        if filtered_eps:
-            for raw in filtered_eps:
-                link = raw.get("page_url")
-                if not link:
-                    continue
-                candidate = EpisodeCandidate(
-                    episode=ep,
-                    link=link,
-                    title=str(raw.get("title", "")),
-                    source=_normalize_release_field(raw.get("source"), "Unknown"),
-                    uploader=_normalize_release_field(raw.get("uploader"), "Anonymous"),
-                    info_url=raw.get("info_url"),
-                    size_gib=_coerce_float(raw.get("size_gib", raw.get("size_gb"))),
-                    seeders=_coerce_int(raw.get("seeders")),
-                    resolution=_infer_resolution_from_title(raw.get("title")),
-                    codec=raw.get("codec"),
-                    score=_coerce_float(raw.get("score")),
-                )
-                normalized_candidates.append(candidate)
-                if len(normalized_candidates) >= EPISODE_CANDIDATE_LIMIT:
-                    break
-        if normalized_candidates:
-            episode_candidates[ep] = normalized_candidates
-        else:
-            missing_candidates.append(ep)
-        processed_eps += 1
+    episode_candidates, missing_candidates = await _search_episode_candidates(
+        context,
+        title,
+        season,
+        targets,
+        target_res=target_res,
+        target_codec=target_codec,
+        on_episode_searched=_on_episode_searched,
+    )
+    if processed_eps:
         await safe_edit_message(
             message,
-            text=_progress_text(ep),
+            text=_progress_text(),
             parse_mode=ParseMode.MARKDOWN_V2,
         )
 
@@ -67,6 +67,23 @@ def tmp_path(tmp_path_factory: RepoTmpPathFactory) -> Generator[Path, None, None
         tmp_path_factory.cleanup(path)
 
 
+@pytest.fixture(autouse=True)
+def _isolated_metadata_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Gives each test a fresh in-memory metadata cache instead of the on-disk one."""
+    from telegram_bot.services import metadata_cache
+
+    monkeypatch.setattr(metadata_cache, "METADATA_CACHE_FILE", ":memory:")
+    monkeypatch.setattr(metadata_cache, "_default_cache", metadata_cache.MetadataCache())
+
+
+@pytest.fixture(autouse=True)
+def _isolated_plex_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keeps cached Plex connections and breaker state from leaking between tests."""
+    from telegram_bot.services import plex_session
+
+    monkeypatch.setattr(plex_session, "_default_session", plex_session.PlexSessionManager())
+
+
 @pytest.fixture
 def user():
     return User(id=123, first_name="Test", is_bot=False)
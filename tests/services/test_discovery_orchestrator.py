@@ -4,7 +4,14 @@ import asyncio
 
 import pytest
 
-from telegram_bot.services.discovery import CircuitBreaker, DiscoveryRequest, DiscoveryResult
+from telegram_bot.services.discovery import (
+    CircuitBreaker,
+    ProviderConcurrencyLimiter,
+    DiscoveryRequest,
+    DiscoveryResult,
+    DiscoveryResultCache,
+)
+from telegram_bot.services.discovery.cache import build_cache_key
 from telegram_bot.services.discovery.exceptions import ProviderSearchError
 from telegram_bot.services.discovery.orchestrator import DiscoveryOrchestrator, PROVIDER_FACTORY
 from telegram_bot.services.discovery.providers.base import BaseProvider
@@ -78,6 +85,120 @@ def test_circuit_breaker_marks_provider_offline_until_cooldown_expires() -> None
     assert breaker.is_healthy("indexer") is True
 
 
+def test_result_cache_expires_entries_and_evicts_least_recent(tmp_path) -> None:
+    now = 1_000.0
+    cache = DiscoveryResultCache(ttl_seconds=60, max_entries=2, clock=lambda: now)
+    request = DiscoveryRequest(query="Great  Movie", media_type="movie")
+    first = build_cache_key("Indexer", request, "2000")
+    second = build_cache_key("Indexer", DiscoveryRequest(query="Other", media_type="movie"), "2000")
+    third = build_cache_key("Indexer", DiscoveryRequest(query="Third", media_type="movie"), "2000")
+
+    cache.put(first, [_result("Great Movie 1080p")])
+    cache.put(second, [_result("Other 1080p")])
+    assert cache.get(build_cache_key("indexer", DiscoveryRequest("great movie", "movie"), "2000"))
+    cache.put(third, [_result("Third 1080p")])
+
+    assert cache.get(second) is None  # Least recently used
+    assert cache.get(first) is not None
+
+    now += 61
+    assert cache.get(first) is None
+    assert len(cache) == 1
+
+
+def test_result_cache_persists_unexpired_entries(tmp_path) -> None:
+    now = 1_000.0
+    path = str(tmp_path / "discovery_cache.json")
+    key = build_cache_key(
+        "Indexer", DiscoveryRequest(query="Great Movie", media_type="movie"), "2000"
+    )
+    cache = DiscoveryResultCache(persist_path=path, clock=lambda: now)
+    cache.put(key, [_result("Great Movie 1080p", info_hash="ABC")])
+    cache.save()
+
+    restored = DiscoveryResultCache(persist_path=path, clock=lambda: now)
+    expired = DiscoveryResultCache(persist_path=path, clock=lambda: now + 3600)
+
+    cached = restored.get(key)
+    assert cached is not None
+    assert cached[0].title == "Great Movie 1080p"
+    assert cached[0].info_hash == "ABC"
+    assert len(expired) == 0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_serves_cached_results_even_while_provider_cools_down() -> None:
+    FakeProvider.responses = {"good": [_result("Great Movie 1080p x265", source="good")]}
+    breaker = CircuitBreaker()
+    orchestrator = DiscoveryOrchestrator(
+        [{"name": "good", "type": "fake", "search_url": "https://good.example"}],
+        preferences={"movies": {"codecs": {"x265": 10}, "uploaders": {"trusted": 20}}},
+        breaker=breaker,
+        result_cache=DiscoveryResultCache(),
+    )
+    request = DiscoveryRequest(query="Great Movie", media_type="movie")
+
+    assert len(await orchestrator.search(request)) == 1
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        breaker.record_failure("good")
+    results = await orchestrator.search(request)
+
+    assert len(results) == 1
+    assert FakeProvider.calls["good"] == 1
+    assert orchestrator.last_provider_stats["good"].status == "cached"
+
+
+class GatedProvider(BaseProvider):
+    in_flight = 0
+    peak = 0
+    release: asyncio.Event | None = None
+
+    async def search(self, request: DiscoveryRequest) -> list[DiscoveryResult]:
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        assert cls.release is not None
+        await cls.release.wait()
+        cls.in_flight -= 1
+        raise ProviderSearchError("indexer down", provider_name=self.config.name)
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_provider_requests_and_skips_queued_after_breaker_opens(
+    monkeypatch,
+) -> None:
+    monkeypatch.setitem(PROVIDER_FACTORY, "gated", GatedProvider)
+    GatedProvider.in_flight = 0
+    GatedProvider.peak = 0
+    GatedProvider.release = asyncio.Event()
+    breaker = CircuitBreaker()
+    limiter = ProviderConcurrencyLimiter()
+    config = {
+        "name": "gated",
+        "type": "gated",
+        "search_url": "https://gated.example",
+        "max_concurrent_requests": CircuitBreaker.FAILURE_THRESHOLD,
+    }
+    orchestrators = [
+        DiscoveryOrchestrator([config], breaker=breaker, limiter=limiter) for _ in range(5)
+    ]
+
+    searches = [
+        asyncio.create_task(
+            orchestrator.search(DiscoveryRequest(query=f"Show E{index}", media_type="tv"))
+        )
+        for index, orchestrator in enumerate(orchestrators)
+    ]
+    await asyncio.sleep(0.01)
+    GatedProvider.release.set()
+    await asyncio.gather(*searches)
+
+    assert GatedProvider.peak == CircuitBreaker.FAILURE_THRESHOLD
+    statuses = [orchestrator.last_provider_stats["gated"].status for orchestrator in orchestrators]
+    assert statuses.count("failed") == CircuitBreaker.FAILURE_THRESHOLD
+    assert statuses.count("skipped") == 5 - CircuitBreaker.FAILURE_THRESHOLD
+
+
 @pytest.mark.asyncio
 async def test_orchestrator_records_provider_failures_and_skips_cooling_provider() -> None:
     FakeProvider.responses = {
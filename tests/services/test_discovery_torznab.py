@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from contextlib import asynccontextmanager
+from typing import Any
 
 import httpx
 import pytest
@@ -8,12 +9,21 @@ import pytest
 from telegram_bot.services.discovery import DiscoveryRequest, ProviderConfig
 from telegram_bot.services.discovery.exceptions import ProviderSearchError
 from telegram_bot.services.discovery.providers import TorznabProvider
+from telegram_bot.services.discovery.providers.torznab import _TorznabFeedParser
 
 
 class DummyResponse:
-    def __init__(self, text: str, *, status_code: int = 200) -> None:
+    def __init__(self, text: str, *, status_code: int = 200, chunk_size: int = 64) -> None:
         self.text = text
         self.status_code = status_code
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+
+    async def aiter_bytes(self):
+        payload = self.text.encode("utf-8")
+        for start in range(0, len(payload), self.chunk_size):
+            self.chunks_read += 1
+            yield payload[start : start + self.chunk_size]
 
     def raise_for_status(self) -> None:
         if self.status_code < 400:
@@ -23,17 +33,45 @@ class DummyResponse:
         raise httpx.HTTPStatusError("request failed", request=request, response=response)
 
 
-def _provider(search_url: str | None = None) -> TorznabProvider:
+def _provider(
+    search_url: str | None = None, *, early_stop_after: int | None = None
+) -> TorznabProvider:
     return TorznabProvider(
         ProviderConfig(
             name="Prowlarr 1337x",
             type="torznab",
             search_url=search_url
             or "http://127.0.0.1:9696/1/api?apikey=KEY&t={type}&q={query}&cat={category}",
+            early_stop_after=early_stop_after,
         )
     )
 
 
+def _patch_stream_page(mocker, response: DummyResponse) -> list[tuple[str, dict[str, Any]]]:
+    calls: list[tuple[str, dict[str, Any]]] = []
+
+    @asynccontextmanager
+    async def fake_stream_page(url: str, **kwargs: Any):
+        calls.append((url, kwargs))
+        yield response
+
+    mocker.patch(
+        "telegram_bot.services.discovery.providers.torznab.stream_page",
+        new=fake_stream_page,
+    )
+    return calls
+
+
+def _item_xml(index: int, *, seeders: int, size_bytes: int = 1073741824) -> str:
+    return f"""
+        <item>
+          <title>Example.Movie.2024.Part{index}.1080p.x264</title>
+          <link>magnet:?xt=urn:btih:ABC123ABC123{index:04d}</link>
+          <size>{size_bytes}</size>
+          <torznab:attr xmlns:torznab="http://torznab.com/schemas/2015/feed" name="seeders" value="{seeders}" />
+        </item>"""
+
+
 def test_torznab_build_search_url_substitutes_and_encodes_placeholders() -> None:
     provider = _provider()
     request = DiscoveryRequest(query="Alien Romulus", media_type="movie")
@@ -171,18 +209,16 @@ async def test_torznab_search_fetches_configured_url(mocker) -> None:
       </channel>
     </rss>
     """
-    fetch_mock = mocker.patch(
-        "telegram_bot.services.discovery.providers.torznab.fetch_page",
-        new=AsyncMock(return_value=DummyResponse(xml)),
-    )
+    calls = _patch_stream_page(mocker, DummyResponse(xml))
 
     results = await provider.search(DiscoveryRequest(query="Example Movie", media_type="movie"))
 
-    fetch_mock.assert_awaited_once_with(
-        "http://127.0.0.1:9696/1/api?apikey=KEY&t=search&q=Example+Movie&cat=2000",
-        timeout=8.0,
-        follow_redirects=True,
-    )
+    assert calls == [
+        (
+            "http://127.0.0.1:9696/1/api?apikey=KEY&t=search&q=Example+Movie&cat=2000",
+            {"timeout": 8.0, "follow_redirects": True},
+        )
+    ]
     assert len(results) == 1
     assert results[0].seeders == 25
 
@@ -190,10 +226,59 @@ async def test_torznab_search_fetches_configured_url(mocker) -> None:
 @pytest.mark.asyncio
 async def test_torznab_search_raises_provider_error_on_request_failure(mocker) -> None:
     provider = _provider()
-    mocker.patch(
-        "telegram_bot.services.discovery.providers.torznab.fetch_page",
-        new=AsyncMock(return_value=DummyResponse("", status_code=503)),
+    _patch_stream_page(mocker, DummyResponse("", status_code=503))
+
+    with pytest.raises(ProviderSearchError):
+        await provider.search(DiscoveryRequest(query="Example Movie", media_type="movie"))
+
+
+@pytest.mark.asyncio
+async def test_torznab_search_stops_after_enough_items_pass_request_filters(mocker) -> None:
+    provider = _provider(early_stop_after=2)
+    items = "".join(
+        [
+            _item_xml(1, seeders=1),
+            _item_xml(2, seeders=50, size_bytes=20 * 1024**3),
+            _item_xml(3, seeders=40),
+            _item_xml(4, seeders=30),
+        ]
+        + [_item_xml(index, seeders=20) for index in range(5, 40)]
     )
+    response = DummyResponse(f"<rss><channel>{items}</channel></rss>", chunk_size=128)
+    _patch_stream_page(mocker, response)
+
+    results = await provider.search(
+        DiscoveryRequest(
+            query="Example Movie",
+            media_type="movie",
+            min_seeders=10,
+            max_size_gib=10,
+        )
+    )
+
+    assert [result.seeders for result in results] == [1, 50, 40, 30]
+    assert response.chunks_read < len(response.text.encode("utf-8")) // 128
+
+
+@pytest.mark.asyncio
+async def test_torznab_search_rejects_truncated_feed_instead_of_partial_results(mocker) -> None:
+    provider = _provider()
+    xml = f"<rss><channel>{_item_xml(1, seeders=5)}{_item_xml(2, seeders=6)}<item><title>Cut"
+    _patch_stream_page(mocker, DummyResponse(xml, chunk_size=32))
 
     with pytest.raises(ProviderSearchError):
         await provider.search(DiscoveryRequest(query="Example Movie", media_type="movie"))
+
+
+def test_torznab_feed_parser_detaches_finished_items_from_the_channel() -> None:
+    seen: list[str] = []
+    parser = _TorznabFeedParser(lambda item: seen.append(item.findtext("title") or "") or None)
+    items = "".join(_item_xml(index, seeders=5) for index in range(1, 20))
+
+    parser.feed(f"<rss><channel><title>Indexer</title>{items}")
+
+    channel = parser._open[-1]
+    assert [child.tag for child in channel] == ["title"]
+    assert len(seen) == 19
+    parser.feed("</channel></rss>")
+    parser.close()
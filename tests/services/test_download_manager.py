@@ -17,6 +17,7 @@ from telegram_bot.services.download_manager import (
     handle_pause_resume,
     handle_cancel_request,
     download_with_progress,
+    _start_download_task,
 )
 
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
@@ -40,15 +41,17 @@ async def test_progress_reporter_movie(mocker):
         clean_name="Sample Movie",
         download_data=download_data,
     )
-    safe_mock = mocker.patch(
-        "telegram_bot.services.download_manager.safe_edit_message",
-        AsyncMock(),
+    scheduler = Mock()
+    mocker.patch(
+        "telegram_bot.services.download_manager.progress.get_message_edit_scheduler",
+        return_value=scheduler,
     )
+    enqueue_mock = scheduler.enqueue
 
     await reporter.report(status)
 
-    safe_mock.assert_awaited_once()
-    _, kwargs = safe_mock.call_args
+    enqueue_mock.assert_called_once()
+    _, kwargs = enqueue_mock.call_args
     assert "⬇️ *Downloading:*" in kwargs["text"]
     assert "Sample Movie" in kwargs["text"]
     btn = kwargs["reply_markup"].inline_keyboard[0][0]
@@ -80,15 +83,17 @@ async def test_progress_reporter_tv_paused(mocker):
         clean_name="ignored",
         download_data=download_data,
     )
-    safe_mock = mocker.patch(
-        "telegram_bot.services.download_manager.safe_edit_message",
-        AsyncMock(),
+    scheduler = Mock()
+    mocker.patch(
+        "telegram_bot.services.download_manager.progress.get_message_edit_scheduler",
+        return_value=scheduler,
     )
+    enqueue_mock = scheduler.enqueue
 
     await reporter.report(status)
 
-    safe_mock.assert_awaited_once()
-    _, kwargs = safe_mock.call_args
+    enqueue_mock.assert_called_once()
+    _, kwargs = enqueue_mock.call_args
     assert "⏸️ *Paused:*" in kwargs["text"]
     assert "S01E02" in kwargs["text"]
     assert "*State:* *paused*" in kwargs["text"]
@@ -127,15 +132,17 @@ async def test_progress_reporter_season_pack_omits_episode_names(mocker):
         clean_name="ignored",
         download_data=download_data,
     )
-    safe_mock = mocker.patch(
-        "telegram_bot.services.download_manager.safe_edit_message",
-        AsyncMock(),
+    scheduler = Mock()
+    mocker.patch(
+        "telegram_bot.services.download_manager.progress.get_message_edit_scheduler",
+        return_value=scheduler,
     )
+    enqueue_mock = scheduler.enqueue
 
     await reporter.report(status)
 
-    safe_mock.assert_awaited_once()
-    _, kwargs = safe_mock.call_args
+    enqueue_mock.assert_called_once()
+    _, kwargs = enqueue_mock.call_args
     text = kwargs["text"]
     # Should not show the Episodes field for season packs
     assert "Episodes:" not in text
@@ -166,14 +173,16 @@ async def test_progress_reporter_skips_when_cancellation_pending(mocker):
         clean_name="Sample Movie",
         download_data=download_data,
     )
-    safe_mock = mocker.patch(
-        "telegram_bot.services.download_manager.safe_edit_message",
-        AsyncMock(),
+    scheduler = Mock()
+    mocker.patch(
+        "telegram_bot.services.download_manager.progress.get_message_edit_scheduler",
+        return_value=scheduler,
     )
+    enqueue_mock = scheduler.enqueue
 
     await reporter.report(status)
 
-    safe_mock.assert_not_awaited()
+    enqueue_mock.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -340,6 +349,21 @@ async def test_download_with_progress_reports_during_pause(mocker):
         def add_torrent(self, _):
             return handle
 
+        def get_settings(self):
+            return {"alert_mask": 0}
+
+        def apply_settings(self, _):
+            return None
+
+        def set_alert_notify(self, _):
+            return None
+
+        def post_torrent_updates(self):
+            return None
+
+        def pop_alerts(self):
+            return []
+
     handle = DummyHandle()
     session = DummySession()
     bot_data = {"TORRENT_SESSION": session}
@@ -359,7 +383,10 @@ async def test_download_with_progress_reports_during_pause(mocker):
             download_data["is_paused"] = False
             handle.status_obj.is_seeding = True
 
-    mocker.patch("asyncio.sleep", AsyncMock())
+    mocker.patch(
+        "telegram_bot.services.download_manager.download_core.STATUS_UPDATE_TIMEOUT_SECONDS",
+        0,
+    )
 
     success, _ = await download_with_progress(
         source="magnet:?xt=urn:btih:test",
@@ -368,6 +395,7 @@ async def test_download_with_progress_reports_during_pause(mocker):
         bot_data=bot_data,
         download_data=download_data,
     )
+    await bot_data["TORRENT_ALERT_PUMP"].stop()
 
     assert success is True
     assert any(calls)
@@ -390,7 +418,7 @@ async def test_add_download_to_queue(
     context.bot_data["SAVE_PATHS"] = {"default": "/tmp"}
     context.application = SimpleNamespace(bot=context.bot, bot_data=context.bot_data)
 
-    mocker.patch("telegram_bot.services.download_manager.save_state")
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
     process_mock = mocker.patch(
         "telegram_bot.services.download_manager.process_queue_for_user",
         AsyncMock(),
@@ -427,7 +455,7 @@ async def test_add_season_to_queue(mocker, make_update, make_callback_query, mak
     context.bot_data["SAVE_PATHS"] = {"default": "/tmp"}
     context.application = SimpleNamespace(bot=context.bot, bot_data=context.bot_data)
 
-    mocker.patch("telegram_bot.services.download_manager.save_state")
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
     process_mock = mocker.patch(
         "telegram_bot.services.download_manager.process_queue_for_user",
         AsyncMock(),
@@ -494,7 +522,7 @@ async def test_add_collection_to_queue(
     context.bot_data["SAVE_PATHS"] = {"default": "/tmp"}
     context.application = SimpleNamespace(bot=context.bot, bot_data=context.bot_data)
 
-    mocker.patch("telegram_bot.services.download_manager.save_state")
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
     process_mock = mocker.patch(
         "telegram_bot.services.download_manager.process_queue_for_user",
         AsyncMock(),
@@ -538,7 +566,7 @@ async def test_add_collection_to_queue_owned_only(
     context.bot_data["SAVE_PATHS"] = {"default": "/tmp"}
     context.application = SimpleNamespace(bot=context.bot, bot_data=context.bot_data)
 
-    mocker.patch("telegram_bot.services.download_manager.save_state")
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
     process_mock = mocker.patch(
         "telegram_bot.services.download_manager.process_queue_for_user",
         AsyncMock(),
@@ -618,8 +646,9 @@ async def test_process_queue_for_user_active(mocker):
     chat_id = 111
     application = Mock()
     application.bot_data = {
-        "active_downloads": {str(chat_id): {}},
-        "download_queues": {},
+        "active_downloads": {"dl-1": {"chat_id": chat_id}, "dl-2": {"chat_id": chat_id}},
+        "download_queues": {str(chat_id): [{"chat_id": chat_id}]},
+        "MAX_CONCURRENT_DOWNLOADS_PER_CHAT": 2,
     }
     start_mock = mocker.patch(
         "telegram_bot.services.download_manager._start_download_task",
@@ -673,8 +702,14 @@ async def test_handle_pause_resume_toggles_state(
 
     message = make_message()
     handle = DummyHandle()
-    download_data = {"lock": asyncio.Lock(), "is_paused": False, "handle": handle}
-    context.bot_data["active_downloads"] = {str(message.chat.id): download_data}
+    download_data = {
+        "chat_id": message.chat.id,
+        "message_id": message.message_id,
+        "lock": asyncio.Lock(),
+        "is_paused": False,
+        "handle": handle,
+    }
+    context.bot_data["active_downloads"] = {"dl-1": download_data}
 
     callback = make_callback_query(data="pause_resume", message=message)
     update = make_update(callback_query=callback)
@@ -696,8 +731,13 @@ async def test_cancel_request_flag_flow(
     message = make_message()
     task = Mock()
     task.done.return_value = False
-    download_data = {"lock": asyncio.Lock(), "task": task}
-    context.bot_data["active_downloads"] = {str(message.chat.id): download_data}
+    download_data = {
+        "chat_id": message.chat.id,
+        "message_id": message.message_id,
+        "lock": asyncio.Lock(),
+        "task": task,
+    }
+    context.bot_data["active_downloads"] = {"dl-1": download_data}
     mocker.patch(
         "telegram_bot.services.download_manager.safe_edit_message",
         AsyncMock(),
@@ -720,3 +760,118 @@ async def test_cancel_request_flag_flow(
     await handle_cancel_request(update_confirm, context)
     assert "cancellation_pending" not in download_data
     task.cancel.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_queue_for_user_fills_free_slots(mocker):
+    chat_id = 333
+    queued = [{"chat_id": chat_id, "n": n} for n in range(4)]
+    application = Mock()
+    application.bot_data = {
+        "active_downloads": {},
+        "download_queues": {str(chat_id): list(queued)},
+        "MAX_CONCURRENT_DOWNLOADS_PER_CHAT": 3,
+        "MAX_CONCURRENT_DOWNLOADS": 5,
+    }
+
+    async def register(download_data, app):
+        app.bot_data["active_downloads"][f"dl-{download_data['n']}"] = download_data
+
+    start_mock = mocker.patch(
+        "telegram_bot.services.download_manager._start_download_task",
+        AsyncMock(side_effect=register),
+    )
+
+    await process_queue_for_user(chat_id, application)
+
+    assert start_mock.await_count == 3
+    assert application.bot_data["download_queues"][str(chat_id)] == [queued[3]]
+
+
+@pytest.mark.asyncio
+async def test_process_queue_for_user_hands_spare_global_slots_to_other_chats(mocker):
+    application = Mock()
+    application.bot_data = {
+        "active_downloads": {"dl-a": {"chat_id": 1}},
+        "download_queues": {"2": [{"chat_id": 2}], "3": [{"chat_id": 3}]},
+        "MAX_CONCURRENT_DOWNLOADS_PER_CHAT": 1,
+        "MAX_CONCURRENT_DOWNLOADS": 2,
+    }
+
+    async def register(download_data, app):
+        key = f"dl-{download_data['chat_id']}"
+        app.bot_data["active_downloads"][key] = download_data
+
+    start_mock = mocker.patch(
+        "telegram_bot.services.download_manager._start_download_task",
+        AsyncMock(side_effect=register),
+    )
+
+    await process_queue_for_user(1, application)
+
+    start_mock.assert_awaited_once_with({"chat_id": 2}, application)
+    assert application.bot_data["download_queues"] == {"3": [{"chat_id": 3}]}
+
+
+@pytest.mark.asyncio
+async def test_start_download_task_gives_batch_siblings_their_own_message(mocker):
+    chat_id = 444
+    sibling = {"chat_id": chat_id, "message_id": 7, "download_id": "dl-1"}
+    download_data = {
+        "chat_id": chat_id,
+        "message_id": 7,
+        "source_dict": {"value": "magnet:?x", "type": "magnet"},
+    }
+    application = Mock()
+    application.bot_data = {"active_downloads": {"dl-1": sibling}, "download_queues": {}}
+
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
+    mocker.patch(
+        "telegram_bot.services.download_manager.download_task_wrapper",
+        AsyncMock(),
+    )
+    send_mock = mocker.patch(
+        "telegram_bot.services.download_manager.safe_send_message",
+        AsyncMock(return_value=SimpleNamespace(message_id=99)),
+    )
+    edit_mock = mocker.patch(
+        "telegram_bot.services.download_manager.safe_edit_message",
+        AsyncMock(),
+    )
+
+    await _start_download_task(download_data, application)
+    await download_data["task"]
+
+    send_mock.assert_awaited_once()
+    edit_mock.assert_not_awaited()
+    assert download_data["message_id"] == 99
+    active_downloads = application.bot_data["active_downloads"]
+    assert active_downloads[download_data["download_id"]] is download_data
+
+
+@pytest.mark.asyncio
+async def test_handle_pause_resume_targets_download_of_pressed_message(
+    make_update, make_callback_query, make_message, context
+):
+    message = make_message(message_id=51)
+    first = {
+        "chat_id": message.chat.id,
+        "message_id": 50,
+        "lock": asyncio.Lock(),
+        "handle": Mock(),
+    }
+    second = {
+        "chat_id": message.chat.id,
+        "message_id": 51,
+        "lock": asyncio.Lock(),
+        "handle": Mock(),
+    }
+    context.bot_data["active_downloads"] = {"dl-1": first, "dl-2": second}
+
+    update = make_update(callback_query=make_callback_query("pause_resume", message))
+    await handle_pause_resume(update, context)
+
+    assert second["is_paused"] is True
+    second["handle"].pause.assert_called_once()
+    assert "is_paused" not in first
+    first["handle"].pause.assert_not_called()
@@ -81,7 +81,7 @@ async def test_requeue_download_timeout_delay(mocker):
         "telegram_bot.services.download_manager.process_queue_for_user",
         AsyncMock(),
     )
-    mocker.patch("telegram_bot.services.download_manager.save_state")
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
 
     await _requeue_download(download_data, application)
 
@@ -114,7 +114,7 @@ async def test_requeue_download_timeout_no_delay_if_queue_not_empty(mocker):
         "telegram_bot.services.download_manager.process_queue_for_user",
         AsyncMock(),
     )
-    mocker.patch("telegram_bot.services.download_manager.save_state")
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
 
     await _requeue_download(download_data, application)
 
@@ -145,7 +145,7 @@ async def test_requeue_download_normal(mocker):
         "telegram_bot.services.download_manager.process_queue_for_user",
         AsyncMock(),
     )
-    mocker.patch("telegram_bot.services.download_manager.save_state")
+    mocker.patch("telegram_bot.services.download_manager.schedule_state_save")
 
     await _requeue_download(download_data, application)
 
@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+import pytest
+
+from telegram_bot.services import http_client
+from telegram_bot.services.http_client import (
+    HttpClientRegistry,
+    PooledHttpClient,
+    close_http_clients,
+    open_http_clients,
+)
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_one_client_per_origin():
+    registry = HttpClientRegistry()
+
+    first = registry.client_for("https://indexer.local/api?t=search&q=a")
+    second = registry.client_for("https://INDEXER.local/api?t=search&q=b")
+    other = registry.client_for("https://api.themoviedb.org/3/search/movie")
+
+    assert first is second
+    assert first is not other
+
+    await registry.aclose()
+    assert first.is_closed
+    assert registry.client_for("https://indexer.local/api") is not first
+    await registry.aclose()
+
+
+def test_clients_from_a_finished_loop_are_closed_with_the_registry():
+    registry = HttpClientRegistry()
+
+    async def _open():
+        return registry.client_for("https://indexer.local/api")
+
+    stale = asyncio.run(_open())
+
+    async def _reopen_and_close():
+        fresh = registry.client_for("https://indexer.local/api")
+        assert fresh is not stale
+        assert not stale.is_closed
+        await registry.aclose()
+        return fresh
+
+    fresh = asyncio.run(_reopen_and_close())
+
+    assert stale.is_closed
+    assert fresh.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_applies_call_defaults_and_stays_open():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text="ok")
+
+    inner = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with PooledHttpClient(inner, timeout=8.0, follow_redirects=True) as client:
+        response = await client.get("https://api.themoviedb.org/3/movie/1")
+
+    assert response.text == "ok"
+    assert seen[0].extensions["timeout"]["read"] == 8.0
+    assert not inner.is_closed
+    await inner.aclose()
+
+
+@pytest.mark.asyncio
+async def test_open_and_close_install_application_registry():
+    bot_data: dict = {}
+
+    registry = open_http_clients(bot_data)
+    assert http_client.get_http_client_registry() is registry
+    client = registry.client_for("https://indexer.local/api")
+
+    await close_http_clients(bot_data)
+
+    assert client.is_closed
+    assert http_client.HTTP_CLIENTS_KEY not in bot_data
+    assert http_client.get_http_client_registry() is not registry
@@ -0,0 +1,71 @@
+import os
+
+from telegram_bot.services.library_index import LibraryIndex
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _bump_mtime(path) -> None:
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_walk_matches_os_walk_and_honours_pruning(tmp_path):
+    (tmp_path / "Movie A (2020)").mkdir()
+    (tmp_path / "Movie A (2020)" / "Movie A (2020).mkv").write_text("x")
+    (tmp_path / ".Trash-1000" / "files").mkdir(parents=True)
+    (tmp_path / "loose.mkv").write_text("x")
+    index = LibraryIndex()
+
+    walked = {}
+    for root, dirs, files in index.walk(str(tmp_path)):
+        dirs[:] = [name for name in dirs if not name.startswith(".Trash")]
+        walked[root] = (sorted(dirs), sorted(files))
+
+    assert walked == {
+        str(tmp_path): (["Movie A (2020)"], ["loose.mkv"]),
+        str(tmp_path / "Movie A (2020)"): ([], ["Movie A (2020).mkv"]),
+    }
+
+
+def test_listing_is_reused_until_revalidation_sees_a_new_mtime(tmp_path):
+    clock = _Clock()
+    index = LibraryIndex(revalidate_after=30, clock=clock)
+    first = index.listing(str(tmp_path))
+
+    (tmp_path / "Show").mkdir()
+    assert index.listing(str(tmp_path)) is first
+
+    clock.now = 31
+    _bump_mtime(tmp_path)
+    refreshed = index.listing(str(tmp_path))
+    assert refreshed is not first
+    assert refreshed is not None and refreshed.dirs == ("Show",)
+
+
+def test_record_added_and_removed_update_cached_parents_without_rescan(tmp_path):
+    clock = _Clock()
+    index = LibraryIndex(revalidate_after=3600, clock=clock)
+    index.warm([str(tmp_path)])
+
+    season_dir = tmp_path / "Show" / "Season 01"
+    season_dir.mkdir(parents=True)
+    episode = season_dir / "Show - S01E02 - Pilot.mkv"
+    episode.write_text("x")
+    index.record_added(str(episode))
+
+    assert index.is_dir(str(tmp_path / "Show"))
+    assert index.episodes(str(season_dir)) == {(1, 2): str(episode)}
+
+    episode.unlink()
+    index.record_removed(str(episode))
+    assert index.episodes(str(season_dir)) == {}
+
+    index.record_removed(str(tmp_path / "Show"))
+    assert not index.is_dir(str(tmp_path / "Show"))
@@ -10,6 +10,7 @@ from telegram_bot.services.media_manager import (
     _get_final_destination_path,
     _trigger_plex_scan,
 )
+from telegram_bot.services.media_manager.placement import PlacementResult
 from telegram_bot.ui.messages import format_media_summary
 
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
@@ -119,7 +120,10 @@ async def test_handle_successful_download(mocker):
         return_value="/final",
     )
     makedirs_mock = mocker.patch("telegram_bot.services.media_manager.adapters.ensure_dir")
-    move_mock = mocker.patch("telegram_bot.services.media_manager.adapters.move_file")
+    move_mock = mocker.patch(
+        "telegram_bot.services.media_manager.processing.place_file_async",
+        AsyncMock(return_value=PlacementResult("rename", 1024, 0.01)),
+    )
     scan_mock = mocker.patch(
         "telegram_bot.services.media_manager.processing._trigger_plex_scan",
         return_value="scan",
@@ -146,7 +150,7 @@ async def test_handle_successful_download(mocker):
     expected_source_path = os.path.join("/downloads", "Movie.mkv")
     expected_dest_path = os.path.join("/final", "Sample (2023).mkv")
 
-    move_mock.assert_called_once_with(expected_source_path, expected_dest_path)
+    move_mock.assert_awaited_once_with(expected_source_path, expected_dest_path, on_progress=None)
 
     scan_mock.assert_called_once()
     size_mock.assert_called_once_with(expected_dest_path)
@@ -156,6 +160,7 @@ async def test_handle_successful_download(mocker):
     assert "📦 Size: 1\\.0 KiB" in result["final_message"]
     assert "📁 Destination: `/final/Sample \\(2023\\)\\.mkv`" in result["final_message"]
     assert "💽 Disk Usage: 62%" in result["final_message"]
+    assert result["placement_strategy"] == "rename"
 
 
 class MovieWithSampleFiles:
@@ -200,7 +205,10 @@ async def test_handle_successful_download_prefers_main_movie_over_sample(mocker)
         return_value="/final",
     )
     makedirs_mock = mocker.patch("telegram_bot.services.media_manager.adapters.ensure_dir")
-    move_mock = mocker.patch("telegram_bot.services.media_manager.adapters.move_file")
+    move_mock = mocker.patch(
+        "telegram_bot.services.media_manager.processing.place_file_async",
+        AsyncMock(return_value=PlacementResult("rename", 1024, 0.01)),
+    )
     mocker.patch(
         "telegram_bot.services.media_manager.processing._trigger_plex_scan",
         return_value="scan",
@@ -228,7 +236,7 @@ async def test_handle_successful_download_prefers_main_movie_over_sample(mocker)
         MovieWithSampleFiles._files[1],
     )
     expected_dest_path = os.path.join("/final", "The Wild Robot (2024).mkv")
-    move_mock.assert_called_once_with(expected_source_path, expected_dest_path)
+    move_mock.assert_awaited_once_with(expected_source_path, expected_dest_path, on_progress=None)
     size_mock.assert_called_once_with(expected_dest_path)
     disk_usage_mock.assert_called_once_with(expected_dest_path)
     assert result["succeeded"] is True
@@ -243,6 +251,9 @@ class SeasonFiles:
     def file_path(self, index):
         return ["Show.S01E01.mkv", "Show.S01E02.mkv"][index]
 
+    def file_size(self, index):
+        return 1024
+
 
 class SeasonTorrent:
     def files(self):
@@ -265,19 +276,23 @@ async def test_handle_successful_download_season_pack(mocker):
         return_value="/final",
     )
     makedirs_mock = mocker.patch("telegram_bot.services.media_manager.adapters.ensure_dir")
-    move_mock = mocker.patch("telegram_bot.services.media_manager.adapters.move_file")
+    move_mock = mocker.patch(
+        "telegram_bot.services.media_manager.processing.place_file_async",
+        AsyncMock(return_value=PlacementResult("rename", 1024, 0.01)),
+    )
+    season_titles_mock = mocker.patch(
+        "telegram_bot.services.media_manager.processing.fetch_episode_titles_for_season",
+        AsyncMock(return_value=({1: {"title": "Ep1"}, 2: {"title": "Ep2"}}, None)),
+    )
     fetch_mock = mocker.patch(
         "telegram_bot.services.media_manager.processing.fetch_episode_title_from_wikipedia",
-        AsyncMock(side_effect=[("Ep1", None), ("Ep2", None)]),
+        AsyncMock(),
     )
     scan_mock = mocker.patch(
         "telegram_bot.services.media_manager.processing._trigger_plex_scan",
         return_value="",
     )
-    size_mock = mocker.patch(
-        "telegram_bot.services.media_manager.adapters.get_path_size_bytes",
-        side_effect=[1024, 2048],
-    )
+    size_mock = mocker.patch("telegram_bot.services.media_manager.adapters.get_path_size_bytes")
     disk_usage_mock = mocker.patch(
         "telegram_bot.services.media_manager.adapters.get_disk_usage",
         return_value=(100, 40, 60),
@@ -291,30 +306,77 @@ async def test_handle_successful_download_season_pack(mocker):
         {"url": "u", "token": "t"},
     )
 
-    assert makedirs_mock.call_count == 2
+    # Both episodes share a season directory, which is created once up front.
+    makedirs_mock.assert_called_once_with("/final")
     expected1_src = os.path.join("/downloads", "Show.S01E01.mkv")
     expected1_dest = os.path.join("/final", "s01e01 - Ep1.mkv")
     expected2_src = os.path.join("/downloads", "Show.S01E02.mkv")
     expected2_dest = os.path.join("/final", "s01e02 - Ep2.mkv")
     move_mock.assert_has_calls(
         [
-            mocker.call(expected1_src, expected1_dest),
-            mocker.call(expected2_src, expected2_dest),
+            mocker.call(expected1_src, expected1_dest, on_progress=None),
+            mocker.call(expected2_src, expected2_dest, on_progress=None),
         ],
         any_order=True,
     )
-    assert fetch_mock.await_count == 2
+    season_titles_mock.assert_awaited_once_with("Show", 1)
+    fetch_mock.assert_not_awaited()
     # One scan after all files have been moved
     assert scan_mock.call_count == 1
-    assert size_mock.call_count == 2
+    size_mock.assert_not_called()
     disk_usage_mock.assert_called_once_with("/final")
     assert result["succeeded"] is True
+    assert [entry["status"] for entry in result["placement_report"]] == ["placed", "placed"]
     assert "Successfully Added to Plex" in result["final_message"]
-    assert "📦 Size: 3\\.0 KiB" in result["final_message"]
+    assert "📦 Size: 2\\.0 KiB" in result["final_message"]
     assert "💽 Disk Usage: 40%" in result["final_message"]
     assert "Processed and moved 2 episodes from the season pack\\." in result["final_message"]
 
 
+@pytest.mark.asyncio
+async def test_season_pack_reports_failed_episode_after_other_moves(mocker):
+    parsed = {"type": "tv", "title": "Show", "season": 1, "is_season_pack": True}
+    mocker.patch(
+        "telegram_bot.services.media_manager.processing._get_final_destination_path",
+        return_value="/final",
+    )
+    mocker.patch("telegram_bot.services.media_manager.adapters.ensure_dir")
+    mocker.patch(
+        "telegram_bot.services.media_manager.processing.fetch_episode_titles_for_season",
+        AsyncMock(return_value=({1: {"title": "Ep1"}, 2: {"title": "Ep2"}}, None)),
+    )
+
+    async def _place(source, destination, *, on_progress):
+        if source.endswith("E02.mkv"):
+            raise OSError("disk full")
+        return PlacementResult("copy", 1024, 0.5)
+
+    mocker.patch(
+        "telegram_bot.services.media_manager.processing.place_file_async",
+        side_effect=_place,
+    )
+    scan_mock = mocker.patch(
+        "telegram_bot.services.media_manager.processing._trigger_plex_scan",
+        return_value="",
+    )
+
+    result = await handle_successful_download(
+        SeasonTorrent(), parsed, "/downloads", {"tv_shows": "/tv"}, {}
+    )
+
+    assert result["succeeded"] is False
+    report = {entry["episode"]: entry for entry in result["placement_report"]}
+    assert report[1]["status"] == "placed"
+    assert report[2] == {
+        "source": os.path.join("/downloads", "Show.S01E02.mkv"),
+        "destination": os.path.join("/final", "s01e02 - Ep2.mkv"),
+        "episode": 2,
+        "status": "failed",
+        "error": "disk full",
+    }
+    scan_mock.assert_not_called()
+
+
 def test_get_final_destination_path_collection():
     parsed = {
         "type": "movie",
@@ -0,0 +1,95 @@
+import errno
+import os
+import threading
+
+import pytest
+
+from telegram_bot.services.media_manager import placement
+from telegram_bot.services.media_manager.placement import (
+    PlacementCancelled,
+    place_file,
+    place_file_async,
+)
+
+_original_replace = os.replace
+
+
+def _real_replace_except_source(source, destination):
+    # Simulate a cross-device rename for the media file only; the final
+    # `.partial` -> destination swap still goes through.
+    if not str(source).endswith(".partial"):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    _original_replace(source, destination)
+
+
+def test_place_file_renames_on_the_same_filesystem(tmp_path):
+    source = tmp_path / "movie.mkv"
+    source.write_bytes(b"x" * 1024)
+    destination = tmp_path / "library" / "Movie (2024).mkv"
+    destination.parent.mkdir()
+
+    result = place_file(str(source), str(destination))
+
+    assert result.strategy == "rename"
+    assert result.size_bytes == 1024
+    assert not source.exists()
+    assert destination.read_bytes() == b"x" * 1024
+
+
+def test_place_file_copies_in_chunks_across_filesystems(tmp_path, mocker):
+    mocker.patch.object(placement.os, "replace", side_effect=_real_replace_except_source)
+    mocker.patch.object(placement, "_try_clone", return_value=False)
+    mocker.patch.object(placement.os, "copy_file_range", side_effect=OSError(errno.EXDEV, "x"))
+    source = tmp_path / "movie.mkv"
+    payload = os.urandom(100_000)
+    source.write_bytes(payload)
+    destination = tmp_path / "Movie.mkv"
+    seen = []
+
+    result = place_file(str(source), str(destination), progress=seen.append, chunk_size=16_384)
+
+    assert result.strategy == "copy"
+    assert destination.read_bytes() == payload
+    assert not source.exists()
+    assert not (tmp_path / "Movie.mkv.partial").exists()
+    assert seen[-1].copied_bytes == len(payload)
+    assert [item.copied_bytes for item in seen] == sorted(item.copied_bytes for item in seen)
+
+
+def test_place_file_cancellation_removes_partial_copy_and_keeps_source(tmp_path, mocker):
+    mocker.patch.object(placement.os, "replace", side_effect=_real_replace_except_source)
+    mocker.patch.object(placement, "_try_clone", return_value=False)
+    source = tmp_path / "movie.mkv"
+    source.write_bytes(b"x" * 50_000)
+    destination = tmp_path / "Movie.mkv"
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(PlacementCancelled):
+        place_file(str(source), str(destination), cancel_event=cancel_event, chunk_size=1024)
+
+    assert source.exists()
+    assert not destination.exists()
+    assert not (tmp_path / "Movie.mkv.partial").exists()
+
+
+@pytest.mark.asyncio
+async def test_place_file_async_forwards_progress_snapshots(tmp_path, mocker):
+    release = threading.Event()
+
+    def slow_place(source, destination, *, progress, cancel_event):
+        progress(placement.PlacementProgress("copy", 512, 1024, 2048.0))
+        release.wait(timeout=5)
+        return placement.PlacementResult("copy", 1024, 0.5)
+
+    mocker.patch.object(placement, "place_file", side_effect=slow_place)
+    reports = []
+
+    async def on_progress(snapshot):
+        reports.append(snapshot)
+        release.set()
+
+    result = await place_file_async("src", "dst", on_progress=on_progress, progress_interval=0.01)
+
+    assert result.strategy == "copy"
+    assert reports[0].fraction == 0.5
@@ -0,0 +1,107 @@
+from datetime import date
+
+from telegram_bot.services import metadata_cache
+from telegram_bot.services.metadata_cache import CacheNamespace, MetadataCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.value = 1_000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def test_entries_survive_reopening_the_cache_file(tmp_path):
+    path = str(tmp_path / "metadata_cache.sqlite3")
+    cache = MetadataCache(path)
+    titles = cache.namespace("wiki:season_titles")
+    titles.set(("show", 1), ({1: {"title": "Pilot"}}, "Show"))
+    cache.namespace("tmdb:movie").set("release", {"aired": date(2026, 3, 1)})
+    cache.close()
+
+    reopened = MetadataCache(path)
+    assert reopened.namespace("wiki:season_titles").get(("show", 1)) == (
+        {1: {"title": "Pilot"}},
+        "Show",
+    )
+    assert reopened.namespace("tmdb:movie").get("release") == {"aired": date(2026, 3, 1)}
+    assert reopened.total_bytes > 0
+    reopened.close()
+
+
+def test_negative_entries_expire_first_and_stats_count_lookups():
+    clock = FakeClock()
+    cache = MetadataCache(clock=clock)
+    lookups = cache.namespace("tmdb:episode_title", ttl=600, negative_ttl=60)
+
+    lookups.set((1, 1, 1), "Pilot")
+    lookups.set((1, 1, 2), None, negative=True)
+    assert lookups.get((1, 1, 2)) is None
+    clock.value += 61
+
+    assert lookups.get((1, 1, 2)) is CacheNamespace.MISS
+    assert lookups.get((1, 1, 1)) == "Pilot"
+    assert cache.stats()["tmdb:episode_title"] == {
+        "hits": 2,
+        "misses": 1,
+        "negative_hits": 1,
+        "entries": 1,
+        "bytes": cache.total_bytes,
+    }
+
+
+def test_size_budget_evicts_least_recently_read_entries():
+    clock = FakeClock()
+    cache = MetadataCache(max_bytes=250, clock=clock)
+    pages = cache.namespace("wiki:pages")
+
+    for name in ("first", "second"):
+        pages.set(name, name * 20)
+        clock.value += metadata_cache.METADATA_CACHE_TOUCH_INTERVAL_SECONDS
+    assert pages.get("first") == "first" * 20
+    clock.value += 1
+    pages.set("third", "third" * 20)
+
+    assert cache.total_bytes <= 250
+    assert pages.get("second") is CacheNamespace.MISS
+    assert pages.get("first") == "first" * 20
+    assert pages.get("third") == "third" * 20
+
+
+def test_database_errors_are_treated_as_misses():
+    cache = MetadataCache()
+    titles = cache.namespace("wiki:season_titles")
+    titles.set("show", "Pilot")
+    cache.close()
+
+    titles.set("other", "Finale")
+    assert titles.get("show") is CacheNamespace.MISS
+    titles.clear()
+    assert cache.stats()["wiki:season_titles"]["entries"] == 0
+
+
+def test_clearing_a_namespace_includes_its_children():
+    cache = MetadataCache()
+    cache.namespace("wiki:movie_years").set("heat", [1995])
+    cache.namespace("wiki:season_count").set("show", 3)
+    cache.namespace("tmdb:movie").set("heat", {"results": [1]})
+
+    cache.clear("wiki")
+
+    assert set(cache.stats()) == {"tmdb:movie"}
+    assert cache.namespace("tmdb:movie").get("heat") == {"results": [1]}
+
+
+def test_open_and_close_track_the_application_cache(tmp_path):
+    bot_data: dict = {}
+    path = str(tmp_path / "metadata_cache.sqlite3")
+
+    cache = metadata_cache.open_metadata_cache(bot_data, path)
+    CacheNamespace("wiki:movie_search").set("heat", ([1995], None))
+    assert cache.namespace("wiki:movie_search").get("heat") == ([1995], None)
+    assert bot_data[metadata_cache.METADATA_CACHE_KEY] is cache
+
+    metadata_cache.close_metadata_cache(bot_data)
+    assert metadata_cache.METADATA_CACHE_KEY not in bot_data
+    assert metadata_cache.get_metadata_cache() is not cache
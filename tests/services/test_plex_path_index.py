@@ -0,0 +1,144 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from telegram_bot.services.plex_path_index import PlexPathIndex
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.value = 1_000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+def _movie(rating_key: int, title: str, *files: str, added: datetime | None = None):
+    parts = [SimpleNamespace(file=file) for file in files]
+    return SimpleNamespace(
+        ratingKey=rating_key,
+        title=title,
+        media=[SimpleNamespace(parts=parts)],
+        addedAt=added or datetime(2026, 1, 1),
+        updatedAt=None,
+    )
+
+
+def _section(mocker, items):
+    section = mocker.Mock(type="movie", uuid="movies-uuid", title="Movies")
+    section.all.return_value = items
+    section.search.return_value = []
+    section.fetchItems.side_effect = lambda keys: [i for i in items if i.ratingKey in keys]
+    return section
+
+
+def test_section_is_listed_once_and_hits_fetch_only_their_keys(mocker):
+    heat = _movie(1, "Heat", "/movies/Heat (1995)/Heat (1995).mkv")
+    alien = _movie(2, "Alien", "/movies/Alien (1979)/Alien (1979).mkv")
+    section = _section(mocker, [heat, alien])
+    index = PlexPathIndex()
+
+    assert index.items_at(section, "/movies/Heat (1995)/Heat (1995).mkv") == [heat]
+    assert index.items_at(section, "/movies/Alien (1979)/Alien (1979).mkv") == [alien]
+
+    section.all.assert_called_once_with(libtype="movie")
+    assert [call.args[0] for call in section.fetchItems.call_args_list] == [[1], [2]]
+    section.search.assert_not_called()
+
+
+def test_misses_refresh_items_changed_since_the_last_sync(mocker):
+    clock = FakeClock()
+    heat = _movie(1, "Heat", "/movies/Heat (1995).mkv", added=datetime(2026, 1, 1))
+    section = _section(mocker, [heat])
+    index = PlexPathIndex(clock=clock)
+    index.items_at(section, "/movies/Heat (1995).mkv")
+
+    ronin = _movie(3, "Ronin", "/movies/Ronin (1998).mkv", added=datetime(2026, 2, 1))
+    section.all.return_value = [heat, ronin]
+    section.fetchItems.side_effect = lambda keys: [ronin] if 3 in keys else []
+    section.search.side_effect = lambda **kwargs: [ronin] if "libtype" in kwargs else []
+    clock.value += 5
+
+    assert index.items_at(section, "/movies/Ronin (1998).mkv") == [ronin]
+
+    section.all.assert_called_once()
+    filters = section.search.call_args_list[0].kwargs["filters"]
+    assert filters["or"][0]["addedAt>>"] < datetime(2026, 1, 1)
+
+
+def test_deleted_items_are_dropped_and_fall_back_to_a_title_search(mocker):
+    heat = _movie(1, "Heat", "/movies/Heat (1995).mkv")
+    section = _section(mocker, [heat])
+    index = PlexPathIndex()
+    index.items_at(section, "/movies/Heat (1995).mkv")
+
+    replacement = _movie(7, "Heat", "/movies/Heat (1995).mkv")
+    section.fetchItems.side_effect = lambda keys: []
+    section.search.return_value = [replacement]
+
+    assert index.items_at(section, "/movies/Heat (1995).mkv") == [replacement]
+    section.search.assert_called_with(filters={"title": "Heat", "year": 1995})
+
+    section.fetchItems.side_effect = lambda keys: [replacement] if keys == [7] else []
+    assert index.items_at(section, "/movies/Heat (1995).mkv") == [replacement]
+
+
+def test_folder_lookups_return_every_item_below_it(mocker):
+    first = _movie(1, "Scary Movie", "/movies/Scary Movie/Scary Movie (2000).mkv")
+    second = _movie(2, "Scary Movie 2", "/movies/Scary Movie/Scary Movie 2 (2001)/movie.mkv")
+    other = _movie(3, "Heat", "/movies/Heat (1995).mkv")
+    section = _section(mocker, [first, second, other])
+    index = PlexPathIndex()
+
+    found = index.items_under(section, "/movies/Scary Movie")
+
+    assert sorted(item.ratingKey for item in found) == [1, 2]
+    assert section.fetchItems.call_args.args[0] == [1, 2]
+
+
+def test_lookups_never_relist_the_section(mocker):
+    clock = FakeClock()
+    heat = _movie(1, "Heat", "/movies/Heat (1995).mkv")
+    section = _section(mocker, [heat])
+    index = PlexPathIndex(clock=clock)
+    index.items_at(section, "/movies/Heat (1995).mkv")
+
+    clock.value += 7 * 24 * 60 * 60
+
+    assert index.items_at(section, "/movies/Heat (1995).mkv") == [heat]
+    section.all.assert_called_once()
+
+
+def test_folder_lookups_find_files_at_any_depth(mocker):
+    extra = _movie(1, "X", "/m/Coll/Sub/X (2000)/Extras/x.mkv")
+    section = _section(mocker, [extra])
+    index = PlexPathIndex()
+
+    assert index.items_under(section, "/m/Coll") == [extra]
+    section.search.assert_not_called()
+
+
+def test_show_sections_load_episodes_only_for_the_show_being_looked_up(mocker):
+    pilot = _movie(11, "Pilot", "/tv/Show/Season 01/Show - S01E01.mkv")
+    second = _movie(12, "Second", "/tv/Show/Season 01/Show - S01E02.mkv")
+    show = SimpleNamespace(
+        ratingKey=10,
+        title="Show",
+        locations=["/tv/Show"],
+        episodes=mocker.Mock(return_value=[pilot, second]),
+    )
+    other = SimpleNamespace(
+        ratingKey=20, title="Other", locations=["/tv/Other"], episodes=mocker.Mock()
+    )
+    everything = [show, other, pilot, second]
+    section = mocker.Mock(type="show", uuid="shows-uuid", title="TV")
+    section.all.return_value = [show, other]
+    section.search.return_value = []
+    section.fetchItems.side_effect = lambda keys: [i for i in everything if i.ratingKey in keys]
+    index = PlexPathIndex()
+
+    assert index.items_at(section, "/tv/Show/Season 01/Show - S01E02.mkv") == [second]
+    assert index.items_at(section, "/tv/Show/Season 01/Show - S01E01.mkv") == [pilot]
+
+    section.all.assert_called_once_with(libtype="show")
+    show.episodes.assert_called_once()
+    other.episodes.assert_not_called()
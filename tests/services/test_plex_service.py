@@ -18,7 +18,7 @@ sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 @pytest.mark.asyncio
 async def test_get_plex_server_status_connected(mocker):
     mock_plex = mocker.Mock(version="1.0", platform="Linux")
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=mock_plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=mock_plex)
 
     context = Mock()
     context.bot_data = {"PLEX_CONFIG": {"url": "http://plex", "token": "abc"}}
@@ -30,7 +30,7 @@ async def test_get_plex_server_status_connected(mocker):
 @pytest.mark.asyncio
 async def test_get_plex_server_status_unauthorized(mocker):
     mocker.patch(
-        "telegram_bot.services.plex_service.create_plex_client",
+        "telegram_bot.services.plex_session.create_plex_client",
         side_effect=Unauthorized("bad token"),
     )
 
@@ -44,7 +44,7 @@ async def test_get_plex_server_status_unauthorized(mocker):
 @pytest.mark.asyncio
 async def test_get_plex_server_status_connection_error(mocker):
     mocker.patch(
-        "telegram_bot.services.plex_service.create_plex_client",
+        "telegram_bot.services.plex_session.create_plex_client",
         side_effect=Exception("no connection"),
     )
 
@@ -79,7 +79,7 @@ async def test_ensure_collection_contains_movies_adds_items(mocker):
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
 
     plex_config = {"url": "http://plex", "token": "123"}
     movies = [{"title": "Movie One", "year": 2021}]
@@ -108,7 +108,7 @@ async def test_ensure_collection_contains_movies_renames_existing_collection_ali
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
 
     plex_config = {"url": "http://plex", "token": "123"}
     movies = [{"title": "Mission: Impossible", "year": 1996}]
@@ -138,7 +138,7 @@ async def test_ensure_collection_contains_movies_falls_back_when_collection_rena
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
 
     plex_config = {"url": "http://plex", "token": "123"}
     movies = [{"title": "Mission: Impossible", "year": 1996}]
@@ -171,7 +171,7 @@ async def test_ensure_collection_contains_movies_uses_existing_requested_collect
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
 
     plex_config = {"url": "http://plex", "token": "123"}
     movies = [{"title": "Mission: Impossible", "year": 1996}]
@@ -197,7 +197,7 @@ async def test_ensure_collection_contains_movies_matches_variant_titles_from_yea
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
 
     plex_config = {"url": "http://plex", "token": "123"}
     movies = [{"title": "Mission: Impossible 2", "year": 2000}]
@@ -219,17 +219,19 @@ async def test_ensure_collection_contains_movies_uses_path_fallback_when_title_s
         file="/mnt/movies/Mission Impossible/07 - Mission Impossible - Dead Reckoning Part One (2023).mp4"
     )
     movie.media = [mocker.Mock(parts=[part])]
+    movie.ratingKey = 101
 
     section = mocker.Mock()
     section.search.side_effect = [[], [], []]
     section.all.return_value = [movie]
+    section.fetchItems.return_value = [movie]
     section.collection.side_effect = Exception("not found")
     section.collections.return_value = []
 
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
 
     plex_config = {"url": "http://plex", "token": "123"}
     movies = [
@@ -244,12 +246,13 @@ async def test_ensure_collection_contains_movies_uses_path_fallback_when_title_s
     assert result == ["Mission: Impossible - Dead Reckoning Part One (2023)"]
     movie.addCollection.assert_called_once_with("Mission Impossible")
     section.all.assert_called_once()
+    section.fetchItems.assert_called_once_with([101])
 
 
 @pytest.mark.asyncio
 async def test_ensure_collection_contains_movies_suppresses_connection_error(mocker):
     mocker.patch(
-        "telegram_bot.services.plex_service.create_plex_client",
+        "telegram_bot.services.plex_session.create_plex_client",
         side_effect=requests_exceptions.RequestException("offline"),
     )
     plex_config = {"url": "http://plex", "token": "123"}
@@ -262,7 +265,7 @@ async def test_ensure_collection_contains_movies_suppresses_connection_error(moc
 
 @pytest.mark.asyncio
 async def test_ensure_collection_contains_movies_skips_placeholder_token(mocker):
-    plex_mock = mocker.patch("telegram_bot.services.plex_service.create_plex_client")
+    plex_mock = mocker.patch("telegram_bot.services.plex_session.create_plex_client")
     plex_config = {"url": "http://plex", "token": "PLEX_TOKEN"}
     movies = [{"title": "Movie One", "year": 2021}]
 
@@ -305,7 +308,7 @@ async def test_ensure_collection_contains_movies_recovers_blank_collection_with_
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
     mocker.patch(
         "telegram_bot.services.plex_service._search_movies_section",
         side_effect=[[movie_one], [movie_two]],
@@ -353,7 +356,7 @@ async def test_ensure_collection_contains_movies_does_not_override_existing_coll
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
     mocker.patch(
         "telegram_bot.services.plex_service._search_movies_section",
         side_effect=[[movie_one], [movie_two]],
@@ -384,7 +387,7 @@ async def test_wait_for_movies_to_be_available_returns_early_when_movies_found(m
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
     current_time = [0.0]
 
     async def fake_sleep(seconds):
@@ -421,7 +424,7 @@ async def test_wait_for_movies_to_be_available_accepts_variant_year_match(mocker
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
     current_time = [0.0]
 
     async def fake_sleep(seconds):
@@ -455,15 +458,17 @@ async def test_wait_for_movies_to_be_available_uses_path_fallback(mocker):
         file="/mnt/movies/Mission Impossible/07 - Mission Impossible - Dead Reckoning Part One (2023).mp4"
     )
     movie.media = [mocker.Mock(parts=[part])]
+    movie.ratingKey = 101
 
     section = mocker.Mock()
     section.search.side_effect = [[], [], []]
     section.all.return_value = [movie]
+    section.fetchItems.return_value = [movie]
 
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
     current_time = [0.0]
 
     async def fake_sleep(seconds):
@@ -492,6 +497,7 @@ async def test_wait_for_movies_to_be_available_uses_path_fallback(mocker):
     assert result is True
     sleep_mock.assert_not_awaited()
     section.all.assert_called_once()
+    section.fetchItems.assert_called_once_with([101])
 
 
 @pytest.mark.asyncio
@@ -502,7 +508,7 @@ async def test_wait_for_movies_to_be_available_times_out(mocker):
     plex = mocker.Mock()
     plex.library.section.return_value = section
 
-    mocker.patch("telegram_bot.services.plex_service.create_plex_client", return_value=plex)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex)
     current_time = [0.0]
 
     async def fake_sleep(seconds):
@@ -0,0 +1,77 @@
+import pytest
+from requests import exceptions as requests_exceptions
+
+from telegram_bot.services import plex_session
+from telegram_bot.services.discovery import CircuitBreaker
+from telegram_bot.services.plex_session import (
+    PlexCircuitBreaker,
+    PlexSessionManager,
+    PlexUnavailableError,
+)
+
+PLEX_CONFIG = {"url": "http://plex", "token": "abc"}
+
+
+def test_server_and_sections_are_reused_across_calls(mocker):
+    plex = mocker.Mock()
+    connect = mocker.patch.object(plex_session, "create_plex_client", return_value=plex)
+    manager = PlexSessionManager()
+
+    first = manager.section(PLEX_CONFIG, "Movies")
+    second = manager.section(PLEX_CONFIG, "Movies")
+
+    assert first is second
+    connect.assert_called_once()
+    assert connect.call_args.kwargs["session"] is not None
+    plex.library.section.assert_called_once_with("Movies")
+
+    manager.section({**PLEX_CONFIG, "token": "new"}, "Movies")
+    assert connect.call_count == 2
+
+
+def test_connection_errors_drop_cached_handles(mocker):
+    plex = mocker.Mock()
+    connect = mocker.patch.object(plex_session, "create_plex_client", return_value=plex)
+    manager = PlexSessionManager()
+    manager.section(PLEX_CONFIG, "Movies")
+
+    manager.record_failure(requests_exceptions.ConnectionError("reset"))
+    manager.record_failure(ValueError("not a connection problem"))
+    manager.section(PLEX_CONFIG, "Movies")
+
+    assert connect.call_count == 2
+    assert plex.library.section.call_count == 2
+
+
+def test_breaker_fails_fast_until_a_probe_reconnects(mocker):
+    now = 0.0
+    connect = mocker.patch.object(
+        plex_session,
+        "create_plex_client",
+        side_effect=requests_exceptions.ConnectionError("refused"),
+    )
+    manager = PlexSessionManager(breaker=PlexCircuitBreaker(clock=lambda: now))
+
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        with pytest.raises(requests_exceptions.ConnectionError):
+            manager.server(PLEX_CONFIG)
+    with pytest.raises(PlexUnavailableError):
+        manager.server(PLEX_CONFIG)
+    assert connect.call_count == CircuitBreaker.FAILURE_THRESHOLD
+
+    connect.side_effect = None
+    connect.return_value = mocker.Mock()
+    assert manager.server(PLEX_CONFIG, refresh=True) is connect.return_value
+    assert manager.is_available
+
+
+def test_open_and_close_track_the_application_session():
+    bot_data: dict = {}
+
+    manager = plex_session.open_plex_session(bot_data)
+    assert plex_session.get_plex_session() is manager
+    assert bot_data[plex_session.PLEX_SESSION_KEY] is manager
+
+    plex_session.close_plex_session(bot_data)
+    assert plex_session.PLEX_SESSION_KEY not in bot_data
+    assert plex_session.get_plex_session() is not manager
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock
 import wikipedia
 from bs4 import BeautifulSoup
 from telegram_bot.services import scraping_service
+from telegram_bot.services.metadata_cache import MetadataCache
 from telegram_bot.services.scrapers import wikipedia as wiki_module
 from telegram_bot.services.scrapers.wikipedia import franchise as wiki_franchise_module
 
@@ -22,10 +23,6 @@ def _clear_wiki_caches():
         scraping_service._WIKI_TITLES_CACHE.clear()  # type: ignore[attr-defined]
     except Exception:
         pass
-    try:
-        scraping_service._WIKI_SOUP_CACHE.clear()  # type: ignore[attr-defined]
-    except Exception:
-        pass
     try:
         scraping_service._WIKI_MOVIE_CACHE.clear()  # type: ignore[attr-defined]
     except Exception:
@@ -49,7 +46,9 @@ def test_wiki_cache_evicts_and_expires():
             return self.value
 
     clock = FakeClock()
-    cache = scraping_service.WikiCache(max_entries=2, ttl=10, clock=clock)
+    # Room for two of the small entries below.
+    backend = MetadataCache(max_bytes=60, clock=clock)
+    cache = scraping_service.WikiCache(ttl=10, cache=backend)
     cache.set(("a",), "alpha")
     clock.value += 5
     assert cache.get(("a",)) == "alpha"
@@ -61,6 +60,7 @@ def test_wiki_cache_evicts_and_expires():
     cache.set(("d",), "delta")
     assert cache.get(("b",)) is scraping_service.WikiCache.MISS
     assert cache.get(("c",)) == "charlie"
+    assert backend.total_bytes <= 60
 
 
 @pytest.mark.asyncio
@@ -959,3 +959,40 @@ async def test_fetch_season_episode_count_skips_ongoing_overview(mocker):
     # No titles are present and overview is marked ongoing -> expect None
     count = await scraping_service.fetch_season_episode_count_from_wikipedia("Show", 27)
     assert count is None
+
+
+MODERN_HEADING_EPISODES_HTML = """
+<div class="mw-parser-output">
+<p>Long lead paragraph that the episode extractors never read.</p>
+<div class="mw-heading mw-heading3"><h3 id="Season_2">Season 2</h3></div>
+<table class="wikitable">
+<tr><th>No. overall</th><th>No. in season</th><th>Title</th><th>Original air date</th></tr>
+<tr><td>11</td><td>1</td><td>"Return"</td><td>March 1, 2001</td></tr>
+<tr><td>12</td><td>2</td><td>"Departure"</td><td>March 8, 2001</td></tr>
+</table>
+</div>
+"""
+
+
+@pytest.mark.asyncio
+async def test_wiki_parse_runs_on_worker_thread_and_keeps_only_strained_elements():
+    import threading
+
+    from telegram_bot.services.scrapers.wikipedia import episodes as wiki_episodes_module
+    from telegram_bot.services.scrapers.wikipedia import parsing as wiki_parsing_module
+
+    parse_threads: list[str] = []
+
+    def _parse(html: str):
+        parse_threads.append(threading.current_thread().name)
+        return wiki_parsing_module.parse_wiki_html(html, wiki_parsing_module.EPISODE_LIST_STRAINER)
+
+    soup = await wiki_parsing_module.run_wiki_parse(_parse, MODERN_HEADING_EPISODES_HTML)
+
+    assert parse_threads and parse_threads[0].startswith("wiki-parse")
+    assert soup.find("p") is None
+    titles = wiki_episodes_module._extract_titles_for_season(soup, 2)
+    assert {number: meta["title"] for number, meta in titles.items()} == {
+        1: "Return",
+        2: "Departure",
+    }
@@ -6,6 +6,7 @@ from telegram_bot.services.search_logic import (
     find_season_directory,
 )
 from telegram_bot.utils import (
+    ScoringProfile,
     compute_av_match_metadata,
     parse_audio_channels,
     parse_audio_formats,
@@ -192,6 +193,48 @@ def test_score_torrent_result_uses_highest_video_and_audio_format_only():
     assert score == 18
 
 
+def test_scoring_profile_sums_overlapping_substring_keys_like_per_key_scan():
+    prefs = {
+        "codecs": {"x265": 4, "265": 1, "X265": 2, "hevc": 3},
+        "resolutions": {"1080p": 5, "080": 1, "p": 1},
+        "uploaders": {"Trusted": 7},
+    }
+    profile = ScoringProfile(prefs)
+
+    # x265 (4 + 2) + 265 (1) + 1080p (5) + 080 (1) + p (1) + Trusted (7)
+    assert profile.score("Movie.1080p.x265", "trusted") == 21
+    assert profile.score("Movie.720p.h264", "other") == 1
+
+
+def test_scoring_profile_score_many_matches_single_result_scoring():
+    prefs = {
+        "codecs": {"x265": 10},
+        "resolutions": {"2160p": 6},
+        "video_formats": {"hdr10": 4},
+        "audio_formats": {"truehd": 3},
+    }
+    results = [
+        {"title": "Movie 2160p HDR10 TrueHD x265", "uploader": "a", "seeders": 50, "leechers": 2},
+        {"title": "Movie 1080p x264", "uploader": "", "seeders": 0, "leechers": 0},
+        {"title": "Movie 2160p HDR10 TrueHD x265", "uploader": None, "seeders": None},
+    ]
+
+    profile = ScoringProfile.for_preferences(prefs)
+
+    assert ScoringProfile.for_preferences(dict(prefs)) is profile
+    assert profile.score_many(results) == [
+        score_torrent_result(
+            str(result["title"]),
+            str(result.get("uploader") or ""),
+            prefs,
+            seeders=int(result.get("seeders") or 0),
+            leechers=int(result.get("leechers") or 0),
+        )
+        for result in results
+    ]
+    assert profile.score_many(results)[0] == 10 + 6 + 4 + 3 + 9
+
+
 @pytest.mark.asyncio
 async def test_find_media_by_name_ignores_trashinfo_files(tmp_path):
     movies_root = tmp_path / "movies"
@@ -213,6 +256,25 @@ async def test_find_media_by_name_ignores_trashinfo_files(tmp_path):
     assert result == str(valid_file)
 
 
+@pytest.mark.asyncio
+async def test_find_media_by_name_ranks_matches_best_first_and_applies_limit(tmp_path):
+    movies_root = tmp_path / "movies"
+    for name in ("Alien Resurrection (1997)", "Alien (1979)", "Aliens (1986)", "Heat (1995)"):
+        (movies_root / name).mkdir(parents=True)
+
+    result = await find_media_by_name(
+        "movie",
+        "Alien (1979)",
+        {"movies": str(movies_root)},
+        "directory",
+        limit=2,
+    )
+
+    assert isinstance(result, list)
+    assert len(result) == 2
+    assert result[0] == str(movies_root / "Alien (1979)")
+
+
 @pytest.mark.asyncio
 async def test_find_media_by_name_ignores_directories_inside_trash_roots(tmp_path):
     movies_root = tmp_path / "movies"
@@ -171,7 +171,7 @@ async def test_orchestrate_searches_reuses_discovery_circuit_breaker(
     ]
 
     first_results = await orchestrate_searches("Movie", "movie", ctx)
-    second_results = await orchestrate_searches("Movie", "movie", ctx)
+    second_results = await orchestrate_searches("Movie Sequel", "movie", ctx)
 
     assert first_results
     assert second_results
@@ -179,6 +179,29 @@ async def test_orchestrate_searches_reuses_discovery_circuit_breaker(
     assert len(fake_discovery_provider.calls) == 2
 
 
+@pytest.mark.asyncio
+async def test_orchestrate_searches_refilters_cached_raw_results(fake_discovery_provider):
+    ctx = _ctx_with_config(providers_movies=[_provider()])
+    fake_discovery_provider.results = [
+        DiscoveryResult(
+            title="Movie 1080p x265",
+            download_url="magnet:?xt=urn:btih:FIRST",
+            source="Prowlarr",
+            size_bytes=1024**3,
+            seeders=5,
+            leechers=0,
+        )
+    ]
+
+    strict_results = await orchestrate_searches("Movie", "movie", ctx)
+    relaxed_results = await orchestrate_searches("  movie ", "movie", ctx, min_seeders=0)
+
+    assert strict_results == []
+    assert [result["title"] for result in relaxed_results] == ["Movie 1080p x265"]
+    assert len(fake_discovery_provider.calls) == 1
+    assert "DISCOVERY_RESULT_CACHE" in ctx.bot_data
+
+
 @pytest.mark.asyncio
 async def test_orchestrate_searches_returns_empty_without_discovery_provider(caplog):
     ctx = _ctx_with_config(
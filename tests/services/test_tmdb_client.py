@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from telegram_bot.services.metadata_cache import MetadataCache
+from telegram_bot.services.tmdb_client import (
+    TMDB_RELEASE_RESPONSE_TTL_SECONDS,
+    TMDB_RESPONSE_TTL_SECONDS,
+    TmdbClient,
+    TmdbNotFoundError,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.value = 1_000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+class _FakeResponse:
+    def __init__(self, payload: Any, *, status_code: int = 200, etag: str | None = None) -> None:
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self) -> Any:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP status {self.status_code}")
+
+
+class _FakeAsyncClient:
+    def __init__(self, responses: list[_FakeResponse], *, delay: float = 0.0) -> None:
+        self._responses = responses
+        self._delay = delay
+        self.requests: list[tuple[str, dict[str, str], dict[str, str]]] = []
+
+    async def __aenter__(self) -> _FakeAsyncClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def get(self, url: str, *, params=None, headers=None) -> _FakeResponse:
+        self.requests.append((url, dict(params or {}), dict(headers or {})))
+        await asyncio.sleep(self._delay)
+        return self._responses.pop(0)
+
+
+@pytest.fixture
+def tmdb_env(mocker):
+    mocker.patch.dict(
+        "os.environ",
+        {"TMDB_ACCESS_TOKEN": "", "TMDB_BEARER_TOKEN": "", "TMDB_API_KEY": "key"},
+    )
+
+
+def _client(mocker, fake: _FakeAsyncClient, clock: FakeClock) -> TmdbClient:
+    mocker.patch("telegram_bot.services.tmdb_client.shared_http_client", return_value=fake)
+    cache = MetadataCache(clock=clock).namespace("tmdb:api", negative_ttl=60)
+    return TmdbClient(cache=cache, limiter=TokenBucket(1000, 1000), clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_bundled_call(mocker, tmdb_env):
+    fake = _FakeAsyncClient(
+        [_FakeResponse({"id": 603, "release_dates": {"results": []}})], delay=0.01
+    )
+    client = _client(mocker, fake, FakeClock())
+
+    payloads = await asyncio.gather(*(client.movie(603) for _ in range(5)))
+
+    assert all(payload["id"] == 603 for payload in payloads)
+    assert len(fake.requests) == 1
+    url, params, _ = fake.requests[0]
+    assert url.endswith("/movie/603")
+    assert params == {"api_key": "key", "append_to_response": "release_dates,watch/providers"}
+    assert (await client.movie(603))["id"] == 603
+    assert len(fake.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_responses_are_revalidated_with_their_etag(mocker, tmdb_env):
+    clock = FakeClock()
+    fake = _FakeAsyncClient(
+        [
+            _FakeResponse({"results": [{"id": 1}]}, etag='"v1"'),
+            _FakeResponse(None, status_code=304),
+        ]
+    )
+    client = _client(mocker, fake, clock)
+
+    await client.search_movie("Heat", year=1995)
+    clock.value += TMDB_RESPONSE_TTL_SECONDS + 1
+    payload = await client.search_movie("Heat", year=1995)
+
+    assert payload == {"results": [{"id": 1}]}
+    assert len(fake.requests) == 2
+    assert fake.requests[1][2]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_release_checks_revalidate_movie_entries_sooner(mocker, tmdb_env):
+    clock = FakeClock()
+    fake = _FakeAsyncClient(
+        [
+            _FakeResponse({"id": 603}, etag='"v1"'),
+            _FakeResponse(None, status_code=304),
+        ]
+    )
+    client = _client(mocker, fake, clock)
+
+    await client.movie(603)
+    clock.value += TMDB_RELEASE_RESPONSE_TTL_SECONDS + 1
+    assert (await client.movie(603))["id"] == 603
+    assert len(fake.requests) == 1
+
+    assert (await client.movie(603, ttl=TMDB_RELEASE_RESPONSE_TTL_SECONDS))["id"] == 603
+    assert len(fake.requests) == 2
+    assert fake.requests[1][2]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_missing_resources_raise_and_are_remembered(mocker, tmdb_env):
+    fake = _FakeAsyncClient([_FakeResponse(None, status_code=404)])
+    client = _client(mocker, fake, FakeClock())
+
+    for _ in range(2):
+        with pytest.raises(TmdbNotFoundError):
+            await client.collection(42)
+    assert len(fake.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_beyond_the_burst(mocker):
+    clock = FakeClock()
+    sleeps: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    mocker.patch("telegram_bot.services.tmdb_client.asyncio.sleep", new=_sleep)
+    bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+
+    waits = [await bucket.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(0.1), pytest.approx(0.2)]
+    assert sleeps == [pytest.approx(0.1), pytest.approx(0.2)]
@@ -12,6 +12,7 @@ class _FakeResponse:
     def __init__(self, payload: Any, *, status_code: int = 200) -> None:
         self._payload = payload
         self.status_code = status_code
+        self.headers: dict[str, str] = {}
 
     def json(self) -> Any:
         return self._payload
@@ -148,7 +149,7 @@ async def test_resolve_tmdb_collection_from_movie_returns_movie_without_collecti
         ]
     )
     mocker.patch(
-        "telegram_bot.services.tmdb_collection_service.httpx.AsyncClient",
+        "telegram_bot.services.tmdb_client.shared_http_client",
         return_value=fake_client,
     )
 
@@ -208,7 +209,7 @@ async def test_resolve_tmdb_collection_from_movie_successfully_returns_collectio
         ]
     )
     mocker.patch(
-        "telegram_bot.services.tmdb_collection_service.httpx.AsyncClient",
+        "telegram_bot.services.tmdb_client.shared_http_client",
         return_value=fake_client,
     )
 
@@ -14,6 +14,7 @@ class _FakeResponse:
     def __init__(self, payload: Any, *, status_code: int = 200) -> None:
         self._payload = payload
         self.status_code = status_code
+        self.headers: dict[str, str] = {}
 
     def json(self) -> Any:
         return self._payload
@@ -189,20 +190,24 @@ async def test_resolve_tmdb_streaming_release_date_uses_webpage_fallback_when_ap
             ),
             _FakeResponse(
                 {
-                    "results": [
-                        {
-                            "iso_3166_1": "US",
-                            "release_dates": [
-                                {"type": 3, "release_date": "2026-02-27T00:00:00.000Z"},
-                            ],
-                        }
-                    ]
+                    "id": 1159559,
+                    "title": "Scream 7",
+                    "release_dates": {
+                        "results": [
+                            {
+                                "iso_3166_1": "US",
+                                "release_dates": [
+                                    {"type": 3, "release_date": "2026-02-27T00:00:00.000Z"},
+                                ],
+                            }
+                        ]
+                    },
                 }
             ),
         ]
     )
     mocker.patch(
-        "telegram_bot.services.tracking.tmdb_release_service.httpx.AsyncClient",
+        "telegram_bot.services.tmdb_client.shared_http_client",
         return_value=fake_client,
     )
     fallback_mock = mocker.patch(
@@ -0,0 +1,121 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from telegram_bot.services.torrent_service import (
+    TorrentAlertPump,
+    get_torrent_alert_pump,
+    stop_torrent_alert_pump,
+)
+
+
+class _Alert(SimpleNamespace):
+    def what(self):
+        return self.kind
+
+    def message(self):
+        return f"{self.kind} alert"
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.pending: list[_Alert] = []
+        self.posts = 0
+        self.notify = None
+        self.settings = {"alert_mask": 1}
+
+    def get_settings(self):
+        return dict(self.settings)
+
+    def apply_settings(self, settings):
+        self.settings.update(settings)
+
+    def set_alert_notify(self, callback):
+        self.notify = callback
+
+    def post_torrent_updates(self):
+        self.posts += 1
+
+    def pop_alerts(self):
+        alerts, self.pending = self.pending, []
+        return alerts
+
+    def push(self, alert: _Alert) -> None:
+        self.pending.append(alert)
+        self.notify()
+
+
+@pytest.mark.asyncio
+async def test_alert_pump_fans_out_state_updates_and_completion():
+    session = _FakeSession()
+    pump = TorrentAlertPump(session, update_interval=0.01)
+    pump.start()
+    handle, other = object(), object()
+    watch = pump.watch(handle)
+
+    status = SimpleNamespace(handle=handle, has_metadata=True, is_seeding=False)
+    ignored = SimpleNamespace(handle=other, has_metadata=True, is_seeding=True)
+    session.push(_Alert(kind="state_update", status=[status, ignored]))
+    await watch.wait_for_update(1)
+
+    assert watch.status is status
+    assert watch.has_metadata is True
+    assert watch.finished is False
+
+    session.push(_Alert(kind="torrent_finished", handle=handle))
+    await watch.wait_for_update(1)
+    await pump.stop()
+
+    assert watch.finished is True
+    assert session.posts >= 1
+    assert session.settings["alert_mask"] != 1
+
+
+@pytest.mark.asyncio
+async def test_alert_pump_reports_errors_and_metadata_waits():
+    session = _FakeSession()
+    pump = TorrentAlertPump(session, update_interval=0.01)
+    pump.start()
+    handle = object()
+    watch = pump.watch(handle)
+
+    waiter = asyncio.create_task(watch.wait_for_metadata(1))
+    await asyncio.sleep(0)
+    session.push(_Alert(kind="metadata_failed", handle=handle))
+
+    assert await waiter is False
+    assert watch.error == "metadata_failed alert"
+
+    pump.unwatch(handle)
+    await pump.stop()
+
+
+@pytest.mark.asyncio
+async def test_alert_pump_forwards_every_alert_to_listeners():
+    session = _FakeSession()
+    seen: list[str] = []
+    pump = TorrentAlertPump(session, update_interval=0.01)
+    pump.add_listener(lambda alert: seen.append(alert.what()))
+    pump.start()
+
+    session.push(_Alert(kind="save_resume_data", handle=object()))
+    for _ in range(50):
+        if seen:
+            break
+        await asyncio.sleep(0.01)
+    await pump.stop()
+
+    assert seen == ["save_resume_data"]
+
+
+@pytest.mark.asyncio
+async def test_get_torrent_alert_pump_is_shared_per_session():
+    bot_data = {"TORRENT_SESSION": _FakeSession()}
+
+    first = get_torrent_alert_pump(bot_data)
+    second = get_torrent_alert_pump(bot_data)
+    await stop_torrent_alert_pump(bot_data)
+
+    assert first is second
+    assert first.is_running is False
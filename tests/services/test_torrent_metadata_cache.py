@@ -0,0 +1,45 @@
+import libtorrent as lt
+
+from telegram_bot.services.torrent_service import TorrentMetadataCache, info_hash_hex
+
+
+def _make_metadata(directory, name: str) -> bytes:
+    payload_dir = directory / name
+    payload_dir.mkdir()
+    (payload_dir / "movie.mkv").write_bytes(name.encode() * 4096)
+    storage = lt.file_storage()
+    lt.add_files(storage, str(payload_dir))
+    creator = lt.create_torrent(storage)
+    lt.set_piece_hashes(creator, str(directory))
+    return lt.bencode(creator.generate())
+
+
+def test_metadata_cache_round_trips_by_magnet_info_hash(tmp_path):
+    metadata = _make_metadata(tmp_path, "alpha")
+    cache = TorrentMetadataCache(str(tmp_path / "spill"))
+
+    key = cache.put(metadata)
+    magnet_params = lt.parse_magnet_uri(f"magnet:?xt=urn:btih:{key}")
+
+    assert key == info_hash_hex(lt.torrent_info(metadata))
+    assert info_hash_hex(magnet_params) == key
+    assert cache.get(info_hash_hex(magnet_params)) == metadata
+    assert cache.get_torrent_info(key).name() == "alpha"
+
+
+def test_metadata_cache_spills_evicted_entries_and_trims_disk(tmp_path):
+    spill_dir = tmp_path / "spill"
+    cache = TorrentMetadataCache(str(spill_dir), max_memory_entries=1, max_disk_entries=1)
+    first = cache.put(_make_metadata(tmp_path, "first"))
+    cache.put(_make_metadata(tmp_path, "second"))
+
+    assert (spill_dir / f"{first}.torrent").exists()
+    assert cache.get(first) is not None  # Reloaded from disk, spilling "second"
+
+    cache.put(_make_metadata(tmp_path, "third"))
+
+    assert len(list(spill_dir.iterdir())) == 1
+
+
+def test_info_hash_hex_ignores_unparseable_sources():
+    assert info_hash_hex(object()) is None
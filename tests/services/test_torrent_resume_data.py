@@ -0,0 +1,67 @@
+import libtorrent as lt
+import pytest
+
+from telegram_bot.services.torrent_service import (
+    TorrentAlertPump,
+    TorrentResumeStore,
+    info_hash_hex,
+)
+
+
+def _make_local_session() -> lt.session:
+    return lt.session(
+        {
+            "listen_interfaces": "127.0.0.1:0",
+            "enable_dht": False,
+            "enable_lsd": False,
+            "enable_upnp": False,
+            "enable_natpmp": False,
+        }
+    )
+
+
+def _make_torrent(directory) -> lt.torrent_info:
+    payload_dir = directory / "payload"
+    payload_dir.mkdir()
+    (payload_dir / "movie.mkv").write_bytes(b"x" * 65536)
+    storage = lt.file_storage()
+    lt.add_files(storage, str(payload_dir))
+    creator = lt.create_torrent(storage)
+    lt.set_piece_hashes(creator, str(directory))
+    return lt.torrent_info(lt.bencode(creator.generate()))
+
+
+@pytest.mark.asyncio
+async def test_resume_store_saves_loads_and_discards_via_alerts(tmp_path):
+    session = _make_local_session()
+    pump = TorrentAlertPump(session, update_interval=0.05)
+    pump.start()
+    store = TorrentResumeStore(str(tmp_path / "resume"))
+    store.attach(pump)
+    store.attach(pump)  # Idempotent
+
+    ti = _make_torrent(tmp_path)
+    handle = session.add_torrent({"ti": ti, "save_path": str(tmp_path)})
+    key = info_hash_hex(ti)
+
+    await store.save_all([handle], timeout=5)
+    await pump.stop()
+
+    resume_file = tmp_path / "resume" / f"{key}.fastresume"
+    assert resume_file.exists()
+    restored = store.load(key)
+    assert restored is not None
+    assert info_hash_hex(restored) == key
+    assert restored.ti is not None  # Metadata is embedded for magnet restarts
+
+    store.discard(key)
+    assert not resume_file.exists()
+    assert store.load(key) is None
+
+
+def test_resume_store_ignores_unreadable_files(tmp_path):
+    store = TorrentResumeStore(str(tmp_path))
+    (tmp_path / f"{'ab' * 20}.fastresume").write_bytes(b"not bencoded")
+
+    assert store.load("ab" * 20) is None
+    assert store.load(None) is None
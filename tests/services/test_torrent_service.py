@@ -141,8 +141,8 @@ async def test_fetch_and_parse_magnet_details_escapes_status_message(mocker, con
         AsyncMock(),
     )
     mocker.patch(
-        "telegram_bot.services.torrent_service.input_handlers._blocking_fetch_metadata",
-        return_value=None,
+        "telegram_bot.services.torrent_service.input_handlers._fetch_metadata_bytes",
+        AsyncMock(return_value=None),
     )
 
     result = await _fetch_and_parse_magnet_details(["magnet1", "magnet2"], context, progress)
@@ -183,8 +183,8 @@ async def test_fetch_and_parse_magnet_details_keeps_large_torrent(mocker, contex
         AsyncMock(),
     )
     mocker.patch(
-        "telegram_bot.services.torrent_service.input_handlers._blocking_fetch_metadata",
-        return_value=b"metadata",
+        "telegram_bot.services.torrent_service.input_handlers._fetch_metadata_bytes",
+        AsyncMock(return_value=b"metadata"),
     )
     mocker.patch(
         "telegram_bot.services.torrent_service.input_handlers.lt.torrent_info",
@@ -210,8 +210,8 @@ async def test_fetch_metadata_from_magnet_timeout(mocker, context, make_message)
         AsyncMock(),
     )
     mocker.patch(
-        "telegram_bot.services.torrent_service.metadata_fetch._blocking_fetch_metadata",
-        return_value=None,
+        "telegram_bot.services.torrent_service.metadata_fetch._fetch_metadata_bytes",
+        AsyncMock(return_value=None),
     )
     safe_mock = mocker.patch(
         "telegram_bot.services.torrent_service.metadata_fetch.safe_edit_message",
@@ -234,8 +234,8 @@ async def test_fetch_metadata_from_magnet_success(mocker, context, make_message)
         AsyncMock(),
     )
     mocker.patch(
-        "telegram_bot.services.torrent_service.metadata_fetch._blocking_fetch_metadata",
-        return_value=b"data",
+        "telegram_bot.services.torrent_service.metadata_fetch._fetch_metadata_bytes",
+        AsyncMock(return_value=b"data"),
     )
     ti_obj = object()
     mocker.patch(
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from telegram_bot.services.tracking.due_queue import TrackingDueQueue
+
+
+def _item(next_check: str | None, status: str = "awaiting_window") -> dict:
+    return {"status": status, "next_check_at_utc": next_check}
+
+
+def test_due_queue_pops_items_in_due_order_and_skips_stale_entries():
+    queue = TrackingDueQueue()
+    queue.rebuild(
+        {
+            "late": _item("2026-06-01T14:00:00Z"),
+            "early": _item("2026-06-01T12:00:00Z"),
+            "unscheduled": _item(None, status="searching"),
+            "done": _item("2026-06-01T10:00:00Z", status="fulfilled"),
+        }
+    )
+    # Rescheduling leaves the old heap entry behind; it must not fire.
+    queue.update("early", _item("2026-06-02T12:00:00Z"))
+
+    assert queue.pop_due(datetime(2026, 6, 1, 13, 0, tzinfo=timezone.utc)) == ["unscheduled"]
+    assert queue.pop_due(datetime(2026, 6, 1, 15, 0, tzinfo=timezone.utc)) == ["late"]
+    assert queue.next_due_at() == datetime(2026, 6, 2, 12, 0, tzinfo=timezone.utc).timestamp()
+
+    queue.update("early", None)
+    assert queue.next_due_at() is None
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_due_queue_wakes_waiter_when_an_item_moves_ahead():
+    queue = TrackingDueQueue()
+    queue.rebuild({"weekly": _item("2026-06-08T12:00:00Z")})
+    await queue.wait(0)
+
+    waiter = asyncio.create_task(queue.wait(5))
+    await asyncio.sleep(0)
+    queue.update("hourly", _item("2026-06-01T13:00:00Z"))
+
+    assert await asyncio.wait_for(waiter, 1) is True
+    # A change behind the current head does not wake the loop.
+    queue.update("later", _item("2026-06-09T12:00:00Z"))
+    assert await queue.wait(0.01) is False
@@ -76,7 +76,7 @@ def test_cancel_tracking_item_removes_persisted_entry(mocker, tmp_path):
     application = _build_application()
     state_file = tmp_path / "tracking_state.json"
 
-    def persist_to_tmp(app):
+    def persist_to_tmp(app, **_kwargs):
         save_tracking_state(str(state_file), tracking_manager.get_tracking_items(app.bot_data))
 
     mocker.patch(
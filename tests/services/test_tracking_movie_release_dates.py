@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from telegram_bot.services.tracking import movie_release_dates
+from telegram_bot.services.tracking import movie_release_dates, tmdb_release_service
 
 
 def test_extract_earliest_availability_from_html_ignores_theatrical_release_rows():
@@ -66,7 +66,7 @@ def test_extract_tmdb_earliest_availability_uses_digital_physical_types_only():
         ]
     }
 
-    resolved_date, resolved_source = movie_release_dates._extract_tmdb_earliest_availability(
+    resolved_date, resolved_source = tmdb_release_service._extract_tmdb_earliest_availability(
         payload,
         region="US",
     )
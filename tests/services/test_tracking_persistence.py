@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import json
 
-from telegram_bot.services.tracking.persistence import load_tracking_state, save_tracking_state
+from telegram_bot.services.tracking import persistence
+from telegram_bot.services.tracking.persistence import (
+    append_tracking_changes,
+    load_tracking_state,
+    save_tracking_state,
+    tracking_journal_length,
+)
 
 
 def test_load_tracking_state_empty_file_returns_empty(tmp_path):
@@ -188,3 +194,64 @@ def test_save_tracking_state_creates_v1_backup_once_before_first_v2_write(tmp_pa
     save_tracking_state(str(state_file), loaded)
     primary_payload = json.loads(state_file.read_text(encoding="utf-8"))
     assert primary_payload["version"] == 2
+
+
+def _tv_item(item_id: str, status: str = "searching") -> dict:
+    return {
+        "id": item_id,
+        "chat_id": 456,
+        "target_kind": "tv",
+        "schedule_mode": "ongoing_next_episode",
+        "target_identity": f"tv:tmdb:{item_id}",
+        "display_title": "Show",
+        "status": status,
+        "next_check_at_utc": "2026-03-23T01:00:00Z",
+        "last_checked_at_utc": "2026-03-23T00:00:00Z",
+        "created_at_utc": "2026-03-23T00:00:00Z",
+        "fulfilled_at_utc": None,
+        "linked_download_message_id": None,
+        "target_payload": {"canonical_title": "Show", "tmdb_series_id": 1234},
+        "retry": {"consecutive_failures": 0, "last_error": None},
+    }
+
+
+def test_journal_changes_replay_over_snapshot(tmp_path):
+    state_file = tmp_path / "tracking_state.json"
+    items = {"trk_a": _tv_item("trk_a"), "trk_b": _tv_item("trk_b")}
+    save_tracking_state(str(state_file), items)
+    snapshot_text = state_file.read_text(encoding="utf-8")
+
+    items["trk_a"]["status"] = "waiting_fulfillment"
+    items.pop("trk_b")
+    items["trk_c"] = _tv_item("trk_c")
+    append_tracking_changes(str(state_file), items, ["trk_a", "trk_b"])
+    append_tracking_changes(str(state_file), items, ["trk_c"])
+    # A crash mid-append leaves a torn final line behind.
+    with (tmp_path / "tracking_state.journal").open("a", encoding="utf-8") as journal:
+        journal.write('{"op":"put","id":"trk_')
+
+    assert state_file.read_text(encoding="utf-8") == snapshot_text
+    loaded = load_tracking_state(str(state_file))
+    assert set(loaded) == {"trk_a", "trk_c"}
+    assert loaded["trk_a"]["status"] == "waiting_fulfillment"
+    assert tracking_journal_length(str(state_file)) == 3
+
+
+def test_journal_is_compacted_into_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "TRACKING_JOURNAL_COMPACT_AFTER", 3)
+    state_file = tmp_path / "tracking_state.json"
+    items = {"trk_a": _tv_item("trk_a")}
+    save_tracking_state(str(state_file), items)
+    journal_file = tmp_path / "tracking_state.journal"
+
+    append_tracking_changes(str(state_file), items, ["trk_a"])
+    append_tracking_changes(str(state_file), items, ["trk_a"])
+    assert journal_file.exists()
+
+    items["trk_a"]["status"] = "fulfilled"
+    append_tracking_changes(str(state_file), items, ["trk_a"])
+
+    assert not journal_file.exists()
+    assert tracking_journal_length(str(state_file)) == 0
+    raw = json.loads(state_file.read_text(encoding="utf-8"))
+    assert raw["items"]["trk_a"]["status"] == "fulfilled"
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date, datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -6,6 +7,7 @@ import pytest
 
 from telegram_bot.services.tracking import manager as tracking_manager
 from telegram_bot.services.tracking import scheduler as tracking_scheduler
+from telegram_bot.services.tracking.budgets import TRACKING_PHASE_CONCURRENCY
 from telegram_bot.services.discovery.orchestrator import PROVIDER_FACTORY
 from telegram_bot.services.discovery.providers.base import BaseProvider
 from telegram_bot.services.discovery.schemas import DiscoveryRequest, DiscoveryResult
@@ -1086,3 +1088,75 @@ async def test_tracking_scheduler_tv_queue_keeps_existing_title_when_lookup_fail
     assert current is not None
     assert current["status"] == "waiting_fulfillment"
     assert current["target_payload"]["pending_episode_title"] == "Old Title"
+
+
+@pytest.mark.asyncio
+async def test_tracking_scheduler_tick_runs_due_items_concurrently_within_discovery_budget(
+    mocker,
+):
+    app = _build_application(mocker)
+    now = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+    for index in range(5):
+        item_id = _create_movie_item(
+            app,
+            now_utc=now,
+            availability_date=date(2026, 6, 1),
+            title=f"Release {index}",
+        )
+        item = tracking_manager.get_tracking_item(app, item_id)
+        assert item is not None
+        item["status"] = "searching"
+        item["next_check_at_utc"] = "2026-06-01T12:00:00Z"
+    tracking_manager.get_tracking_due_queue(app.bot_data).rebuild(
+        tracking_manager.get_tracking_items(app.bot_data)
+    )
+
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def _search(*_args, **_kwargs):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    mocker.patch(
+        "telegram_bot.services.tracking.scheduler.orchestrate_searches",
+        AsyncMock(side_effect=_search),
+    )
+
+    processed = await tracking_scheduler.run_tracking_scheduler_tick(app, now_utc=now)
+
+    assert processed == 5
+    assert peak_in_flight == TRACKING_PHASE_CONCURRENCY["discovery"]
+    assert not tracking_manager.get_tracking_in_progress_ids(app.bot_data)
+    budget = app.bot_data[tracking_scheduler.TRACKING_LAST_TICK_BUDGET_KEY]
+    assert budget.timings["discovery"].calls == 5
+    assert budget.timings["discovery"].wait_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_tracking_scheduler_failing_item_waits_for_retry_delay(mocker):
+    app = _build_application(mocker)
+    now = datetime(2026, 6, 1, 12, 0, tzinfo=timezone.utc)
+    item_id = _create_movie_item(app, now_utc=now, availability_date=date(2026, 6, 1))
+    item = tracking_manager.get_tracking_item(app, item_id)
+    assert item is not None
+    item["status"] = "searching"
+    item["next_check_at_utc"] = None
+    due_queue = tracking_manager.get_tracking_due_queue(app.bot_data)
+    due_queue.rebuild(tracking_manager.get_tracking_items(app.bot_data))
+    process = mocker.patch(
+        "telegram_bot.services.tracking.scheduler._process_due_item",
+        AsyncMock(side_effect=RuntimeError("boom")),
+    )
+
+    assert await tracking_scheduler.run_tracking_scheduler_tick(app, now_utc=now) == 0
+    assert await tracking_scheduler.run_tracking_scheduler_tick(app, now_utc=now) == 0
+
+    process.assert_awaited_once()
+    assert due_queue.next_due_at() == (
+        now.timestamp() + tracking_scheduler.TRACKING_FAILED_ITEM_RETRY_SECONDS
+    )
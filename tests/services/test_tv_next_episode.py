@@ -9,8 +9,11 @@ from telegram_bot.services.tracking import tv_next_episode
 
 
 class _FakeResponse:
+    status_code = 200
+
     def __init__(self, payload):
         self._payload = payload
+        self.headers = {}
 
     def raise_for_status(self) -> None:
         return None
@@ -28,7 +31,7 @@ def _patch_async_client(mocker, responses: list[_FakeResponse]) -> AsyncMock:
     client_cm.__aexit__.return_value = False
 
     mocker.patch(
-        "telegram_bot.services.tracking.tv_next_episode.httpx.AsyncClient",
+        "telegram_bot.services.tmdb_client.shared_http_client",
         return_value=client_cm,
     )
     return client
@@ -38,9 +41,9 @@ def _patch_async_client(mocker, responses: list[_FakeResponse]) -> AsyncMock:
 async def test_find_tv_tracking_candidates_uses_details_next_episode_air_date_when_search_omits_it(
     mocker,
 ):
-    mocker.patch(
-        "telegram_bot.services.tracking.tv_next_episode._get_tmdb_auth",
-        return_value=({}, {"api_key": "dummy"}),
+    mocker.patch.dict(
+        "os.environ",
+        {"TMDB_ACCESS_TOKEN": "", "TMDB_BEARER_TOKEN": "", "TMDB_API_KEY": "dummy"},
     )
     client = _patch_async_client(
         mocker,
@@ -80,9 +83,9 @@ async def test_find_tv_tracking_candidates_uses_details_next_episode_air_date_wh
 async def test_find_tv_tracking_candidates_skips_details_lookup_when_search_has_next_air_date(
     mocker,
 ):
-    mocker.patch(
-        "telegram_bot.services.tracking.tv_next_episode._get_tmdb_auth",
-        return_value=({}, {"api_key": "dummy"}),
+    mocker.patch.dict(
+        "os.environ",
+        {"TMDB_ACCESS_TOKEN": "", "TMDB_BEARER_TOKEN": "", "TMDB_API_KEY": "dummy"},
     )
     client = _patch_async_client(
         mocker,
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+
+import pytest
+import wikipedia
+
+from telegram_bot.services import scraping_service
+from telegram_bot.services.scrapers.wikipedia import resolver as resolver_module
+from telegram_bot.services.scrapers.wikipedia.resolver import WikiPageResolver
+
+LIST_PAGE_HTML = """
+<div class="mw-heading mw-heading2"><h2>Series overview</h2></div>
+<table class="wikitable">
+<tr><th>Season</th><th>Episodes</th><th>First aired</th><th>Last aired</th></tr>
+<tr><td>1</td><td>2</td><td>January 1, 2001</td><td>January 8, 2001</td></tr>
+</table>
+<div class="mw-heading mw-heading3"><h3>Season 1 (2001)</h3></div>
+<table class="wikitable">
+<tr><th>No. overall</th><th>No. in season</th><th>Title</th><th>Original air date</th></tr>
+<tr><td>1</td><td>1</td><td>"Pilot"</td><td>January 1, 2001</td></tr>
+<tr><td>2</td><td>2</td><td>"Second"</td><td>January 8, 2001</td></tr>
+</table>
+"""
+
+
+class _FakePage:
+    def __init__(self, title: str, html: str) -> None:
+        self.title = title
+        self.url = f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}"
+        self._html = html
+        self.html_calls = 0
+
+    def html(self) -> str:
+        self.html_calls += 1
+        return self._html
+
+
+@pytest.fixture(autouse=True)
+def _fresh_resolver(mocker):
+    mocker.patch.object(resolver_module, "_default_resolver", WikiPageResolver())
+    scraping_service.clear_wiki_cache()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_page_requests_share_one_lookup(mocker):
+    release = threading.Event()
+    page = _FakePage("Show", LIST_PAGE_HTML)
+
+    def _slow_page(title, **_kwargs):
+        release.wait(timeout=5)
+        return page
+
+    page_mock = mocker.patch("wikipedia.page", side_effect=_slow_page)
+    resolver = WikiPageResolver()
+
+    waiters = [asyncio.create_task(resolver.page("Show")) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+    pages = await asyncio.gather(*waiters)
+
+    assert all(result is page for result in pages)
+    assert page_mock.call_count == 1
+    soups = await asyncio.gather(*(resolver.soup(page) for _ in range(3)))
+    assert soups[0] is soups[1] is soups[2]
+    assert page.html_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_soups_are_cached_per_named_strainer():
+    page = _FakePage("Show", LIST_PAGE_HTML)
+    resolver = WikiPageResolver()
+
+    episode_list = await resolver.soup(page, "episode_list")
+    links = await resolver.soup(page, "links")
+
+    assert episode_list is not links
+    assert episode_list.find("table") is not None
+    assert links.find("table") is None
+    assert await resolver.soup(page, "episode_list") is episode_list
+    assert page.html_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_pages_are_remembered_and_content_is_evicted_by_size(mocker):
+    page_mock = mocker.patch(
+        "wikipedia.page", side_effect=wikipedia.exceptions.PageError("List of Show episodes")
+    )
+    resolver = WikiPageResolver(max_bytes=2500)
+
+    for _ in range(2):
+        with pytest.raises(wikipedia.exceptions.PageError):
+            await resolver.page("List of Show episodes")
+    assert page_mock.call_count == 1
+
+    first, second = _FakePage("First", "a" * 1000), _FakePage("Second", "b" * 1000)
+    await resolver.html(first)
+    await resolver.html(second)
+    await resolver.html(first)  # refresh "First" so "Second" is the eviction candidate
+    await resolver.html(_FakePage("Third", "c" * 1000))
+
+    assert resolver.cached_bytes == 2000
+    await resolver.html(first)
+    await resolver.html(second)
+    assert first.html_calls == 1
+    assert second.html_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_tv_lookups_for_one_show_download_the_list_page_once(mocker):
+    main_page = _FakePage("Show", "<p>Show is a series.</p>")
+    list_page = _FakePage("List of Show episodes", LIST_PAGE_HTML)
+    pages = {"Show": main_page, "List of Show episodes": list_page}
+    search_mock = mocker.patch("wikipedia.search", return_value=["Show"])
+    page_mock = mocker.patch("wikipedia.page", side_effect=lambda title, **_: pages[title])
+
+    titles, _ = await scraping_service.fetch_episode_titles_for_season("Show", 1)
+    seasons = await scraping_service.fetch_total_seasons_from_wikipedia("Show")
+    episodes = await scraping_service.fetch_season_episode_count_from_wikipedia("Show", 1)
+
+    assert {number: meta["title"] for number, meta in titles.items()} == {1: "Pilot", 2: "Second"}
+    assert seasons == 1
+    assert episodes == 2
+    assert list_page.html_calls == 1
+    assert search_mock.call_count == 1
+    assert page_mock.call_count == 2
@@ -59,7 +59,11 @@ region=ca
         "preferences": {"category": "movie"},
     }
     assert tmdb_config == {"access_token": "TMDB_TEST_ACCESS_TOKEN", "region": "CA"}
-    assert runtime_limits == {"scraper_max_torrent_size_gib": 22.0}
+    assert runtime_limits == {
+        "scraper_max_torrent_size_gib": 22.0,
+        "max_concurrent_downloads_per_chat": 2,
+        "max_concurrent_downloads": 4,
+    }
 
 
 def test_resolve_scraper_max_torrent_size_gib_caps_requested_limit():
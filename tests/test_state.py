@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 import json
@@ -5,8 +6,10 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 import pytest
 from unittest.mock import Mock
+from telegram_bot import state as state_module
 from telegram_bot.state import (
     STATE_LOAD_COMPLETED_KEY,
+    DebouncedStateWriter,
     load_state,
     post_init,
     post_shutdown,
@@ -16,8 +19,8 @@ from telegram_bot.state import (
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 
-def test_save_and_load_state_roundtrip(mocker):
-    file_path = "state.json"
+def test_save_and_load_state_roundtrip(tmp_path):
+    file_path = str(tmp_path / "state.json")
     active_downloads = {
         "123": {
             "name": "test",
@@ -29,26 +32,61 @@ def test_save_and_load_state_roundtrip(mocker):
     }
     download_queues = {"123": [{"name": "queued"}]}
 
-    mock_open_write = mocker.mock_open()
-    mocker.patch("builtins.open", mock_open_write)
-
     save_state(file_path, active_downloads, download_queues)
 
-    handle = mock_open_write()
-    written_data = "".join(call.args[0] for call in handle.write.call_args_list)
+    written_data = (tmp_path / "state.json").read_text()
     assert "task" not in written_data
     assert "lock" not in written_data
     assert "handle" not in written_data
-
-    mock_open_read = mocker.mock_open(read_data=written_data)
-    mocker.patch("builtins.open", mock_open_read)
-    mocker.patch("os.path.exists", return_value=True)
+    # Written compactly and atomically, without leaving the temp file behind.
+    assert "\n" not in written_data
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
 
     loaded_active, loaded_queue = load_state(file_path)
     assert loaded_active == {"123": {"name": "test", "requeued": False}}
     assert loaded_queue == download_queues
 
 
+def test_save_state_keeps_previous_file_when_write_fails(tmp_path, mocker):
+    file_path = tmp_path / "state.json"
+    save_state(str(file_path), {}, {"1": [{"name": "kept"}]})
+    mocker.patch("telegram_bot.state.os.fsync", side_effect=OSError("disk full"))
+
+    save_state(str(file_path), {}, {"1": [{"name": "lost"}]})
+
+    assert load_state(str(file_path))[1] == {"1": [{"name": "kept"}]}
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]
+
+
+@pytest.mark.asyncio
+async def test_debounced_writer_coalesces_bursts_into_one_write(tmp_path, mocker):
+    write_mock = mocker.patch(
+        "telegram_bot.state._write_state_payload", wraps=state_module._write_state_payload
+    )
+    writer = DebouncedStateWriter(str(tmp_path / "state.json"), debounce_seconds=0.01)
+    queues: dict = {"1": []}
+
+    for index in range(40):
+        queues["1"].append({"name": f"movie {index}"})
+        writer.mark_dirty({}, queues)
+    assert writer.dirty
+    await asyncio.sleep(0.05)
+
+    write_mock.assert_called_once()
+    assert not writer.dirty
+    assert len(load_state(str(tmp_path / "state.json"))[1]["1"]) == 40
+
+
+@pytest.mark.asyncio
+async def test_debounced_writer_flush_writes_pending_state(tmp_path):
+    writer = DebouncedStateWriter(str(tmp_path / "state.json"), debounce_seconds=60)
+
+    writer.mark_dirty({}, {"1": [{"name": "queued"}]})
+    await writer.flush()
+
+    assert load_state(str(tmp_path / "state.json"))[1] == {"1": [{"name": "queued"}]}
+
+
 def test_load_state_missing_file(mocker):
     mocker.patch("os.path.exists", return_value=False)
     active, queue = load_state("missing.json")
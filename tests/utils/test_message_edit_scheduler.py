@@ -0,0 +1,85 @@
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from telegram import Bot
+from telegram.error import RetryAfter
+
+from telegram_bot import utils
+from telegram_bot.utils import (
+    MessageEditScheduler,
+    close_message_edit_scheduler,
+    get_message_edit_scheduler,
+    safe_edit_message,
+)
+
+
+def _bot() -> Mock:
+    bot = Mock(spec=Bot)
+    bot.edit_message_text = AsyncMock()
+    return bot
+
+
+@pytest.mark.asyncio
+async def test_scheduler_keeps_latest_text_and_drops_identical_edits():
+    bot = _bot()
+    scheduler = MessageEditScheduler(per_chat_interval=0)
+
+    assert scheduler.enqueue(bot, "10%", chat_id=1, message_id=2)
+    assert scheduler.enqueue(bot, "20%", chat_id=1, message_id=2)
+    assert not scheduler.enqueue(bot, "20%", chat_id=1, message_id=2)
+    assert await scheduler.flush(timeout=1)
+
+    bot.edit_message_text.assert_awaited_once_with(text="20%", chat_id=1, message_id=2)
+    # Already on screen, so no request is made.
+    assert not scheduler.enqueue(bot, "20%", chat_id=1, message_id=2)
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_spaces_edits_to_the_same_chat():
+    bot = _bot()
+    sent_at: list[float] = []
+    bot.edit_message_text.side_effect = lambda **_: sent_at.append(time.monotonic())
+    scheduler = MessageEditScheduler(per_chat_interval=0.2)
+
+    scheduler.enqueue(bot, "a", chat_id=1, message_id=10)
+    scheduler.enqueue(bot, "b", chat_id=1, message_id=11)
+    scheduler.enqueue(bot, "c", chat_id=2, message_id=12)
+    assert await scheduler.flush(timeout=1)
+
+    assert bot.edit_message_text.await_count == 3
+    texts = [call.kwargs["text"] for call in bot.edit_message_text.await_args_list]
+    # The other chat is not held up behind chat 1's interval.
+    assert texts == ["a", "c", "b"]
+    assert sent_at[2] - sent_at[0] >= 0.15
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_defers_chat_on_retry_after():
+    bot = _bot()
+    bot.edit_message_text.side_effect = [RetryAfter(0.05), None]
+    scheduler = MessageEditScheduler(per_chat_interval=0)
+
+    scheduler.enqueue(bot, "50%", chat_id=1, message_id=2)
+    assert await scheduler.flush(timeout=1)
+
+    assert bot.edit_message_text.await_count == 2
+    assert bot.edit_message_text.await_args.kwargs["text"] == "50%"
+    await scheduler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_direct_edit_discards_queued_progress():
+    bot = _bot()
+    scheduler = get_message_edit_scheduler()
+    try:
+        scheduler.enqueue(bot, "99%", chat_id=1, message_id=2)
+        await safe_edit_message(bot, "Done", chat_id=1, message_id=2)
+        assert await scheduler.flush(timeout=1)
+    finally:
+        await close_message_edit_scheduler()
+
+    bot.edit_message_text.assert_awaited_once_with(text="Done", chat_id=1, message_id=2)
+    assert utils._default_edit_scheduler is None
@@ -114,3 +114,80 @@ def test_pick_collection_candidate_ignores_rm4k_for_4k_request():
     # Tier 2 (2160p + x264) -> Should match magnet:real4k
     candidate = _pick_collection_candidate(results, "2160p", "x265", None, None)
     assert candidate["page_url"] == "magnet:real4k"
+
+
+@pytest.mark.asyncio
+async def test_collect_collection_torrents_searches_in_parallel_and_selects_in_order(
+    mocker, context, make_message
+):
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    from telegram_bot.workflows.search_session import SearchSession
+    from telegram_bot.workflows.search_workflow.movie_collection_flow import (
+        _collect_collection_torrents,
+    )
+
+    in_flight = 0
+    peak = 0
+    delays = {"First": 0.03, "Second": 0.0, "Third": 0.01}
+
+    async def fake_search(label, media_type, ctx, **kwargs):  # noqa: ARG001
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        title = label.split(" (")[0]
+        await asyncio.sleep(delays[title])
+        in_flight -= 1
+        first = title == "First"
+        return [
+            {
+                "title": f"{title} 1080p x265",
+                "codec": "x265",
+                "score": 12 if first else 10,
+                "seeders": 40,
+                "size_gib": 2.0,
+                "uploader": "GroupB",
+                "page_url": f"magnet:{title}-b",
+            },
+            {
+                "title": f"{title} 1080p x265",
+                "codec": "x265",
+                "score": 10 if first else 12,
+                "seeders": 40,
+                "size_gib": 2.0,
+                "uploader": "GroupC",
+                "page_url": f"magnet:{title}-c",
+            },
+        ]
+
+    mocker.patch(
+        "telegram_bot.workflows.search_workflow.movie_collection_flow.search_logic.orchestrate_searches",
+        new=AsyncMock(side_effect=fake_search),
+    )
+    edit_mock = mocker.patch(
+        "telegram_bot.workflows.search_workflow.movie_collection_flow.safe_edit_message",
+        new=AsyncMock(),
+    )
+    session = SearchSession(media_type="movie")
+    session.collection_resolution = "1080p"
+    session.collection_codec = "x265"
+    movies = [
+        {"title": "First", "year": 2001},
+        {"title": "Second", "year": 2002},
+        {"title": "Third", "year": 2003},
+    ]
+
+    pending, missing = await _collect_collection_torrents(make_message(), context, session, movies)
+
+    assert peak == 3
+    assert missing == []
+    # The first movie seeds the uploader, so later picks follow GroupB even though
+    # their searches completed first and rank GroupC higher on their own.
+    assert session.collection_seed_uploader == "GroupB"
+    assert [item["link"] for item in pending["items"]] == [
+        "magnet:First-b",
+        "magnet:Second-b",
+        "magnet:Third-b",
+    ]
+    assert edit_mock.await_count == 0  # Fast searches stay under the edit interval
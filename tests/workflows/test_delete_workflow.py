@@ -222,7 +222,7 @@ async def test_confirm_delete_skips_plex_when_item_has_multiple_parts(
         new=AsyncMock(),
     )
     mocker.patch(
-        "telegram_bot.workflows.delete_workflow.plex.PlexServer",
+        "telegram_bot.services.plex_session.create_plex_client",
         return_value=mocker.Mock(),
     )
 
@@ -365,11 +365,12 @@ async def test_delete_item_from_plex_collection_returns_manual_cleanup_when_dele
 
     section = mocker.Mock(type="movie")
     section.all.return_value = [item]
+    section.fetchItems.return_value = [item]
 
     plex_server = mocker.Mock()
     plex_server.library.sections.return_value = [section]
 
-    mocker.patch("telegram_bot.workflows.delete_workflow.plex.PlexServer", return_value=plex_server)
+    mocker.patch("telegram_bot.services.plex_session.create_plex_client", return_value=plex_server)
 
     result, plex = await _delete_item_from_plex(str(collection_dir), {"url": "u", "token": "t"})
 
@@ -36,6 +36,7 @@ from telegram_bot.workflows.search_workflow.tv_flow import (
     _perform_tv_all_seasons_search,
     _present_season_download_confirmation,
     _prompt_tv_season_preferences,
+    _search_episode_candidates,
     _select_consistent_episode_set,
 )
 
@@ -2008,6 +2009,53 @@ async def test_all_seasons_preferences_continue_routes_to_all_seasons_search(
     assert perform_all_mock.await_args.args[3] == 3
 
 
+@pytest.mark.asyncio
+async def test_search_episode_candidates_dispatches_episode_queries_together(mocker, context):
+    import asyncio
+
+    started: list[str] = []
+    all_started = asyncio.Event()
+
+    async def orch_side_effect(query, media_type, ctx, **kwargs):  # noqa: ARG001
+        started.append(query)
+        if len(started) == 3:
+            all_started.set()
+        # Every query must be in flight before any of them can finish.
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+        if query.startswith("Show S01E02"):
+            return []
+        return [{"title": f"{query} x265", "page_url": query, "codec": "x265"}]
+
+    mocker.patch(
+        "telegram_bot.workflows.search_workflow.tv_flow.search_logic.orchestrate_searches",
+        new=AsyncMock(side_effect=orch_side_effect),
+    )
+    progress: list[int] = []
+
+    async def on_episode_searched(episode: int) -> None:
+        progress.append(episode)
+
+    candidates, missing = await _search_episode_candidates(
+        context,
+        "Show",
+        1,
+        [1, 2, 3],
+        target_res="1080p",
+        target_codec="x265",
+        on_episode_searched=on_episode_searched,
+    )
+
+    assert sorted(started) == [
+        "Show S01E01 1080p",
+        "Show S01E02 1080p",
+        "Show S01E03 1080p",
+    ]
+    assert list(candidates) == [1, 3]
+    assert candidates[3][0].link == "Show S01E03 1080p"
+    assert missing == [2]
+    assert sorted(progress) == [1, 2, 3]
+
+
 @pytest.mark.asyncio
 async def test_perform_tv_all_seasons_search_aggregates_torrents(mocker, context, make_message):
     mocker.patch(
@@ -41,10 +41,15 @@ async def test_tv_season_fallback_uses_wiki_titles_and_corrected_title(mocker):
     )
 
     # Stub helpers used inside workflow
-    mocker.patch(
+    edit_mock = mocker.patch(
         "telegram_bot.workflows.search_workflow.tv_flow.safe_edit_message",
         new=AsyncMock(return_value=None),
     )
+    scheduler = Mock()
+    mocker.patch(
+        "telegram_bot.workflows.search_workflow.tv_flow.get_message_edit_scheduler",
+        return_value=scheduler,
+    )
     mocker.patch(
         "telegram_bot.workflows.search_workflow.tv_flow.parse_torrent_name",
         return_value={},
@@ -91,3 +96,7 @@ async def test_tv_season_fallback_uses_wiki_titles_and_corrected_title(mocker):
     assert pi["episode_title"] == "Pilot"
     assert pi["title"] == "Show (TV series)"
     assert pi["season"] == 1 and pi["episode"] == 1 and pi["type"] == "tv"
+
+    # Per-episode ticks are queued; only the finished count is edited directly
+    scheduler.enqueue.assert_called_once()
+    assert "Progress: 1/1" in edit_mock.await_args_list[-1].kwargs["text"]